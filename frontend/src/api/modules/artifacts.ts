@@ -148,6 +148,37 @@ export async function downloadArtifact(artifactId: string): Promise<Blob> {
   return response.blob()
 }
 
+const ARTIFACT_POLL_INTERVAL_MS = 500
+const ARTIFACT_POLL_MAX_INTERVAL_MS = 5_000
+const ARTIFACT_BUILD_TIMEOUT_MS = 5 * 60_000
+
+/**
+ * Wait until a queued artifact build finishes.
+ *
+ * Generate endpoints return the artifact while it is still pending; its file
+ * can only be downloaded once the build has completed.
+ */
+export async function waitForArtifact(
+  artifact: ArtifactRecord,
+  timeoutMs: number = ARTIFACT_BUILD_TIMEOUT_MS
+): Promise<ArtifactRecord> {
+  const deadline = Date.now() + timeoutMs
+  let current = artifact
+  let interval = ARTIFACT_POLL_INTERVAL_MS
+  while (current.status === 'pending' || current.status === 'generating') {
+    if (Date.now() >= deadline) {
+      throw new Error('Timed out waiting for the artifact build to finish')
+    }
+    await new Promise((resolve) => setTimeout(resolve, interval))
+    interval = Math.min(interval * 2, ARTIFACT_POLL_MAX_INTERVAL_MS)
+    current = await getArtifact(current.id)
+  }
+  if (current.status !== 'completed') {
+    throw new Error(current.error_message || `Artifact build ${current.status}`)
+  }
+  return current
+}
+
 export async function generateReportArtifact(
   validationId: string,
   options?: ArtifactGenerateOptions
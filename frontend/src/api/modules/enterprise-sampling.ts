@@ -176,6 +176,9 @@ export interface SketchEstimateRequest {
   columns: string[]
   sketch_type: SketchType
   sketch_config?: SketchConfig | null
+  membership_values?: string[] | null
+  partition_path?: string | null
+  refresh?: boolean
 }
 
 export interface SketchEstimateResult {
@@ -185,6 +188,10 @@ export interface SketchEstimateResult {
   cardinality_error?: number | null
   heavy_hitters?: Array<{ value: string; count: number }> | null
   membership_tests?: Record<string, boolean> | null
+  false_positive_rate?: number | null
+  rows_ingested?: number | null
+  partitions_merged?: number | null
+  from_store?: boolean
   memory_used_bytes: number
   processing_time_ms: number
 }
@@ -127,6 +127,7 @@ export interface Validation {
   metadata: Record<string, unknown>
   error_message?: string
   duration_ms?: number
+  cache_hit?: boolean
   started_at?: string
   completed_at?: string
   created_at: string
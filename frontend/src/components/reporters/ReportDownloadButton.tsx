@@ -9,7 +9,11 @@ import { Download, Loader2 } from 'lucide-react'
 import { Button } from '@/components/ui/button'
 import { useToast } from '@/hooks/use-toast'
 import type { ArtifactRecord, ArtifactFormat } from '@/api/modules/artifacts'
-import { downloadArtifact, generateReportArtifact } from '@/api/modules/artifacts'
+import {
+  downloadArtifact,
+  generateReportArtifact,
+  waitForArtifact,
+} from '@/api/modules/artifacts'
 import { getFormatExtension } from '@/types/reporters'
 
 interface ReportDownloadButtonProps {
@@ -62,7 +66,8 @@ export function ReportDownloadButton({
         downloadFilename += getFormatExtension(artifact.format)
       } else if (validationId) {
         const generatedArtifact = await generateReportArtifact(validationId, { format })
-        blob = await downloadArtifact(generatedArtifact.id)
+        const ready = await waitForArtifact(generatedArtifact)
+        blob = await downloadArtifact(ready.id)
         downloadFilename = filename || `report_${validationId.slice(0, 8)}`
         downloadFilename += getFormatExtension(format)
       } else {
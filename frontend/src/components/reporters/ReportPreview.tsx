@@ -26,7 +26,11 @@ import { useToast } from '@/hooks/use-toast'
 import { cn } from '@/lib/utils'
 import { FormatIcon } from './FormatIcon'
 import type { ReportFormatType, ReportThemeType, ReportLocale } from '@/types/reporters'
-import { downloadArtifact, generateReportArtifact } from '@/api/modules/artifacts'
+import {
+  downloadArtifact,
+  generateReportArtifact,
+  waitForArtifact,
+} from '@/api/modules/artifacts'
 
 interface ReportPreviewProps {
   /** Existing artifact ID to preview */
@@ -91,7 +95,7 @@ export function ReportPreview({
           theme: theme as 'light' | 'dark' | 'professional' | 'minimal' | 'high_contrast',
           locale: locale as 'en' | 'ko' | 'ja' | 'zh' | 'de' | 'fr' | 'es' | 'pt' | 'it' | 'ru' | 'ar' | 'th' | 'vi' | 'id' | 'tr',
         })
-        resolvedArtifactId = artifact.id
+        resolvedArtifactId = (await waitForArtifact(artifact)).id
       }
       const blob = await downloadArtifact(resolvedArtifactId)
       const result = await blob.text()
@@ -27,6 +27,7 @@ import {
   downloadArtifact,
   generateReportArtifact,
   getArtifactCapabilities,
+  waitForArtifact,
   type ArtifactFormat as ReportFormat,
   type ArtifactTheme as ReportTheme,
   type ArtifactLocale as ReportLocale,
@@ -141,7 +142,8 @@ export function ReportDownloadButton({
         theme: theme || 'professional',
         locale: locale || selectedLocale,
       })
-      const blob = await downloadArtifact(artifact.id)
+      const ready = await waitForArtifact(artifact)
+      const blob = await downloadArtifact(ready.id)
 
       // Create download link
       const url = window.URL.createObjectURL(blob)
@@ -20,6 +20,7 @@ import {
   downloadArtifact,
   generateReportArtifact,
   getArtifactCapabilities,
+  waitForArtifact,
   type ArtifactFormat as ReportFormat,
   type ArtifactTheme as ReportTheme,
   type ArtifactLocale as ModuleReportLocale,
@@ -137,7 +138,7 @@ export function useReportGeneration(
     setError(null)
 
     try {
-      await generateReportArtifact(validationId, {
+      const artifact = await generateReportArtifact(validationId, {
         format: format as ReportFormat,
         theme,
         locale,
@@ -145,6 +146,7 @@ export function useReportGeneration(
         include_samples: config?.includeSamples,
         include_statistics: config?.includeStatistics,
       })
+      await waitForArtifact(artifact)
 
       toast({
         title: 'Report Generated',
@@ -175,7 +177,8 @@ export function useReportGeneration(
         include_samples: config?.includeSamples,
         include_statistics: config?.includeStatistics,
       })
-      const blob = await downloadArtifact(artifact.id)
+      const ready = await waitForArtifact(artifact)
+      const blob = await downloadArtifact(ready.id)
 
       // Create download link
       const url = window.URL.createObjectURL(blob)
@@ -216,7 +219,8 @@ export function useReportGeneration(
         include_samples: config?.includeSamples,
         include_statistics: config?.includeStatistics,
       })
-      const blob = await downloadArtifact(artifact.id)
+      const ready = await waitForArtifact(artifact)
+      const blob = await downloadArtifact(ready.id)
       const content = await blob.text()
       setPreviewContent(content)
     } catch (err) {
@@ -0,0 +1,681 @@
+#!/usr/bin/env python3
+"""In-process benchmark suite for the dashboard's hot paths.
+
+Seeds a throwaway SQLite database with a synthetic fleet (sources,
+validations, a lineage graph, incidents, notification rules and logs)
+and times the service calls behind the busiest pages and pipelines:
+
+- ``overview``: ``OverviewService.get_overview`` for the fleet workspace
+- ``history``: ``HistoryService.get_history`` for one source over 90 days
+- ``lineage_impact``: ``LineageService.analyze_impact`` from a root node
+- ``dispatcher_routing``: rule matching in ``NotificationDispatcher``
+- ``expression_eval``: ``SafeExpressionEvaluator`` over a batch of contexts
+- ``streaming_detection``: a rolling z-score session fed a batch of points
+
+Results are written as JSON. Given a baseline file from an earlier run
+(for example the target branch, on the same machine), the median of each
+case is compared and the script exits non-zero when any case regressed
+by more than ``--max-regression``.
+
+Usage:
+    python scripts/benchmark.py
+    python scripts/benchmark.py --sources 500 --validations 40 --output bench.json
+    python scripts/benchmark.py --baseline main.json --max-regression 0.25
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass, field
+from datetime import timedelta
+from pathlib import Path
+from typing import Any
+from uuid import uuid4
+
+RESULTS_VERSION = 1
+
+# Cases faster than this are dominated by timer and scheduler noise, so
+# they are never reported as regressions no matter the ratio.
+MIN_REGRESSION_DELTA_MS = 1.0
+
+
+@dataclass
+class FleetConfig:
+    """Shape of the synthetic fleet.
+
+    Attributes:
+        sources: Number of data sources.
+        validations: Validation runs per source.
+        lineage_fanout: Downstream nodes derived from each lineage node.
+        lineage_depth: Levels of derived nodes below the source nodes.
+        incidents: Escalation incidents in the workspace.
+        notification_logs: Delivery log rows across all channels.
+        rules: Active notification rules.
+        seed: Random seed, so two runs build the same fleet.
+    """
+
+    sources: int = 200
+    validations: int = 25
+    lineage_fanout: int = 2
+    lineage_depth: int = 3
+    incidents: int = 200
+    notification_logs: int = 2000
+    rules: int = 50
+    seed: int = 42
+
+
+@dataclass
+class Fleet:
+    """IDs of the seeded rows the benchmark cases start from."""
+
+    workspace_id: str
+    source_ids: list[str]
+    root_node_id: str
+    lineage_nodes: int
+    lineage_edges: int
+
+
+@dataclass
+class CaseResult:
+    """Timings for one benchmark case, in milliseconds.
+
+    Attributes:
+        name: Case name.
+        repeat: Number of timed iterations.
+        median_ms: Median iteration time.
+        p95_ms: 95th percentile iteration time.
+        min_ms: Fastest iteration.
+        error: Error message if the case could not run.
+    """
+
+    name: str
+    repeat: int
+    median_ms: float = 0.0
+    p95_ms: float = 0.0
+    min_ms: float = 0.0
+    error: str | None = None
+
+
+@dataclass
+class Comparison:
+    """One case compared against its baseline median."""
+
+    name: str
+    baseline_ms: float
+    current_ms: float
+    regressed: bool
+
+    @property
+    def change(self) -> float:
+        return self.current_ms / self.baseline_ms - 1 if self.baseline_ms else 0.0
+
+
+@dataclass
+class BenchmarkContext:
+    """Everything a case needs besides the database session."""
+
+    fleet: Fleet
+    config: FleetConfig
+    batch_size: int
+    extra: dict[str, Any] = field(default_factory=dict)
+
+
+async def seed_fleet(session: Any, config: FleetConfig) -> Fleet:
+    """Insert a synthetic fleet and return the IDs the cases need.
+
+    Rows are written with bulk ORM inserts and explicit IDs, so seeding a
+    few hundred thousand rows takes seconds rather than minutes.
+    """
+    from sqlalchemy import insert
+
+    from truthound_dashboard.db import (
+        NotificationChannel,
+        NotificationLog,
+        NotificationRule,
+        Source,
+        Validation,
+        Workspace,
+    )
+    from truthound_dashboard.db.models import (
+        EscalationIncidentModel,
+        EscalationPolicyModel,
+        LineageEdge,
+        LineageNode,
+    )
+    from truthound_dashboard.time import utc_now
+
+    rng = random.Random(config.seed)
+    now = utc_now()
+
+    workspace_id = str(uuid4())
+    await session.execute(
+        insert(Workspace),
+        [{"id": workspace_id, "name": "Benchmark Fleet", "slug": "benchmark-fleet"}],
+    )
+
+    source_ids = [str(uuid4()) for _ in range(config.sources)]
+    await session.execute(
+        insert(Source),
+        [
+            {
+                "id": source_id,
+                "workspace_id": workspace_id,
+                "name": f"source_{i:05d}",
+                "type": "csv",
+                "config": {"path": f"/data/source_{i:05d}.csv"},
+            }
+            for i, source_id in enumerate(source_ids)
+        ],
+    )
+
+    validations = []
+    for source_id in source_ids:
+        for _ in range(config.validations):
+            passed = rng.random() > 0.3
+            validations.append(
+                {
+                    "id": str(uuid4()),
+                    "source_id": source_id,
+                    "status": "success" if passed else "failed",
+                    "passed": passed,
+                    "has_critical": not passed and rng.random() < 0.2,
+                    "has_high": not passed and rng.random() < 0.5,
+                    "total_issues": 0 if passed else rng.randint(1, 20),
+                    "created_at": now - timedelta(minutes=rng.randint(0, 60 * 24 * 80)),
+                }
+            )
+    await _insert_chunked(session, insert(Validation), validations)
+
+    # One source node per source; each node derives ``fanout`` children
+    # per level, and every child also joins with a random earlier node so
+    # the graph is a DAG rather than a forest.
+    nodes: list[dict[str, Any]] = []
+    edges: list[dict[str, Any]] = []
+    level = []
+    for i, source_id in enumerate(source_ids):
+        node_id = str(uuid4())
+        nodes.append(
+            {"id": node_id, "name": f"source_{i:05d}", "node_type": "source", "source_id": source_id}
+        )
+        level.append(node_id)
+    for depth in range(config.lineage_depth):
+        next_level = []
+        for parent_id in level:
+            for _ in range(config.lineage_fanout):
+                node_type = "sink" if depth == config.lineage_depth - 1 else "transform"
+                node_id = str(uuid4())
+                nodes.append(
+                    {"id": node_id, "name": f"{node_type}_{len(nodes):06d}", "node_type": node_type}
+                )
+                next_level.append(node_id)
+                edges.append(
+                    {
+                        "id": str(uuid4()),
+                        "source_node_id": parent_id,
+                        "target_node_id": node_id,
+                        "edge_type": "derives_from",
+                    }
+                )
+                other = rng.choice(level)
+                if other != parent_id:
+                    edges.append(
+                        {
+                            "id": str(uuid4()),
+                            "source_node_id": other,
+                            "target_node_id": node_id,
+                            "edge_type": "joins_with",
+                        }
+                    )
+        level = next_level
+    await _insert_chunked(session, insert(LineageNode), nodes)
+    await _insert_chunked(session, insert(LineageEdge), edges)
+
+    policy_id = str(uuid4())
+    await session.execute(
+        insert(EscalationPolicyModel),
+        [
+            {
+                "id": policy_id,
+                "workspace_id": workspace_id,
+                "name": "benchmark",
+                "levels": [{"level": 1, "delay_minutes": 0, "targets": []}],
+            }
+        ],
+    )
+    states = ["pending", "triggered", "acknowledged", "escalated", "resolved"]
+    await _insert_chunked(
+        session,
+        insert(EscalationIncidentModel),
+        [
+            {
+                "id": str(uuid4()),
+                "policy_id": policy_id,
+                "workspace_id": workspace_id,
+                "incident_ref": f"validation:{rng.choice(source_ids)}:{i}",
+                "state": rng.choice(states),
+                "events": [],
+                "created_at": now - timedelta(minutes=rng.randint(0, 60 * 24 * 30)),
+                "updated_at": now,
+            }
+            for i in range(config.incidents)
+        ],
+    )
+
+    channel_ids = [str(uuid4()) for _ in range(max(1, config.rules // 5))]
+    await session.execute(
+        insert(NotificationChannel),
+        [
+            {
+                "id": channel_id,
+                "type": "webhook",
+                "name": f"channel_{i}",
+                "config": {"url": f"https://hooks.invalid/{i}"},
+            }
+            for i, channel_id in enumerate(channel_ids)
+        ],
+    )
+    conditions = ["validation_failed", "critical_issues", "high_issues", "schedule_failed"]
+    await session.execute(
+        insert(NotificationRule),
+        [
+            {
+                "id": str(uuid4()),
+                "name": f"rule_{i}",
+                "condition": conditions[i % len(conditions)],
+                "channel_ids": rng.sample(channel_ids, k=min(2, len(channel_ids))),
+                # Half of the rules are scoped to a handful of sources.
+                "source_ids": rng.sample(source_ids, k=min(5, len(source_ids)))
+                if i % 2
+                else None,
+            }
+            for i in range(config.rules)
+        ],
+    )
+    await _insert_chunked(
+        session,
+        insert(NotificationLog),
+        [
+            {
+                "id": str(uuid4()),
+                "channel_id": rng.choice(channel_ids),
+                "event_type": "validation_failed",
+                "event_data": {"source_id": rng.choice(source_ids)},
+                "message": "Validation failed",
+                "status": "sent" if rng.random() > 0.1 else "failed",
+                "created_at": now - timedelta(minutes=rng.randint(0, 60 * 24 * 30)),
+            }
+            for _ in range(config.notification_logs)
+        ],
+    )
+
+    return Fleet(
+        workspace_id=workspace_id,
+        source_ids=source_ids,
+        root_node_id=nodes[0]["id"],
+        lineage_nodes=len(nodes),
+        lineage_edges=len(edges),
+    )
+
+
+async def _insert_chunked(
+    session: Any,
+    statement: Any,
+    rows: list[dict[str, Any]],
+    chunk_size: int = 5000,
+) -> None:
+    for start in range(0, len(rows), chunk_size):
+        await session.execute(statement, rows[start : start + chunk_size])
+
+
+# =============================================================================
+# Cases
+# =============================================================================
+
+
+async def bench_overview(ctx: BenchmarkContext) -> None:
+    from truthound_dashboard.core.overview import OverviewService
+    from truthound_dashboard.db import get_session
+
+    async with get_session() as session:
+        await OverviewService(session).get_overview(workspace_id=ctx.fleet.workspace_id)
+
+
+async def bench_history(ctx: BenchmarkContext) -> None:
+    from truthound_dashboard.core.domains.history import HistoryService
+    from truthound_dashboard.db import get_session
+
+    async with get_session() as session:
+        await HistoryService(session).get_history(ctx.fleet.source_ids[0], period="90d")
+
+
+async def bench_lineage_impact(ctx: BenchmarkContext) -> None:
+    from truthound_dashboard.core.lineage import LineageService
+    from truthound_dashboard.db import get_session
+
+    async with get_session() as session:
+        await LineageService(session).analyze_impact(
+            ctx.fleet.root_node_id, direction="both", max_depth=ctx.config.lineage_depth + 1
+        )
+
+
+async def bench_dispatcher_routing(ctx: BenchmarkContext) -> None:
+    from truthound_dashboard.core.notifications.dispatcher import NotificationDispatcher
+    from truthound_dashboard.core.notifications.events import ValidationFailedEvent
+    from truthound_dashboard.db import get_session
+
+    # Routing only: resolve rules and channels for a batch of events
+    # without delivering anything.
+    async with get_session() as session:
+        dispatcher = NotificationDispatcher(session, use_truthound=False)
+        for i in range(max(1, ctx.batch_size // 50)):
+            source_id = ctx.fleet.source_ids[i % len(ctx.fleet.source_ids)]
+            event = ValidationFailedEvent(
+                source_id=source_id,
+                source_name=source_id,
+                validation_id=f"validation-{i}",
+                has_critical=i % 3 == 0,
+                has_high=i % 2 == 0,
+                total_issues=i % 20,
+            )
+            await dispatcher._get_channels_for_event(event)
+
+
+EXPRESSIONS = [
+    "severity == 'critical' and pass_rate < 0.9",
+    "'null_check' in issues or metadata.get('total_issues', 0) > 10",
+    "action_type == 'check' and metadata.get('environment') == 'production'",
+    "len(issues) > 2 and severity in ('critical', 'high')",
+]
+
+
+async def bench_expression_eval(ctx: BenchmarkContext) -> None:
+    from truthound_dashboard.core.notifications.routing.expression_engine import (
+        SafeExpressionEvaluator,
+    )
+
+    contexts = ctx.extra["expression_contexts"]
+    evaluator = SafeExpressionEvaluator()
+    for i, context in enumerate(contexts):
+        evaluator.evaluate(EXPRESSIONS[i % len(EXPRESSIONS)], context)
+
+
+async def bench_streaming_detection(ctx: BenchmarkContext) -> None:
+    from truthound_dashboard.core.streaming_anomaly import (
+        StreamingAlgorithm,
+        StreamingAnomalyDetector,
+    )
+
+    detector = StreamingAnomalyDetector()
+    session = await detector.create_session(
+        algorithm=StreamingAlgorithm.ZSCORE_ROLLING,
+        window_size=100,
+        columns=["value", "latency"],
+    )
+    await detector.start_session(session.id)
+    await detector.push_batch(session.id, ctx.extra["stream_points"])
+
+
+CASES: dict[str, Callable[[BenchmarkContext], Awaitable[None]]] = {
+    "overview": bench_overview,
+    "history": bench_history,
+    "lineage_impact": bench_lineage_impact,
+    "dispatcher_routing": bench_dispatcher_routing,
+    "expression_eval": bench_expression_eval,
+    "streaming_detection": bench_streaming_detection,
+}
+
+
+def _prepare_inputs(ctx: BenchmarkContext) -> None:
+    """Build the in-memory inputs so they are not part of the timings."""
+    from truthound_dashboard.core.notifications.routing.expression_engine import (
+        ExpressionContext,
+    )
+
+    rng = random.Random(ctx.config.seed)
+    severities = ["critical", "high", "medium", "low", "info"]
+    ctx.extra["expression_contexts"] = [
+        ExpressionContext(
+            checkpoint_name=f"checkpoint_{i}",
+            action_type="check",
+            severity=rng.choice(severities),
+            issues=rng.sample(["null_check", "range_check", "unique_check", "schema"], k=2),
+            pass_rate=rng.random(),
+            metadata={"environment": "production", "total_issues": rng.randint(0, 30)},
+        )
+        for i in range(ctx.batch_size)
+    ]
+    points = []
+    for i in range(ctx.batch_size):
+        value = rng.gauss(100.0, 5.0)
+        if i % 97 == 0:
+            value *= 3  # inject an outlier now and then
+        points.append({"value": value, "latency": rng.expovariate(1 / 20)})
+    ctx.extra["stream_points"] = points
+
+
+async def run_case(
+    name: str,
+    case: Callable[[BenchmarkContext], Awaitable[None]],
+    ctx: BenchmarkContext,
+    repeat: int,
+) -> CaseResult:
+    """Run ``case`` once to warm up, then ``repeat`` timed iterations."""
+    try:
+        await case(ctx)
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            await case(ctx)
+            timings.append((time.perf_counter() - start) * 1000)
+    except Exception as e:  # a broken case must not hide the others
+        return CaseResult(name=name, repeat=repeat, error=f"{type(e).__name__}: {e}")
+
+    timings.sort()
+    p95_index = min(len(timings) - 1, round(0.95 * (len(timings) - 1)))
+    return CaseResult(
+        name=name,
+        repeat=repeat,
+        median_ms=round(statistics.median(timings), 3),
+        p95_ms=round(timings[p95_index], 3),
+        min_ms=round(timings[0], 3),
+    )
+
+
+async def run_suite(
+    fleet: Fleet,
+    config: FleetConfig,
+    *,
+    repeat: int = 5,
+    batch_size: int = 1000,
+    cases: list[str] | None = None,
+) -> list[CaseResult]:
+    """Time the selected cases against a seeded fleet."""
+    ctx = BenchmarkContext(fleet=fleet, config=config, batch_size=batch_size)
+    _prepare_inputs(ctx)
+    results = []
+    for name in cases or list(CASES):
+        results.append(await run_case(name, CASES[name], ctx, repeat))
+    return results
+
+
+def compare(
+    results: list[CaseResult],
+    baseline: dict[str, Any],
+    max_regression: float,
+) -> list[Comparison]:
+    """Compare median timings with a baseline results document.
+
+    Cases missing from either side, or that errored on either side, are
+    skipped so a new case does not fail the first run that adds it.
+    """
+    previous = {
+        case["name"]: case
+        for case in baseline.get("results", [])
+        if not case.get("error") and case.get("median_ms")
+    }
+    comparisons = []
+    for result in results:
+        base = previous.get(result.name)
+        if result.error or base is None:
+            continue
+        baseline_ms = base["median_ms"]
+        regressed = (
+            result.median_ms > baseline_ms * (1 + max_regression)
+            and result.median_ms - baseline_ms > MIN_REGRESSION_DELTA_MS
+        )
+        comparisons.append(Comparison(result.name, baseline_ms, result.median_ms, regressed))
+    return comparisons
+
+
+def results_document(
+    results: list[CaseResult],
+    config: FleetConfig,
+    fleet: Fleet,
+    *,
+    batch_size: int,
+) -> dict[str, Any]:
+    """Machine-readable results, the format ``--baseline`` reads back."""
+    from truthound_dashboard.time import utc_now
+
+    return {
+        "version": RESULTS_VERSION,
+        "created_at": utc_now().isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "fleet": {
+            **asdict(config),
+            "lineage_nodes": fleet.lineage_nodes,
+            "lineage_edges": fleet.lineage_edges,
+        },
+        "batch_size": batch_size,
+        "results": [asdict(result) for result in results],
+    }
+
+
+def print_report(results: list[CaseResult], comparisons: list[Comparison]) -> None:
+    by_name = {c.name: c for c in comparisons}
+    print(f"\n{'Case':<22} {'median ms':>10} {'p95 ms':>10} {'baseline':>10} {'change':>8}")
+    print("-" * 64)
+    for result in results:
+        if result.error:
+            print(f"{result.name:<22} ERROR {result.error}")
+            continue
+        line = f"{result.name:<22} {result.median_ms:>10.2f} {result.p95_ms:>10.2f}"
+        comparison = by_name.get(result.name)
+        if comparison is not None:
+            flag = "  REGRESSED" if comparison.regressed else ""
+            line += f" {comparison.baseline_ms:>10.2f} {comparison.change:>+7.0%}{flag}"
+        print(line)
+
+
+async def main() -> int:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Dashboard hot-path benchmark suite")
+    parser.add_argument("--sources", type=int, default=200, help="Sources (default: 200)")
+    parser.add_argument(
+        "--validations",
+        type=int,
+        default=25,
+        help="Validations per source (default: 25)",
+    )
+    parser.add_argument("--incidents", type=int, default=200, help="Incidents (default: 200)")
+    parser.add_argument(
+        "--notification-logs",
+        type=int,
+        default=2000,
+        help="Notification log rows (default: 2000)",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="Timed iterations per case (default: 5)",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=1000,
+        help="Items per iteration for the batch cases (default: 1000)",
+    )
+    parser.add_argument(
+        "--case",
+        action="append",
+        choices=sorted(CASES),
+        help="Run only this case (repeatable)",
+    )
+    parser.add_argument("--output", type=Path, help="Write JSON results to this file")
+    parser.add_argument("--baseline", type=Path, help="JSON results to compare against")
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        default=0.5,
+        help="Allowed median slowdown vs. baseline, as a fraction (default: 0.5)",
+    )
+    parser.add_argument(
+        "--log-level",
+        default="WARNING",
+        help="Dashboard log level while benchmarking (default: WARNING)",
+    )
+    args = parser.parse_args()
+    logging.basicConfig(level=args.log_level)
+
+    config = FleetConfig(
+        sources=args.sources,
+        validations=args.validations,
+        incidents=args.incidents,
+        notification_logs=args.notification_logs,
+    )
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        os.environ["TRUTHOUND_DATA_DIR"] = data_dir
+
+        from truthound_dashboard.db import init_db
+        from truthound_dashboard.db.database import get_engine, get_session
+
+        await init_db()
+        start = time.perf_counter()
+        async with get_session() as session:
+            fleet = await seed_fleet(session, config)
+        print(
+            f"Seeded {config.sources} sources x {config.validations} validations, "
+            f"{fleet.lineage_nodes} lineage nodes in {time.perf_counter() - start:.1f}s"
+        )
+
+        results = await run_suite(
+            fleet, config, repeat=args.repeat, batch_size=args.batch_size, cases=args.case
+        )
+        await get_engine().dispose()
+
+    document = results_document(results, config, fleet, batch_size=args.batch_size)
+    if args.output:
+        args.output.write_text(json.dumps(document, indent=2) + "\n", encoding="utf-8")
+
+    comparisons: list[Comparison] = []
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        if baseline.get("fleet") != document["fleet"]:
+            print("Warning: baseline was seeded with a different fleet; timings may not compare")
+        comparisons = compare(results, baseline, args.max_regression)
+
+    print_report(results, comparisons)
+
+    regressed = [c.name for c in comparisons if c.regressed]
+    if regressed:
+        print(f"\nRegressed beyond {args.max_regression:.0%}: {', '.join(regressed)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
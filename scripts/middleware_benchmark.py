@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""In-process middleware throughput benchmark for truthound-dashboard.
+
+Compares requests/second through the pure-ASGI ``MiddlewarePipeline``
+against the previous layout of one ``BaseHTTPMiddleware`` per concern.
+Both apps run the same stages (logging, security headers, rate limiting)
+and the same routes; requests go through ``httpx.ASGITransport`` so the
+numbers measure the framework stack rather than the network.
+
+Usage:
+    python scripts/middleware_benchmark.py
+    python scripts/middleware_benchmark.py --requests 5000 --concurrency 32
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import os
+import tempfile
+import time
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+from fastapi import FastAPI, Request, Response
+from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+
+from truthound_dashboard.api.middleware import (
+    ASGIMiddleware,
+    MiddlewarePipeline,
+    RateLimitConfig,
+    RateLimitMiddleware,
+    RequestContext,
+    RequestLoggingMiddleware,
+    SecurityHeadersMiddleware,
+)
+
+ENDPOINTS = ["/api/v1/health", "/api/v1/sources"]
+
+
+class LegacyLayer(BaseHTTPMiddleware):
+    """Runs one stage the way the old ``BaseHTTPMiddleware`` classes did."""
+
+    def __init__(self, app: Any, stage: ASGIMiddleware) -> None:
+        super().__init__(app)
+        self._stage = stage
+
+    async def dispatch(
+        self,
+        request: Request,
+        call_next: RequestResponseEndpoint,
+    ) -> Response:
+        ctx = RequestContext(request.scope)
+        response = self._stage.on_request(ctx)
+        try:
+            if response is None:
+                response = await call_next(request)
+        except BaseException as e:
+            self._stage.on_complete(ctx, e)
+            raise
+        for name, value in ctx.response_headers:
+            response.headers[name] = value
+        ctx.status_code = response.status_code
+        self._stage.on_complete(ctx, None)
+        return response
+
+
+@dataclass
+class BenchmarkResult:
+    """Throughput for one app layout and endpoint.
+
+    Attributes:
+        layout: Middleware layout name.
+        path: Request path.
+        requests: Number of requests sent.
+        seconds: Wall-clock duration.
+    """
+
+    layout: str
+    path: str
+    requests: int
+    seconds: float
+
+    @property
+    def requests_per_second(self) -> float:
+        return self.requests / self.seconds if self.seconds else 0.0
+
+
+def _stages() -> list[ASGIMiddleware]:
+    # A limit high enough that the benchmark never trips it.
+    config = RateLimitConfig(requests_per_minute=10_000_000)
+    return [
+        RequestLoggingMiddleware(),
+        SecurityHeadersMiddleware(),
+        RateLimitMiddleware(config=config),
+    ]
+
+
+def build_app(layout: str) -> FastAPI:
+    """Build the dashboard API with the given middleware layout."""
+    from truthound_dashboard.api.error_handlers import setup_error_handlers
+    from truthound_dashboard.api.router import api_router
+
+    app = FastAPI()
+    if layout == "pipeline":
+        app.add_middleware(MiddlewarePipeline, stages=_stages())
+    else:
+        # add_middleware prepends, so add innermost first.
+        for stage in reversed(_stages()):
+            app.add_middleware(LegacyLayer, stage=stage)
+    setup_error_handlers(app)
+    app.include_router(api_router, prefix="/api/v1")
+    return app
+
+
+async def run_endpoint(
+    app: FastAPI,
+    layout: str,
+    path: str,
+    num_requests: int,
+    concurrency: int,
+) -> BenchmarkResult:
+    """Send ``num_requests`` GETs to ``path`` and time them."""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        # Warm up routing, DB connections and caches.
+        for _ in range(20):
+            (await client.get(path)).raise_for_status()
+
+        remaining = iter(range(num_requests))
+
+        async def worker() -> None:
+            for _ in remaining:
+                (await client.get(path)).raise_for_status()
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        seconds = time.perf_counter() - start
+
+    return BenchmarkResult(layout, path, num_requests, seconds)
+
+
+async def main() -> None:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Middleware throughput benchmark")
+    parser.add_argument(
+        "--requests",
+        type=int,
+        default=300,
+        help="Requests per endpoint and layout (default: 300)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=16,
+        help="Concurrent in-flight requests (default: 16)",
+    )
+    parser.add_argument(
+        "--log-level",
+        default="WARNING",
+        help="Dashboard log level while benchmarking (default: WARNING)",
+    )
+    args = parser.parse_args()
+    logging.basicConfig(level=args.log_level)
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        os.environ["TRUTHOUND_DATA_DIR"] = data_dir
+
+        from truthound_dashboard.core.control_plane import ControlPlaneService
+        from truthound_dashboard.db import init_db
+        from truthound_dashboard.db.database import get_session
+
+        await init_db()
+        # Seed the default workspace, roles and user so list endpoints
+        # authorize on the first request.
+        async with get_session() as session:
+            await ControlPlaneService(session).ensure_bootstrap_state()
+
+        results = []
+        for layout in ("base_http", "pipeline"):
+            app = build_app(layout)
+            for path in ENDPOINTS:
+                results.append(
+                    await run_endpoint(
+                        app, layout, path, args.requests, args.concurrency
+                    )
+                )
+
+        from truthound_dashboard.db.database import get_engine
+
+        await get_engine().dispose()
+
+    print(f"\n{'Layout':<12} {'Endpoint':<20} {'req/s':>10}")
+    print("-" * 44)
+    for result in results:
+        print(
+            f"{result.layout:<12} {result.path:<20} "
+            f"{result.requests_per_second:>10.0f}"
+        )
+
+    print()
+    for path in ENDPOINTS:
+        before, after = (r for r in results if r.path == path)
+        gain = after.requests_per_second / before.requests_per_second
+        print(f"{path}: {gain:.2f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
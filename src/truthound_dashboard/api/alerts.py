@@ -12,6 +12,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ..core.incidents import encode_incident_cursor
 from ..core.unified_alerts import UnifiedAlertsService
 from ..db import SavedView, get_db_session
 from ..schemas.unified_alerts import (
@@ -77,6 +78,9 @@ async def list_alerts(
     queue_id: str | None = Query(None, description="Filter by queue ID"),
     assignee_user_id: str | None = Query(None, description="Filter by assignee user ID"),
     search: str | None = Query(None, description="Text search across title/source"),
+    cursor: str | None = Query(
+        None, description="Keyset cursor from a previous page (overrides offset)"
+    ),
     offset: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=200),
     service: UnifiedAlertsService = Depends(get_service),
@@ -87,22 +91,34 @@ async def list_alerts(
         workspace_id=workspace_id or context.workspace.id,
         saved_view_id=saved_view_id,
     )
-    alerts = await service.list_incidents(
-        workspace_id=workspace_id or context.workspace.id,
-        source=source or saved_filters.get("source"),
-        severity=severity or saved_filters.get("severity"),
-        status=status or saved_filters.get("status"),
-        queue_id=queue_id or saved_filters.get("queue_id"),
-        assignee_user_id=assignee_user_id or saved_filters.get("assignee_user_id"),
-        search=search or saved_filters.get("search"),
-    )
-    total = len(alerts)
+    filters = {
+        "workspace_id": workspace_id or context.workspace.id,
+        "source": source or saved_filters.get("source"),
+        "severity": severity or saved_filters.get("severity"),
+        "status": status or saved_filters.get("status"),
+        "queue_id": queue_id or saved_filters.get("queue_id"),
+        "assignee_user_id": assignee_user_id or saved_filters.get("assignee_user_id"),
+        "search": search or saved_filters.get("search"),
+    }
+    try:
+        alerts = await service.list_incidents(
+            **filters, limit=limit + 1, offset=offset, cursor=cursor
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    total = await service.count_incidents(**filters)
+
+    next_cursor = None
+    if len(alerts) > limit:
+        alerts = alerts[:limit]
+        next_cursor = encode_incident_cursor(alerts[-1])
 
     return UnifiedAlertListResponse(
-        items=alerts[offset : offset + limit],
+        items=alerts,
         total=total,
-        offset=offset,
+        offset=0 if cursor else offset,
         limit=limit,
+        next_cursor=next_cursor,
     )
 
 
@@ -126,13 +142,13 @@ async def get_alert_count(
     service: UnifiedAlertsService = Depends(get_service),
 ) -> AlertCountResponse:
     """Get quick alert count."""
-    alerts = await service.list_incidents(
+    count = await service.count_incidents(
         workspace_id=context.workspace.id,
         status=status,
     )
 
     return AlertCountResponse(
-        count=len(alerts),
+        count=count,
         status_filter=status.value if status else "all",
     )
 
@@ -7,10 +7,14 @@ from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from fastapi import Path as ApiPath
-from fastapi.responses import FileResponse, RedirectResponse
+from fastapi.responses import FileResponse, RedirectResponse, StreamingResponse
 
 from truthound_dashboard.core.control_plane import ControlPlaneContext
-from truthound_dashboard.core.reporters import ReportTheme, get_available_formats
+from truthound_dashboard.core.reporters import (
+    ReportTheme,
+    get_available_formats,
+    stream_report,
+)
 from truthound_dashboard.core.reporters.registry import get_report_locales
 from truthound_dashboard.db import ArtifactRecord
 from truthound_dashboard.schemas.artifacts import (
@@ -176,7 +180,9 @@ async def generate_report_artifact(
     validation_service: ValidationServiceDep,
     context: ControlPlaneContext = Depends(require_permission("artifacts:write")),
 ) -> ArtifactResponse:
-    validation = await validation_service.get_validation(validation_id, with_source=True)
+    validation = await validation_service.get_validation(
+        validation_id, with_source=True, workspace_id=context.workspace.id
+    )
     if validation is None:
         raise HTTPException(status_code=404, detail="Validation not found")
     artifact = await service.generate_report_artifact(
@@ -193,6 +199,39 @@ async def generate_report_artifact(
     return _artifact_response(artifact)
 
 
+@router.post("/validations/{validation_id}/report/stream")
+async def stream_validation_report(
+    validation_id: Annotated[str, ApiPath()],
+    payload: ArtifactGenerateRequest,
+    validation_service: ValidationServiceDep,
+    context: ControlPlaneContext = Depends(require_permission("artifacts:read")),
+) -> StreamingResponse:
+    """Render a report straight into the response without storing an artifact."""
+    validation = await validation_service.get_validation(
+        validation_id, with_source=True, workspace_id=context.workspace.id
+    )
+    if validation is None:
+        raise HTTPException(status_code=404, detail="Validation not found")
+    try:
+        report = stream_report(
+            validation,
+            format=payload.format,
+            theme=payload.theme or "professional",
+            locale=payload.locale,
+            title=payload.title,
+            include_samples=payload.include_samples,
+            include_statistics=payload.include_statistics,
+            custom_metadata=payload.custom_metadata,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    return StreamingResponse(
+        report.chunks,
+        media_type=report.content_type,
+        headers={"Content-Disposition": f'attachment; filename="{report.filename}"'},
+    )
+
+
 @router.post("/validations/{validation_id}/datadocs", response_model=ArtifactResponse, status_code=201)
 async def generate_datadocs_artifact(
     validation_id: Annotated[str, ApiPath()],
@@ -201,7 +240,9 @@ async def generate_datadocs_artifact(
     validation_service: ValidationServiceDep,
     context: ControlPlaneContext = Depends(require_permission("artifacts:write")),
 ) -> ArtifactResponse:
-    validation = await validation_service.get_validation(validation_id, with_source=True)
+    validation = await validation_service.get_validation(
+        validation_id, with_source=True, workspace_id=context.workspace.id
+    )
     if validation is None:
         raise HTTPException(status_code=404, detail="Validation not found")
     artifact = await service.generate_datadocs_artifact(
@@ -126,14 +126,9 @@ def require_permission(permission_key: str):
 
     async def _require_permission(
         context: Annotated[ControlPlaneContext, Depends(get_control_plane_context)],
-        authz: Annotated[AuthorizationService, Depends(get_authorization_service)],
     ) -> ControlPlaneContext:
-        allowed = await authz.has_permission(
-            user_id=context.user.id,
-            workspace_id=context.workspace.id,
-            permission_key=permission_key,
-        )
-        if not allowed:
+        # The context already carries the membership's permission keys.
+        if permission_key not in context.permission_keys:
             raise HTTPException(status_code=403, detail=f"Missing permission: {permission_key}")
         return context
 
@@ -16,6 +16,7 @@ Endpoints:
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any
 
@@ -23,6 +24,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from truthound_dashboard.api.deps import get_session
+from truthound_dashboard.core.datasource_factory import SourceType
 from truthound_dashboard.core.enterprise_sampling import (
     QUALITY_PRESETS,
     SCALE_STRATEGY_MAP,
@@ -31,6 +33,8 @@ from truthound_dashboard.core.enterprise_sampling import (
     get_sample_size_estimator,
     get_sketch_estimator,
 )
+from truthound_dashboard.core.result_cache import fingerprint_file
+from truthound_dashboard.core.sketches import resolve_partition_path
 from sqlalchemy import select
 from truthound_dashboard.db import Source
 from truthound_dashboard.schemas.enterprise_sampling import (
@@ -172,7 +176,7 @@ async def run_enterprise_sampling(
         import polars as pl
 
         # Load data
-        data_path = source.path
+        data_path = source.source_path or ""
         if data_path.endswith(".csv"):
             lf = pl.scan_csv(data_path)
         elif data_path.endswith(".parquet"):
@@ -205,6 +209,7 @@ async def run_enterprise_sampling(
             data=lf,
             row_count=row_count,
             column_count=column_count,
+            source_path=data_path,
         )
 
         return response
@@ -254,6 +259,10 @@ async def estimate_sample_size(
     - **Bloom Filter**: Membership testing
 
     Ideal for datasets exceeding 10B rows where exact computation is impractical.
+
+    Sketches are stored per source and column. Repeating a request for
+    unchanged data is answered from the stored sketch without a scan, and
+    `partition_path` merges a new partition into the stored sketches.
     """,
 )
 async def run_sketch_estimation(
@@ -273,12 +282,28 @@ async def run_sketch_estimation(
     try:
         import polars as pl
 
-        # Load data
-        data_path = source.path
+        # Load data; a partition path is scanned instead of the whole source
+        data_path = source.source_path
+        if not data_path or not SourceType.is_file_type(source.type):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Sketch estimation requires a file-based source",
+            )
+        if request.partition_path is not None:
+            try:
+                data_path = str(
+                    resolve_partition_path(data_path, request.partition_path)
+                )
+            except ValueError as e:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)
+                ) from e
         if data_path.endswith(".csv"):
             lf = pl.scan_csv(data_path)
         elif data_path.endswith(".parquet"):
             lf = pl.scan_parquet(data_path)
+        elif data_path.endswith(".jsonl") or data_path.endswith(".ndjson"):
+            lf = pl.scan_ndjson(data_path)
         else:
             lf = pl.read_csv(data_path).lazy()
 
@@ -291,9 +316,17 @@ async def run_sketch_estimation(
                     detail=f"Column not found: {col}",
                 )
 
+        # Fingerprint the scanned file so stored sketches can be reused
+        fingerprint = await asyncio.to_thread(fingerprint_file, data_path)
+
         # Run sketch estimation
         estimator = get_sketch_estimator()
-        response = await estimator.estimate(request, lf)
+        response = await estimator.estimate(
+            request,
+            lf,
+            partition_key=fingerprint.digest if fingerprint else None,
+            incremental=request.partition_path is not None,
+        )
 
         return response
 
@@ -6,36 +6,52 @@ This module provides extensible middleware components for:
 - Request/response logging
 - Authentication (optional)
 
-The middleware uses the Chain of Responsibility pattern for
-flexible composition.
+Every middleware is a pure ASGI stage: it inspects the request before the
+endpoint runs and contributes response headers when the response starts,
+without buffering bodies or spawning tasks the way ``BaseHTTPMiddleware``
+does. Streaming responses therefore pass through untouched. Stages can be
+added individually, or composed into a single ``MiddlewarePipeline`` so a
+request crosses one ASGI layer no matter how many stages are enabled.
 
 Example:
     from truthound_dashboard.api.middleware import (
+        MiddlewarePipeline,
         RateLimitMiddleware,
         SecurityHeadersMiddleware,
         RequestLoggingMiddleware,
     )
 
-    app.add_middleware(SecurityHeadersMiddleware)
-    app.add_middleware(RateLimitMiddleware, requests_per_minute=120)
-    app.add_middleware(RequestLoggingMiddleware)
+    app.add_middleware(
+        MiddlewarePipeline,
+        stages=[
+            RequestLoggingMiddleware(),
+            SecurityHeadersMiddleware(),
+            RateLimitMiddleware(config=RateLimitConfig(requests_per_minute=120)),
+        ],
+    )
 """
 
 from __future__ import annotations
 
 import asyncio
-import hashlib
+import base64
+import itertools
 import logging
+import os
+import sqlite3
+import threading
 import time
 from abc import ABC, abstractmethod
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
+from collections.abc import Sequence
 from dataclasses import dataclass, field
-from datetime import datetime
-from typing import Any, Callable
+from pathlib import Path
+from typing import Any
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.responses import JSONResponse
+from starlette.datastructures import MutableHeaders
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from truthound_dashboard.core.exceptions import ErrorCode
 from truthound_dashboard.core.i18n import SupportedLocale, detect_locale
@@ -43,12 +59,173 @@ from truthound_dashboard.core.i18n import SupportedLocale, detect_locale
 logger = logging.getLogger(__name__)
 
 
+# =============================================================================
+# ASGI Pipeline
+# =============================================================================
+
+
+class RequestContext:
+    """Per-request state shared by the stages of a pipeline.
+
+    Attributes:
+        request: Starlette request view over the ASGI scope. Headers and
+            query parameters are parsed lazily on first access.
+        response_headers: Headers contributed by stages, applied when the
+            response starts (later entries are set first, so outer stages
+            win on conflicts just like nested middleware).
+        status_code: Response status once the response has started.
+        request_id: Request ID assigned by the logging stage, if any.
+        started_at: ``perf_counter`` timestamp set by the logging stage.
+    """
+
+    __slots__ = ("request", "response_headers", "status_code", "request_id", "started_at")
+
+    def __init__(self, scope: Scope) -> None:
+        self.request = Request(scope)
+        self.response_headers: list[tuple[str, str]] = []
+        self.status_code: int | None = None
+        self.request_id: str | None = None
+        self.started_at: float | None = None
+
+    @property
+    def path(self) -> str:
+        """Request path."""
+        return self.request.scope["path"]
+
+    @property
+    def client_ip(self) -> str:
+        """Client host, or ``"unknown"`` when the server does not report it."""
+        client = self.request.scope.get("client")
+        return client[0] if client else "unknown"
+
+
+class ASGIMiddleware:
+    """Base class for pure ASGI middleware stages.
+
+    Subclasses override ``on_request`` to reject requests or queue response
+    headers, and ``on_complete`` to observe the outcome. Stages whose request
+    hook blocks (e.g. on a database) set ``async_request`` and override
+    ``on_request_async`` instead, so the pipeline awaits them rather than
+    stalling the event loop. Instances work as
+    standalone ASGI middleware (``app.add_middleware(Stage, ...)``) or as a
+    stage of a ``MiddlewarePipeline``, in which case ``app`` is omitted.
+    """
+
+    async_request = False
+
+    def __init__(self, app: ASGIApp | None = None) -> None:
+        """Initialize the stage.
+
+        Args:
+            app: Wrapped ASGI application when used standalone.
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Run this stage around the wrapped application."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        await run_stages((self,), self.app, scope, receive, send)
+
+    def on_request(self, ctx: RequestContext) -> Response | None:
+        """Inspect the request before the endpoint runs.
+
+        Returns:
+            A response to send instead of calling the endpoint, or None.
+        """
+        return None
+
+    async def on_request_async(self, ctx: RequestContext) -> Response | None:
+        """Awaited instead of ``on_request`` when ``async_request`` is set."""
+        return self.on_request(ctx)
+
+    def on_complete(self, ctx: RequestContext, error: BaseException | None) -> None:
+        """Observe the finished request (``error`` is set if it raised)."""
+
+
+class MiddlewarePipeline:
+    """Single ASGI middleware that runs several stages in one pass.
+
+    Stages run ``on_request`` in order (the first stage is the outermost)
+    and ``on_complete`` in reverse. A stage that returns a response stops
+    the chain; headers queued by the stages before it still apply.
+    """
+
+    def __init__(self, app: ASGIApp, stages: Sequence[ASGIMiddleware]) -> None:
+        """Initialize the pipeline.
+
+        Args:
+            app: ASGI application.
+            stages: Middleware stages, outermost first.
+        """
+        self.app = app
+        self.stages = tuple(stages)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Run all stages around the wrapped application."""
+        if scope["type"] != "http" or not self.stages:
+            await self.app(scope, receive, send)
+            return
+        await run_stages(self.stages, self.app, scope, receive, send)
+
+
+async def run_stages(
+    stages: Sequence[ASGIMiddleware],
+    app: ASGIApp,
+    scope: Scope,
+    receive: Receive,
+    send: Send,
+) -> None:
+    """Run middleware stages around an ASGI application for one request.
+
+    Args:
+        stages: Stages to run, outermost first.
+        app: Wrapped ASGI application.
+        scope: HTTP connection scope.
+        receive: ASGI receive callable.
+        send: ASGI send callable.
+    """
+    ctx = RequestContext(scope)
+    entered = 0
+    response: Response | None = None
+    for stage in stages:
+        entered += 1
+        if stage.async_request:
+            response = await stage.on_request_async(ctx)
+        else:
+            response = stage.on_request(ctx)
+        if response is not None:
+            break
+
+    async def send_with_headers(message: Message) -> None:
+        if message["type"] == "http.response.start":
+            ctx.status_code = message["status"]
+            if ctx.response_headers:
+                headers = MutableHeaders(scope=message)
+                for name, value in reversed(ctx.response_headers):
+                    headers[name] = value
+        await send(message)
+
+    try:
+        if response is not None:
+            await response(scope, receive, send_with_headers)
+        else:
+            await app(scope, receive, send_with_headers)
+    except BaseException as e:
+        for stage in reversed(stages[:entered]):
+            stage.on_complete(ctx, e)
+        raise
+    for stage in reversed(stages[:entered]):
+        stage.on_complete(ctx, None)
+
+
 # =============================================================================
 # Locale Detection
 # =============================================================================
 
 
-class LocaleDetectionMiddleware(BaseHTTPMiddleware):
+class LocaleDetectionMiddleware(ASGIMiddleware):
     """Middleware to detect and set user locale from request.
 
     Detection priority:
@@ -67,7 +244,7 @@ class LocaleDetectionMiddleware(BaseHTTPMiddleware):
 
     def __init__(
         self,
-        app: Any,
+        app: ASGIApp | None = None,
         default_locale: SupportedLocale = SupportedLocale.ENGLISH,
     ) -> None:
         """Initialize locale detection middleware.
@@ -79,25 +256,12 @@ class LocaleDetectionMiddleware(BaseHTTPMiddleware):
         super().__init__(app)
         self._default_locale = default_locale
 
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: RequestResponseEndpoint,
-    ) -> Response:
-        """Detect locale and store in request state."""
-        # Detect locale from request
-        locale = detect_locale(request, default=self._default_locale)
-
-        # Store in request state
-        request.state.locale = locale
-
-        # Process request
-        response = await call_next(request)
-
-        # Add Content-Language header
-        response.headers["Content-Language"] = locale.value
-
-        return response
+    def on_request(self, ctx: RequestContext) -> Response | None:
+        """Detect locale, store it in request state and echo it back."""
+        locale = detect_locale(ctx.request, default=self._default_locale)
+        ctx.request.state.locale = locale
+        ctx.response_headers.append(("Content-Language", locale.value))
+        return None
 
 
 # =============================================================================
@@ -115,6 +279,7 @@ class RateLimitConfig:
         by_ip: Rate limit by IP address.
         by_path: Rate limit by path (in addition to IP).
         exclude_paths: Paths to exclude from rate limiting.
+        max_keys: Maximum keys tracked by the in-memory limiter.
     """
 
     requests_per_minute: int = 60
@@ -122,10 +287,17 @@ class RateLimitConfig:
     by_ip: bool = True
     by_path: bool = False
     exclude_paths: list[str] = field(default_factory=lambda: ["/health", "/docs"])
+    max_keys: int = 10_000
 
 
 class RateLimitStrategy(ABC):
-    """Abstract base class for rate limiting strategies."""
+    """Abstract base class for rate limiting strategies.
+
+    Strategies that do blocking I/O in ``is_allowed`` set ``blocking`` so
+    the middleware calls them from a worker thread.
+    """
+
+    blocking = False
 
     @abstractmethod
     def is_allowed(self, key: str) -> tuple[bool, dict[str, Any]]:
@@ -146,68 +318,242 @@ class RateLimitStrategy(ABC):
 
 
 class SlidingWindowRateLimiter(RateLimitStrategy):
-    """Sliding window rate limiter.
-
-    Tracks requests in a sliding time window for smooth rate limiting.
+    """Sliding window counter rate limiter.
+
+    Keeps two fixed-window counters per key (current and previous) and
+    weights the previous one by how much of it still overlaps the sliding
+    window. That approximates a true sliding log in O(1) time and memory
+    per key. Keys live in an LRU table capped at ``max_keys``, so a flood
+    of distinct clients evicts the least recently seen ones instead of
+    growing without bound.
     """
 
     def __init__(
         self,
         requests_per_minute: int = 60,
         window_seconds: int = 60,
+        max_keys: int = 10_000,
     ) -> None:
         """Initialize rate limiter.
 
         Args:
             requests_per_minute: Maximum requests per window.
             window_seconds: Window size in seconds.
+            max_keys: Maximum number of tracked keys.
         """
         self._requests_per_minute = requests_per_minute
         self._window_seconds = window_seconds
-        self._requests: dict[str, list[float]] = defaultdict(list)
-        self._lock = asyncio.Lock()
+        self._max_keys = max_keys
+        # key -> [window index, current count, previous count]
+        self._counters: OrderedDict[str, list[int]] = OrderedDict()
 
     def is_allowed(self, key: str) -> tuple[bool, dict[str, Any]]:
-        """Check if request is allowed using sliding window."""
+        """Check if request is allowed using the weighted two-bucket window."""
         now = time.time()
-        window_start = now - self._window_seconds
+        window = int(now // self._window_seconds)
+
+        entry = self._counters.get(key)
+        if entry is None:
+            entry = [window, 0, 0]
+            self._counters[key] = entry
+            if len(self._counters) > self._max_keys:
+                self._counters.popitem(last=False)
+        else:
+            self._counters.move_to_end(key)
+            _roll_window(entry, window)
 
-        # Clean old requests
-        self._requests[key] = [
-            t for t in self._requests[key] if t > window_start
-        ]
+        allowed, info = self._evaluate(now, window, entry[1], entry[2])
+        if allowed:
+            entry[1] += 1
+        return allowed, info
 
-        current_count = len(self._requests[key])
-        remaining = max(0, self._requests_per_minute - current_count)
-        reset_at = int(now + self._window_seconds)
+    def cleanup(self) -> None:
+        """Remove keys with no requests in the current or previous window."""
+        window = int(time.time() // self._window_seconds)
+        for key in [k for k, (w, _, _) in self._counters.items() if w < window - 1]:
+            del self._counters[key]
 
-        info = {
+    def __len__(self) -> int:
+        return len(self._counters)
+
+    def _evaluate(
+        self,
+        now: float,
+        window: int,
+        current: int,
+        previous: int,
+    ) -> tuple[bool, dict[str, Any]]:
+        """Decide a request from the two bucket counts."""
+        elapsed = (now - window * self._window_seconds) / self._window_seconds
+        estimated = previous * (1.0 - elapsed) + current
+        allowed = estimated < self._requests_per_minute
+        remaining = int(self._requests_per_minute - estimated) - (1 if allowed else 0)
+        return allowed, {
             "limit": self._requests_per_minute,
-            "remaining": remaining,
-            "reset_at": reset_at,
+            "remaining": max(0, remaining),
+            "reset_at": (window + 1) * self._window_seconds,
         }
 
-        if current_count >= self._requests_per_minute:
-            return False, info
 
-        # Record request
-        self._requests[key].append(now)
-        info["remaining"] = remaining - 1
+def _roll_window(entry: list[int], window: int) -> None:
+    """Advance a ``[window, current, previous]`` counter to ``window``."""
+    if entry[0] == window:
+        return
+    entry[2] = entry[1] if entry[0] == window - 1 else 0
+    entry[1] = 0
+    entry[0] = window
 
-        return True, info
 
-    def cleanup(self) -> None:
-        """Remove entries with no recent requests."""
+class SQLiteRateLimiter(SlidingWindowRateLimiter):
+    """Sliding window counter limiter backed by a shared SQLite file.
+
+    Every uvicorn worker pointing at the same file enforces one limit.
+    Each check is a single short ``BEGIN IMMEDIATE`` transaction on a
+    WAL-mode database kept separate from the dashboard database, so it
+    never contends with application writes. Checks block, so the middleware
+    runs them in a worker thread.
+
+    Expired keys are pruned inside the check transaction whenever the window
+    advances or a new key is added; the same pass trims the table to
+    ``max_keys``, dropping the keys seen least recently.
+    """
+
+    blocking = True
+
+    def __init__(
+        self,
+        path: str | Path,
+        requests_per_minute: int = 60,
+        window_seconds: int = 60,
+        max_keys: int = 10_000,
+    ) -> None:
+        """Initialize the shared rate limiter.
+
+        Args:
+            path: SQLite file shared by all workers.
+            requests_per_minute: Maximum requests per window.
+            window_seconds: Window size in seconds.
+            max_keys: Maximum number of tracked keys.
+        """
+        super().__init__(requests_per_minute, window_seconds, max_keys)
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            str(path), isolation_level=None, check_same_thread=False, timeout=1.0
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS rate_limit_windows ("
+            "key TEXT PRIMARY KEY, window INTEGER NOT NULL, "
+            "current INTEGER NOT NULL, previous INTEGER NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS ix_rate_limit_windows_window "
+            "ON rate_limit_windows (window)"
+        )
+        self._lock = threading.Lock()
+        self._pruned_window = -1
+
+    def is_allowed(self, key: str) -> tuple[bool, dict[str, Any]]:
+        """Check and record the request atomically across workers."""
         now = time.time()
-        window_start = now - self._window_seconds
+        window = int(now // self._window_seconds)
+
+        with self._lock:
+            try:
+                self._conn.execute("BEGIN IMMEDIATE")
+            except sqlite3.OperationalError:
+                # Store is locked past the timeout: fail open.
+                logger.warning("Rate limit store busy; allowing request for %s", key)
+                return True, {
+                    "limit": self._requests_per_minute,
+                    "remaining": self._requests_per_minute,
+                    "reset_at": (window + 1) * self._window_seconds,
+                }
+            try:
+                row = self._conn.execute(
+                    "SELECT window, current, previous FROM rate_limit_windows WHERE key = ?",
+                    (key,),
+                ).fetchone()
+                entry = list(row) if row else [window, 0, 0]
+                _roll_window(entry, window)
+                allowed, info = self._evaluate(now, window, entry[1], entry[2])
+                if allowed:
+                    entry[1] += 1
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO rate_limit_windows "
+                    "(key, window, current, previous) VALUES (?, ?, ?, ?)",
+                    (key, *entry),
+                )
+                if row is None or window != self._pruned_window:
+                    self._prune(window)
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return allowed, info
 
-        keys_to_remove = []
-        for key, timestamps in self._requests.items():
-            if all(t <= window_start for t in timestamps):
-                keys_to_remove.append(key)
+    def cleanup(self) -> None:
+        """Remove keys with no requests in the current or previous window."""
+        window = int(time.time() // self._window_seconds)
+        with self._lock:
+            self._prune(window)
+
+    def _prune(self, window: int) -> None:
+        """Drop expired keys, then the least recently seen beyond ``max_keys``."""
+        self._conn.execute("DELETE FROM rate_limit_windows WHERE window < ?", (window - 1,))
+        # INSERT OR REPLACE re-inserts a key on every check, so rowid order
+        # is least recently seen first.
+        self._conn.execute(
+            "DELETE FROM rate_limit_windows WHERE key IN ("
+            "SELECT key FROM rate_limit_windows ORDER BY rowid "
+            "LIMIT max(0, (SELECT COUNT(*) FROM rate_limit_windows) - ?))",
+            (self._max_keys,),
+        )
+        self._pruned_window = window
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM rate_limit_windows").fetchone()[0]
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+        self._conn.close()
 
-        for key in keys_to_remove:
-            del self._requests[key]
+
+def create_rate_limit_strategy(
+    config: RateLimitConfig,
+    backend: str = "memory",
+    path: str | Path | None = None,
+) -> RateLimitStrategy:
+    """Build the sliding window limiter for a backend.
+
+    Args:
+        config: Rate limit configuration.
+        backend: ``"memory"`` for a per-process limiter, ``"sqlite"`` for one
+            shared by every worker using the same data directory.
+        path: SQLite file for the shared backend. Defaults to
+            ``<data_dir>/rate_limits.db``.
+
+    Returns:
+        Rate limiting strategy.
+    """
+    if backend == "sqlite":
+        if path is None:
+            from truthound_dashboard.config import get_settings
+
+            path = get_settings().data_dir / "rate_limits.db"
+        return SQLiteRateLimiter(
+            path,
+            requests_per_minute=config.requests_per_minute,
+            max_keys=config.max_keys,
+        )
+    if backend != "memory":
+        raise ValueError(f"Unknown rate limit backend: {backend}")
+    return SlidingWindowRateLimiter(
+        requests_per_minute=config.requests_per_minute,
+        max_keys=config.max_keys,
+    )
 
 
 class TokenBucketRateLimiter(RateLimitStrategy):
@@ -275,7 +621,7 @@ class TokenBucketRateLimiter(RateLimitStrategy):
             del self._buckets[key]
 
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
+class RateLimitMiddleware(ASGIMiddleware):
     """Rate limiting middleware with configurable strategies.
 
     Limits request rate by IP address and optionally by path.
@@ -283,7 +629,7 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
 
     def __init__(
         self,
-        app: Any,
+        app: ASGIApp | None = None,
         config: RateLimitConfig | None = None,
         strategy: RateLimitStrategy | None = None,
     ) -> None:
@@ -296,30 +642,40 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         """
         super().__init__(app)
         self._config = config or RateLimitConfig()
-        self._strategy = strategy or SlidingWindowRateLimiter(
-            requests_per_minute=self._config.requests_per_minute
-        )
+        self._exclude_paths = frozenset(self._config.exclude_paths)
+        self._strategy = strategy or create_rate_limit_strategy(self._config)
+        # Shared stores are queried off the event loop.
+        self.async_request = self._strategy.blocking
 
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: RequestResponseEndpoint,
-    ) -> Response:
-        """Process request through rate limiter."""
+    def on_request(self, ctx: RequestContext) -> Response | None:
+        """Check the rate limit and queue the X-RateLimit headers."""
         # Skip excluded paths
-        if request.url.path in self._config.exclude_paths:
-            return await call_next(request)
+        if ctx.path in self._exclude_paths:
+            return None
+
+        key = self._build_key(ctx)
+        return self._apply(ctx, key, *self._strategy.is_allowed(key))
 
-        # Build rate limit key
-        key = self._build_key(request)
+    async def on_request_async(self, ctx: RequestContext) -> Response | None:
+        """Check a blocking rate limit store from a worker thread."""
+        if ctx.path in self._exclude_paths:
+            return None
 
-        # Check rate limit
-        allowed, info = self._strategy.is_allowed(key)
+        key = self._build_key(ctx)
+        allowed, info = await asyncio.to_thread(self._strategy.is_allowed, key)
+        return self._apply(ctx, key, allowed, info)
 
+    def _apply(
+        self,
+        ctx: RequestContext,
+        key: str,
+        allowed: bool,
+        info: dict[str, Any],
+    ) -> Response | None:
+        """Reject over-limit requests or queue the X-RateLimit headers."""
         if not allowed:
             logger.warning(
-                f"Rate limit exceeded for {key}",
-                extra={"path": request.url.path},
+                "Rate limit exceeded for %s", key, extra={"path": ctx.path}
             )
             return JSONResponse(
                 status_code=429,
@@ -338,26 +694,22 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
                 },
             )
 
-        # Process request
-        response = await call_next(request)
-
-        # Add rate limit headers
-        response.headers["X-RateLimit-Limit"] = str(info["limit"])
-        response.headers["X-RateLimit-Remaining"] = str(info["remaining"])
-        response.headers["X-RateLimit-Reset"] = str(info["reset_at"])
-
-        return response
+        ctx.response_headers += (
+            ("X-RateLimit-Limit", str(info["limit"])),
+            ("X-RateLimit-Remaining", str(info["remaining"])),
+            ("X-RateLimit-Reset", str(info["reset_at"])),
+        )
+        return None
 
-    def _build_key(self, request: Request) -> str:
+    def _build_key(self, ctx: RequestContext) -> str:
         """Build rate limit key from request."""
         parts = []
 
         if self._config.by_ip:
-            client_ip = request.client.host if request.client else "unknown"
-            parts.append(client_ip)
+            parts.append(ctx.client_ip)
 
         if self._config.by_path:
-            parts.append(request.url.path)
+            parts.append(ctx.path)
 
         return ":".join(parts) if parts else "global"
 
@@ -390,12 +742,12 @@ class SecurityHeadersConfig:
     permissions_policy: str | None = None
 
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
+class SecurityHeadersMiddleware(ASGIMiddleware):
     """Middleware to add security headers to responses."""
 
     def __init__(
         self,
-        app: Any,
+        app: ASGIApp | None = None,
         config: SecurityHeadersConfig | None = None,
     ) -> None:
         """Initialize security headers middleware.
@@ -407,35 +759,29 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
         super().__init__(app)
         self._config = config or SecurityHeadersConfig()
 
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: RequestResponseEndpoint,
-    ) -> Response:
-        """Add security headers to response."""
-        response = await call_next(request)
-
-        # Always add these headers
-        response.headers["X-Content-Type-Options"] = self._config.content_type_options
-        response.headers["X-Frame-Options"] = self._config.frame_options
-        response.headers["X-XSS-Protection"] = self._config.xss_protection
-        response.headers["Referrer-Policy"] = self._config.referrer_policy
-
-        # Optionally add these headers
+        # The header set never changes, so build it once.
+        headers = [
+            ("X-Content-Type-Options", self._config.content_type_options),
+            ("X-Frame-Options", self._config.frame_options),
+            ("X-XSS-Protection", self._config.xss_protection),
+            ("Referrer-Policy", self._config.referrer_policy),
+        ]
         if self._config.content_security_policy:
-            response.headers["Content-Security-Policy"] = (
-                self._config.content_security_policy
+            headers.append(
+                ("Content-Security-Policy", self._config.content_security_policy)
             )
-
         if self._config.strict_transport_security:
-            response.headers["Strict-Transport-Security"] = (
-                self._config.strict_transport_security
+            headers.append(
+                ("Strict-Transport-Security", self._config.strict_transport_security)
             )
-
         if self._config.permissions_policy:
-            response.headers["Permissions-Policy"] = self._config.permissions_policy
+            headers.append(("Permissions-Policy", self._config.permissions_policy))
+        self._headers = tuple(headers)
 
-        return response
+    def on_request(self, ctx: RequestContext) -> Response | None:
+        """Queue security headers for the response."""
+        ctx.response_headers += self._headers
+        return None
 
 
 # =============================================================================
@@ -464,12 +810,28 @@ class RequestLogConfig:
     max_body_length: int = 1000
 
 
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
-    """Middleware for logging HTTP requests and responses."""
+# Request IDs: a random per-process prefix plus a counter. Unique within a
+# deployment and far cheaper than hashing a timestamp per request.
+_REQUEST_ID_PREFIX = os.urandom(3).hex()
+_request_counter = itertools.count(1)
+
+
+def new_request_id() -> str:
+    """Return a short, process-unique request ID."""
+    return f"{_REQUEST_ID_PREFIX}{next(_request_counter) & 0xFFFFFF:06x}"
+
+
+class RequestLoggingMiddleware(ASGIMiddleware):
+    """Middleware for logging HTTP requests and responses.
+
+    Every logged request gets an ``X-Request-ID`` response header, also
+    available to endpoints as ``request.state.request_id``. The structured
+    log context is only built when the corresponding log level is enabled.
+    """
 
     def __init__(
         self,
-        app: Any,
+        app: ASGIApp | None = None,
         config: RequestLogConfig | None = None,
     ) -> None:
         """Initialize request logging middleware.
@@ -480,88 +842,95 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
         """
         super().__init__(app)
         self._config = config or RequestLogConfig()
-
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: RequestResponseEndpoint,
-    ) -> Response:
-        """Log request and response."""
-        # Skip excluded paths
-        if request.url.path in self._config.exclude_paths:
-            return await call_next(request)
-
-        # Generate request ID
-        request_id = hashlib.sha256(
-            f"{time.time()}{request.client}".encode()
-        ).hexdigest()[:8]
-
-        start_time = time.time()
-
-        # Build log context
-        log_context = {
-            "request_id": request_id,
-            "method": request.method,
-            "path": request.url.path,
-            "client_ip": request.client.host if request.client else "unknown",
-        }
-
-        if self._config.log_headers:
-            log_context["headers"] = self._mask_headers(dict(request.headers))
-
-        logger.info(
-            f"[{request_id}] {request.method} {request.url.path} - Started",
-            extra=log_context,
+        self._exclude_paths = frozenset(self._config.exclude_paths)
+        self._sensitive_headers = frozenset(
+            h.lower() for h in self._config.sensitive_headers
         )
 
-        # Process request
-        try:
-            response = await call_next(request)
-            duration_ms = int((time.time() - start_time) * 1000)
-
-            log_context["status_code"] = response.status_code
+    def on_request(self, ctx: RequestContext) -> Response | None:
+        """Assign a request ID and log the start of the request."""
+        # Skip excluded paths
+        if ctx.path in self._exclude_paths:
+            return None
+
+        ctx.request_id = new_request_id()
+        ctx.started_at = time.perf_counter()
+        ctx.request.state.request_id = ctx.request_id
+        ctx.response_headers.append(("X-Request-ID", ctx.request_id))
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "[%s] %s %s - Started",
+                ctx.request_id,
+                ctx.request.method,
+                ctx.path,
+                extra=self._log_context(ctx),
+            )
+        return None
+
+    def on_complete(self, ctx: RequestContext, error: BaseException | None) -> None:
+        """Log the outcome of the request."""
+        if ctx.started_at is None:
+            return
+        duration_ms = int((time.perf_counter() - ctx.started_at) * 1000)
+
+        if error is not None:
+            if logger.isEnabledFor(logging.ERROR):
+                log_context = self._log_context(ctx)
+                log_context["duration_ms"] = duration_ms
+                log_context["error"] = str(error)
+                logger.error(
+                    "[%s] %s %s - Error (%sms): %s",
+                    ctx.request_id,
+                    ctx.request.method,
+                    ctx.path,
+                    duration_ms,
+                    error,
+                    extra=log_context,
+                    exc_info=error,
+                )
+            return
+
+        status_code = ctx.status_code or 0
+        log_level = logging.INFO
+        if status_code >= 500:
+            log_level = logging.ERROR
+        elif status_code >= 400:
+            log_level = logging.WARNING
+
+        if logger.isEnabledFor(log_level):
+            log_context = self._log_context(ctx)
+            log_context["status_code"] = status_code
             log_context["duration_ms"] = duration_ms
-
-            log_level = logging.INFO
-            if response.status_code >= 500:
-                log_level = logging.ERROR
-            elif response.status_code >= 400:
-                log_level = logging.WARNING
-
             logger.log(
                 log_level,
-                f"[{request_id}] {request.method} {request.url.path} - "
-                f"{response.status_code} ({duration_ms}ms)",
+                "[%s] %s %s - %s (%sms)",
+                ctx.request_id,
+                ctx.request.method,
+                ctx.path,
+                status_code,
+                duration_ms,
                 extra=log_context,
             )
 
-            # Add request ID to response headers
-            response.headers["X-Request-ID"] = request_id
-
-            return response
-
-        except Exception as e:
-            duration_ms = int((time.time() - start_time) * 1000)
-            log_context["duration_ms"] = duration_ms
-            log_context["error"] = str(e)
-
-            logger.error(
-                f"[{request_id}] {request.method} {request.url.path} - "
-                f"Error ({duration_ms}ms): {e}",
-                extra=log_context,
-                exc_info=True,
-            )
-            raise
+    def _log_context(self, ctx: RequestContext) -> dict[str, Any]:
+        """Build the structured log context for a request."""
+        log_context: dict[str, Any] = {
+            "request_id": ctx.request_id,
+            "method": ctx.request.method,
+            "path": ctx.path,
+            "client_ip": ctx.client_ip,
+        }
+        if self._config.log_headers:
+            log_context["headers"] = self._mask_headers(dict(ctx.request.headers))
+        return log_context
 
     def _mask_headers(self, headers: dict[str, str]) -> dict[str, str]:
         """Mask sensitive headers."""
-        masked = {}
-        for key, value in headers.items():
-            if key.lower() in self._config.sensitive_headers:
-                masked[key] = "***"
-            else:
-                masked[key] = value
-        return masked
+        return {
+            key: "***" if key.lower() in self._sensitive_headers else value
+            for key, value in headers.items()
+        }
 
 
 # =============================================================================
@@ -569,7 +938,7 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
 # =============================================================================
 
 
-class BasicAuthMiddleware(BaseHTTPMiddleware):
+class BasicAuthMiddleware(ASGIMiddleware):
     """Optional basic authentication middleware.
 
     Only active when auth_enabled is True in settings.
@@ -577,7 +946,7 @@ class BasicAuthMiddleware(BaseHTTPMiddleware):
 
     def __init__(
         self,
-        app: Any,
+        app: ASGIApp | None = None,
         password: str | None = None,
         exclude_paths: list[str] | None = None,
     ) -> None:
@@ -590,24 +959,22 @@ class BasicAuthMiddleware(BaseHTTPMiddleware):
         """
         super().__init__(app)
         self._password = password
-        self._exclude_paths = exclude_paths or ["/health", "/docs", "/redoc", "/openapi.json"]
+        self._exclude_paths = tuple(
+            exclude_paths or ["/health", "/docs", "/redoc", "/openapi.json"]
+        )
 
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: RequestResponseEndpoint,
-    ) -> Response:
+    def on_request(self, ctx: RequestContext) -> Response | None:
         """Authenticate request if password is set."""
         # Skip if no password configured
         if not self._password:
-            return await call_next(request)
+            return None
 
         # Skip excluded paths
-        if any(request.url.path.startswith(p) for p in self._exclude_paths):
-            return await call_next(request)
+        if ctx.path.startswith(self._exclude_paths):
+            return None
 
         # Check authorization header
-        auth_header = request.headers.get("Authorization")
+        auth_header = ctx.request.headers.get("Authorization")
         if not auth_header:
             return self._unauthorized_response()
 
@@ -617,7 +984,6 @@ class BasicAuthMiddleware(BaseHTTPMiddleware):
             if scheme.lower() != "basic":
                 return self._unauthorized_response()
 
-            import base64
             decoded = base64.b64decode(credentials).decode("utf-8")
             _, password = decoded.split(":", 1)
 
@@ -627,7 +993,7 @@ class BasicAuthMiddleware(BaseHTTPMiddleware):
         except (ValueError, UnicodeDecodeError):
             return self._unauthorized_response()
 
-        return await call_next(request)
+        return None
 
     def _unauthorized_response(self) -> JSONResponse:
         """Create 401 Unauthorized response."""
@@ -673,7 +1039,7 @@ class NotificationThrottleConfig:
     endpoint_overrides: dict[str, dict[str, int]] = field(default_factory=dict)
 
 
-class NotificationThrottleMiddleware(BaseHTTPMiddleware):
+class NotificationThrottleMiddleware(ASGIMiddleware):
     """Middleware for notification-specific throttling.
 
     Provides fine-grained rate limiting for notification operations with:
@@ -696,7 +1062,7 @@ class NotificationThrottleMiddleware(BaseHTTPMiddleware):
 
     def __init__(
         self,
-        app: Any,
+        app: ASGIApp | None = None,
         config: NotificationThrottleConfig | None = None,
     ) -> None:
         """Initialize notification throttle middleware.
@@ -717,24 +1083,19 @@ class NotificationThrottleMiddleware(BaseHTTPMiddleware):
         self._total_requests = 0
         self._throttled_requests = 0
 
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: RequestResponseEndpoint,
-    ) -> Response:
-        """Process request with notification-specific throttling."""
+    def on_request(self, ctx: RequestContext) -> Response | None:
+        """Apply notification-specific throttling."""
         # Only apply to notification endpoints
-        if not self._config.enabled or not self._is_notification_endpoint(request.url.path):
-            return await call_next(request)
+        path = ctx.path
+        if not self._config.enabled or not self._is_notification_endpoint(path):
+            return None
 
-        # Get client key
-        client_ip = request.client.host if request.client else "unknown"
-        key = f"notif:{client_ip}"
+        key = f"notif:{ctx.client_ip}"
 
         self._total_requests += 1
 
         # Get limits for this endpoint
-        limits = self._get_limits(request.url.path)
+        limits = self._get_limits(path)
 
         # Check all windows
         now = time.time()
@@ -743,9 +1104,10 @@ class NotificationThrottleMiddleware(BaseHTTPMiddleware):
         if not allowed:
             self._throttled_requests += 1
             logger.warning(
-                f"Notification throttle exceeded for {key}",
+                "Notification throttle exceeded for %s",
+                key,
                 extra={
-                    "path": request.url.path,
+                    "path": path,
                     "window": info["window"],
                     "limit": info["limit"],
                 },
@@ -774,13 +1136,8 @@ class NotificationThrottleMiddleware(BaseHTTPMiddleware):
         # Record request
         self._record_request(key, now)
 
-        # Process request
-        response = await call_next(request)
-
-        # Add rate limit headers
-        response.headers.update(self._build_headers(info))
-
-        return response
+        ctx.response_headers += self._build_headers(info).items()
+        return None
 
     def _is_notification_endpoint(self, path: str) -> bool:
         """Check if path is a notification endpoint."""
@@ -940,7 +1297,13 @@ class NotificationThrottleMiddleware(BaseHTTPMiddleware):
 
 
 def setup_middleware(app: Any) -> None:
-    """Configure all middleware for the application.
+    """Configure security and logging middleware for the application.
+
+    All stages are composed into one ``MiddlewarePipeline`` so each request
+    crosses a single ASGI layer. Stages run outermost first:
+    - Request logging
+    - Security headers
+    - Rate limiting
 
     Args:
         app: FastAPI application instance.
@@ -948,52 +1311,20 @@ def setup_middleware(app: Any) -> None:
     from truthound_dashboard.config import get_settings
 
     settings = get_settings()
-
-    # Add middleware in reverse order (last added = first executed)
-
-    # Request logging (always enabled)
-    app.add_middleware(RequestLoggingMiddleware)
-
-    # Rate limiting (general)
-    # 600 requests/minute = 10/second - reasonable for dashboard navigation
     rate_limit_config = RateLimitConfig(
-        requests_per_minute=600,
+        requests_per_minute=120,
         exclude_paths=["/health", "/docs", "/redoc", "/openapi.json", "/api/openapi.json"],
     )
-    app.add_middleware(RateLimitMiddleware, config=rate_limit_config)
-
-    # Notification-specific throttling (more granular)
-    notif_throttle_config = NotificationThrottleConfig(
-        per_minute=60,
-        per_hour=500,
-        per_day=5000,
-        burst_allowance=1.5,
-        endpoint_overrides={
-            # Higher limits for read operations
-            "/api/v1/notifications/routing/rules": {
-                "per_minute": 120,
-                "per_hour": 1000,
-            },
-            # Lower limits for write operations
-            "/api/v1/notifications/escalation/incidents": {
-                "per_minute": 30,
-                "per_hour": 200,
-            },
-        },
-    )
-    app.add_middleware(NotificationThrottleMiddleware, config=notif_throttle_config)
-
-    # Security headers
-    app.add_middleware(SecurityHeadersMiddleware)
-
-    # Basic auth (optional)
-    if settings.auth_enabled and settings.auth_password:
-        app.add_middleware(
-            BasicAuthMiddleware,
-            password=settings.auth_password,
-        )
-
-    # Locale detection (runs first, so it's available to all other middleware)
-    app.add_middleware(LocaleDetectionMiddleware)
+    stages: list[ASGIMiddleware] = [
+        RequestLoggingMiddleware(),
+        SecurityHeadersMiddleware(),
+        RateLimitMiddleware(
+            config=rate_limit_config,
+            strategy=create_rate_limit_strategy(
+                rate_limit_config, settings.rate_limit_backend
+            ),
+        ),
+    ]
+    app.add_middleware(MiddlewarePipeline, stages=stages)
 
     logger.info("Middleware configured successfully")
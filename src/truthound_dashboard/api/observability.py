@@ -12,6 +12,9 @@ from typing import Any
 
 from fastapi import APIRouter, HTTPException, Query
 
+from truthound_dashboard.config import get_settings
+from truthound_dashboard.core.result_cache import get_result_cache_metrics
+from truthound_dashboard.core.secrets import get_secret_cache
 from truthound_dashboard.core.store_manager import get_store_manager
 from truthound_dashboard.schemas.observability import (
     AuditEventListResponse,
@@ -25,6 +28,8 @@ from truthound_dashboard.schemas.observability import (
     ObservabilityConfigRequest,
     ObservabilityConfigResponse,
     ObservabilityStatsResponse,
+    ResultCacheMetricsResponse,
+    ResultCacheOperationMetrics,
     SpanListResponse,
     SpanResponse,
     StoreMetricsResponse,
@@ -451,6 +456,36 @@ async def get_metrics() -> MetricsResponse:
                     labels={"store": "dashboard"},
                 ))
 
+        for operation, stats in get_result_cache_metrics().snapshot().items():
+            labels = {"operation": operation}
+            counters.append(MetricValue(
+                name="result_cache_hits_total",
+                value=float(stats["hits"]),
+                labels=labels,
+            ))
+            counters.append(MetricValue(
+                name="result_cache_misses_total",
+                value=float(stats["misses"]),
+                labels=labels,
+            ))
+            gauges.append(MetricValue(
+                name="result_cache_hit_rate",
+                value=float(stats["hit_rate"]),
+                labels=labels,
+            ))
+
+        secret_stats = get_secret_cache().get_stats()
+        for key in ("hits", "misses", "evictions"):
+            counters.append(MetricValue(
+                name=f"secret_cache_{key}_total",
+                value=float(secret_stats[key]),
+            ))
+        for key in ("hit_rate", "entries"):
+            gauges.append(MetricValue(
+                name=f"secret_cache_{key}",
+                value=float(secret_stats[key]),
+            ))
+
         return MetricsResponse(
             counters=counters,
             gauges=gauges,
@@ -511,6 +546,28 @@ async def get_store_metrics() -> StoreMetricsResponse:
         return StoreMetricsResponse()
 
 
+@router.get(
+    "/metrics/result-cache",
+    response_model=ResultCacheMetricsResponse,
+    summary="Get result cache metrics",
+    description="Get hit-rate metrics for the validation/profile result cache",
+)
+async def get_result_cache_stats() -> ResultCacheMetricsResponse:
+    """Get content-fingerprint result cache metrics.
+
+    Returns:
+        Per-operation hit, miss and bypass counters.
+    """
+    snapshot = get_result_cache_metrics().snapshot()
+    return ResultCacheMetricsResponse(
+        enabled=get_settings().result_cache_enabled,
+        operations={
+            operation: ResultCacheOperationMetrics(**stats)
+            for operation, stats in snapshot.items()
+        },
+    )
+
+
 # =============================================================================
 # Tracing Endpoints
 # =============================================================================
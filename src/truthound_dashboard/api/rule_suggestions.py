@@ -115,6 +115,7 @@ async def suggest_rules(
         enable_cross_column=request.enable_cross_column,
         include_cross_column_types=request.include_cross_column_types,
         exclude_cross_column_types=request.exclude_cross_column_types,
+        sample_rows=request.sample_data_rows,
     )
 
     return result
@@ -92,6 +92,8 @@ async def get_trigger_monitoring() -> TriggerMonitoringResponse:
         checker_running=status.get("checker_running", False),
         checker_interval_seconds=status.get("checker_interval_seconds", 300),
         last_checker_run_at=status.get("last_checker_run_at"),
+        checker_metrics=status.get("checker", {}),
+        run_queue=status.get("run_queue", {}),
     )
 
 
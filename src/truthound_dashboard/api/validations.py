@@ -87,6 +87,7 @@ async def run_validation(
             # Exception handling controls
             catch_exceptions=request.catch_exceptions,
             max_retries=request.max_retries,
+            use_cache=request.use_cache,
         )
         return ValidationResponse.from_model(validation)
     except ValueError as e:
@@ -4,6 +4,9 @@ This module provides WebSocket endpoints for real-time updates.
 
 Endpoints:
     WebSocket /ws/notifications/incidents - Real-time escalation incident updates
+    WebSocket /ws/anomaly/batches - Real-time anomaly batch detection progress
+    WebSocket /ws/anomaly/streaming - Live streaming anomaly session statistics
+    WebSocket /ws/artifacts/builds - Background artifact build status
 """
 
 from __future__ import annotations
@@ -15,6 +18,9 @@ from typing import Any
 
 from fastapi import APIRouter, Query, WebSocket, WebSocketDisconnect
 
+from ..core.anomaly import ANOMALY_BATCH_ROOM
+from ..core.artifact_queue import ARTIFACT_BUILDS_ROOM
+from ..core.streaming_anomaly import STREAMING_STATS_ROOM
 from ..core.websocket import (
     WebSocketManager,
     WebSocketMessage,
@@ -79,6 +85,91 @@ async def websocket_incidents(
             ws.send(JSON.stringify({ type: 'ping' }));
         }, 30000);
     """
+    await _serve_room(websocket, token, INCIDENTS_ROOM)
+
+
+@router.websocket("/ws/anomaly/batches")
+async def websocket_anomaly_batches(
+    websocket: WebSocket,
+    token: str | None = Query(default=None, description="Optional authentication token"),
+) -> None:
+    """WebSocket endpoint for anomaly batch detection progress.
+
+    Each source finished by a running batch job is pushed as soon as its
+    result is committed, so clients do not need to poll the batch endpoint.
+
+    Query Parameters:
+        token: Optional authentication token for secure connections.
+
+    Message Types Sent:
+        - connected: Sent when connection is established
+        - anomaly_batch_progress: A source finished (or the batch started);
+          includes ``batch_id``, counters, ``progress_percent`` and, per
+          source, ``source_id`` and ``source_result``
+        - anomaly_batch_completed: The batch reached a terminal status
+    """
+    await _serve_room(websocket, token, ANOMALY_BATCH_ROOM)
+
+
+@router.websocket("/ws/anomaly/streaming")
+async def websocket_anomaly_streaming(
+    websocket: WebSocket,
+    token: str | None = Query(default=None, description="Optional authentication token"),
+) -> None:
+    """WebSocket endpoint for live streaming anomaly statistics.
+
+    Statistics are pushed after every data point. Updates for the same
+    session are coalesced while queued, so a slow client receives the
+    latest numbers rather than a backlog.
+
+    Query Parameters:
+        token: Optional authentication token for secure connections.
+
+    Message Types Sent:
+        - connected: Sent when connection is established
+        - streaming_stats: ``session_id``, ``total_points``, ``total_alerts``,
+          per-column ``columns`` statistics and ``buffer_utilization``
+    """
+    await _serve_room(websocket, token, STREAMING_STATS_ROOM)
+
+
+@router.websocket("/ws/artifacts/builds")
+async def websocket_artifact_builds(
+    websocket: WebSocket,
+    token: str | None = Query(default=None, description="Optional authentication token"),
+) -> None:
+    """WebSocket endpoint for background artifact build status.
+
+    Report and Data Docs requests return a pending artifact at once; this
+    endpoint reports when its build starts and finishes.
+
+    Query Parameters:
+        token: Optional authentication token for secure connections.
+
+    Message Types Sent:
+        - connected: Sent when connection is established
+        - artifact_build_progress: A build was queued (``status=pending``)
+          or started (``status=generating``); includes ``artifact_id``,
+          ``artifact_type``, ``validation_id`` and ``format``
+        - artifact_build_completed: The build finished with
+          ``status=completed`` (and ``file_size``) or ``status=failed``
+          (and ``error_message``)
+    """
+    await _serve_room(websocket, token, ARTIFACT_BUILDS_ROOM)
+
+
+async def _serve_room(
+    websocket: WebSocket,
+    token: str | None,
+    room: str,
+) -> None:
+    """Accept a WebSocket connection, join it to a room and pump messages.
+
+    Args:
+        websocket: Incoming WebSocket.
+        token: Optional authentication token.
+        room: Room to join for broadcast updates.
+    """
     manager = get_websocket_manager()
     connection_id = str(uuid.uuid4())
 
@@ -95,11 +186,11 @@ async def websocket_incidents(
             token=token,
         )
 
-        # Join the incidents room for broadcast updates
-        await manager.join_room(connection, INCIDENTS_ROOM)
+        # Join the room for broadcast updates
+        await manager.join_room(connection, room)
 
         logger.info(
-            f"Client connected to incidents WebSocket: {connection_id}"
+            f"Client connected to {room} WebSocket: {connection_id}"
         )
 
         # Handle incoming messages
@@ -122,7 +213,7 @@ async def websocket_incidents(
                 )
 
     except WebSocketDisconnect:
-        logger.info(f"Client disconnected from incidents WebSocket: {connection_id}")
+        logger.info(f"Client disconnected from {room} WebSocket: {connection_id}")
     except Exception as e:
         logger.error(f"WebSocket error for {connection_id}: {e}")
     finally:
@@ -38,9 +38,23 @@ class Settings(BaseSettings):
         log_level: Logging verbosity level.
         auth_enabled: Whether authentication is required.
         auth_password: Password for basic auth (if enabled).
+        control_plane_cache_ttl_seconds: Lifetime of cached sessions and
+            permission grants (0 disables the cache).
+        session_touch_interval_seconds: Minimum time between session
+            last_seen_at writes.
+        secret_cache_ttl_seconds: Lifetime of decrypted secret values kept
+            in memory (0 disables the cache).
+        secret_cache_max_entries: Maximum number of cached secret values.
         sample_size: Default sample size for validation.
         max_failed_rows: Maximum failed rows to store.
         default_timeout: Default timeout for operations in seconds.
+        result_cache_enabled: Reuse results for runs on unchanged source content.
+        datasource_pool_enabled: Reuse warm SQL data source handles across runs.
+        datasource_schema_ttl_seconds: How long pooled handles reuse an
+            introspected table schema.
+        anomaly_max_workers: Worker processes for anomaly detection (None = CPU count - 1).
+        artifact_max_workers: Worker processes for artifact builds (None = up to 4).
+        rate_limit_backend: API rate limit store ("sqlite" shares limits across workers).
     """
 
     model_config = SettingsConfigDict(
@@ -68,6 +82,26 @@ class Settings(BaseSettings):
     auth_password: str | None = Field(
         default=None, description="Password for basic auth"
     )
+    control_plane_cache_ttl_seconds: int = Field(
+        default=30,
+        ge=0,
+        description="Seconds to cache resolved sessions and permissions (0 disables)",
+    )
+    session_touch_interval_seconds: int = Field(
+        default=60,
+        ge=0,
+        description="Minimum seconds between session last_seen_at writes",
+    )
+    secret_cache_ttl_seconds: int = Field(
+        default=60,
+        ge=0,
+        description="Seconds to keep decrypted secret values in memory (0 disables)",
+    )
+    secret_cache_max_entries: int = Field(
+        default=256,
+        ge=1,
+        description="Maximum number of decrypted secret values kept in memory",
+    )
 
     # Validation defaults
     sample_size: int = Field(
@@ -80,6 +114,43 @@ class Settings(BaseSettings):
         default=300, ge=10, description="Default operation timeout in seconds"
     )
 
+    # Result cache
+    result_cache_enabled: bool = Field(
+        default=True,
+        description="Reuse validation/profile results when source content is unchanged",
+    )
+
+    # Data source pool
+    datasource_pool_enabled: bool = Field(
+        default=True,
+        description="Reuse warm SQL data source handles across runs",
+    )
+    datasource_schema_ttl_seconds: int = Field(
+        default=300,
+        ge=0,
+        description="Seconds pooled data sources reuse an introspected schema",
+    )
+
+    # Anomaly detection
+    anomaly_max_workers: int | None = Field(
+        default=None,
+        ge=1,
+        description="Worker processes for anomaly detection (default: CPU count - 1)",
+    )
+
+    # Artifact builds
+    artifact_max_workers: int | None = Field(
+        default=None,
+        ge=1,
+        description="Worker processes for report and Data Docs builds (default: up to 4)",
+    )
+
+    # Rate limiting
+    rate_limit_backend: Literal["memory", "sqlite"] = Field(
+        default="memory",
+        description="API rate limit store; 'sqlite' enforces one limit across workers",
+    )
+
     # Worker configuration
     max_workers: int = Field(
         default=4, ge=1, le=32, description="Maximum worker threads"
@@ -213,6 +213,7 @@ from .tiering import (
     MigrationItem,
     MigrationResult,
     TieringExecutionResult,
+    TierMigrationEngine,
     get_tiering_adapter,
     process_tiering_policies,
 )
@@ -383,6 +384,7 @@ __all__ = [
     "MigrationItem",
     "MigrationResult",
     "TieringExecutionResult",
+    "TierMigrationEngine",
     "get_tiering_adapter",
     "process_tiering_policies",
 ]
@@ -6,16 +6,30 @@ supporting multiple algorithms from truthound core.
 
 from __future__ import annotations
 
-from collections.abc import Sequence
+import asyncio
+import logging
+import multiprocessing
+import os
+from collections.abc import Awaitable, Callable, Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from truthound_dashboard.core.anomaly_features import (
+    FeatureMatrix,
+    get_feature_matrix_cache,
+    params_key,
+    project_features,
+)
 from truthound_dashboard.db import BaseRepository
 from truthound_dashboard.db.models import AnomalyDetection, AnomalyBatchJob, Source
 
+logger = logging.getLogger(__name__)
+
 
 class AnomalyDetectionRepository(BaseRepository[AnomalyDetection]):
     """Repository for AnomalyDetection model operations."""
@@ -97,195 +111,15 @@ class AnomalyDetectionRepository(BaseRepository[AnomalyDetection]):
         return await self.count(filters=[AnomalyDetection.source_id == source_id])
 
 
-class AnomalyDetectionService:
-    """Service for ML-based anomaly detection.
+class AnomalyAlgorithmRunner:
+    """Session-free anomaly detection algorithms.
 
-    Provides functionality for:
-    - Running anomaly detection with various algorithms
-    - Managing detection history
-    - Retrieving algorithm information
+    Kept separate from the service so detections can run in worker
+    processes, which cannot share the database session. Every algorithm
+    reads the same prepared ``FeatureMatrix`` rather than cleaning and
+    scaling its own copy of the data.
     """
 
-    def __init__(self, session: AsyncSession) -> None:
-        """Initialize service.
-
-        Args:
-            session: Database session.
-        """
-        self.session = session
-        self.repo = AnomalyDetectionRepository(session)
-
-    # =========================================================================
-    # Detection Operations
-    # =========================================================================
-
-    async def create_detection(
-        self,
-        source_id: str,
-        *,
-        algorithm: str = "isolation_forest",
-        columns: list[str] | None = None,
-        config: dict[str, Any] | None = None,
-        sample_size: int | None = None,
-    ) -> AnomalyDetection:
-        """Create a new anomaly detection record.
-
-        This creates a pending detection that should be executed separately.
-
-        Args:
-            source_id: Source ID to analyze.
-            algorithm: Detection algorithm to use.
-            columns: Columns to analyze (None = all numeric).
-            config: Algorithm-specific configuration.
-            sample_size: Sample size for large datasets.
-
-        Returns:
-            Created detection record.
-
-        Raises:
-            ValueError: If source not found.
-        """
-        # Verify source exists
-        result = await self.session.execute(
-            select(Source).where(Source.id == source_id)
-        )
-        source = result.scalar_one_or_none()
-        if source is None:
-            raise ValueError(f"Source '{source_id}' not found")
-
-        # Prepare configuration
-        full_config = config or {}
-        if columns:
-            full_config["columns"] = columns
-        if sample_size:
-            full_config["sample_size"] = sample_size
-
-        detection = await self.repo.create(
-            source_id=source_id,
-            algorithm=algorithm,
-            config=full_config if full_config else None,
-            columns_analyzed=columns,
-            status="pending",
-        )
-
-        return detection
-
-    async def run_detection(
-        self,
-        detection_id: str,
-    ) -> AnomalyDetection:
-        """Execute anomaly detection.
-
-        This runs the actual ML algorithm on the source data.
-
-        Args:
-            detection_id: Detection record ID.
-
-        Returns:
-            Updated detection with results.
-
-        Raises:
-            ValueError: If detection not found.
-        """
-        detection = await self.repo.get_by_id(detection_id)
-        if detection is None:
-            raise ValueError(f"Detection '{detection_id}' not found")
-
-        # Mark as started
-        detection.mark_started()
-        await self.session.flush()
-
-        try:
-            # Get source info
-            result = await self.session.execute(
-                select(Source).where(Source.id == detection.source_id)
-            )
-            source = result.scalar_one_or_none()
-            if source is None:
-                raise ValueError(f"Source '{detection.source_id}' not found")
-
-            # Run the actual detection using truthound
-            detection_result = await self._execute_detection(
-                source=source,
-                algorithm=detection.algorithm,
-                config=detection.config,
-            )
-
-            # Update detection with results
-            detection.total_rows = detection_result.get("total_rows", 0)
-            detection.anomaly_count = detection_result.get("anomaly_count", 0)
-            detection.anomaly_rate = detection_result.get("anomaly_rate", 0.0)
-            detection.columns_analyzed = detection_result.get("columns_analyzed", [])
-            detection.mark_completed(
-                anomaly_count=detection.anomaly_count,
-                anomaly_rate=detection.anomaly_rate,
-                result=detection_result,
-            )
-
-        except Exception as e:
-            detection.mark_error(str(e))
-
-        await self.session.flush()
-        await self.session.refresh(detection)
-        return detection
-
-    async def _execute_detection(
-        self,
-        source: Source,
-        algorithm: str,
-        config: dict[str, Any] | None,
-    ) -> dict[str, Any]:
-        """Execute the anomaly detection algorithm.
-
-        This is the core detection logic that interfaces with truthound.
-
-        Args:
-            source: Source to analyze.
-            algorithm: Algorithm to use.
-            config: Algorithm configuration.
-
-        Returns:
-            Detection results dictionary.
-        """
-        try:
-            from truthound.datasources import get_datasource
-
-            # Load data from source using truthound datasources factory
-            # The source.config contains the path or connection info
-            datasource = get_datasource(source.config.get("path", source.config))
-            df = datasource.to_polars_lazyframe().collect()
-
-            # Get columns to analyze
-            columns = None
-            if config and "columns" in config:
-                columns = config["columns"]
-
-            # Get sample size
-            sample_size = None
-            if config and "sample_size" in config:
-                sample_size = config["sample_size"]
-
-            # Build algorithm-specific parameters
-            algo_params = self._build_algorithm_params(algorithm, config)
-
-            # Run anomaly detection based on algorithm
-            # Note: truthound's anomaly validators are used here
-            result = self._run_algorithm(
-                df=df,
-                algorithm=algorithm,
-                columns=columns,
-                sample_size=sample_size,
-                params=algo_params,
-            )
-
-            return result
-
-        except ImportError as exc:
-            raise RuntimeError(
-                "Truthound 3.0 anomaly features are unavailable. "
-                "Install truthound with the ML extras required by this dashboard."
-            ) from exc
-
     def _build_algorithm_params(
         self,
         algorithm: str,
@@ -320,7 +154,8 @@ class AnomalyDetectionService:
         Uses truthound.ml.anomaly_models when available, falls back to sklearn.
 
         Args:
-            df: DataFrame to analyze.
+            df: Polars DataFrame or LazyFrame to analyze. Only the analyzed
+                numeric columns are materialized.
             algorithm: Algorithm name.
             columns: Columns to analyze.
             sample_size: Sample size.
@@ -330,22 +165,14 @@ class AnomalyDetectionService:
             Detection results.
         """
         import numpy as np
-        import pandas as pd
 
-        # Sample if needed
-        if sample_size and len(df) > sample_size:
-            df = df.sample(n=sample_size, random_state=42)
-
-        # Select columns (numeric only if not specified)
-        if columns:
-            df_analyze = df[columns].select_dtypes(include=[np.number])
-        else:
-            df_analyze = df.select_dtypes(include=[np.number])
-            columns = list(df_analyze.columns)
+        features = FeatureMatrix.from_frame(df, columns=columns, sample_size=sample_size)
+        columns = list(features.columns)
+        total_rows = features.n_rows
 
-        if df_analyze.empty:
+        if features.empty:
             return {
-                "total_rows": len(df),
+                "total_rows": total_rows,
                 "anomaly_count": 0,
                 "anomaly_rate": 0.0,
                 "columns_analyzed": columns,
@@ -353,27 +180,11 @@ class AnomalyDetectionService:
                 "column_summaries": [],
             }
 
-        # Run algorithm
-        if algorithm == "isolation_forest":
-            result = self._run_isolation_forest(df_analyze, params)
-        elif algorithm == "lof":
-            result = self._run_lof(df_analyze, params)
-        elif algorithm == "one_class_svm":
-            result = self._run_one_class_svm(df_analyze, params)
-        elif algorithm == "dbscan":
-            result = self._run_dbscan(df_analyze, params)
-        elif algorithm == "statistical":
-            result = self._run_statistical(df_analyze, params)
-        elif algorithm == "autoencoder":
-            result = self._run_autoencoder(df_analyze, params)
-        elif algorithm == "ensemble":
-            result = self._run_ensemble(df_analyze, params)
-        else:
-            raise ValueError(f"Unknown algorithm: {algorithm}")
+        result = self._detect(features, algorithm, params)
 
         # Build final result
-        anomaly_mask = result["is_anomaly"]
-        anomaly_scores = result["scores"]
+        anomaly_mask = np.asarray(result["is_anomaly"], dtype=bool)
+        anomaly_scores = np.asarray(result["scores"], dtype=np.float64)
 
         # Get top anomalies (limit to 100)
         anomaly_indices = np.where(anomaly_mask)[0]
@@ -384,40 +195,75 @@ class AnomalyDetectionService:
             anomalies.append({
                 "row_index": int(idx),
                 "anomaly_score": float(anomaly_scores[idx]),
-                "column_values": df_analyze.iloc[idx].to_dict(),
+                "column_values": features.row_values(int(idx)),
                 "is_anomaly": True,
             })
 
         # Build column summaries
-        column_summaries = []
-        for col in columns:
-            if col in df_analyze.columns:
-                col_data = df_analyze[col]
-                col_anomalies = anomaly_mask & ~col_data.isna()
-                summary = {
-                    "column": col,
-                    "dtype": str(col_data.dtype),
-                    "anomaly_count": int(col_anomalies.sum()),
-                    "anomaly_rate": float(col_anomalies.sum() / len(col_data)) if len(col_data) > 0 else 0.0,
-                    "mean_anomaly_score": float(np.mean(anomaly_scores[anomaly_mask])) if anomaly_mask.any() else 0.0,
-                    "min_value": float(col_data.min()) if not col_data.empty else None,
-                    "max_value": float(col_data.max()) if not col_data.empty else None,
-                    "top_anomaly_indices": [int(i) for i in top_indices[:10]],
-                }
-                column_summaries.append(summary)
+        mean_anomaly_score = (
+            float(np.mean(anomaly_scores[anomaly_mask])) if anomaly_mask.any() else 0.0
+        )
+        top_anomaly_indices = [int(i) for i in top_indices[:10]]
+        column_summaries = [
+            {
+                **summary,
+                "mean_anomaly_score": mean_anomaly_score,
+                "top_anomaly_indices": top_anomaly_indices,
+            }
+            for summary in features.column_summaries(anomaly_mask)
+        ]
 
         return {
-            "total_rows": len(df),
+            "total_rows": total_rows,
             "anomaly_count": int(anomaly_mask.sum()),
-            "anomaly_rate": float(anomaly_mask.sum() / len(df)) if len(df) > 0 else 0.0,
+            "anomaly_rate": float(anomaly_mask.sum() / total_rows) if total_rows > 0 else 0.0,
             "columns_analyzed": columns,
             "anomalies": anomalies,
             "column_summaries": column_summaries,
         }
 
+    def _detect(
+        self,
+        features: FeatureMatrix,
+        algorithm: str,
+        params: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Fit and score one algorithm on a prepared feature matrix.
+
+        Results are memoized on the matrix by algorithm and parameters, so a
+        model requested twice in one comparison (directly and as an ensemble
+        member) is fitted once.
+
+        Args:
+            features: Prepared feature matrix.
+            algorithm: Algorithm name.
+            params: Algorithm parameters.
+
+        Returns:
+            Dictionary with ``is_anomaly`` mask and ``scores`` arrays.
+
+        Raises:
+            ValueError: If the algorithm is unknown.
+        """
+        runners = {
+            "isolation_forest": self._run_isolation_forest,
+            "lof": self._run_lof,
+            "one_class_svm": self._run_one_class_svm,
+            "dbscan": self._run_dbscan,
+            "statistical": self._run_statistical,
+            "autoencoder": self._run_autoencoder,
+            "ensemble": self._run_ensemble,
+        }
+        run = runners.get(algorithm)
+        if run is None:
+            raise ValueError(f"Unknown algorithm: {algorithm}")
+        return features.memoize(
+            params_key(algorithm, params), lambda: run(features, params)
+        )
+
     def _run_isolation_forest(
         self,
-        df: Any,
+        features: FeatureMatrix,
         params: dict[str, Any],
     ) -> dict[str, Any]:
         """Run Isolation Forest algorithm using truthound.ml."""
@@ -429,27 +275,22 @@ class AnomalyDetectionService:
         max_samples = params.get("max_samples", 256)
         random_state = params.get("random_state", 42)
 
-        # Handle NaN values
-        df_clean = df.fillna(df.mean())
-
         try:
             from truthound.ml.anomaly_models.isolation_forest import (
                 IsolationForestDetector,
                 IsolationForestConfig,
             )
-            import polars as pl
 
             # Create truthound detector
             config = IsolationForestConfig(
                 n_estimators=n_estimators,
                 max_samples=max_samples if isinstance(max_samples, int) else 256,
-                columns=list(df_clean.columns),
+                columns=list(features.columns),
             )
 
             detector = IsolationForestDetector(config)
 
-            # Convert to Polars for truthound
-            pl_df = pl.from_pandas(df_clean).lazy()
+            pl_df = features.frame().lazy()
             detector.fit(pl_df)
 
             # Get predictions
@@ -474,8 +315,8 @@ class AnomalyDetectionService:
                 max_samples=max_samples,
                 random_state=random_state,
             )
-            predictions = clf.fit_predict(df_clean)
-            scores = -clf.score_samples(df_clean)  # Higher = more anomalous
+            predictions = clf.fit_predict(features.values)
+            scores = -clf.score_samples(features.values)  # Higher = more anomalous
 
             return {
                 "is_anomaly": predictions == -1,
@@ -484,30 +325,23 @@ class AnomalyDetectionService:
 
     def _run_lof(
         self,
-        df: Any,
+        features: FeatureMatrix,
         params: dict[str, Any],
     ) -> dict[str, Any]:
         """Run Local Outlier Factor algorithm."""
         from sklearn.neighbors import LocalOutlierFactor
-        from sklearn.preprocessing import StandardScaler
-        import numpy as np
 
         n_neighbors = params.get("n_neighbors", 20)
         contamination = params.get("contamination", 0.1)
         algorithm = params.get("algorithm", "auto")
 
-        # Handle NaN values and scale
-        df_clean = df.fillna(df.mean())
-        scaler = StandardScaler()
-        df_scaled = scaler.fit_transform(df_clean)
-
         clf = LocalOutlierFactor(
             n_neighbors=n_neighbors,
             contamination=contamination,
             algorithm=algorithm,
             novelty=False,
         )
-        predictions = clf.fit_predict(df_scaled)
+        predictions = clf.fit_predict(features.scaled())
         scores = -clf.negative_outlier_factor_  # Higher = more anomalous
 
         return {
@@ -517,30 +351,24 @@ class AnomalyDetectionService:
 
     def _run_one_class_svm(
         self,
-        df: Any,
+        features: FeatureMatrix,
         params: dict[str, Any],
     ) -> dict[str, Any]:
         """Run One-Class SVM algorithm."""
         from sklearn.svm import OneClassSVM
-        from sklearn.preprocessing import StandardScaler
-        import numpy as np
 
         kernel = params.get("kernel", "rbf")
         nu = params.get("nu", 0.1)
         gamma = params.get("gamma", "scale")
 
-        # Handle NaN values and scale
-        df_clean = df.fillna(df.mean())
-        scaler = StandardScaler()
-        df_scaled = scaler.fit_transform(df_clean)
-
+        scaled = features.scaled()
         clf = OneClassSVM(
             kernel=kernel,
             nu=nu,
             gamma=gamma,
         )
-        predictions = clf.fit_predict(df_scaled)
-        scores = -clf.score_samples(df_scaled)  # Higher = more anomalous
+        predictions = clf.fit_predict(scaled)
+        scores = -clf.score_samples(scaled)  # Higher = more anomalous
 
         return {
             "is_anomaly": predictions == -1,
@@ -549,12 +377,11 @@ class AnomalyDetectionService:
 
     def _run_dbscan(
         self,
-        df: Any,
+        features: FeatureMatrix,
         params: dict[str, Any],
     ) -> dict[str, Any]:
         """Run DBSCAN algorithm."""
         from sklearn.cluster import DBSCAN
-        from sklearn.preprocessing import StandardScaler
         from sklearn.metrics import pairwise_distances
         import numpy as np
 
@@ -562,32 +389,28 @@ class AnomalyDetectionService:
         min_samples = params.get("min_samples", 5)
         metric = params.get("metric", "euclidean")
 
-        # Handle NaN values and scale
-        df_clean = df.fillna(df.mean())
-        scaler = StandardScaler()
-        df_scaled = scaler.fit_transform(df_clean)
-
+        scaled = features.scaled()
         clf = DBSCAN(
             eps=eps,
             min_samples=min_samples,
             metric=metric,
         )
-        labels = clf.fit_predict(df_scaled)
+        labels = clf.fit_predict(scaled)
 
         # Points labeled as -1 are noise (anomalies)
         is_anomaly = labels == -1
 
         # Calculate distance-based scores (distance to nearest cluster centroid)
-        scores = np.zeros(len(df_scaled))
+        scores = np.zeros(len(scaled))
         if not is_anomaly.all():
             # Get centroids of each cluster
             unique_labels = set(labels) - {-1}
             if unique_labels:
                 centroids = np.array([
-                    df_scaled[labels == label].mean(axis=0)
+                    scaled[labels == label].mean(axis=0)
                     for label in unique_labels
                 ])
-                distances = pairwise_distances(df_scaled, centroids, metric=metric)
+                distances = pairwise_distances(scaled, centroids, metric=metric)
                 scores = distances.min(axis=1)
 
         return {
@@ -597,7 +420,7 @@ class AnomalyDetectionService:
 
     def _run_statistical(
         self,
-        df: Any,
+        features: FeatureMatrix,
         params: dict[str, Any],
     ) -> dict[str, Any]:
         """Run statistical anomaly detection using truthound.ml."""
@@ -606,15 +429,21 @@ class AnomalyDetectionService:
         method = params.get("method", "zscore")
         threshold = params.get("threshold", 3.0)
 
-        # Handle NaN values
-        df_clean = df.fillna(df.mean())
-
         try:
             from truthound.ml.anomaly_models.statistical import (
-                StatisticalAnomalyDetector,
+                IQRAnomalyDetector,
+                MADAnomalyDetector,
                 StatisticalConfig,
+                ZScoreAnomalyDetector,
             )
-            import polars as pl
+
+            detectors = {
+                "zscore": ZScoreAnomalyDetector,
+                "iqr": IQRAnomalyDetector,
+                "mad": MADAnomalyDetector,
+            }
+            if method not in detectors:
+                raise ValueError(f"Unknown statistical method: {method}")
 
             # Create truthound detector
             config = StatisticalConfig(
@@ -622,13 +451,12 @@ class AnomalyDetectionService:
                 iqr_multiplier=threshold if method == "iqr" else 1.5,
                 use_robust_stats=(method == "mad"),
                 per_column=True,
-                columns=list(df_clean.columns),
+                columns=list(features.columns),
             )
 
-            detector = StatisticalAnomalyDetector(config)
+            detector = detectors[method](config)
 
-            # Convert to Polars for truthound
-            pl_df = pl.from_pandas(df_clean).lazy()
+            pl_df = features.frame().lazy()
             detector.fit(pl_df)
 
             # Get predictions
@@ -645,53 +473,44 @@ class AnomalyDetectionService:
 
         except ImportError:
             # Fallback to manual implementation
+            values = features.values
             if method == "zscore":
-                mean = df_clean.mean()
-                std = df_clean.std()
-                z_scores = np.abs((df_clean - mean) / std)
+                z_scores = np.abs(features.scaled())
                 # Take max z-score across all columns for each row
-                max_z = z_scores.max(axis=1)
-                is_anomaly = max_z > threshold
-                scores = max_z.values
+                scores = z_scores.max(axis=1)
+                is_anomaly = scores > threshold
 
             elif method == "iqr":
-                q1 = df_clean.quantile(0.25)
-                q3 = df_clean.quantile(0.75)
+                q1, q3 = np.quantile(values, [0.25, 0.75], axis=0)
                 iqr = q3 - q1
+                iqr[iqr == 0] = 1.0
                 lower = q1 - threshold * iqr
                 upper = q3 + threshold * iqr
-                is_outlier = ((df_clean < lower) | (df_clean > upper)).any(axis=1)
-                is_anomaly = is_outlier.values
+                is_anomaly = ((values < lower) | (values > upper)).any(axis=1)
                 # Score based on distance from bounds
-                scores = np.zeros(len(df_clean))
-                for col in df_clean.columns:
-                    col_scores = np.maximum(
-                        (lower[col] - df_clean[col]) / iqr[col],
-                        (df_clean[col] - upper[col]) / iqr[col],
-                    )
-                    col_scores = np.maximum(col_scores, 0)
-                    scores = np.maximum(scores, col_scores.values)
+                col_scores = np.maximum((lower - values) / iqr, (values - upper) / iqr)
+                scores = np.maximum(col_scores, 0).max(axis=1)
 
             elif method == "mad":
-                median = df_clean.median()
-                mad = np.abs(df_clean - median).median()
+                median = np.median(values, axis=0)
+                mad = np.median(np.abs(values - median), axis=0)
+                mad[mad == 0] = 1.0
                 # Modified z-score using MAD
-                modified_z = 0.6745 * (df_clean - median) / mad
-                max_z = np.abs(modified_z).max(axis=1)
-                is_anomaly = max_z > threshold
-                scores = max_z.values
+                modified_z = 0.6745 * (values - median) / mad
+                scores = np.abs(modified_z).max(axis=1)
+                is_anomaly = scores > threshold
 
             else:
                 raise ValueError(f"Unknown statistical method: {method}")
 
             return {
-                "is_anomaly": np.array(is_anomaly),
-                "scores": np.array(scores),
+                "is_anomaly": np.asarray(is_anomaly),
+                "scores": np.asarray(scores),
             }
 
     def _run_ensemble(
         self,
-        df: Any,
+        features: FeatureMatrix,
         params: dict[str, Any],
     ) -> dict[str, Any]:
         """Run ensemble anomaly detection using truthound.ml."""
@@ -701,9 +520,6 @@ class AnomalyDetectionService:
         weights = params.get("weights", [0.3, 0.3, 0.4])
         vote_threshold = params.get("vote_threshold", 0.5)
 
-        # Handle NaN values
-        df_clean = df.fillna(df.mean())
-
         try:
             from truthound.ml.anomaly_models.ensemble import (
                 EnsembleAnomalyDetector,
@@ -711,14 +527,14 @@ class AnomalyDetectionService:
                 EnsembleStrategy,
             )
             from truthound.ml.anomaly_models.statistical import (
-                StatisticalAnomalyDetector,
+                IQRAnomalyDetector,
                 StatisticalConfig,
+                ZScoreAnomalyDetector,
             )
             from truthound.ml.anomaly_models.isolation_forest import (
                 IsolationForestDetector,
                 IsolationForestConfig,
             )
-            import polars as pl
 
             # Map strategy string to enum
             strategy_map = {
@@ -737,25 +553,24 @@ class AnomalyDetectionService:
                 vote_threshold=vote_threshold,
             )
 
-            ensemble = EnsembleAnomalyDetector(config)
+            ensemble = EnsembleAnomalyDetector(config=config)
 
             # Add detectors
-            columns = list(df_clean.columns)
+            columns = list(features.columns)
 
             # Z-Score detector
             zscore_config = StatisticalConfig(z_threshold=3.0, columns=columns)
-            ensemble.add_detector(StatisticalAnomalyDetector(zscore_config), weight=weights[0] if len(weights) > 0 else 0.33)
+            ensemble.add_detector(ZScoreAnomalyDetector(zscore_config), weight=weights[0] if len(weights) > 0 else 0.33)
 
             # IQR detector
             iqr_config = StatisticalConfig(iqr_multiplier=1.5, columns=columns)
-            ensemble.add_detector(StatisticalAnomalyDetector(iqr_config), weight=weights[1] if len(weights) > 1 else 0.33)
+            ensemble.add_detector(IQRAnomalyDetector(iqr_config), weight=weights[1] if len(weights) > 1 else 0.33)
 
             # Isolation Forest detector
             if_config = IsolationForestConfig(n_estimators=100, columns=columns)
             ensemble.add_detector(IsolationForestDetector(if_config), weight=weights[2] if len(weights) > 2 else 0.34)
 
-            # Convert to Polars for truthound
-            pl_df = pl.from_pandas(df_clean).lazy()
+            pl_df = features.frame().lazy()
             ensemble.fit(pl_df)
 
             # Get predictions
@@ -771,23 +586,16 @@ class AnomalyDetectionService:
             }
 
         except ImportError:
-            # Fallback: run individual algorithms and combine
-            results = []
-
-            # Run zscore
-            zscore_result = self._run_statistical(df, {"method": "zscore", "threshold": 3.0})
-            results.append(zscore_result)
-
-            # Run IQR
-            iqr_result = self._run_statistical(df, {"method": "iqr", "threshold": 1.5})
-            results.append(iqr_result)
-
-            # Run isolation forest
-            if_result = self._run_isolation_forest(df, {"n_estimators": 100})
-            results.append(if_result)
+            # Fallback: combine individual algorithms. Base models go through
+            # _detect so runs already made on this matrix are reused.
+            results = [
+                self._detect(features, "statistical", {"method": "zscore", "threshold": 3.0}),
+                self._detect(features, "statistical", {"method": "iqr", "threshold": 1.5}),
+                self._detect(features, "isolation_forest", {"n_estimators": 100}),
+            ]
 
             # Combine using weighted average
-            combined_scores = np.zeros(len(df_clean))
+            combined_scores = np.zeros(features.n_rows)
             for i, result in enumerate(results):
                 weight = weights[i] if i < len(weights) else 1.0 / len(results)
                 combined_scores += weight * result["scores"]
@@ -807,22 +615,18 @@ class AnomalyDetectionService:
 
     def _run_autoencoder(
         self,
-        df: Any,
+        features: FeatureMatrix,
         params: dict[str, Any],
     ) -> dict[str, Any]:
         """Run Autoencoder-based anomaly detection."""
         import numpy as np
-        from sklearn.preprocessing import StandardScaler
 
         encoding_dim = params.get("encoding_dim", 32)
         epochs = params.get("epochs", 50)
         threshold_percentile = params.get("threshold_percentile", 95)
         batch_size = params.get("batch_size", 32)
 
-        # Handle NaN values and scale
-        df_clean = df.fillna(df.mean())
-        scaler = StandardScaler()
-        df_scaled = scaler.fit_transform(df_clean)
+        df_scaled = features.scaled()
 
         try:
             import tensorflow as tf
@@ -885,6 +689,466 @@ class AnomalyDetectionService:
                 "scores": reconstruction_error,
             }
 
+
+# =============================================================================
+# Process-Pool Execution
+# =============================================================================
+
+# WebSocket room receiving anomaly batch progress events.
+ANOMALY_BATCH_ROOM = "anomaly_batches"
+
+
+def scan_source(source_config: dict[str, Any]) -> Any:
+    """Open a source as a Polars LazyFrame.
+
+    Local files are scanned directly with Polars; anything else goes
+    through the truthound datasources factory.
+
+    Args:
+        source_config: Source configuration (path or connection info).
+
+    Returns:
+        Polars LazyFrame.
+
+    Raises:
+        ImportError: If truthound datasources are needed but unavailable.
+    """
+    from pathlib import Path
+
+    from truthound_dashboard.core.sampling import scan_data_file
+
+    path = source_config.get("path")
+    if isinstance(path, str) and Path(path).is_file():
+        return scan_data_file(path)
+
+    from truthound.datasources import get_datasource
+
+    # The source config contains the path or connection info
+    datasource = get_datasource(source_config.get("path", source_config))
+    return datasource.to_polars_lazyframe()
+
+
+def load_source_frame(
+    source_config: dict[str, Any],
+    config: dict[str, Any] | None = None,
+) -> Any:
+    """Load the analyzed columns of a source into a Polars DataFrame.
+
+    Only the numeric columns selected by ``config["columns"]`` are read, and
+    ``config["sample_size"]`` is applied inside the scan, so the frame shipped
+    to a worker process is already as small as the detection needs.
+
+    Args:
+        source_config: Source configuration (path or connection info).
+        config: Detection configuration (columns, sample_size, parameters).
+
+    Returns:
+        Polars DataFrame of Float32 feature columns.
+    """
+    config = config or {}
+    try:
+        frame, _, _ = project_features(
+            scan_source(source_config),
+            columns=config.get("columns"),
+            sample_size=config.get("sample_size"),
+        )
+    except ImportError as exc:
+        raise RuntimeError(
+            "Truthound 3.0 anomaly features are unavailable. "
+            "Install truthound with the ML extras required by this dashboard."
+        ) from exc
+    return frame
+
+
+async def load_feature_matrix(
+    source: Source,
+    columns: list[str] | None,
+    sample_size: int | None,
+) -> tuple[FeatureMatrix, Any]:
+    """Load a source and prepare its feature matrix, reusing cached ones.
+
+    Matrices are cached under the source content fingerprint plus the
+    column selection and sample size; sources that cannot be
+    fingerprinted are prepared fresh every time.
+
+    Args:
+        source: Source to load.
+        columns: Columns to analyze (None = all numeric).
+        sample_size: Sample size for large datasets.
+
+    Returns:
+        Tuple of (feature matrix, source fingerprint or None).
+
+    Raises:
+        ImportError: If truthound datasources are unavailable.
+    """
+    from truthound_dashboard.core.result_cache import (
+        build_cache_key,
+        compute_source_fingerprint,
+        get_result_cache_metrics,
+    )
+
+    metrics = get_result_cache_metrics()
+    cache = get_feature_matrix_cache()
+    source_config = source.config or {}
+    fingerprint = await compute_source_fingerprint(source.type, source_config, None)
+    cache_key = None
+    if fingerprint is not None:
+        cache_key = build_cache_key(
+            "anomaly_features",
+            fingerprint,
+            columns=columns,
+            sample_size=sample_size,
+        )
+        cached = cache.get(cache_key)
+        if cached is not None:
+            metrics.record_hit("anomaly_features")
+            return cached, fingerprint
+        metrics.record_miss("anomaly_features")
+    else:
+        metrics.record_bypass("anomaly_features")
+
+    def prepare() -> FeatureMatrix:
+        return FeatureMatrix.from_frame(
+            scan_source(source_config), columns=columns, sample_size=sample_size
+        )
+
+    features = await asyncio.to_thread(prepare)
+    if cache_key is not None:
+        cache.put(cache_key, features)
+    return features, fingerprint
+
+
+def run_detection_algorithm(
+    df: Any,
+    algorithm: str,
+    config: dict[str, Any] | None,
+) -> dict[str, Any]:
+    """Fit and score one detection without touching the database.
+
+    Module-level so it can be pickled into process-pool workers.
+
+    Args:
+        df: Polars DataFrame to analyze.
+        algorithm: Algorithm name.
+        config: Detection configuration (columns, sample_size, parameters).
+
+    Returns:
+        Detection results dictionary.
+    """
+    runner = AnomalyAlgorithmRunner()
+    config = config or {}
+    return runner._run_algorithm(
+        df=df,
+        algorithm=algorithm,
+        columns=config.get("columns"),
+        sample_size=config.get("sample_size"),
+        params=runner._build_algorithm_params(algorithm, config),
+    )
+
+
+_process_pool: ProcessPoolExecutor | None = None
+
+
+def anomaly_worker_count() -> int:
+    """Number of worker processes used for anomaly detection.
+
+    Defaults to one less than the CPU count, leaving a core for the server.
+    """
+    from truthound_dashboard.config import get_settings
+
+    return get_settings().anomaly_max_workers or max((os.cpu_count() or 2) - 1, 1)
+
+
+def get_anomaly_process_pool() -> ProcessPoolExecutor:
+    """Get the shared process pool for anomaly detection.
+
+    Workers are spawned rather than forked so they never inherit the event
+    loop, database connections or Polars thread pools of the server.
+    """
+    global _process_pool
+    if _process_pool is None:
+        _process_pool = ProcessPoolExecutor(
+            max_workers=anomaly_worker_count(),
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _process_pool
+
+
+def shutdown_anomaly_process_pool() -> None:
+    """Shut down the shared process pool (on application shutdown)."""
+    global _process_pool
+    if _process_pool is not None:
+        _process_pool.shutdown(wait=False, cancel_futures=True)
+        _process_pool = None
+
+
+@dataclass
+class BatchSourceJob:
+    """One source of a batch detection.
+
+    Attributes:
+        source_id: Source being analyzed.
+        detection_id: Detection record receiving the result.
+        source_config: Configuration used to load the source.
+    """
+
+    source_id: str
+    detection_id: str
+    source_config: dict[str, Any]
+
+
+class AnomalyBatchExecutor:
+    """Runs per-source detections concurrently on a process pool.
+
+    Sources are loaded in threads and fitted in worker processes. At most
+    ``max_workers`` fits run at once, and up to ``prefetch`` further sources
+    are loaded while those fits run, so loading the next source overlaps
+    with fitting the current ones while memory stays bounded.
+
+    Usage:
+        executor = AnomalyBatchExecutor()
+        await executor.run(jobs, "isolation_forest", config, on_result)
+    """
+
+    def __init__(
+        self,
+        *,
+        max_workers: int | None = None,
+        prefetch: int = 1,
+        pool: Executor | None = None,
+        loader: Callable[[dict[str, Any], dict[str, Any] | None], Any] = load_source_frame,
+        worker: Callable[..., dict[str, Any]] = run_detection_algorithm,
+    ) -> None:
+        """Initialize the executor.
+
+        Args:
+            max_workers: Concurrent fits. Defaults to the configured worker count.
+            prefetch: Sources loaded ahead of the running fits.
+            pool: Executor for fits. Defaults to the shared process pool.
+            loader: Loads ``(source_config, config)`` into a DataFrame.
+            worker: Fits and scores a DataFrame.
+        """
+        self._max_workers = max_workers or anomaly_worker_count()
+        self._prefetch = max(0, prefetch)
+        self._pool = pool
+        self._loader = loader
+        self._worker = worker
+
+    async def run(
+        self,
+        jobs: Sequence[BatchSourceJob],
+        algorithm: str,
+        config: dict[str, Any] | None,
+        on_result: Callable[[BatchSourceJob, dict[str, Any] | None, BaseException | None], Awaitable[None]],
+        on_start: Callable[[BatchSourceJob], Awaitable[None]] | None = None,
+    ) -> None:
+        """Run all jobs, reporting each result as soon as it is available.
+
+        Args:
+            jobs: Sources to analyze.
+            algorithm: Algorithm name.
+            config: Detection configuration shared by all sources.
+            on_result: Awaited with ``(job, result, error)`` per source.
+            on_start: Awaited when a source starts fitting.
+        """
+        loop = asyncio.get_running_loop()
+        pool = self._pool or get_anomaly_process_pool()
+        in_flight = asyncio.Semaphore(self._max_workers + self._prefetch)
+        fitting = asyncio.Semaphore(self._max_workers)
+
+        async def process(job: BatchSourceJob) -> None:
+            result = None
+            error: BaseException | None = None
+            async with in_flight:
+                try:
+                    df = await asyncio.to_thread(self._loader, job.source_config, config)
+                    async with fitting:
+                        if on_start is not None:
+                            await on_start(job)
+                        result = await loop.run_in_executor(
+                            pool, self._worker, df, algorithm, config
+                        )
+                except Exception as e:
+                    error = e
+            await on_result(job, result, error)
+
+        await asyncio.gather(*(process(job) for job in jobs))
+
+
+class AnomalyDetectionService(AnomalyAlgorithmRunner):
+    """Service for ML-based anomaly detection.
+
+    Provides functionality for:
+    - Running anomaly detection with various algorithms
+    - Managing detection history
+    - Retrieving algorithm information
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        """Initialize service.
+
+        Args:
+            session: Database session.
+        """
+        self.session = session
+        self.repo = AnomalyDetectionRepository(session)
+
+    # =========================================================================
+    # Detection Operations
+    # =========================================================================
+
+    async def create_detection(
+        self,
+        source_id: str,
+        *,
+        algorithm: str = "isolation_forest",
+        columns: list[str] | None = None,
+        config: dict[str, Any] | None = None,
+        sample_size: int | None = None,
+    ) -> AnomalyDetection:
+        """Create a new anomaly detection record.
+
+        This creates a pending detection that should be executed separately.
+
+        Args:
+            source_id: Source ID to analyze.
+            algorithm: Detection algorithm to use.
+            columns: Columns to analyze (None = all numeric).
+            config: Algorithm-specific configuration.
+            sample_size: Sample size for large datasets.
+
+        Returns:
+            Created detection record.
+
+        Raises:
+            ValueError: If source not found.
+        """
+        # Verify source exists
+        result = await self.session.execute(
+            select(Source).where(Source.id == source_id)
+        )
+        source = result.scalar_one_or_none()
+        if source is None:
+            raise ValueError(f"Source '{source_id}' not found")
+
+        # Prepare configuration
+        full_config = config or {}
+        if columns:
+            full_config["columns"] = columns
+        if sample_size:
+            full_config["sample_size"] = sample_size
+
+        detection = await self.repo.create(
+            source_id=source_id,
+            algorithm=algorithm,
+            config=full_config if full_config else None,
+            columns_analyzed=columns,
+            status="pending",
+        )
+
+        return detection
+
+    async def run_detection(
+        self,
+        detection_id: str,
+    ) -> AnomalyDetection:
+        """Execute anomaly detection.
+
+        This runs the actual ML algorithm on the source data.
+
+        Args:
+            detection_id: Detection record ID.
+
+        Returns:
+            Updated detection with results.
+
+        Raises:
+            ValueError: If detection not found.
+        """
+        detection = await self.repo.get_by_id(detection_id)
+        if detection is None:
+            raise ValueError(f"Detection '{detection_id}' not found")
+
+        # Mark as started
+        detection.mark_started()
+        await self.session.flush()
+
+        try:
+            # Get source info
+            result = await self.session.execute(
+                select(Source).where(Source.id == detection.source_id)
+            )
+            source = result.scalar_one_or_none()
+            if source is None:
+                raise ValueError(f"Source '{detection.source_id}' not found")
+
+            # Run the actual detection using truthound
+            detection_result = await self._execute_detection(
+                source=source,
+                algorithm=detection.algorithm,
+                config=detection.config,
+            )
+            self._apply_detection_result(detection, detection_result)
+
+        except Exception as e:
+            detection.mark_error(str(e))
+
+        await self.session.flush()
+        await self.session.refresh(detection)
+        return detection
+
+    def _apply_detection_result(
+        self,
+        detection: AnomalyDetection,
+        detection_result: dict[str, Any],
+    ) -> None:
+        """Copy detection results onto the record and mark it completed."""
+        detection.total_rows = detection_result.get("total_rows", 0)
+        detection.anomaly_count = detection_result.get("anomaly_count", 0)
+        detection.anomaly_rate = detection_result.get("anomaly_rate", 0.0)
+        detection.columns_analyzed = detection_result.get("columns_analyzed", [])
+        detection.mark_completed(
+            anomaly_count=detection.anomaly_count,
+            anomaly_rate=detection.anomaly_rate,
+            result=detection_result,
+        )
+
+    async def _execute_detection(
+        self,
+        source: Source,
+        algorithm: str,
+        config: dict[str, Any] | None,
+    ) -> dict[str, Any]:
+        """Execute the anomaly detection algorithm.
+
+        Loading runs in a thread and fitting in the anomaly process pool, so
+        the event loop stays responsive for the whole fit.
+
+        Args:
+            source: Source to analyze.
+            algorithm: Algorithm to use.
+            config: Algorithm configuration.
+
+        Returns:
+            Detection results dictionary.
+        """
+        loop = asyncio.get_running_loop()
+        df = await asyncio.to_thread(load_source_frame, source.config, config)
+        try:
+            return await loop.run_in_executor(
+                get_anomaly_process_pool(),
+                run_detection_algorithm,
+                df,
+                algorithm,
+                config,
+            )
+        except ImportError as exc:
+            raise RuntimeError(
+                "Truthound 3.0 anomaly features are unavailable. "
+                "Install truthound with the ML extras required by this dashboard."
+            ) from exc
+
     # =========================================================================
     # Query Operations
     # =========================================================================
@@ -939,7 +1203,12 @@ class AnomalyDetectionService:
         Returns:
             True if deleted.
         """
-        return await self.repo.delete(detection_id)
+        from truthound_dashboard.core.anomaly_explainer import get_explainer_model_store
+
+        deleted = await self.repo.delete(detection_id)
+        if deleted:
+            await asyncio.to_thread(get_explainer_model_store().delete, detection_id)
+        return deleted
 
     # =========================================================================
     # Algorithm Information
@@ -1046,13 +1315,18 @@ class AnomalyDetectionService:
     async def run_batch_detection(
         self,
         batch_id: str,
+        *,
+        executor: AnomalyBatchExecutor | None = None,
     ) -> AnomalyBatchJob:
         """Execute batch anomaly detection.
 
-        This runs detection on all sources in the batch sequentially.
+        Sources are detected concurrently on the anomaly process pool. Each
+        finished source is committed to the batch job and broadcast to the
+        ``anomaly_batches`` WebSocket room as it completes.
 
         Args:
             batch_id: Batch job ID.
+            executor: Batch executor. Uses a default executor if not provided.
 
         Returns:
             Updated batch job with results.
@@ -1069,34 +1343,23 @@ class AnomalyDetectionService:
         await self.session.flush()
 
         try:
-            # Process each source
+            # Create a pending detection per source up front
+            jobs: list[BatchSourceJob] = []
             for source_id in batch_job.source_ids:
-                # Update current source
-                batch_job.current_source_id = source_id
-                await self.session.flush()
-
                 try:
-                    # Create detection for this source
                     detection = await self.create_detection(
                         source_id=source_id,
                         algorithm=batch_job.algorithm,
-                        config=batch_job.config,
+                        config=dict(batch_job.config or {}),
                     )
-
-                    # Run the detection
-                    detection = await self.run_detection(detection.id)
-
-                    # Update batch progress
-                    batch_job.update_progress(
-                        source_id=source_id,
-                        detection_id=detection.id,
-                        status=detection.status,
-                        anomaly_count=detection.anomaly_count or 0,
-                        anomaly_rate=detection.anomaly_rate or 0.0,
-                        total_rows=detection.total_rows or 0,
-                        error_message=detection.error_message,
+                    source = await self.session.get(Source, source_id)
+                    jobs.append(
+                        BatchSourceJob(
+                            source_id=source_id,
+                            detection_id=detection.id,
+                            source_config=dict(source.config or {}),
+                        )
                     )
-
                 except Exception as e:
                     # Record error for this source but continue
                     batch_job.update_progress(
@@ -1105,8 +1368,51 @@ class AnomalyDetectionService:
                         status="error",
                         error_message=str(e),
                     )
+            await self._publish_batch_progress(batch_job)
+
+            # Callbacks share the session, so serialize their database work
+            lock = asyncio.Lock()
+
+            async def on_start(job: BatchSourceJob) -> None:
+                async with lock:
+                    detection = await self.repo.get_by_id(job.detection_id)
+                    if detection is not None:
+                        detection.mark_started()
+                    batch_job.current_source_id = job.source_id
+                    await self.session.flush()
+
+            async def on_result(
+                job: BatchSourceJob,
+                result: dict[str, Any] | None,
+                error: BaseException | None,
+            ) -> None:
+                async with lock:
+                    detection = await self.repo.get_by_id(job.detection_id)
+                    if detection is None:
+                        return
+                    if error is None and result is not None:
+                        self._apply_detection_result(detection, result)
+                    else:
+                        detection.mark_error(str(error))
 
-                await self.session.flush()
+                    batch_job.update_progress(
+                        source_id=job.source_id,
+                        detection_id=detection.id,
+                        status=detection.status,
+                        anomaly_count=detection.anomaly_count or 0,
+                        anomaly_rate=detection.anomaly_rate or 0.0,
+                        total_rows=detection.total_rows or 0,
+                        error_message=detection.error_message,
+                    )
+                    await self._publish_batch_progress(batch_job, source_id=job.source_id)
+
+            await (executor or AnomalyBatchExecutor()).run(
+                jobs,
+                batch_job.algorithm,
+                batch_job.config,
+                on_result=on_result,
+                on_start=on_start,
+            )
 
             # Mark batch as completed
             batch_job.mark_completed()
@@ -1114,10 +1420,54 @@ class AnomalyDetectionService:
         except Exception as e:
             batch_job.mark_error(str(e))
 
-        await self.session.flush()
+        await self._publish_batch_progress(batch_job)
         await self.session.refresh(batch_job)
         return batch_job
 
+    async def _publish_batch_progress(
+        self,
+        batch_job: AnomalyBatchJob,
+        source_id: str | None = None,
+    ) -> None:
+        """Flush batch progress and broadcast it to WebSocket subscribers.
+
+        Progress stays in the caller's unit of work and is committed with
+        it; subscribers of the batch room see it live.
+        """
+        await self.session.flush()
+
+        from truthound_dashboard.core.websocket import (
+            WebSocketMessage,
+            WebSocketMessageType,
+            get_websocket_manager,
+        )
+
+        message_type = (
+            WebSocketMessageType.ANOMALY_BATCH_COMPLETED
+            if batch_job.is_complete
+            else WebSocketMessageType.ANOMALY_BATCH_PROGRESS
+        )
+        data: dict[str, Any] = {
+            "batch_id": batch_job.id,
+            "status": batch_job.status,
+            "total_sources": batch_job.total_sources,
+            "completed_sources": batch_job.completed_sources,
+            "failed_sources": batch_job.failed_sources,
+            "progress_percent": batch_job.progress_percent,
+            "total_anomalies": batch_job.total_anomalies,
+        }
+        if source_id is not None:
+            data["source_id"] = source_id
+            data["source_result"] = (batch_job.results_json or {}).get(source_id)
+
+        try:
+            await get_websocket_manager().broadcast_to_room(
+                ANOMALY_BATCH_ROOM,
+                WebSocketMessage(type=message_type, data=data),
+            )
+        except Exception as e:
+            logger.warning(f"Failed to broadcast anomaly batch progress: {e}")
+
     async def get_batch_job(self, batch_id: str) -> AnomalyBatchJob | None:
         """Get a batch job by ID.
 
@@ -1254,6 +1604,11 @@ class AnomalyDetectionService:
     ) -> dict[str, Any]:
         """Run multiple algorithms on the same data and compare results.
 
+        The source is loaded and prepared into a single ``FeatureMatrix``
+        (cached by source fingerprint), which every algorithm reads without
+        copying. Algorithms run concurrently in worker threads, so the
+        comparison takes roughly as long as its slowest model.
+
         Args:
             source_id: Source ID to analyze.
             algorithms: List of algorithm names to compare.
@@ -1269,7 +1624,8 @@ class AnomalyDetectionService:
         """
         import time
         import uuid
-        from collections import defaultdict
+
+        import numpy as np
 
         if len(algorithms) < 2:
             raise ValueError("At least 2 algorithms required for comparison")
@@ -1286,40 +1642,17 @@ class AnomalyDetectionService:
         comparison_id = str(uuid.uuid4())
         created_at = datetime.now()
 
-        # Load data once
+        # Load and prepare data once
+        features: FeatureMatrix | None = None
         try:
-            from truthound.datasources import get_datasource
-            import numpy as np
-            import pandas as pd
-
-            # Load data using truthound datasources factory
-            datasource = get_datasource(source.config.get("path", source.config))
-            df = datasource.to_polars_lazyframe().collect().to_pandas()
-
-            # Sample if needed
-            if sample_size and len(df) > sample_size:
-                df = df.sample(n=sample_size, random_state=42)
-
-            # Select columns
-            if columns:
-                df_analyze = df[columns].select_dtypes(include=[np.number])
-            else:
-                df_analyze = df.select_dtypes(include=[np.number])
-                columns = list(df_analyze.columns)
-
-            total_rows = len(df_analyze)
-            columns_analyzed = columns
+            features, _ = await load_feature_matrix(source, columns, sample_size)
+            total_rows = features.n_rows
+            columns_analyzed = list(features.columns)
 
         except ImportError:
             # Mock mode
             total_rows = 5000
             columns_analyzed = columns or ["col_a", "col_b", "col_c"]
-            df = None
-            df_analyze = None
-
-        # Run each algorithm and collect results
-        algorithm_results = []
-        all_anomaly_indices: dict[str, set[int]] = {}
 
         algorithm_display_names = {
             "isolation_forest": "Isolation Forest",
@@ -1330,67 +1663,61 @@ class AnomalyDetectionService:
             "autoencoder": "Autoencoder",
         }
 
-        for algorithm in algorithms:
+        def detect_indices(algorithm: str, algo_config: dict[str, Any]) -> set[int]:
+            if features is not None and not features.empty:
+                # Run actual detection on the shared matrix
+                detection_result = self._detect(features, algorithm, algo_config)
+                return set(int(i) for i in np.where(detection_result["is_anomaly"])[0])
+
+            # Mock results
+            import random
+            anomaly_count = int(total_rows * random.uniform(0.05, 0.15))
+            return set(random.sample(range(total_rows), anomaly_count))
+
+        async def run_one(algorithm: str) -> tuple[dict[str, Any], set[int]]:
             algo_start = time.time()
             algo_config = (config or {}).get(algorithm, {})
-
             try:
-                if df_analyze is not None and not df_analyze.empty:
-                    # Run actual detection
-                    detection_result = self._run_algorithm(
-                        df=df_analyze,
-                        algorithm=algorithm,
-                        columns=columns_analyzed,
-                        sample_size=None,  # Already sampled
-                        params=algo_config,
-                    )
-
-                    is_anomaly = detection_result["is_anomaly"]
-                    anomaly_indices = set(int(i) for i in np.where(is_anomaly)[0])
-                    anomaly_count = len(anomaly_indices)
-                    anomaly_rate = anomaly_count / total_rows if total_rows > 0 else 0.0
-
-                else:
-                    # Mock results
-                    import random
-                    base_rate = random.uniform(0.05, 0.15)
-                    anomaly_count = int(total_rows * base_rate)
-                    anomaly_rate = base_rate
-                    anomaly_indices = set(random.sample(range(total_rows), anomaly_count))
-
-                duration_ms = int((time.time() - algo_start) * 1000)
-                all_anomaly_indices[algorithm] = anomaly_indices
-
-                algorithm_results.append({
-                    "algorithm": algorithm,
-                    "display_name": algorithm_display_names.get(algorithm, algorithm),
-                    "status": "success",
-                    "anomaly_count": anomaly_count,
-                    "anomaly_rate": anomaly_rate,
-                    "duration_ms": duration_ms,
-                    "error_message": None,
-                    "anomaly_indices": list(anomaly_indices)[:1000],  # Limit stored indices
-                })
-
+                anomaly_indices = await asyncio.to_thread(
+                    detect_indices, algorithm, algo_config
+                )
             except Exception as e:
-                duration_ms = int((time.time() - algo_start) * 1000)
-                all_anomaly_indices[algorithm] = set()
-                algorithm_results.append({
+                return {
                     "algorithm": algorithm,
                     "display_name": algorithm_display_names.get(algorithm, algorithm),
                     "status": "error",
                     "anomaly_count": None,
                     "anomaly_rate": None,
-                    "duration_ms": duration_ms,
+                    "duration_ms": int((time.time() - algo_start) * 1000),
                     "error_message": str(e),
                     "anomaly_indices": [],
-                })
+                }, set()
+
+            anomaly_count = len(anomaly_indices)
+            return {
+                "algorithm": algorithm,
+                "display_name": algorithm_display_names.get(algorithm, algorithm),
+                "status": "success",
+                "anomaly_count": anomaly_count,
+                "anomaly_rate": anomaly_count / total_rows if total_rows > 0 else 0.0,
+                "duration_ms": int((time.time() - algo_start) * 1000),
+                "error_message": None,
+                "anomaly_indices": list(anomaly_indices)[:1000],  # Limit stored indices
+            }, anomaly_indices
+
+        # Run all algorithms concurrently and collect results in request order
+        outcomes = await asyncio.gather(*(run_one(algorithm) for algorithm in algorithms))
+        algorithm_results = [outcome for outcome, _ in outcomes]
+        all_anomaly_indices: dict[str, set[int]] = {
+            algorithm: indices
+            for algorithm, (_, indices) in zip(algorithms, outcomes, strict=True)
+        }
 
         # Calculate agreement
         agreement_summary, agreement_records = self._calculate_agreement(
             algorithms=algorithms,
             all_anomaly_indices=all_anomaly_indices,
-            df=df_analyze if df_analyze is not None else None,
+            features=features,
         )
 
         total_duration_ms = int((time.time() - start_time) * 1000)
@@ -1424,14 +1751,14 @@ class AnomalyDetectionService:
         self,
         algorithms: list[str],
         all_anomaly_indices: dict[str, set[int]],
-        df: Any | None = None,
+        features: FeatureMatrix | None = None,
     ) -> tuple[dict[str, Any], list[dict[str, Any]]]:
         """Calculate agreement between algorithms.
 
         Args:
             algorithms: List of algorithm names.
             all_anomaly_indices: Mapping of algorithm to anomaly indices.
-            df: DataFrame for column values (optional).
+            features: Feature matrix for column values (optional).
 
         Returns:
             Tuple of (agreement_summary, agreement_records).
@@ -1478,11 +1805,8 @@ class AnomalyDetectionService:
 
             # Get column values if available
             column_values = {}
-            if df is not None:
-                try:
-                    column_values = df.iloc[row_index].to_dict()
-                except (IndexError, KeyError):
-                    pass
+            if features is not None and row_index < features.n_rows:
+                column_values = features.row_values(row_index)
 
             agreement_records.append({
                 "row_index": row_index,
@@ -5,8 +5,11 @@ using SHAP (SHapley Additive exPlanations) and LIME (Local Interpretable
 Model-agnostic Explanations).
 
 Features:
-- SHAP TreeExplainer for tree-based models (Isolation Forest)
-- SHAP KernelExplainer as fallback for other models
+- SHAP TreeExplainer for tree-based models (Isolation Forest), batched over
+  all requested rows
+- SHAP KernelExplainer for other models, with a sampled background set and
+  rows fanned out across the anomaly process pool
+- Fitted models persisted per detection and reused across requests
 - Feature importance ranking
 - Local explanations per anomaly
 - Human-readable summary generation
@@ -14,19 +17,267 @@ Features:
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
-import json
-from collections.abc import Sequence
-from datetime import datetime
+import logging
+import os
+import pickle
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Any
 
 import numpy as np
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from truthound_dashboard.db.models import AnomalyDetection, AnomalyExplanation, Source
 from truthound_dashboard.time import utc_now
 
+logger = logging.getLogger(__name__)
+
+# Model evaluations per explained row for Kernel SHAP.
+KERNEL_SHAP_NSAMPLES = 100
+
+# Fitted models kept in memory on top of the on-disk store.
+MODEL_CACHE_SIZE = 16
+
+# Seed for background sampling and permutations, so explanations are stable.
+EXPLAIN_SEED = 42
+
+# Algorithms whose models are fitted on standardized features.
+_SCALED_ALGORITHMS = {"lof", "one_class_svm", "dbscan"}
+
+
+# =============================================================================
+# Fitted Models
+# =============================================================================
+
+
+@dataclass
+class FittedExplainerModel:
+    """A model fitted for one detection, reusable across explanation requests.
+
+    Attributes:
+        detection_id: Detection the model explains.
+        algorithm: Detection algorithm.
+        feature_names: Feature order the model was fitted on.
+        fingerprint: Source content digest at fit time (None if unknown).
+        scaled: Whether the model consumes standardized features.
+        model: Fitted sklearn estimator.
+    """
+
+    detection_id: str
+    algorithm: str
+    feature_names: list[str]
+    fingerprint: str | None
+    scaled: bool
+    model: Any
+    # TreeExplainer built on first use; kept in memory only.
+    tree_explainer: Any = field(default=None, repr=False, compare=False)
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = dict(self.__dict__)
+        state["tree_explainer"] = None
+        return state
+
+
+def build_explainer_model(algorithm: str, config: dict[str, Any]) -> Any:
+    """Build the sklearn model used to explain a detection.
+
+    Every returned model can score rows it was not fitted on, which SHAP
+    and permutation explanations require.
+    """
+    if algorithm == "lof":
+        from sklearn.neighbors import LocalOutlierFactor
+        return LocalOutlierFactor(
+            n_neighbors=config.get("n_neighbors", 20),
+            contamination=config.get("contamination", 0.1),
+            novelty=True,
+        )
+
+    elif algorithm == "one_class_svm":
+        from sklearn.svm import OneClassSVM
+        return OneClassSVM(
+            kernel=config.get("kernel", "rbf"),
+            nu=config.get("nu", 0.1),
+            gamma=config.get("gamma", "scale"),
+        )
+
+    elif algorithm == "dbscan":
+        from sklearn.cluster import DBSCAN
+        return DBSCAN(
+            eps=config.get("eps", 0.5),
+            min_samples=config.get("min_samples", 5),
+        )
+
+    # Isolation Forest, and the default for algorithms without an sklearn model
+    from sklearn.ensemble import IsolationForest
+    return IsolationForest(
+        n_estimators=config.get("n_estimators", 100),
+        contamination=config.get("contamination", 0.1),
+        max_samples=config.get("max_samples", "auto"),
+        random_state=config.get("random_state", 42),
+    )
+
+
+def anomaly_scores(model: Any, X: np.ndarray) -> np.ndarray:
+    """Score rows with a fitted model (higher = more anomalous)."""
+    if hasattr(model, "score_samples"):
+        return -model.score_samples(X)
+    if hasattr(model, "decision_function"):
+        return -model.decision_function(X)
+    if hasattr(model, "components_"):
+        # DBSCAN: distance to the nearest core sample
+        from sklearn.metrics import pairwise_distances
+
+        if len(model.components_) == 0:
+            return np.zeros(len(X))
+        return pairwise_distances(X, model.components_).min(axis=1)
+    return np.zeros(len(X))
+
+
+def kernel_shap_values(
+    model: Any,
+    background: np.ndarray,
+    X_explain: np.ndarray,
+    nsamples: int = KERNEL_SHAP_NSAMPLES,
+) -> np.ndarray:
+    """Compute Kernel SHAP values for a chunk of rows.
+
+    Module-level so chunks can be pickled into process-pool workers.
+    """
+    import shap
+
+    explainer = shap.KernelExplainer(lambda x: anomaly_scores(model, x), background)
+    return np.asarray(explainer.shap_values(X_explain, nsamples=nsamples, silent=True))
+
+
+def permutation_importance(
+    model: Any,
+    X_explain: np.ndarray,
+    background: np.ndarray,
+    seed: int = EXPLAIN_SEED,
+) -> np.ndarray:
+    """Approximate feature contributions by replacing one feature at a time.
+
+    Each feature of each row is replaced with a value drawn from the
+    background sample, and all perturbed rows are scored in one batched
+    model call.
+
+    Returns:
+        ``(n_rows, n_features)`` array of score changes.
+    """
+    rng = np.random.default_rng(seed)
+    n_rows, n_features = X_explain.shape
+    base_scores = anomaly_scores(model, X_explain)
+
+    # Block j holds every row with feature j replaced.
+    perturbed = np.tile(X_explain, (n_features, 1))
+    draws = rng.integers(0, len(background), size=(n_features, n_rows))
+    for j in range(n_features):
+        perturbed[j * n_rows:(j + 1) * n_rows, j] = background[draws[j], j]
+
+    permuted_scores = anomaly_scores(model, perturbed).reshape(n_features, n_rows)
+    return (permuted_scores - base_scores).T
+
+
+class ExplainerModelStore:
+    """File-backed store of fitted explainer models, one per detection.
+
+    Models are pickled under ``<root>/<detection>.model`` and replaced
+    atomically. A small in-memory LRU avoids unpickling hot models; a stored
+    model is only returned while the source fingerprint it was fitted on
+    still matches.
+    """
+
+    def __init__(self, root: Path, max_cached: int = MODEL_CACHE_SIZE) -> None:
+        self._root = root
+        self._max_cached = max_cached
+        self._cached: OrderedDict[str, FittedExplainerModel] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _path(self, detection_id: str) -> Path:
+        digest = hashlib.sha256(detection_id.encode()).hexdigest()[:24]
+        return self._root / f"{digest}.model"
+
+    def _remember(self, fitted: FittedExplainerModel) -> None:
+        with self._lock:
+            self._cached[fitted.detection_id] = fitted
+            self._cached.move_to_end(fitted.detection_id)
+            while len(self._cached) > self._max_cached:
+                self._cached.popitem(last=False)
+
+    def load(
+        self,
+        detection_id: str,
+        fingerprint: str | None,
+    ) -> FittedExplainerModel | None:
+        """Load the model for a detection, or None if missing or stale."""
+        with self._lock:
+            fitted = self._cached.get(detection_id)
+        if fitted is None:
+            path = self._path(detection_id)
+            try:
+                fitted = pickle.loads(path.read_bytes())
+            except FileNotFoundError:
+                return None
+            except (OSError, pickle.UnpicklingError, AttributeError, EOFError) as exc:
+                logger.info("Discarding stored explainer model %s: %s", path, exc)
+                return None
+            self._remember(fitted)
+
+        if fingerprint is not None and fitted.fingerprint != fingerprint:
+            return None
+        return fitted
+
+    def save(self, fitted: FittedExplainerModel) -> None:
+        """Persist a fitted model, replacing any previous version."""
+        path = self._path(fitted.detection_id)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_bytes(pickle.dumps(fitted, protocol=pickle.HIGHEST_PROTOCOL))
+        os.replace(tmp_path, path)
+        self._remember(fitted)
+
+    def delete(self, detection_id: str) -> bool:
+        """Delete the stored model of a detection.
+
+        Returns:
+            True if a stored model was removed.
+        """
+        with self._lock:
+            self._cached.pop(detection_id, None)
+        path = self._path(detection_id)
+        existed = path.exists()
+        path.unlink(missing_ok=True)
+        return existed
+
+
+_model_store: ExplainerModelStore | None = None
+
+
+def get_explainer_model_store() -> ExplainerModelStore:
+    """Get the explainer model store singleton."""
+    global _model_store
+    if _model_store is None:
+        from truthound_dashboard.config import get_settings
+
+        _model_store = ExplainerModelStore(get_settings().cache_dir / "anomaly_models")
+    return _model_store
+
+
+def reset_explainer_model_store() -> None:
+    """Reset the explainer model store singleton (for testing)."""
+    global _model_store
+    _model_store = None
+
+
+# =============================================================================
+# Explainer Service
+# =============================================================================
+
 
 class AnomalyExplainerService:
     """Service for generating SHAP/LIME explanations for anomaly detections.
@@ -36,14 +287,20 @@ class AnomalyExplainerService:
     anomalies.
     """
 
-    def __init__(self, session: AsyncSession) -> None:
+    def __init__(
+        self,
+        session: AsyncSession,
+        model_store: ExplainerModelStore | None = None,
+    ) -> None:
         """Initialize the explainer service.
 
         Args:
             session: Database session for persistence.
+            model_store: Store of fitted models. Uses the shared store if
+                not provided.
         """
         self.session = session
-        self._model_cache: dict[str, Any] = {}
+        self._model_store = model_store or get_explainer_model_store()
 
     async def explain_anomaly(
         self,
@@ -157,317 +414,237 @@ class AnomalyExplainerService:
         """Generate SHAP explanations for anomaly rows.
 
         This method uses the appropriate SHAP explainer based on the
-        algorithm used for detection.
+        algorithm used for detection. Rows are explained together: one
+        batched TreeSHAP call, or Kernel SHAP chunks spread over the anomaly
+        process pool.
         """
+        from truthound_dashboard.core.anomaly import load_feature_matrix
+
+        config = detection.config or {}
         try:
-            from truthound.datasources import get_datasource
+            # The same columns and seeded sample the detection analyzed, so
+            # row indices refer to the same rows.
+            features, fingerprint = await load_feature_matrix(
+                source,
+                columns=detection.columns_analyzed or config.get("columns"),
+                sample_size=config.get("sample_size"),
+            )
+        except ImportError:
+            # Fallback: generate mock explanations
+            return self._generate_mock_explanations(
+                detection, row_indices, max_features
+            )
 
-            # Load data using truthound datasources factory
-            datasource = get_datasource(source.config.get("path", source.config))
-            df = datasource.to_polars_lazyframe().collect().to_pandas()
+        if features.empty:
+            return {
+                "detection_id": detection.id,
+                "row_indices": row_indices,
+                "error": "No numeric columns to explain",
+                "explanations": [],
+            }
 
-            # Get columns that were analyzed
-            columns = detection.columns_analyzed or list(
-                df.select_dtypes(include=[np.number]).columns
-            )
+        # Get the rows to explain
+        valid_indices = [i for i in row_indices if 0 <= i < features.n_rows]
+        if not valid_indices:
+            return {
+                "detection_id": detection.id,
+                "row_indices": row_indices,
+                "error": "No valid row indices",
+                "explanations": [],
+            }
 
-            # Filter to analyzed columns and handle NaN
-            df_analyze = df[columns].select_dtypes(include=[np.number])
-            df_clean = df_analyze.fillna(df_analyze.mean())
+        fitted = await self._get_fitted_model(
+            detection,
+            features,
+            fingerprint.digest if fingerprint is not None else None,
+        )
+        X = features.scaled() if fitted.scaled else features.values
+        X_explain = X[valid_indices]
+        feature_names = list(features.columns)
+
+        # Generate SHAP values based on algorithm
+        shap_values = await self._compute_shap_values(
+            fitted=fitted,
+            X=X,
+            X_explain=X_explain,
+            sample_background=sample_background,
+        )
 
-            if df_clean.empty:
-                return {
-                    "detection_id": detection.id,
-                    "row_indices": row_indices,
-                    "error": "No numeric columns to explain",
-                    "explanations": [],
-                }
+        # Rank contributions for all rows at once
+        order = np.argsort(-np.abs(shap_values), axis=1, kind="stable")[:, :max_features]
+        raw_values = features.values[valid_indices]
+        scores_by_row = self._anomaly_score_map(detection)
 
-            # Get the rows to explain
-            valid_indices = [i for i in row_indices if i < len(df_clean)]
-            if not valid_indices:
-                return {
-                    "detection_id": detection.id,
-                    "row_indices": row_indices,
-                    "error": "No valid row indices",
-                    "explanations": [],
+        explanations = []
+        for i, row_idx in enumerate(valid_indices):
+            row_shap = shap_values[i]
+            top_contributions = [
+                {
+                    "feature": feature_names[j],
+                    "value": float(raw_values[i, j]),
+                    "shap_value": float(row_shap[j]),
+                    "contribution": float(abs(row_shap[j])),
                 }
+                for j in order[i]
+            ]
 
-            X = df_clean.values
-            X_explain = X[valid_indices]
-            feature_names = list(df_clean.columns)
+            # Get anomaly score from detection result
+            anomaly_score = scores_by_row.get(row_idx, 0.0)
 
-            # Generate SHAP values based on algorithm
-            shap_values = self._compute_shap_values(
-                X=X,
-                X_explain=X_explain,
-                algorithm=detection.algorithm,
-                config=detection.config,
-                sample_background=sample_background,
-            )
-
-            # Build explanation results
-            explanations = []
-            for i, row_idx in enumerate(valid_indices):
-                # Get feature contributions for this row
-                row_shap = shap_values[i] if i < len(shap_values) else np.zeros(len(feature_names))
-                row_values = X_explain[i] if i < len(X_explain) else np.zeros(len(feature_names))
-
-                # Create feature contributions
-                contributions = []
-                for j, (fname, shap_val, feat_val) in enumerate(
-                    zip(feature_names, row_shap, row_values)
-                ):
-                    contributions.append({
-                        "feature": fname,
-                        "value": float(feat_val),
-                        "shap_value": float(shap_val),
-                        "contribution": float(abs(shap_val)),
-                    })
-
-                # Sort by absolute contribution
-                contributions.sort(key=lambda x: x["contribution"], reverse=True)
-
-                # Limit to max features
-                top_contributions = contributions[:max_features]
-
-                # Get anomaly score from detection result
-                anomaly_score = self._get_anomaly_score(detection, row_idx)
-
-                # Generate summary text
-                summary = self._generate_summary(top_contributions, anomaly_score)
-
-                explanations.append({
-                    "row_index": row_idx,
-                    "anomaly_score": anomaly_score,
-                    "feature_contributions": top_contributions,
-                    "total_shap": float(np.sum(row_shap)),
-                    "summary": summary,
-                })
+            explanations.append({
+                "row_index": row_idx,
+                "anomaly_score": anomaly_score,
+                "feature_contributions": top_contributions,
+                "total_shap": float(np.sum(row_shap)),
+                "summary": self._generate_summary(top_contributions, anomaly_score),
+            })
 
-            return {
-                "detection_id": detection.id,
-                "algorithm": detection.algorithm,
-                "row_indices": valid_indices,
-                "feature_names": feature_names,
-                "explanations": explanations,
-                "generated_at": utc_now().isoformat(),
-            }
+        return {
+            "detection_id": detection.id,
+            "algorithm": detection.algorithm,
+            "row_indices": valid_indices,
+            "feature_names": feature_names,
+            "explanations": explanations,
+            "generated_at": utc_now().isoformat(),
+        }
 
-        except ImportError:
-            # Fallback: generate mock explanations
-            return self._generate_mock_explanations(
-                detection, row_indices, max_features
+    async def _get_fitted_model(
+        self,
+        detection: AnomalyDetection,
+        features: Any,
+        fingerprint: str | None,
+    ) -> FittedExplainerModel:
+        """Return the stored model for a detection, fitting it on first use."""
+        feature_names = list(features.columns)
+        fitted = await asyncio.to_thread(self._model_store.load, detection.id, fingerprint)
+        if fitted is not None and fitted.feature_names == feature_names:
+            return fitted
+
+        algorithm = detection.algorithm
+        scaled = algorithm in _SCALED_ALGORITHMS
+
+        def fit() -> FittedExplainerModel:
+            model = self._build_model(algorithm, detection.config or {})
+            model.fit(features.scaled() if scaled else features.values)
+            fitted = FittedExplainerModel(
+                detection_id=detection.id,
+                algorithm=algorithm,
+                feature_names=feature_names,
+                fingerprint=fingerprint,
+                scaled=scaled,
+                model=model,
             )
+            self._model_store.save(fitted)
+            return fitted
+
+        return await asyncio.to_thread(fit)
 
-    def _compute_shap_values(
+    async def _compute_shap_values(
         self,
+        fitted: FittedExplainerModel,
         X: np.ndarray,
         X_explain: np.ndarray,
-        algorithm: str,
-        config: dict[str, Any] | None,
         sample_background: int,
     ) -> np.ndarray:
         """Compute SHAP values using the appropriate explainer.
 
         Args:
+            fitted: Fitted model for the detection.
             X: Full feature matrix for background data.
             X_explain: Feature matrix for rows to explain.
-            algorithm: Detection algorithm used.
-            config: Algorithm configuration.
             sample_background: Number of background samples.
 
         Returns:
             Array of SHAP values for each row and feature.
         """
-        try:
-            import shap
-
-            # Use TreeExplainer for tree-based models
-            if algorithm == "isolation_forest":
-                return self._compute_isolation_forest_shap(
-                    X, X_explain, config, sample_background
-                )
-
-            # Use KernelExplainer as fallback
-            return self._compute_kernel_shap(X, X_explain, algorithm, config, sample_background)
+        rng = np.random.default_rng(EXPLAIN_SEED)
+        background_size = min(sample_background, len(X))
+        background = X[rng.choice(len(X), background_size, replace=False)]
 
+        try:
+            import shap  # noqa: F401
         except ImportError:
             # SHAP not installed, use permutation importance
-            return self._compute_permutation_importance(X, X_explain, algorithm, config)
+            return await asyncio.to_thread(
+                self._compute_permutation_importance, fitted, X_explain, background
+            )
+
+        # Use TreeExplainer for tree-based models
+        if hasattr(fitted.model, "estimators_"):
+            return await asyncio.to_thread(
+                self._compute_isolation_forest_shap, fitted, X_explain
+            )
+
+        # Use KernelExplainer as fallback
+        return await self._compute_kernel_shap(fitted, background, X_explain)
 
     def _compute_isolation_forest_shap(
         self,
-        X: np.ndarray,
+        fitted: FittedExplainerModel,
         X_explain: np.ndarray,
-        config: dict[str, Any] | None,
-        sample_background: int,
     ) -> np.ndarray:
-        """Compute SHAP values for Isolation Forest using TreeExplainer."""
-        import shap
-        from sklearn.ensemble import IsolationForest
-
-        config = config or {}
+        """Compute SHAP values for Isolation Forest using TreeExplainer.
 
-        # Build and train Isolation Forest
-        clf = IsolationForest(
-            n_estimators=config.get("n_estimators", 100),
-            contamination=config.get("contamination", 0.1),
-            max_samples=config.get("max_samples", "auto"),
-            random_state=config.get("random_state", 42),
-        )
-        clf.fit(X)
-
-        # Use TreeExplainer for efficient SHAP calculation
-        explainer = shap.TreeExplainer(clf)
-        shap_values = explainer.shap_values(X_explain)
+        The explainer is built once per fitted model and evaluates every
+        requested row in a single batched call.
+        """
+        import shap
 
-        return np.array(shap_values)
+        if fitted.tree_explainer is None:
+            fitted.tree_explainer = shap.TreeExplainer(fitted.model)
+        return np.asarray(fitted.tree_explainer.shap_values(X_explain))
 
-    def _compute_kernel_shap(
+    async def _compute_kernel_shap(
         self,
-        X: np.ndarray,
+        fitted: FittedExplainerModel,
+        background: np.ndarray,
         X_explain: np.ndarray,
-        algorithm: str,
-        config: dict[str, Any] | None,
-        sample_background: int,
     ) -> np.ndarray:
-        """Compute SHAP values using KernelExplainer (model-agnostic)."""
-        import shap
-        from sklearn.preprocessing import StandardScaler
-
-        config = config or {}
-
-        # Scale data
-        scaler = StandardScaler()
-        X_scaled = scaler.fit_transform(X)
-        X_explain_scaled = scaler.transform(X_explain)
+        """Compute SHAP values using KernelExplainer (model-agnostic).
 
-        # Build model based on algorithm
-        model = self._build_model(algorithm, config)
-        model.fit(X_scaled)
-
-        # Get prediction function
-        if hasattr(model, "score_samples"):
-            predict_fn = lambda x: -model.score_samples(x)
-        elif hasattr(model, "decision_function"):
-            predict_fn = lambda x: -model.decision_function(x)
-        else:
-            predict_fn = lambda x: model.fit_predict(x).astype(float)
-
-        # Sample background data
-        background_size = min(sample_background, len(X_scaled))
-        background_indices = np.random.choice(
-            len(X_scaled), background_size, replace=False
+        Rows are split into one chunk per worker and explained in parallel
+        on the anomaly process pool against the same sampled background.
+        """
+        from truthound_dashboard.core.anomaly import (
+            anomaly_worker_count,
+            get_anomaly_process_pool,
         )
-        background = X_scaled[background_indices]
-
-        # Create KernelExplainer
-        explainer = shap.KernelExplainer(predict_fn, background)
-
-        # Compute SHAP values
-        shap_values = explainer.shap_values(X_explain_scaled, nsamples=100)
 
-        return np.array(shap_values)
+        loop = asyncio.get_running_loop()
+        pool = get_anomaly_process_pool()
+        n_chunks = max(1, min(anomaly_worker_count(), len(X_explain)))
+        chunks = np.array_split(X_explain, n_chunks)
+        results = await asyncio.gather(
+            *(
+                loop.run_in_executor(
+                    pool, kernel_shap_values, fitted.model, background, chunk
+                )
+                for chunk in chunks
+            )
+        )
+        return np.vstack(results)
 
     def _build_model(self, algorithm: str, config: dict[str, Any]) -> Any:
         """Build the appropriate sklearn model for the algorithm."""
-        if algorithm == "isolation_forest":
-            from sklearn.ensemble import IsolationForest
-            return IsolationForest(
-                n_estimators=config.get("n_estimators", 100),
-                contamination=config.get("contamination", 0.1),
-                random_state=config.get("random_state", 42),
-            )
-
-        elif algorithm == "lof":
-            from sklearn.neighbors import LocalOutlierFactor
-            return LocalOutlierFactor(
-                n_neighbors=config.get("n_neighbors", 20),
-                contamination=config.get("contamination", 0.1),
-                novelty=False,
-            )
-
-        elif algorithm == "one_class_svm":
-            from sklearn.svm import OneClassSVM
-            return OneClassSVM(
-                kernel=config.get("kernel", "rbf"),
-                nu=config.get("nu", 0.1),
-                gamma=config.get("gamma", "scale"),
-            )
-
-        elif algorithm == "dbscan":
-            from sklearn.cluster import DBSCAN
-            return DBSCAN(
-                eps=config.get("eps", 0.5),
-                min_samples=config.get("min_samples", 5),
-            )
-
-        else:
-            # Default to Isolation Forest
-            from sklearn.ensemble import IsolationForest
-            return IsolationForest(random_state=42)
+        return build_explainer_model(algorithm, config)
 
     def _compute_permutation_importance(
         self,
-        X: np.ndarray,
+        fitted: FittedExplainerModel,
         X_explain: np.ndarray,
-        algorithm: str,
-        config: dict[str, Any] | None,
+        background: np.ndarray,
     ) -> np.ndarray:
         """Fallback: compute approximate feature importance via permutation."""
-        config = config or {}
-
-        # Build and train model
-        model = self._build_model(algorithm, config)
-
-        from sklearn.preprocessing import StandardScaler
-        scaler = StandardScaler()
-        X_scaled = scaler.fit_transform(X)
-        X_explain_scaled = scaler.transform(X_explain)
+        return permutation_importance(fitted.model, X_explain, background)
 
-        model.fit(X_scaled)
-
-        # Get base predictions/scores
-        if hasattr(model, "score_samples"):
-            base_scores = -model.score_samples(X_explain_scaled)
-        elif hasattr(model, "decision_function"):
-            base_scores = -model.decision_function(X_explain_scaled)
-        else:
-            base_scores = np.zeros(len(X_explain_scaled))
-
-        # Compute permutation importance for each feature
-        n_features = X_explain_scaled.shape[1]
-        importances = np.zeros((len(X_explain_scaled), n_features))
-
-        for j in range(n_features):
-            X_permuted = X_explain_scaled.copy()
-            # Permute column j
-            X_permuted[:, j] = np.random.permutation(X_permuted[:, j])
-
-            if hasattr(model, "score_samples"):
-                permuted_scores = -model.score_samples(X_permuted)
-            elif hasattr(model, "decision_function"):
-                permuted_scores = -model.decision_function(X_permuted)
-            else:
-                permuted_scores = np.zeros(len(X_permuted))
-
-            # Importance is the change in score
-            importances[:, j] = permuted_scores - base_scores
-
-        return importances
-
-    def _get_anomaly_score(
-        self,
-        detection: AnomalyDetection,
-        row_index: int,
-    ) -> float:
-        """Get the anomaly score for a specific row from detection results."""
-        if detection.result_json and "anomalies" in detection.result_json:
-            for anomaly in detection.result_json["anomalies"]:
-                if anomaly.get("row_index") == row_index:
-                    return anomaly.get("anomaly_score", 0.0)
-        return 0.0
+    def _anomaly_score_map(self, detection: AnomalyDetection) -> dict[int, float]:
+        """Map row index to anomaly score from the detection results."""
+        anomalies = (detection.result_json or {}).get("anomalies") or []
+        return {
+            anomaly["row_index"]: anomaly.get("anomaly_score", 0.0)
+            for anomaly in anomalies
+            if "row_index" in anomaly
+        }
 
     def _generate_summary(
         self,
@@ -533,10 +710,11 @@ class AnomalyExplainerService:
         import random
 
         columns = detection.columns_analyzed or ["feature_1", "feature_2", "feature_3"]
+        scores_by_row = self._anomaly_score_map(detection)
 
         explanations = []
         for row_idx in row_indices:
-            anomaly_score = self._get_anomaly_score(detection, row_idx)
+            anomaly_score = scores_by_row.get(row_idx, 0.0)
             if anomaly_score == 0:
                 anomaly_score = random.uniform(0.5, 1.0)
 
@@ -577,38 +755,49 @@ class AnomalyExplainerService:
         row_indices: list[int],
         explanations_data: dict[str, Any],
     ) -> None:
-        """Save explanations to database for caching."""
-        for explanation in explanations_data.get("explanations", []):
-            row_idx = explanation["row_index"]
-
-            # Check if explanation already exists
-            existing = await self.session.execute(
-                select(AnomalyExplanation).where(
-                    AnomalyExplanation.detection_id == detection_id,
-                    AnomalyExplanation.row_index == row_idx,
-                )
+        """Save explanations to database for caching.
+
+        Existing rows are loaded with one query and updated in place; new
+        rows are written with a single bulk insert.
+        """
+        explanations = explanations_data.get("explanations", [])
+        if not explanations:
+            return
+
+        result = await self.session.execute(
+            select(AnomalyExplanation).where(
+                AnomalyExplanation.detection_id == detection_id,
+                AnomalyExplanation.row_index.in_(
+                    [exp["row_index"] for exp in explanations]
+                ),
             )
-            existing_exp = existing.scalar_one_or_none()
+        )
+        existing = {exp.row_index: exp for exp in result.scalars().all()}
 
+        now = utc_now()
+        new_rows = []
+        for explanation in explanations:
+            existing_exp = existing.get(explanation["row_index"])
             if existing_exp:
                 # Update existing
                 existing_exp.anomaly_score = explanation["anomaly_score"]
                 existing_exp.feature_contributions = explanation["feature_contributions"]
                 existing_exp.total_shap = explanation["total_shap"]
                 existing_exp.summary = explanation["summary"]
-                existing_exp.generated_at = utc_now()
+                existing_exp.generated_at = now
             else:
-                # Create new
-                new_explanation = AnomalyExplanation(
-                    detection_id=detection_id,
-                    row_index=row_idx,
-                    anomaly_score=explanation["anomaly_score"],
-                    feature_contributions=explanation["feature_contributions"],
-                    total_shap=explanation["total_shap"],
-                    summary=explanation["summary"],
-                )
-                self.session.add(new_explanation)
+                new_rows.append({
+                    "detection_id": detection_id,
+                    "row_index": explanation["row_index"],
+                    "anomaly_score": explanation["anomaly_score"],
+                    "feature_contributions": explanation["feature_contributions"],
+                    "total_shap": explanation["total_shap"],
+                    "summary": explanation["summary"],
+                    "generated_at": now,
+                })
 
+        if new_rows:
+            await self.session.execute(insert(AnomalyExplanation), new_rows)
         await self.session.flush()
 
     def _explanation_to_dict(self, explanation: AnomalyExplanation) -> dict[str, Any]:
@@ -0,0 +1,451 @@
+"""Prepared feature matrices for anomaly detection.
+
+Every detection algorithm needs the same numeric view of a source: the
+analyzed columns as a dense array, missing values imputed, and (for most
+models) standardized. ``FeatureMatrix`` builds that view once so algorithm
+comparisons can share it instead of re-deriving it per model.
+
+Only the analyzed numeric columns are ever materialized: the projection,
+Float32 cast and row sampling are pushed into the Polars scan, and the model
+input is produced by one ``to_numpy`` copy. No pandas is involved.
+
+Matrices are immutable once built. Derived views (standardized values, the
+Polars frame handed to truthound detectors) and per-algorithm results are
+computed lazily and memoized on the matrix, so concurrent algorithms read
+the same buffers without copying them.
+
+Example:
+    features = FeatureMatrix.from_frame(df, columns=["amount"], sample_size=10_000)
+    scaled = features.scaled()  # float32, C-contiguous, shared
+
+    cache = get_feature_matrix_cache()
+    cache.put(cache_key, features)
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+
+# Number of prepared matrices kept in memory for reuse across comparisons.
+FEATURE_CACHE_SIZE = 8
+
+# Memory budget for cached matrices, including their derived views.
+FEATURE_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+# Seed used when down-sampling rows, so repeated runs analyze the same rows.
+SAMPLE_SEED = 42
+
+
+def _is_numeric_dtype(dtype: Any) -> bool:
+    import polars as pl
+
+    # Booleans are not features, matching numpy's notion of "number".
+    return dtype.is_numeric() and dtype != pl.Boolean
+
+
+def numeric_columns(schema: Any, columns: list[str] | None = None) -> list[str]:
+    """Return the analyzable numeric columns of a Polars schema.
+
+    Args:
+        schema: Polars schema (name -> dtype mapping).
+        columns: Requested columns; None selects every numeric column.
+
+    Returns:
+        Numeric column names in request (or schema) order.
+    """
+    candidates = columns if columns else list(schema.keys())
+    return [name for name in candidates if name in schema and _is_numeric_dtype(schema[name])]
+
+
+def project_features(
+    data: Any,
+    columns: list[str] | None = None,
+    sample_size: int | None = None,
+) -> tuple[Any, int, dict[str, str]]:
+    """Collect only the analyzed numeric columns of a frame or scan.
+
+    The column projection and the Float32 cast are part of the lazy plan, so
+    file scans read nothing else. When ``sample_size`` is set, rows are
+    sampled inside the scan with a seeded streaming hash sample instead of
+    collecting the full frame first.
+
+    Args:
+        data: Polars DataFrame or LazyFrame.
+        columns: Columns to analyze (None = all numeric).
+        sample_size: Maximum number of rows to keep.
+
+    Returns:
+        Tuple of (Float32 DataFrame with NaN normalized to null, row count
+        before sampling, original dtype name per column).
+    """
+    import polars as pl
+
+    from truthound_dashboard.core.sampling import hash_sample
+
+    lf = data.lazy()
+    schema = lf.collect_schema()
+    selected = numeric_columns(schema, columns)
+    dtypes = {name: str(schema[name]) for name in selected}
+
+    if not selected:
+        source_rows = int(lf.select(pl.len()).collect().item())
+        return pl.DataFrame(), source_rows, dtypes
+
+    projected = lf.select(
+        pl.col(name).cast(pl.Float32).fill_nan(None) for name in selected
+    )
+    if isinstance(data, pl.DataFrame):
+        source_rows = data.height
+    elif sample_size:
+        source_rows = int(projected.select(pl.len()).collect().item())
+    else:
+        source_rows = -1
+
+    if sample_size and source_rows > sample_size:
+        frame = hash_sample(projected, sample_size, source_rows, seed=SAMPLE_SEED)
+    else:
+        frame = projected.collect()
+        source_rows = frame.height
+    return frame.rechunk(), source_rows, dtypes
+
+
+@dataclass(eq=False)
+class FeatureMatrix:
+    """Dense, imputed numeric view of a source shared by all algorithms.
+
+    Attributes:
+        columns: Analyzed column names, in matrix column order.
+        values: ``(n_rows, n_features)`` float32 C-contiguous array with
+            missing values replaced by the column mean.
+        missing: Boolean mask of the same shape, True where the source value
+            was null or NaN.
+        mean: Per-column mean of the observed values (float64).
+        std: Per-column population standard deviation; zero-variance
+            columns use 1.0 so standardization never divides by zero.
+        source_rows: Row count before sampling.
+        observed: Projected Float32 Polars frame with nulls where values
+            were missing (the matrix before imputation).
+        dtypes: Original dtype name of each analyzed column.
+    """
+
+    columns: tuple[str, ...]
+    values: np.ndarray
+    missing: np.ndarray
+    mean: np.ndarray
+    std: np.ndarray
+    source_rows: int
+    observed: Any = None
+    dtypes: dict[str, str] = field(default_factory=dict)
+    _scaled: np.ndarray | None = field(default=None, init=False, repr=False)
+    _frame: Any = field(default=None, init=False, repr=False)
+    _memo: dict[Hashable, Any] = field(default_factory=dict, init=False, repr=False)
+    _memo_locks: dict[Hashable, threading.Lock] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    @classmethod
+    def from_frame(
+        cls,
+        data: Any,
+        columns: list[str] | None = None,
+        sample_size: int | None = None,
+    ) -> FeatureMatrix:
+        """Build a feature matrix from a Polars DataFrame or LazyFrame.
+
+        Args:
+            data: Polars DataFrame or LazyFrame (e.g. a file scan).
+            columns: Columns to analyze. Non-numeric columns are dropped;
+                None selects all numeric columns.
+            sample_size: Down-sample to this many rows when set.
+
+        Returns:
+            Prepared feature matrix.
+        """
+        import polars as pl
+
+        frame, source_rows, dtypes = project_features(data, columns, sample_size)
+        if frame.width == 0:
+            rows = min(source_rows, sample_size) if sample_size else source_rows
+            empty = np.empty((rows, 0), dtype=np.float32)
+            return cls(
+                columns=(),
+                values=empty,
+                missing=empty.astype(bool),
+                mean=np.empty(0),
+                std=np.empty(0),
+                source_rows=source_rows,
+                observed=frame,
+                dtypes=dtypes,
+            )
+
+        # Mean and std of observed values for every column in one pass.
+        names = frame.columns
+        stats = frame.select(
+            *(pl.col(name).mean().alias(f"mean:{name}") for name in names),
+            *(pl.col(name).std(ddof=0).alias(f"std:{name}") for name in names),
+        ).row(0)
+        mean = np.array(
+            [v if v is not None else 0.0 for v in stats[: len(names)]], dtype=np.float64
+        )
+        std = np.array(
+            [v if v else 1.0 for v in stats[len(names) :]], dtype=np.float64
+        )
+
+        # One float32 copy into row-major layout; nulls arrive as NaN.
+        values = frame.to_numpy(order="c")
+        if values.dtype != np.float32 or not values.flags.c_contiguous:
+            values = np.ascontiguousarray(values, dtype=np.float32)
+        if not values.flags.writeable:
+            values = values.copy()
+        missing = np.isnan(values)
+        if missing.any():
+            rows, cols = np.nonzero(missing)
+            values[rows, cols] = mean[cols]
+
+        return cls(
+            columns=tuple(names),
+            values=values,
+            missing=missing,
+            mean=mean,
+            std=std,
+            source_rows=source_rows,
+            observed=frame,
+            dtypes=dtypes,
+        )
+
+    @property
+    def n_rows(self) -> int:
+        """Number of analyzed rows (after sampling)."""
+        return int(self.values.shape[0])
+
+    @property
+    def n_features(self) -> int:
+        """Number of analyzed columns."""
+        return int(self.values.shape[1])
+
+    @property
+    def empty(self) -> bool:
+        """True when there are no rows or no numeric columns to analyze."""
+        return self.n_rows == 0 or self.n_features == 0
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory held by the matrix and its derived views."""
+        total = self.values.nbytes + self.missing.nbytes
+        if self._scaled is not None:
+            total += self._scaled.nbytes
+        if self.observed is not None:
+            total += int(self.observed.estimated_size())
+        return total
+
+    def scaled(self) -> np.ndarray:
+        """Standardized values (zero mean, unit variance), computed once.
+
+        Returns:
+            float32 C-contiguous array. Treat it as read-only; it is shared
+            by every algorithm run on this matrix.
+        """
+        if self._scaled is None:
+            with self._lock:
+                if self._scaled is None:
+                    scaled = (self.values - self.mean.astype(np.float32)) / self.std.astype(
+                        np.float32
+                    )
+                    scaled = np.ascontiguousarray(scaled, dtype=np.float32)
+                    scaled.setflags(write=False)
+                    self._scaled = scaled
+        return self._scaled
+
+    def frame(self) -> Any:
+        """Imputed values as a Polars DataFrame for truthound detectors."""
+        if self._frame is None:
+            import polars as pl
+
+            with self._lock:
+                if self._frame is None:
+                    self._frame = self.observed.with_columns(
+                        pl.col(name).fill_null(float(self.mean[i]))
+                        for i, name in enumerate(self.columns)
+                    )
+        return self._frame
+
+    def column_summaries(self, anomaly_mask: np.ndarray) -> list[dict[str, Any]]:
+        """Per-column range and anomaly counts from a single aggregation.
+
+        Args:
+            anomaly_mask: Boolean anomaly flag per analyzed row.
+
+        Returns:
+            One dictionary per column with ``dtype``, ``anomaly_count``,
+            ``anomaly_rate``, ``min_value`` and ``max_value``. Anomalies are
+            only counted for a column where that column had a value.
+        """
+        import polars as pl
+
+        if not self.columns:
+            return []
+
+        flag = pl.Series(anomaly_mask, dtype=pl.Boolean)
+        row = self.observed.select(
+            *(pl.col(name).min().alias(f"min:{name}") for name in self.columns),
+            *(pl.col(name).max().alias(f"max:{name}") for name in self.columns),
+            *(
+                (pl.col(name).is_not_null() & pl.lit(flag)).sum().alias(f"anomalies:{name}")
+                for name in self.columns
+            ),
+        ).row(0, named=True)
+
+        n_rows = self.n_rows
+        summaries = []
+        for name in self.columns:
+            count = int(row[f"anomalies:{name}"] or 0)
+            low, high = row[f"min:{name}"], row[f"max:{name}"]
+            summaries.append({
+                "column": name,
+                "dtype": self.dtypes.get(name, "Float32"),
+                "anomaly_count": count,
+                "anomaly_rate": count / n_rows if n_rows > 0 else 0.0,
+                "min_value": float(low) if low is not None else None,
+                "max_value": float(high) if high is not None else None,
+            })
+        return summaries
+
+    def row_values(self, index: int) -> dict[str, float | None]:
+        """Observed (non-imputed) values of one row keyed by column."""
+        row = self.values[index]
+        gaps = self.missing[index]
+        return {
+            name: None if gaps[i] else float(row[i])
+            for i, name in enumerate(self.columns)
+        }
+
+    def memoize(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Compute a value once per key for this matrix.
+
+        Concurrent callers with the same key wait for the first computation
+        instead of repeating it, so an ensemble and a base model requested
+        in the same comparison fit that base model once.
+
+        Args:
+            key: Hashable identity of the computation.
+            compute: Zero-argument callable producing the value.
+
+        Returns:
+            The memoized value.
+        """
+        with self._lock:
+            if key in self._memo:
+                return self._memo[key]
+            key_lock = self._memo_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            with self._lock:
+                if key in self._memo:
+                    return self._memo[key]
+            value = compute()
+            with self._lock:
+                self._memo[key] = value
+            return value
+
+
+def params_key(name: str, params: dict[str, Any] | None) -> tuple[str, str]:
+    """Canonical memo key for an algorithm run with the given parameters."""
+    return name, json.dumps(params or {}, sort_keys=True, default=str)
+
+
+class FeatureMatrixCache:
+    """Thread-safe LRU cache of prepared feature matrices.
+
+    Keys are expected to include a content fingerprint of the source, so a
+    changed source never returns a stale matrix. The cache is bounded both
+    by entry count and by the total ``nbytes`` of its matrices; matrices
+    grow as derived views are memoized, so the budget is re-checked on
+    every ``put``.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = FEATURE_CACHE_SIZE,
+        max_bytes: int = FEATURE_CACHE_MAX_BYTES,
+    ) -> None:
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[str, FeatureMatrix] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> FeatureMatrix | None:
+        """Return the cached matrix for a key, if any."""
+        with self._lock:
+            features = self._entries.get(key)
+            if features is not None:
+                self._entries.move_to_end(key)
+            return features
+
+    def put(self, key: str, features: FeatureMatrix) -> None:
+        """Store a matrix, evicting the least recently used entries.
+
+        A matrix larger than the whole byte budget is not cached.
+        """
+        with self._lock:
+            if features.nbytes > self._max_bytes:
+                self._entries.pop(key, None)
+                return
+            self._entries[key] = features
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries or self._nbytes() > self._max_bytes:
+                self._entries.popitem(last=False)
+
+    def _nbytes(self) -> int:
+        return sum(features.nbytes for features in self._entries.values())
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory held by the cached matrices."""
+        with self._lock:
+            return self._nbytes()
+
+    def clear(self) -> None:
+        """Drop all cached matrices."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+_feature_cache: FeatureMatrixCache | None = None
+
+
+def get_feature_matrix_cache() -> FeatureMatrixCache:
+    """Get the feature matrix cache singleton."""
+    global _feature_cache
+    if _feature_cache is None:
+        _feature_cache = FeatureMatrixCache()
+    return _feature_cache
+
+
+def reset_feature_matrix_cache() -> None:
+    """Reset the feature matrix cache singleton (for tests)."""
+    global _feature_cache
+    _feature_cache = None
+
+
+__all__ = [
+    "FEATURE_CACHE_MAX_BYTES",
+    "FEATURE_CACHE_SIZE",
+    "FeatureMatrix",
+    "FeatureMatrixCache",
+    "get_feature_matrix_cache",
+    "numeric_columns",
+    "params_key",
+    "project_features",
+    "reset_feature_matrix_cache",
+]
@@ -0,0 +1,528 @@
+"""Background build queue for report and Data Docs artifacts.
+
+Artifact requests return a pending ArtifactRecord immediately; rendering
+and file writes happen in worker processes. Identical requests (same
+validation, artifact type and render options in a workspace) share one
+build: while a build is queued or running, further requests get the same
+artifact back.
+
+Build status is published to the ``artifact_builds`` WebSocket room:
+``artifact_build_progress`` when a build is queued or starts, and
+``artifact_build_completed`` when it completes or fails.
+
+Example:
+    queue = get_artifact_build_queue()
+    queue.submit(ArtifactBuildJob(artifact_id=..., build_key=..., ...))
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+import time
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import AbstractAsyncContextManager
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from truthound_dashboard.core.reporters.base import STREAM_CHUNK_SIZE
+from truthound_dashboard.db import ArtifactRecord, get_session
+
+logger = logging.getLogger(__name__)
+
+ARTIFACT_BUILDS_ROOM = "artifact_builds"
+
+
+# =============================================================================
+# Build inputs
+# =============================================================================
+
+
+@dataclass
+class SourceSnapshot:
+    """Source fields used by reporters."""
+
+    name: str
+
+
+@dataclass
+class ValidationSnapshot:
+    """Picklable copy of the Validation fields reporters read.
+
+    Worker processes cannot use ORM instances, so builds carry this
+    snapshot instead. It exposes the same attribute names as Validation.
+    """
+
+    id: str
+    source_id: str
+    status: str
+    passed: bool | None = None
+    has_critical: bool | None = None
+    has_high: bool | None = None
+    total_issues: int | None = None
+    critical_issues: int | None = None
+    high_issues: int | None = None
+    medium_issues: int | None = None
+    low_issues: int | None = None
+    row_count: int | None = None
+    column_count: int | None = None
+    result_json: dict[str, Any] | None = None
+    error_message: str | None = None
+    duration_ms: int | None = None
+    created_at: datetime | None = None
+    started_at: datetime | None = None
+    completed_at: datetime | None = None
+    source: SourceSnapshot | None = None
+
+    @classmethod
+    def from_model(cls, validation: Any) -> ValidationSnapshot:
+        """Snapshot a Validation model (its source only if already loaded)."""
+        source = None
+        if "source" not in inspect(validation).unloaded and validation.source:
+            source = SourceSnapshot(name=validation.source.name)
+        return cls(
+            id=validation.id,
+            source_id=validation.source_id,
+            status=validation.status,
+            passed=validation.passed,
+            has_critical=validation.has_critical,
+            has_high=validation.has_high,
+            total_issues=validation.total_issues,
+            critical_issues=validation.critical_issues,
+            high_issues=validation.high_issues,
+            medium_issues=validation.medium_issues,
+            low_issues=validation.low_issues,
+            row_count=validation.row_count,
+            column_count=validation.column_count,
+            result_json=validation.result_json,
+            error_message=validation.error_message,
+            duration_ms=validation.duration_ms,
+            created_at=validation.created_at,
+            started_at=validation.started_at,
+            completed_at=validation.completed_at,
+            source=source,
+        )
+
+
+@dataclass
+class ArtifactBuildJob:
+    """One queued artifact build.
+
+    Attributes:
+        artifact_id: ArtifactRecord receiving the result.
+        build_key: Hash identifying identical builds.
+        artifact_type: ``report`` or ``datadocs``.
+        file_path: Destination file.
+        validation: Snapshot of the validation being rendered.
+        options: Render options (format, theme, locale, title, ...).
+    """
+
+    artifact_id: str
+    build_key: str
+    artifact_type: str
+    file_path: str
+    validation: ValidationSnapshot
+    options: dict[str, Any] = field(default_factory=dict)
+
+
+def artifact_build_key(
+    *,
+    workspace_id: str | None,
+    validation_id: str,
+    artifact_type: str,
+    options: dict[str, Any],
+) -> str:
+    """Hash the inputs that determine an artifact's content.
+
+    Args:
+        workspace_id: Workspace the artifact belongs to.
+        validation_id: Validation being rendered.
+        artifact_type: ``report`` or ``datadocs``.
+        options: Render options.
+
+    Returns:
+        SHA-256 hex digest.
+    """
+    payload = {
+        "workspace_id": workspace_id,
+        "validation_id": validation_id,
+        "artifact_type": artifact_type,
+        "options": options,
+    }
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+# =============================================================================
+# Worker-side rendering (runs in worker processes)
+# =============================================================================
+
+
+def _load_truthound_datadocs_runtime() -> tuple[type[Any], Callable[..., str]]:
+    try:
+        from truthound import ValidationRunResult
+        from truthound.datadocs import (
+            generate_validation_report as generate_validation_datadocs,
+        )
+    except Exception as exc:  # pragma: no cover - exercised via runtime integration
+        raise RuntimeError(
+            "truthound>=3.0 with Data Docs support is required for artifact generation"
+        ) from exc
+
+    return ValidationRunResult, generate_validation_datadocs
+
+
+async def _write_stream(chunks: AsyncIterator[bytes], file_path: Path) -> tuple[int, str]:
+    """Write streamed content to ``file_path``, hashing it on the way.
+
+    Content goes to a temporary file that replaces ``file_path`` only once
+    the stream is complete, so a failed build never leaves a partial file.
+
+    Returns:
+        Size in bytes and SHA-256 hex digest of the content.
+    """
+    digest = hashlib.sha256()
+    size = 0
+    tmp_path = file_path.with_name(f".{file_path.name}.tmp")
+    try:
+        with tmp_path.open("wb") as handle:
+            async for chunk in chunks:
+                handle.write(chunk)
+                digest.update(chunk)
+                size += len(chunk)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return size, digest.hexdigest()
+
+
+async def _iter_bytes(content: bytes) -> AsyncIterator[bytes]:
+    for start in range(0, len(content), STREAM_CHUNK_SIZE):
+        yield content[start : start + STREAM_CHUNK_SIZE]
+
+
+async def _build(
+    artifact_type: str,
+    file_path: Path,
+    validation: ValidationSnapshot,
+    options: dict[str, Any],
+) -> dict[str, Any]:
+    if artifact_type == "report":
+        from truthound_dashboard.core.reporters import stream_report
+
+        report = stream_report(validation, **options)  # type: ignore[arg-type]
+        file_size, content_hash = await _write_stream(report.chunks, file_path)
+        metadata = {
+            "content_type": report.content_type,
+            "filename": report.filename,
+            "source_name": report.metadata.source_name,
+            "validation_id": report.metadata.validation_id,
+            "generated_at": report.metadata.generated_at.isoformat(),
+        }
+    elif artifact_type == "datadocs":
+        if not validation.result_json:
+            raise ValueError("Validation result is empty")
+        ValidationRunResult, generate_validation_datadocs = _load_truthound_datadocs_runtime()
+        title = options.get("title") or "Truthound Validation Data Docs"
+        html_content = generate_validation_datadocs(
+            ValidationRunResult.from_dict(validation.result_json),
+            title=title,
+            theme=options.get("theme") or "professional",
+        )
+        file_size, content_hash = await _write_stream(
+            _iter_bytes(html_content.encode("utf-8")), file_path
+        )
+        metadata = {"title": title}
+    else:
+        raise ValueError(f"Unknown artifact type: {artifact_type}")
+
+    return {"file_size": file_size, "content_hash": content_hash, "metadata": metadata}
+
+
+def build_artifact_file(
+    artifact_type: str,
+    file_path: str,
+    validation: ValidationSnapshot,
+    options: dict[str, Any],
+) -> dict[str, Any]:
+    """Render an artifact and write it to ``file_path``.
+
+    Entry point for worker processes; everything it needs is in its
+    (picklable) arguments.
+
+    Returns:
+        ``file_size``, ``content_hash`` and artifact ``metadata``.
+    """
+    return asyncio.run(_build(artifact_type, Path(file_path), validation, options))
+
+
+_process_pool: ProcessPoolExecutor | None = None
+
+
+def artifact_worker_count() -> int:
+    """Number of worker processes used for artifact builds."""
+    from truthound_dashboard.config import get_settings
+
+    return get_settings().artifact_max_workers or min(4, os.cpu_count() or 1)
+
+
+def get_artifact_process_pool() -> ProcessPoolExecutor:
+    """Get the shared process pool for artifact builds.
+
+    Workers are spawned rather than forked so they never inherit the event
+    loop or database connections of the server.
+    """
+    global _process_pool
+    if _process_pool is None:
+        _process_pool = ProcessPoolExecutor(
+            max_workers=artifact_worker_count(),
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _process_pool
+
+
+def shutdown_artifact_process_pool() -> None:
+    """Shut down the shared process pool (on application shutdown)."""
+    global _process_pool
+    if _process_pool is not None:
+        _process_pool.shutdown(wait=False, cancel_futures=True)
+        _process_pool = None
+
+
+# =============================================================================
+# Queue
+# =============================================================================
+
+
+class ArtifactBuildQueue:
+    """Runs artifact builds in the background with deduplication.
+
+    At most ``max_workers`` builds run at once; each renders in the worker
+    pool and then records its result on the ArtifactRecord. A build whose
+    key is already queued or running is not started again.
+
+    Usage:
+        queue = ArtifactBuildQueue()
+        if queue.active_build(build_key) is None:
+            queue.submit(job)
+    """
+
+    def __init__(
+        self,
+        *,
+        max_workers: int | None = None,
+        pool: Executor | None = None,
+        session_factory: Callable[
+            [], AbstractAsyncContextManager[AsyncSession]
+        ] = get_session,
+    ) -> None:
+        """Initialize the queue.
+
+        Args:
+            max_workers: Concurrent builds. Defaults to the configured worker count.
+            pool: Executor for builds. Defaults to the shared process pool.
+            session_factory: Opens a session for recording build results.
+        """
+        self._max_workers = max_workers or artifact_worker_count()
+        self._pool = pool
+        self._session_factory = session_factory
+        self._semaphore = asyncio.Semaphore(self._max_workers)
+        self._builds: dict[str, str] = {}
+        self._tasks: dict[str, asyncio.Task] = {}
+
+        self._submitted = 0
+        self._deduplicated = 0
+        self._completed = 0
+        self._failed = 0
+
+    @property
+    def depth(self) -> int:
+        """Number of builds queued or running."""
+        return len(self._tasks)
+
+    def active_build(self, build_key: str) -> str | None:
+        """Get the artifact ID of a queued or running build, if any."""
+        artifact_id = self._builds.get(build_key)
+        if artifact_id is not None:
+            self._deduplicated += 1
+        return artifact_id
+
+    def submit(self, job: ArtifactBuildJob) -> bool:
+        """Queue a build.
+
+        Args:
+            job: Build to run. Its ArtifactRecord must already be committed.
+
+        Returns:
+            True if queued, False if a build with the same key is active.
+        """
+        if job.build_key in self._builds:
+            self._deduplicated += 1
+            return False
+        self._submitted += 1
+        self._builds[job.build_key] = job.artifact_id
+        self._tasks[job.artifact_id] = asyncio.create_task(self._run(job))
+        return True
+
+    async def _run(self, job: ArtifactBuildJob) -> None:
+        await self._publish(job, "pending")
+        try:
+            async with self._semaphore:
+                await self._set_status(job.artifact_id, "generating")
+                await self._publish(job, "generating")
+                started = time.perf_counter()
+                loop = asyncio.get_running_loop()
+                result = await loop.run_in_executor(
+                    self._pool or get_artifact_process_pool(),
+                    build_artifact_file,
+                    job.artifact_type,
+                    job.file_path,
+                    job.validation,
+                    job.options,
+                )
+                generation_ms = (time.perf_counter() - started) * 1000
+            await self._record(job, result, generation_ms)
+            self._completed += 1
+            await self._publish(job, "completed", file_size=result["file_size"])
+        except asyncio.CancelledError:
+            # Don't leave the record pending or generating forever.
+            await self._fail(job, "Build cancelled before completion")
+            raise
+        except Exception as e:
+            logger.warning(f"Artifact build {job.artifact_id} failed: {e}")
+            await self._fail(job, str(e))
+        finally:
+            self._builds.pop(job.build_key, None)
+            self._tasks.pop(job.artifact_id, None)
+
+    async def _fail(self, job: ArtifactBuildJob, error: str) -> None:
+        self._failed += 1
+        try:
+            await self._record_failure(job.artifact_id, error)
+        except Exception as record_error:
+            logger.error(
+                f"Failed to record artifact build failure {job.artifact_id}: "
+                f"{record_error}"
+            )
+        await self._publish(job, "failed", error_message=error)
+
+    async def _set_status(self, artifact_id: str, status: str) -> None:
+        async with self._session_factory() as session:
+            artifact = await session.get(ArtifactRecord, artifact_id)
+            if artifact is not None:
+                artifact.status = status
+
+    async def _record(
+        self,
+        job: ArtifactBuildJob,
+        result: dict[str, Any],
+        generation_ms: float,
+    ) -> None:
+        async with self._session_factory() as session:
+            artifact = await session.get(ArtifactRecord, job.artifact_id)
+            if artifact is None:
+                # Deleted while building
+                Path(job.file_path).unlink(missing_ok=True)
+                return
+            artifact.status = "completed"
+            artifact.file_path = job.file_path
+            artifact.file_size = result["file_size"]
+            artifact.content_hash = result["content_hash"]
+            artifact.generation_time_ms = generation_ms
+            artifact.error_message = None
+            artifact.artifact_metadata = {
+                **artifact.artifact_metadata,
+                **result["metadata"],
+            }
+
+    async def _record_failure(self, artifact_id: str, error: str) -> None:
+        async with self._session_factory() as session:
+            artifact = await session.get(ArtifactRecord, artifact_id)
+            if artifact is not None:
+                artifact.status = "failed"
+                artifact.error_message = error
+
+    async def _publish(self, job: ArtifactBuildJob, status: str, **extra: Any) -> None:
+        """Broadcast build status to WebSocket subscribers."""
+        from truthound_dashboard.core.websocket import (
+            WebSocketMessage,
+            WebSocketMessageType,
+            get_websocket_manager,
+        )
+
+        manager = get_websocket_manager()
+        if not manager.room_size(ARTIFACT_BUILDS_ROOM):
+            return
+        message_type = (
+            WebSocketMessageType.ARTIFACT_BUILD_COMPLETED
+            if status in ("completed", "failed")
+            else WebSocketMessageType.ARTIFACT_BUILD_PROGRESS
+        )
+        data = {
+            "artifact_id": job.artifact_id,
+            "artifact_type": job.artifact_type,
+            "validation_id": job.validation.id,
+            "format": job.options.get("format", "html"),
+            "status": status,
+            **extra,
+        }
+        try:
+            await manager.broadcast_to_room(
+                ARTIFACT_BUILDS_ROOM,
+                WebSocketMessage(type=message_type, data=data),
+            )
+        except Exception as e:
+            logger.warning(f"Failed to broadcast artifact build status: {e}")
+
+    async def join(self) -> None:
+        """Wait until no build is queued or running."""
+        while self._tasks:
+            await asyncio.gather(*self._tasks.values(), return_exceptions=True)
+
+    async def stop(self) -> None:
+        """Cancel queued and running builds, marking their records failed."""
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def get_metrics(self) -> dict[str, Any]:
+        """Get build queue statistics."""
+        return {
+            "active": len(self._tasks),
+            "max_workers": self._max_workers,
+            "submitted": self._submitted,
+            "deduplicated": self._deduplicated,
+            "completed": self._completed,
+            "failed": self._failed,
+        }
+
+
+_queue: ArtifactBuildQueue | None = None
+
+
+def get_artifact_build_queue() -> ArtifactBuildQueue:
+    """Get the singleton artifact build queue."""
+    global _queue
+    if _queue is None:
+        _queue = ArtifactBuildQueue()
+    return _queue
+
+
+async def reset_artifact_build_queue() -> None:
+    """Stop and discard the singleton queue (on shutdown and in tests)."""
+    global _queue
+    if _queue is not None:
+        await _queue.stop()
+        _queue = None
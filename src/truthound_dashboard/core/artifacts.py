@@ -2,8 +2,6 @@
 
 from __future__ import annotations
 
-import hashlib
-from collections.abc import Callable
 from datetime import timedelta
 from pathlib import Path
 from typing import Any, Literal, cast
@@ -13,26 +11,17 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from truthound_dashboard.config import get_settings
-from truthound_dashboard.core.reporters import generate_report
+from truthound_dashboard.core.artifact_queue import (
+    ArtifactBuildJob,
+    ValidationSnapshot,
+    artifact_build_key,
+    get_artifact_build_queue,
+)
 from truthound_dashboard.db import ArtifactRecord, SavedView
 from truthound_dashboard.db.models import Validation
 from truthound_dashboard.time import utc_now
 
 
-def _load_truthound_datadocs_runtime() -> tuple[type[Any], Callable[..., str]]:
-    try:
-        from truthound import ValidationRunResult
-        from truthound.datadocs import (
-            generate_validation_report as generate_validation_datadocs,
-        )
-    except Exception as exc:  # pragma: no cover - exercised via runtime integration
-        raise RuntimeError(
-            "truthound>=3.0 with Data Docs support is required for artifact generation"
-        ) from exc
-
-    return ValidationRunResult, generate_validation_datadocs
-
-
 class ArtifactService:
     """Manage canonical artifact records."""
 
@@ -190,10 +179,15 @@ class ArtifactService:
         custom_metadata: dict[str, Any] | None = None,
         expires_in_days: int | None = 30,
     ) -> ArtifactRecord:
-        artifact = await self._create_pending_artifact(
+        """Queue a report build and return its artifact.
+
+        The artifact is returned in ``pending`` status and built in the
+        background. An identical request that is still building, or that
+        already completed, returns that artifact instead.
+        """
+        return await self._queue_build(
             workspace_id=workspace_id,
-            source_id=validation.source_id,
-            validation_id=validation.id,
+            validation=validation,
             artifact_type="report",
             format=format,
             title=title or f"Validation Report {validation.id[:8]}",
@@ -202,50 +196,17 @@ class ArtifactService:
             theme=theme,
             metadata=custom_metadata or {},
             expires_in_days=expires_in_days,
+            options={
+                "format": format,
+                "theme": theme,
+                "locale": locale,
+                "title": title,
+                "include_samples": include_samples,
+                "include_statistics": include_statistics,
+                "custom_metadata": custom_metadata,
+            },
         )
 
-        started_at = utc_now()
-        try:
-            result = await generate_report(
-                validation,
-                format=format,
-                theme=theme,
-                locale=locale,
-                title=title,
-                include_samples=include_samples,
-                include_statistics=include_statistics,
-                custom_metadata=custom_metadata,
-            )
-            content_bytes = result.content.encode("utf-8") if isinstance(result.content, str) else result.content
-            file_path = self._artifact_path(
-                artifact_id=artifact.id,
-                artifact_type="report",
-                extension=Path(result.filename).suffix or f".{format}",
-            )
-            file_path.write_bytes(content_bytes)
-
-            artifact.status = "completed"
-            artifact.file_path = str(file_path)
-            artifact.file_size = len(content_bytes)
-            artifact.content_hash = hashlib.sha256(content_bytes).hexdigest()
-            artifact.generation_time_ms = result.generation_time_ms or (
-                (utc_now() - started_at).total_seconds() * 1000
-            )
-            artifact.artifact_metadata = {
-                **artifact.artifact_metadata,
-                "content_type": result.content_type,
-                "filename": result.filename,
-                "source_name": result.metadata.source_name,
-                "validation_id": result.metadata.validation_id,
-                "generated_at": result.metadata.generated_at.isoformat(),
-            }
-        except Exception as exc:
-            artifact.status = "failed"
-            artifact.error_message = str(exc)
-        await self.session.flush()
-        await self.session.refresh(artifact)
-        return artifact
-
     async def generate_datadocs_artifact(
         self,
         *,
@@ -255,10 +216,10 @@ class ArtifactService:
         title: str | None = None,
         expires_in_days: int | None = 30,
     ) -> ArtifactRecord:
-        artifact = await self._create_pending_artifact(
+        """Queue a Data Docs build and return its artifact (see generate_report_artifact)."""
+        return await self._queue_build(
             workspace_id=workspace_id,
-            source_id=validation.source_id,
-            validation_id=validation.id,
+            validation=validation,
             artifact_type="datadocs",
             format="html",
             title=title or f"Data Docs {validation.id[:8]}",
@@ -267,43 +228,109 @@ class ArtifactService:
             theme=theme,
             metadata={},
             expires_in_days=expires_in_days,
+            options={"format": "html", "theme": theme, "title": title},
         )
 
-        started_at = utc_now()
-        try:
-            if not validation.result_json:
-                raise ValueError("Validation result is empty")
-            ValidationRunResult, generate_validation_datadocs = _load_truthound_datadocs_runtime()
-            run_result = ValidationRunResult.from_dict(validation.result_json)
-            html_content = generate_validation_datadocs(
-                run_result,
-                title=title or "Truthound Validation Data Docs",
-                theme=theme,
-            )
-            content_bytes = html_content.encode("utf-8")
-            file_path = self._artifact_path(
+    async def _queue_build(
+        self,
+        *,
+        workspace_id: str,
+        validation: Validation,
+        artifact_type: str,
+        format: str,
+        title: str,
+        description: str,
+        locale: str,
+        theme: str,
+        metadata: dict[str, Any],
+        expires_in_days: int | None,
+        options: dict[str, Any],
+    ) -> ArtifactRecord:
+        build_key = artifact_build_key(
+            workspace_id=workspace_id,
+            validation_id=validation.id,
+            artifact_type=artifact_type,
+            options=options,
+        )
+        queue = get_artifact_build_queue()
+        existing = await self._find_build(
+            workspace_id=workspace_id,
+            validation_id=validation.id,
+            artifact_type=artifact_type,
+            format=format,
+            build_key=build_key,
+            active_id=queue.active_build(build_key),
+        )
+        if existing is not None:
+            return existing
+
+        artifact = await self._create_pending_artifact(
+            workspace_id=workspace_id,
+            source_id=validation.source_id,
+            validation_id=validation.id,
+            artifact_type=artifact_type,
+            format=format,
+            title=title,
+            description=description,
+            locale=locale,
+            theme=theme,
+            metadata={**metadata, "build_key": build_key},
+            expires_in_days=expires_in_days,
+        )
+        file_path = self._artifact_path(
+            artifact_id=artifact.id,
+            artifact_type=artifact_type,
+            extension=f".{format}",
+        )
+        # The build records its result from another session
+        await self.session.commit()
+        queue.submit(
+            ArtifactBuildJob(
                 artifact_id=artifact.id,
-                artifact_type="datadocs",
-                extension=".html",
+                build_key=build_key,
+                artifact_type=artifact_type,
+                file_path=str(file_path),
+                validation=ValidationSnapshot.from_model(validation),
+                options=options,
             )
-            file_path.write_bytes(content_bytes)
-
-            artifact.status = "completed"
-            artifact.file_path = str(file_path)
-            artifact.file_size = len(content_bytes)
-            artifact.content_hash = hashlib.sha256(content_bytes).hexdigest()
-            artifact.generation_time_ms = (utc_now() - started_at).total_seconds() * 1000
-            artifact.artifact_metadata = {
-                **artifact.artifact_metadata,
-                "title": title or "Truthound Validation Data Docs",
-            }
-        except Exception as exc:
-            artifact.status = "failed"
-            artifact.error_message = str(exc)
-        await self.session.flush()
-        await self.session.refresh(artifact)
+        )
         return artifact
 
+    async def _find_build(
+        self,
+        *,
+        workspace_id: str,
+        validation_id: str,
+        artifact_type: str,
+        format: str,
+        build_key: str,
+        active_id: str | None,
+    ) -> ArtifactRecord | None:
+        """Find an artifact an identical request is building or has built."""
+        if active_id is not None:
+            artifact = await self.get_artifact(artifact_id=active_id, workspace_id=workspace_id)
+            if artifact is not None:
+                return artifact
+
+        query = select(ArtifactRecord).where(
+            ArtifactRecord.validation_id == validation_id,
+            ArtifactRecord.artifact_type == artifact_type,
+            ArtifactRecord.format == format,
+            ArtifactRecord.status == "completed",
+            or_(ArtifactRecord.expires_at.is_(None), ArtifactRecord.expires_at > utc_now()),
+        )
+        if workspace_id:
+            query = query.where(ArtifactRecord.workspace_id == workspace_id)
+        result = await self.session.execute(query.order_by(desc(ArtifactRecord.created_at)))
+        for artifact in result.scalars():
+            if (
+                artifact.artifact_metadata.get("build_key") == build_key
+                and artifact.file_path
+                and Path(artifact.file_path).exists()
+            ):
+                return artifact
+        return None
+
     async def statistics(self, *, workspace_id: str) -> dict[str, Any]:
         artifacts, _ = await self.list_artifacts(
             workspace_id=workspace_id,
@@ -352,7 +379,7 @@ class ArtifactService:
             validation_id=validation_id,
             artifact_type=artifact_type,
             format=format,
-            status="generating",
+            status="pending",
             title=title,
             description=description,
             artifact_metadata=metadata,
@@ -10,6 +10,8 @@ from sqlalchemy.orm import selectinload
 
 from truthound_dashboard.db import Membership, Permission, Role, RolePermission
 
+from .control_plane_cache import get_control_plane_cache
+
 
 @dataclass(frozen=True)
 class PermissionDefinition:
@@ -113,6 +115,7 @@ class AuthorizationService:
             .order_by(Role.name.asc())
         )
         roles = {role.name: role for role in role_result.scalars().all()}
+        changed = False
 
         for role_name, permission_keys in SYSTEM_ROLE_PERMISSIONS.items():
             role = roles.get(role_name)
@@ -141,10 +144,12 @@ class AuthorizationService:
             for key, link in current_links.items():
                 if key not in desired_keys:
                     await self.session.delete(link)
+                    changed = True
 
             for key in desired_keys:
                 if key in current_links:
                     continue
+                changed = True
                 permission = permissions[key]
                 self.session.add(
                     RolePermission(
@@ -154,6 +159,9 @@ class AuthorizationService:
                 )
 
         await self.session.flush()
+        if changed:
+            # Cached grants carry role permission keys.
+            await get_control_plane_cache().invalidate_grants()
 
         refreshed_roles = await self.session.execute(
             select(Role)
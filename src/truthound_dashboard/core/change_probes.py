@@ -0,0 +1,308 @@
+"""Tiered change-detection probes for data change triggers.
+
+A DATA_CHANGE schedule compares the two most recent profiles of its source,
+which means profiling the source on every check. Most checks find nothing
+new, so this module answers "did the source change since the last check?"
+with the cheapest probe that can tell, and the scheduler only runs the full
+profile when a probe reports a change (or cannot decide).
+
+Tiers:
+    1. ``stat``: file size and mtime. Identical stat means unchanged.
+    2. ``metadata``: head/tail block hash of the file plus, for Parquet,
+       the footer row count. The Parquet footer (schema, row groups and
+       column statistics) sits in the tail block, so rewritten data shows up
+       even when the file size is unchanged. A ``touch`` without a content
+       change is reported as unchanged.
+    3. ``sql``: one ``COUNT(*)`` / ``MAX(<change column>)`` / checksum
+       query. Runs only when the trigger config (``change_column``,
+       ``checksum_column``) or the source config (``fingerprint_column``)
+       says how to detect updates; a bare row count would miss them.
+       Column names must be plain identifiers present in the table schema,
+       and the checksum is one of ``CHECKSUM_AGGREGATES``, so no
+       user-supplied SQL reaches the query.
+
+The probe state is returned as a plain dict so the caller can persist it
+next to the trigger result and hand it back on the next check.
+
+Example:
+    outcome = await probe_source_change(source.type, config, data_input,
+                                        previous=stored_state)
+    if outcome.changed is False:
+        return  # skip profiling
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import os
+import re
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from .datasource_factory import SourceType, detect_file_type
+from .result_cache import _canonical_json, fingerprint_file
+
+logger = logging.getLogger(__name__)
+
+# Aggregates allowed as a SQL content checksum.
+CHECKSUM_AGGREGATES: dict[str, str] = {
+    "sum": "SUM({})",
+    "avg": "AVG({})",
+    "min": "MIN({})",
+    "max": "MAX({})",
+    "count_distinct": "COUNT(DISTINCT {})",
+}
+
+SQL_IDENTIFIER_PATTERN = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+# Identifier quotes per SQL dialect; the rest use ANSI double quotes.
+_IDENTIFIER_QUOTES: dict[str, tuple[str, str]] = {
+    SourceType.MYSQL.value: ("`", "`"),
+    SourceType.BIGQUERY.value: ("`", "`"),
+    SourceType.DATABRICKS.value: ("`", "`"),
+    SourceType.SQLSERVER.value: ("[", "]"),
+}
+
+
+@dataclass
+class ProbeOutcome:
+    """Result of one change-detection probe.
+
+    Attributes:
+        changed: True if the source changed, False if it did not, None if
+            no probe applies and the caller must fall back to profiling.
+        tier: Deepest probe tier that ran (``stat``, ``metadata``, ``sql``
+            or ``none``).
+        state: Probe state to persist and pass back as ``previous``.
+        elapsed_ms: Time spent probing.
+    """
+
+    changed: bool | None
+    tier: str
+    state: dict[str, Any] = field(default_factory=dict)
+    elapsed_ms: float = 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for storage in trigger results."""
+        return {
+            "changed": self.changed,
+            "tier": self.tier,
+            "state": self.state,
+            "elapsed_ms": round(self.elapsed_ms, 3),
+        }
+
+
+def _digest(details: dict[str, Any]) -> str:
+    return hashlib.sha256(_canonical_json(details).encode()).hexdigest()
+
+
+def _parquet_row_count(path: str | Path) -> int | None:
+    """Read the row count from a Parquet footer without scanning data."""
+    try:
+        import polars as pl
+
+        return int(pl.scan_parquet(path).select(pl.len()).collect().item())
+    except Exception as exc:
+        logger.debug("Cannot read Parquet metadata for %s: %s", path, exc)
+        return None
+
+
+def probe_file(
+    path: str | Path,
+    previous: dict[str, Any] | None = None,
+) -> ProbeOutcome:
+    """Probe a local file for changes.
+
+    Args:
+        path: File path.
+        previous: State returned by the previous probe of this file.
+
+    Returns:
+        ProbeOutcome; ``changed`` is None if the file cannot be read.
+    """
+    try:
+        stat = os.stat(path)
+    except OSError as exc:
+        logger.debug("Cannot stat %s: %s", path, exc)
+        return ProbeOutcome(changed=None, tier="stat")
+
+    stat_key = [stat.st_size, stat.st_mtime_ns]
+    previous = previous or {}
+    if previous.get("stat") == stat_key and previous.get("digest"):
+        return ProbeOutcome(changed=False, tier="stat", state=previous)
+
+    fingerprint = fingerprint_file(path)
+    if fingerprint is None:
+        return ProbeOutcome(changed=None, tier="metadata")
+
+    details: dict[str, Any] = {
+        "size": fingerprint.details["size"],
+        "partial_hash": fingerprint.details["partial_hash"],
+    }
+    if detect_file_type(path) == "parquet":
+        details["row_count"] = _parquet_row_count(path)
+
+    digest = _digest(details)
+    state = {"kind": "file", "stat": stat_key, "digest": digest, **details}
+    return ProbeOutcome(
+        changed=previous.get("digest") != digest,
+        tier="metadata",
+        state=state,
+    )
+
+
+def _column_ref(datasource: Any, column: str, source_type: str | None) -> str:
+    """Quote a column name after checking it against the table schema.
+
+    Raises:
+        ValueError: If the name is not a plain identifier or not a column.
+    """
+    if not SQL_IDENTIFIER_PATTERN.match(column):
+        raise ValueError(f"Invalid column name: {column!r}")
+    if column not in datasource.schema:
+        raise ValueError(f"Unknown column: {column!r}")
+    start, end = _IDENTIFIER_QUOTES.get(source_type or "", ('"', '"'))
+    return f"{start}{column}{end}"
+
+
+def probe_sql(
+    datasource: Any,
+    *,
+    change_column: str | None = None,
+    checksum_column: str | None = None,
+    checksum_aggregate: str = "sum",
+    source_type: str | None = None,
+    previous: dict[str, Any] | None = None,
+) -> ProbeOutcome:
+    """Probe a SQL data source with a single aggregate query.
+
+    Args:
+        datasource: truthound SQL data source exposing ``execute_query``.
+        change_column: Column whose maximum advances on every write
+            (typically ``updated_at``).
+        checksum_column: Column aggregated into a content checksum that
+            changes when monitored values change.
+        checksum_aggregate: Key of ``CHECKSUM_AGGREGATES`` applied to
+            ``checksum_column``.
+        source_type: Source type, used to pick the identifier quoting.
+        previous: State returned by the previous probe of this source.
+
+    Returns:
+        ProbeOutcome; ``changed`` is None if neither a change column nor a
+        checksum is configured, a column is invalid, or the query fails.
+    """
+    if not (change_column or checksum_column) or not hasattr(
+        datasource, "execute_query"
+    ):
+        return ProbeOutcome(changed=None, tier="none")
+
+    columns = ["COUNT(*) AS row_count"]
+    try:
+        if change_column:
+            quoted = _column_ref(datasource, change_column, source_type)
+            columns.append(f"MAX({quoted}) AS max_changed")
+        if checksum_column:
+            aggregate = CHECKSUM_AGGREGATES.get(checksum_aggregate)
+            if aggregate is None:
+                raise ValueError(f"Unknown checksum aggregate: {checksum_aggregate!r}")
+            quoted = _column_ref(datasource, checksum_column, source_type)
+            columns.append(f"{aggregate.format(quoted)} AS checksum")
+    except Exception as exc:
+        logger.debug("SQL change probe not applicable: %s", exc)
+        return ProbeOutcome(changed=None, tier="sql")
+
+    try:
+        rows = datasource.execute_query(
+            f"SELECT {', '.join(columns)} FROM {datasource.full_table_name}"
+        )
+    except Exception as exc:
+        logger.debug("SQL change probe failed: %s", exc)
+        return ProbeOutcome(changed=None, tier="sql")
+    if not rows:
+        return ProbeOutcome(changed=None, tier="sql")
+
+    first = rows[0]
+    values = list(first.values()) if isinstance(first, dict) else list(first)
+    details = {"row_count": values[0]}
+    index = 1
+    if change_column:
+        details["max_changed"] = str(values[index])
+        index += 1
+    if checksum_column:
+        details["checksum"] = str(values[index])
+
+    digest = _digest(details)
+    previous = previous or {}
+    state = {"kind": "sql", "digest": digest, **details}
+    return ProbeOutcome(
+        changed=previous.get("digest") != digest,
+        tier="sql",
+        state=state,
+    )
+
+
+def _probe_sync(
+    source_type: str,
+    config: dict[str, Any],
+    trigger_config: dict[str, Any],
+    data_input: Any,
+    previous: dict[str, Any] | None,
+) -> ProbeOutcome:
+    if SourceType.is_file_type(source_type):
+        path = (
+            data_input
+            if isinstance(data_input, (str, os.PathLike))
+            else config.get("path")
+        )
+        if path:
+            return probe_file(path, previous)
+    elif SourceType.is_sql_type(source_type):
+        return probe_sql(
+            data_input,
+            change_column=(
+                trigger_config.get("change_column")
+                or config.get("fingerprint_column")
+            ),
+            checksum_column=trigger_config.get("checksum_column"),
+            checksum_aggregate=trigger_config.get("checksum_aggregate") or "sum",
+            source_type=source_type,
+            previous=previous,
+        )
+    return ProbeOutcome(changed=None, tier="none")
+
+
+async def probe_source_change(
+    source_type: str,
+    config: dict[str, Any],
+    data_input: Any,
+    *,
+    trigger_config: dict[str, Any] | None = None,
+    previous: dict[str, Any] | None = None,
+) -> ProbeOutcome:
+    """Run the cheapest applicable change probe off the event loop.
+
+    Args:
+        source_type: Source type string (e.g. ``parquet``, ``postgresql``).
+        config: Resolved source configuration.
+        data_input: Path or truthound data source for the source.
+        trigger_config: DATA_CHANGE trigger configuration.
+        previous: Probe state persisted from the previous check.
+
+    Returns:
+        ProbeOutcome with timing filled in.
+    """
+    start = time.perf_counter()
+    outcome = await asyncio.to_thread(
+        _probe_sync,
+        source_type.lower(),
+        config,
+        trigger_config or {},
+        data_input,
+        previous,
+    )
+    outcome.elapsed_ms = (time.perf_counter() - start) * 1000
+    return outcome
@@ -17,6 +17,11 @@ from truthound_dashboard.db import Membership, Role, SavedView, Session, User, W
 from truthound_dashboard.db import RolePermission
 
 from .authz import AuthorizationService
+from .control_plane_cache import (
+    CachedGrant,
+    get_control_plane_cache,
+    get_session_activity_writer,
+)
 from truthound_dashboard.time import utc_now
 
 DEFAULT_WORKSPACE_SLUG = "default"
@@ -110,6 +115,7 @@ class ControlPlaneService:
         if membership is not None:
             if membership.role_id != role_id:
                 membership.role_id = role_id
+                await get_control_plane_cache().invalidate_grants(user_id, workspace_id)
             membership.is_default = True
             return membership
 
@@ -126,32 +132,40 @@ class ControlPlaneService:
     async def resolve_context(self, token: str | None = None) -> ControlPlaneContext:
         settings = get_settings()
         if token:
+            cache = get_control_plane_cache()
             token_hash = _hash_value(token)
-            result = await self.session.execute(
-                select(Session)
-                .options(
-                    selectinload(Session.user),
-                    selectinload(Session.workspace),
+            cached = await cache.get_session(token_hash)
+            if cached is None:
+                result = await self.session.execute(
+                    select(Session)
+                    .options(
+                        selectinload(Session.user),
+                        selectinload(Session.workspace),
+                    )
+                    .where(Session.token_hash == token_hash)
+                    .where(Session.revoked_at.is_(None))
                 )
-                .where(Session.token_hash == token_hash)
-                .where(Session.revoked_at.is_(None))
-            )
-            session_obj = result.scalar_one_or_none()
-            if session_obj is not None and session_obj.is_active:
-                membership = await self._get_membership(
-                    user_id=session_obj.user_id,
-                    workspace_id=session_obj.workspace_id,
+                session_obj = result.scalar_one_or_none()
+                if session_obj is not None:
+                    cached = await cache.set_session(token_hash, session_obj)
+            if cached is not None and cached.session.is_active:
+                grant = await self._get_grant(
+                    user_id=cached.session.user_id,
+                    workspace_id=cached.session.workspace_id,
                 )
-                if membership is None:
+                if grant is None:
                     raise PermissionError("Session is not attached to an active workspace")
-                session_obj.last_seen_at = utc_now()
-                permission_keys = tuple(self.authz.permission_keys_for_role(membership.role))
+                # Debounced and written in the background, so read requests
+                # do not take the write lock.
+                get_session_activity_writer().touch(
+                    cached.session.id, cached.session.last_seen_at
+                )
                 return ControlPlaneContext(
-                    user=session_obj.user,
-                    workspace=session_obj.workspace,
-                    role=membership.role,
-                    session=session_obj,
-                    permission_keys=permission_keys,
+                    user=cached.user,
+                    workspace=cached.workspace,
+                    role=grant.role,
+                    session=cached.session,
+                    permission_keys=grant.permission_keys,
                 )
 
         if settings.auth_enabled:
@@ -159,6 +173,21 @@ class ControlPlaneService:
 
         return await self.ensure_bootstrap_state()
 
+    async def _get_grant(self, *, user_id: str, workspace_id: str) -> CachedGrant | None:
+        cache = get_control_plane_cache()
+        grant = await cache.get_grant(user_id, workspace_id)
+        if grant is not None:
+            return grant
+        membership = await self._get_membership(user_id=user_id, workspace_id=workspace_id)
+        if membership is None:
+            return None
+        return await cache.set_grant(
+            user_id,
+            workspace_id,
+            membership.role,
+            tuple(self.authz.permission_keys_for_role(membership.role)),
+        )
+
     async def _get_membership(self, *, user_id: str, workspace_id: str) -> Membership | None:
         result = await self.session.execute(
             select(Membership)
@@ -237,6 +266,7 @@ class AuthService(ControlPlaneService):
         if session_obj is not None:
             session_obj.revoked_at = utc_now()
             session_obj.last_seen_at = utc_now()
+        await get_control_plane_cache().invalidate_session(token_hash)
 
     async def _create_session(self, context: ControlPlaneContext) -> tuple[Session, str]:
         token = secrets.token_urlsafe(32)
@@ -0,0 +1,288 @@
+"""Request-context cache for control-plane session and permission resolution.
+
+Every authenticated API call resolves its session, workspace membership and
+role permissions. This module keeps those answers in a bounded TTL cache so
+steady-state requests skip the session and membership queries:
+
+- Sessions are cached by token hash together with their user and workspace.
+- Grants (role + permission keys) are cached by ``(user_id, workspace_id)``.
+
+Cached rows are transient copies of the ORM objects (column values only), so
+they never belong to, or get flushed or expired by, a request's session.
+Logout, membership and role changes invalidate the affected entries; the TTL
+bounds staleness for changes made by other processes.
+
+``SessionActivityWriter`` records session activity without turning read
+requests into writes: ``last_seen_at`` is updated at most once per interval
+per session, and pending updates are coalesced into one batched UPDATE
+issued in the background.
+
+Example:
+    cache = get_control_plane_cache()
+    grant = await cache.get_grant(user_id, workspace_id)
+    get_session_activity_writer().touch(session.id, session.last_seen_at)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, TypeVar
+
+from sqlalchemy import bindparam, inspect, update
+
+from truthound_dashboard.config import get_settings
+from truthound_dashboard.db import Role, Session, User, Workspace, get_session
+from truthound_dashboard.time import utc_now
+
+from .cache import MemoryCache
+
+logger = logging.getLogger(__name__)
+
+ModelT = TypeVar("ModelT")
+
+# Upper bound on cached sessions and grants together.
+DEFAULT_CONTEXT_CACHE_SIZE = 1024
+
+
+def detached_copy(instance: ModelT) -> ModelT:
+    """Copy an ORM instance's column values into a new transient instance.
+
+    Relationships are left unloaded, so the copy is safe to share across
+    requests and never triggers lazy loads or flushes.
+    """
+    mapper = inspect(instance).mapper
+    values = {attr.key: getattr(instance, attr.key) for attr in mapper.column_attrs}
+    return mapper.class_(**values)
+
+
+@dataclass(frozen=True)
+class CachedSession:
+    """Session row with the user and workspace it belongs to."""
+
+    session: Session
+    user: User
+    workspace: Workspace
+
+
+@dataclass(frozen=True)
+class CachedGrant:
+    """Role and permission keys of a workspace membership."""
+
+    role: Role
+    permission_keys: tuple[str, ...]
+
+
+class ControlPlaneCache:
+    """Bounded TTL cache of resolved sessions and membership grants."""
+
+    def __init__(
+        self,
+        ttl_seconds: int | None = None,
+        max_size: int = DEFAULT_CONTEXT_CACHE_SIZE,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            ttl_seconds: Entry lifetime (default: settings). 0 disables caching.
+            max_size: Maximum number of entries.
+        """
+        if ttl_seconds is None:
+            ttl_seconds = get_settings().control_plane_cache_ttl_seconds
+        self.ttl_seconds = ttl_seconds
+        self._cache = MemoryCache(max_size=max_size)
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0
+
+    async def get_session(self, token_hash: str) -> CachedSession | None:
+        if not self.enabled:
+            return None
+        return await self._cache.get(f"session:{token_hash}")
+
+    async def set_session(self, token_hash: str, session_obj: Session) -> CachedSession:
+        """Cache a session loaded with its user and workspace."""
+        cached = CachedSession(
+            session=detached_copy(session_obj),
+            user=detached_copy(session_obj.user),
+            workspace=detached_copy(session_obj.workspace),
+        )
+        if self.enabled:
+            await self._cache.set(f"session:{token_hash}", cached, self.ttl_seconds)
+        return cached
+
+    async def invalidate_session(self, token_hash: str) -> None:
+        await self._cache.delete(f"session:{token_hash}")
+
+    async def get_grant(self, user_id: str, workspace_id: str) -> CachedGrant | None:
+        if not self.enabled:
+            return None
+        return await self._cache.get(f"grant:{user_id}:{workspace_id}")
+
+    async def set_grant(
+        self,
+        user_id: str,
+        workspace_id: str,
+        role: Role,
+        permission_keys: tuple[str, ...],
+    ) -> CachedGrant:
+        """Cache the role and permission keys of a membership."""
+        cached = CachedGrant(role=detached_copy(role), permission_keys=permission_keys)
+        if self.enabled:
+            await self._cache.set(
+                f"grant:{user_id}:{workspace_id}", cached, self.ttl_seconds
+            )
+        return cached
+
+    async def invalidate_grants(
+        self, user_id: str | None = None, workspace_id: str | None = None
+    ) -> None:
+        """Drop cached grants of one membership, one user, or everyone."""
+        if user_id is None:
+            await self._cache.invalidate_pattern("grant:")
+        elif workspace_id is None:
+            await self._cache.invalidate_pattern(f"grant:{user_id}:")
+        else:
+            await self._cache.delete(f"grant:{user_id}:{workspace_id}")
+
+    async def clear(self) -> None:
+        await self._cache.clear()
+
+    async def get_stats(self) -> dict[str, Any]:
+        return {"ttl_seconds": self.ttl_seconds, **await self._cache.get_stats()}
+
+
+class SessionActivityWriter:
+    """Debounced, coalesced writer for session ``last_seen_at``."""
+
+    def __init__(
+        self,
+        interval_seconds: int | None = None,
+        flush_delay_seconds: float = 1.0,
+    ) -> None:
+        """Initialize the writer.
+
+        Args:
+            interval_seconds: Minimum time between writes for one session
+                (default: settings).
+            flush_delay_seconds: How long touches are collected before a
+                batch is written.
+        """
+        if interval_seconds is None:
+            interval_seconds = get_settings().session_touch_interval_seconds
+        self.interval = timedelta(seconds=interval_seconds)
+        self.flush_delay_seconds = flush_delay_seconds
+        self._last_seen: dict[str, datetime] = {}
+        self._pending: dict[str, datetime] = {}
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def touch(self, session_id: str, last_seen_at: datetime | None = None) -> bool:
+        """Record activity on a session.
+
+        Args:
+            session_id: Session ID.
+            last_seen_at: Last persisted activity, if known.
+
+        Returns:
+            True if a write was scheduled, False if debounced.
+        """
+        now = utc_now()
+        seen = self._last_seen.get(session_id, last_seen_at)
+        if seen is not None and now - seen < self.interval:
+            return False
+        self._last_seen[session_id] = now
+        self._pending[session_id] = now
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._flush_later())
+        return True
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self.flush_delay_seconds)
+        await self.flush()
+
+    async def flush(self) -> int:
+        """Write all pending updates in one batch.
+
+        Returns:
+            Number of sessions updated.
+        """
+        if not self._pending:
+            return 0
+        pending, self._pending = self._pending, {}
+        cutoff = utc_now() - self.interval
+        self._last_seen = {
+            session_id: seen
+            for session_id, seen in self._last_seen.items()
+            if seen > cutoff
+        }
+
+        table = Session.__table__
+        statement = (
+            update(table)
+            .where(table.c.id == bindparam("session_id"))
+            .values(last_seen_at=bindparam("seen_at"))
+        )
+        try:
+            async with get_session() as session:
+                await session.execute(
+                    statement,
+                    [
+                        {"session_id": session_id, "seen_at": seen_at}
+                        for session_id, seen_at in pending.items()
+                    ],
+                )
+        except Exception as e:
+            logger.warning(f"Failed to record session activity: {e}")
+            return 0
+        return len(pending)
+
+    async def close(self) -> None:
+        """Cancel the scheduled flush and write what is pending."""
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+        self._task = None
+        await self.flush()
+
+
+_control_plane_cache: ControlPlaneCache | None = None
+_session_activity_writer: SessionActivityWriter | None = None
+
+
+def get_control_plane_cache() -> ControlPlaneCache:
+    """Get the control-plane context cache singleton."""
+    global _control_plane_cache
+    if _control_plane_cache is None:
+        _control_plane_cache = ControlPlaneCache()
+    return _control_plane_cache
+
+
+def reset_control_plane_cache() -> None:
+    """Drop the context cache singleton (for testing)."""
+    global _control_plane_cache
+    _control_plane_cache = None
+
+
+def get_session_activity_writer() -> SessionActivityWriter:
+    """Get the session activity writer singleton."""
+    global _session_activity_writer
+    if _session_activity_writer is None:
+        _session_activity_writer = SessionActivityWriter()
+    return _session_activity_writer
+
+
+async def reset_session_activity_writer() -> None:
+    """Flush and drop the session activity writer singleton."""
+    global _session_activity_writer
+    if _session_activity_writer is not None:
+        await _session_activity_writer.close()
+    _session_activity_writer = None
@@ -0,0 +1,368 @@
+"""Pooled, reusable data source handles.
+
+Building a truthound SQL data source sets up a new connection pool, and the
+first run re-introspects the table schema. ``DataSourcePool`` keeps handles
+keyed by the normalized source config, so repeated runs against the same
+source share warm connections:
+
+- Keys are a SHA-256 digest of the canonical config; credentials never
+  appear in them.
+- ``acquire`` checks a handle out to one run; ``release`` hands it back.
+  Concurrent runs of the same source each get their own handle, and a
+  handle that is never released is simply not reused.
+- Per-type ``PoolLimits`` cap how many idle handles are kept and how long
+  an unused one stays open.
+- A handle unused for longer than its health-check interval must pass
+  ``validate_connection()`` before it is handed out again.
+- Row counts are re-read on every checkout; introspected schemas are kept
+  for ``datasource_schema_ttl_seconds``.
+- ``invalidate_source`` closes a source's idle handles when it is updated
+  or deleted; checked-out handles are closed when they are released.
+
+Only server-backed SQL data sources are pooled. Embedded engines (SQLite,
+DuckDB) open thread-bound connections, and runs use a handle from several
+worker threads, so they get a new handle per call.
+
+Example:
+    pool = get_datasource_pool()
+    datasource = pool.acquire({"type": "postgresql", ...}, source_id=source.id)
+    try:
+        ...
+    finally:
+        pool.release(datasource)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from truthound_dashboard.config import get_settings
+
+from .datasource_factory import (
+    DataSourceFactory,
+    SourceConfig,
+    SourceType,
+    get_datasource_factory,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class PoolLimits:
+    """Pooling limits for one source type.
+
+    Attributes:
+        max_size: Idle handles kept across all configs of the type.
+        max_idle_seconds: Unused handles older than this are closed.
+        health_check_after_seconds: Handles unused for longer than this are
+            validated before reuse.
+    """
+
+    max_size: int = 8
+    max_idle_seconds: float = 300.0
+    health_check_after_seconds: float = 30.0
+
+
+# Warehouse sessions are slow to open, so they are kept around for longer.
+DEFAULT_POOL_LIMITS: dict[str, PoolLimits] = {
+    SourceType.BIGQUERY.value: PoolLimits(max_size=4, max_idle_seconds=900.0),
+    SourceType.SNOWFLAKE.value: PoolLimits(max_size=4, max_idle_seconds=900.0),
+    SourceType.DATABRICKS.value: PoolLimits(max_size=4, max_idle_seconds=900.0),
+    SourceType.REDSHIFT.value: PoolLimits(max_size=4, max_idle_seconds=900.0),
+}
+
+# Their connections may only be used by the thread that opened them.
+UNPOOLED_SOURCE_TYPES: frozenset[str] = frozenset(
+    {SourceType.SQLITE.value, SourceType.DUCKDB.value}
+)
+
+
+def datasource_pool_key(config: SourceConfig) -> str:
+    """Digest of the normalized config identifying interchangeable handles."""
+    data = config.to_dict()
+    data["type"] = str(data["type"]).lower()
+    payload = json.dumps(data, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _is_poolable(handle: Any) -> bool:
+    try:
+        from truthound.datasources.sql.base import BaseSQLDataSource
+    except ImportError:
+        return False
+    return isinstance(handle, BaseSQLDataSource)
+
+
+def _close_handle(handle: Any) -> None:
+    try:
+        handle._disconnect()
+    except Exception as e:
+        logger.debug(f"Failed to close pooled data source: {e}")
+
+
+@dataclass
+class _PooledHandle:
+    key: str
+    source_type: str
+    source_id: str | None
+    last_used: float
+    schema_loaded_at: float
+    retired: bool = False
+
+
+class DataSourcePool:
+    """Size-bounded pool of warm SQL data source handles."""
+
+    def __init__(
+        self,
+        factory: DataSourceFactory | None = None,
+        limits: dict[str, PoolLimits] | None = None,
+        schema_ttl_seconds: int | None = None,
+        enabled: bool | None = None,
+    ) -> None:
+        """Initialize the pool.
+
+        Args:
+            factory: Factory creating new handles (default: singleton).
+            limits: Per-type overrides of ``DEFAULT_POOL_LIMITS``.
+            schema_ttl_seconds: How long introspected schemas are reused
+                (default: settings).
+            enabled: Whether handles are pooled at all (default: settings).
+        """
+        settings = get_settings()
+        self._factory = factory or get_datasource_factory()
+        self._limits = {**DEFAULT_POOL_LIMITS, **(limits or {})}
+        self.schema_ttl_seconds = (
+            settings.datasource_schema_ttl_seconds
+            if schema_ttl_seconds is None
+            else schema_ttl_seconds
+        )
+        self.enabled = settings.datasource_pool_enabled if enabled is None else enabled
+        # Idle handles by id(), least recently released first.
+        self._idle: OrderedDict[int, tuple[Any, _PooledHandle]] = OrderedDict()
+        # Weak, so handles a run never releases are garbage collected.
+        self._leased: weakref.WeakKeyDictionary[Any, _PooledHandle] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._failed_checks = 0
+
+    def limits_for(self, source_type: str) -> PoolLimits:
+        return self._limits.get(source_type.lower(), PoolLimits())
+
+    def acquire(
+        self,
+        config: SourceConfig | dict[str, Any],
+        *,
+        source_id: str | None = None,
+    ) -> Any:
+        """Check out a warm handle for the config, creating one if needed.
+
+        Blocking: may run a health-check query or open a connection, so
+        call it from a worker thread in async code. The caller owns the
+        handle until it passes it to ``release``.
+
+        Args:
+            config: Source configuration (dict or SourceConfig).
+            source_id: Owning source, used by ``invalidate_source``.
+
+        Returns:
+            Truthound DataSource instance.
+        """
+        if isinstance(config, dict):
+            config = SourceConfig.from_dict(config)
+        source_type = config.source_type.lower()
+        if not self.enabled or source_type in UNPOOLED_SOURCE_TYPES:
+            return self._factory.create(config)
+
+        key = datasource_pool_key(config)
+        limits = self.limits_for(source_type)
+        now = time.monotonic()
+
+        while True:
+            with self._lock:
+                self._prune(now)
+                idle = self._take_idle(key)
+            if idle is None:
+                break
+            handle, entry = idle
+            stale = now - entry.last_used > limits.health_check_after_seconds
+            if stale and not self._is_healthy(handle):
+                with self._lock:
+                    self._failed_checks += 1
+                _close_handle(handle)
+                continue
+            with self._lock:
+                self._hits += 1
+                if source_id is not None:
+                    entry.source_id = source_id
+                self._leased[handle] = entry
+            self._refresh(handle, entry, now)
+            return handle
+
+        handle = self._factory.create(config)
+        if not _is_poolable(handle):
+            return handle
+        handle._connect()
+        with self._lock:
+            self._misses += 1
+            self._leased[handle] = _PooledHandle(
+                key=key,
+                source_type=source_type,
+                source_id=source_id,
+                last_used=now,
+                schema_loaded_at=now,
+            )
+        return handle
+
+    def release(self, handle: Any) -> None:
+        """Return a handle checked out by ``acquire``.
+
+        Handles the pool did not hand out are ignored. A handle whose source
+        was invalidated while it was checked out is closed instead.
+        """
+        if not _is_poolable(handle):
+            return
+        with self._lock:
+            entry = self._leased.pop(handle, None)
+            if entry is None:
+                return
+            if entry.retired or not self.enabled:
+                _close_handle(handle)
+                return
+            entry.last_used = time.monotonic()
+            self._idle[id(handle)] = (handle, entry)
+            self._enforce_max_size(entry.source_type)
+
+    def _take_idle(self, key: str) -> tuple[Any, _PooledHandle] | None:
+        # Prefer the most recently released handle; its connections are warmest.
+        for handle_id, (handle, entry) in reversed(self._idle.items()):
+            if entry.key == key:
+                del self._idle[handle_id]
+                return handle, entry
+        return None
+
+    def _is_healthy(self, handle: Any) -> bool:
+        try:
+            return bool(handle.validate_connection())
+        except Exception:
+            return False
+
+    def _refresh(self, handle: Any, entry: _PooledHandle, now: float) -> None:
+        """Drop per-run state so a reused handle never reports stale data."""
+        handle._cached_row_count = None
+        if now - entry.schema_loaded_at >= self.schema_ttl_seconds:
+            handle._cached_schema = None
+            handle._db_schema = None
+            entry.schema_loaded_at = now
+
+    def _prune(self, now: float) -> None:
+        for handle_id, (handle, entry) in list(self._idle.items()):
+            if now - entry.last_used > self.limits_for(entry.source_type).max_idle_seconds:
+                del self._idle[handle_id]
+                _close_handle(handle)
+
+    def _enforce_max_size(self, source_type: str) -> None:
+        ids = [i for i, (_, e) in self._idle.items() if e.source_type == source_type]
+        for handle_id in ids[: max(0, len(ids) - self.limits_for(source_type).max_size)]:
+            handle, _ = self._idle.pop(handle_id)
+            _close_handle(handle)
+            self._evictions += 1
+
+    def _retire(self, matches: Callable[[_PooledHandle], bool]) -> int:
+        """Close matching idle handles and retire matching checked-out ones."""
+        count = 0
+        for handle_id, (handle, entry) in list(self._idle.items()):
+            if matches(entry):
+                del self._idle[handle_id]
+                _close_handle(handle)
+                count += 1
+        for entry in list(self._leased.values()):
+            if matches(entry) and not entry.retired:
+                entry.retired = True
+                count += 1
+        return count
+
+    def invalidate(self, config: SourceConfig | dict[str, Any]) -> None:
+        """Close the pooled handles for a config, if any."""
+        if isinstance(config, dict):
+            config = SourceConfig.from_dict(config)
+        key = datasource_pool_key(config)
+        with self._lock:
+            self._retire(lambda entry: entry.key == key)
+
+    def invalidate_source(self, source_id: str) -> int:
+        """Close all pooled handles of a source.
+
+        Checked-out handles are closed when their run releases them.
+
+        Returns:
+            Number of handles closed or retired.
+        """
+        with self._lock:
+            return self._retire(lambda entry: entry.source_id == source_id)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._retire(lambda _entry: True)
+
+    def get_stats(self) -> dict[str, Any]:
+        with self._lock:
+            lookups = self._hits + self._misses
+            by_type: dict[str, int] = {}
+            for _, entry in self._idle.values():
+                by_type[entry.source_type] = by_type.get(entry.source_type, 0) + 1
+            return {
+                "enabled": self.enabled,
+                "handles": len(self._idle),
+                "handles_by_type": by_type,
+                "checked_out": len(self._leased),
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "failed_health_checks": self._failed_checks,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+            }
+
+
+_datasource_pool: DataSourcePool | None = None
+
+
+def get_datasource_pool() -> DataSourcePool:
+    """Get the data source pool singleton."""
+    global _datasource_pool
+    if _datasource_pool is None:
+        _datasource_pool = DataSourcePool()
+    return _datasource_pool
+
+
+def reset_datasource_pool() -> None:
+    """Close all pooled handles and drop the singleton."""
+    global _datasource_pool
+    if _datasource_pool is not None:
+        _datasource_pool.clear()
+    _datasource_pool = None
+
+
+__all__ = [
+    "DEFAULT_POOL_LIMITS",
+    "DataSourcePool",
+    "PoolLimits",
+    "UNPOOLED_SOURCE_TYPES",
+    "datasource_pool_key",
+    "get_datasource_pool",
+    "reset_datasource_pool",
+]
@@ -13,6 +13,7 @@ from .rules import RuleRepository, RuleService
 from .schedules import ScheduleRepository, ScheduleService
 from .schemas import SchemaRepository, SchemaService
 from .source_io import (
+    checkout_data_input,
     get_async_data_input_from_source,
     get_data_input_from_source,
     get_source_data_input,
@@ -36,6 +37,7 @@ __all__ = [
     "ScheduleService",
     "SchemaRepository",
     "SchemaService",
+    "checkout_data_input",
     "get_async_data_input_from_source",
     "get_data_input_from_source",
     "get_source_data_input",
@@ -10,9 +10,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from truthound_dashboard.db import BaseRepository, DriftComparison
 
-from ..datasource_factory import SourceType
 from ..truthound_adapter import get_adapter
-from .source_io import get_async_data_input_from_source, get_data_input_from_source
+from .source_io import checkout_data_input
 from .sources import SourceRepository
 
 
@@ -81,24 +80,18 @@ class DriftService:
         if current is None:
             raise ValueError(f"Current source '{current_source_id}' not found")
 
-        if SourceType.is_async_type(baseline.type):
-            baseline_input = await get_async_data_input_from_source(baseline, self.session)
-        else:
-            baseline_input = await get_data_input_from_source(baseline, self.session)
-
-        if SourceType.is_async_type(current.type):
-            current_input = await get_async_data_input_from_source(current, self.session)
-        else:
-            current_input = await get_data_input_from_source(current, self.session)
-
-        result = await self.adapter.compare(
-            baseline_input,
-            current_input,
-            columns=columns,
-            method=method,
-            threshold=threshold,
-            sample_size=sample_size,
-        )
+        async with (
+            checkout_data_input(baseline, self.session) as baseline_input,
+            checkout_data_input(current, self.session) as current_input,
+        ):
+            result = await self.adapter.compare(
+                baseline_input,
+                current_input,
+                columns=columns,
+                method=method,
+                threshold=threshold,
+                sample_size=sample_size,
+            )
         config = {
             "columns": columns,
             "method": method,
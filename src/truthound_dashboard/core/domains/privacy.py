@@ -14,7 +14,7 @@ from truthound_dashboard.db import BaseRepository, DataMask, PIIScan
 from ..datasource_factory import SourceType
 from ..truthound_adapter import MaskResult, ScanResult, get_adapter
 from truthound_dashboard.time import utc_now
-from .source_io import get_async_data_input_from_source, get_data_input_from_source
+from .source_io import checkout_data_input
 from .sources import SourceRepository
 
 
@@ -62,12 +62,8 @@ class PIIScanService:
         )
 
         try:
-            if SourceType.is_async_type(source.type):
-                data_input = await get_async_data_input_from_source(source, self.session)
-            else:
-                data_input = await get_data_input_from_source(source, self.session)
-
-            result = await self.adapter.scan(data_input)
+            async with checkout_data_input(source, self.session) as data_input:
+                result = await self.adapter.scan(data_input)
             await self._update_scan_success(scan, result)
         except Exception as exc:
             scan.mark_error(str(exc))
@@ -178,17 +174,13 @@ class MaskService:
         )
 
         try:
-            if SourceType.is_async_type(source.type):
-                data_input = await get_async_data_input_from_source(source, self.session)
-            else:
-                data_input = await get_data_input_from_source(source, self.session)
-
-            result = await self.adapter.mask(
-                data_input,
-                output_path,
-                columns=columns,
-                strategy=strategy,
-            )
+            async with checkout_data_input(source, self.session) as data_input:
+                result = await self.adapter.mask(
+                    data_input,
+                    output_path,
+                    columns=columns,
+                    strategy=strategy,
+                )
             await self._update_mask_success(mask, result)
         except Exception as exc:
             mask.mark_error(str(exc))
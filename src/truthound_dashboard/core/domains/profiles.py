@@ -5,20 +5,38 @@ from __future__ import annotations
 from collections.abc import Sequence
 from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from truthound_dashboard.db import BaseRepository, Profile
+from truthound_dashboard.config import get_settings
+from truthound_dashboard.db import BaseRepository, Profile, ProfileColumnMetric, Source
 
-from ..datasource_factory import SourceType
-from ..truthound_adapter import get_adapter
-from .source_io import get_async_data_input_from_source, get_data_input_from_source
+from ..result_cache import (
+    build_cache_key,
+    compute_source_fingerprint,
+    get_result_cache_metrics,
+)
+from ..truthound_adapter import DataInput, get_adapter
+from .source_io import checkout_data_input
 from .sources import SourceRepository
 
 
 class ProfileRepository(BaseRepository[Profile]):
     model = Profile
 
+    async def create(self, **kwargs: Any) -> Profile:
+        profile = await super().create(**kwargs)
+        await self.record_column_metrics(profile)
+        return profile
+
+    async def record_column_metrics(self, profile: Profile) -> None:
+        """Write the profile's per-column metrics to the trend table."""
+        values = ProfileColumnMetric.values_for_profile(
+            profile.id, profile.source_id, profile.created_at, profile.profile_json
+        )
+        if values:
+            await self.session.execute(insert(ProfileColumnMetric), values)
+
     async def get_for_source(
         self,
         source_id: str,
@@ -42,6 +60,15 @@ class ProfileRepository(BaseRepository[Profile]):
         )
         return result.scalar_one_or_none()
 
+    async def get_cached_result(self, source_id: str, cache_key: str) -> Profile | None:
+        result = await self.session.execute(
+            select(Profile)
+            .where(Profile.source_id == source_id, Profile.cache_key == cache_key)
+            .order_by(Profile.created_at.desc())
+            .limit(1)
+        )
+        return result.scalar_one_or_none()
+
 
 class ProfileService:
     def __init__(self, session: AsyncSession) -> None:
@@ -57,21 +84,29 @@ class ProfileService:
         sample_size: int | None = None,
         include_patterns: bool = True,
         save: bool = True,
+        use_cache: bool = True,
     ) -> Profile:
         source = await self.source_repo.get_by_id(source_id)
         if source is None:
             raise ValueError(f"Source '{source_id}' not found")
 
-        if SourceType.is_async_type(source.type):
-            data_input = await get_async_data_input_from_source(source, self.session)
-        else:
-            data_input = await get_data_input_from_source(source, self.session)
+        async with checkout_data_input(source, self.session) as data_input:
+            cache_key, cached = await self._lookup_cached_profile(
+                source,
+                data_input,
+                enabled=use_cache,
+                mode="basic",
+                sample_size=sample_size,
+                include_patterns=include_patterns,
+            )
+            if cached is not None:
+                return cached
 
-        result = await self.adapter.profile(
-            data_input,
-            sample_size=sample_size,
-            include_patterns=include_patterns,
-        )
+            result = await self.adapter.profile(
+                data_input,
+                sample_size=sample_size,
+                include_patterns=include_patterns,
+            )
         if save:
             return await self.profile_repo.create(
                 source_id=source_id,
@@ -79,6 +114,7 @@ class ProfileService:
                 row_count=result.row_count,
                 column_count=result.column_count,
                 size_bytes=result.size_bytes or result.estimated_memory_bytes,
+                cache_key=cache_key,
             )
 
         return Profile(
@@ -95,20 +131,27 @@ class ProfileService:
         *,
         config: dict[str, Any] | None = None,
         save: bool = True,
+        use_cache: bool = True,
     ) -> Profile:
         source = await self.source_repo.get_by_id(source_id)
         if source is None:
             raise ValueError(f"Source '{source_id}' not found")
 
-        if SourceType.is_async_type(source.type):
-            data_input = await get_async_data_input_from_source(source, self.session)
-        else:
-            data_input = await get_data_input_from_source(source, self.session)
+        async with checkout_data_input(source, self.session) as data_input:
+            cache_key, cached = await self._lookup_cached_profile(
+                source,
+                data_input,
+                enabled=use_cache,
+                mode="advanced",
+                config=config,
+            )
+            if cached is not None:
+                return cached
 
-        result = await self.adapter.profile_advanced(
-            data_input,
-            config=config,
-        )
+            result = await self.adapter.profile_advanced(
+                data_input,
+                config=config,
+            )
         if save:
             return await self.profile_repo.create(
                 source_id=source_id,
@@ -116,6 +159,7 @@ class ProfileService:
                 row_count=result.row_count,
                 column_count=result.column_count,
                 size_bytes=result.size_bytes or result.estimated_memory_bytes,
+                cache_key=cache_key,
             )
 
         return Profile(
@@ -126,6 +170,33 @@ class ProfileService:
             size_bytes=result.size_bytes or result.estimated_memory_bytes,
         )
 
+    async def _lookup_cached_profile(
+        self,
+        source: Source,
+        data_input: DataInput,
+        *,
+        enabled: bool,
+        **params: Any,
+    ) -> tuple[str | None, Profile | None]:
+        """Return the run's cache key and a stored profile of identical content."""
+        metrics = get_result_cache_metrics()
+        fingerprint = None
+        if enabled and get_settings().result_cache_enabled:
+            fingerprint = await compute_source_fingerprint(
+                source.type, source.config or {}, data_input
+            )
+        if fingerprint is None:
+            metrics.record_bypass("profile")
+            return None, None
+
+        cache_key = build_cache_key("profile", fingerprint, **params)
+        cached = await self.profile_repo.get_cached_result(source.id, cache_key)
+        if cached is None:
+            metrics.record_miss("profile")
+        else:
+            metrics.record_hit("profile")
+        return cache_key, cached
+
     async def generate_rules_from_profile(
         self,
         source_id: str,
@@ -7,9 +7,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from truthound_dashboard.db import BaseRepository, Schema
 
-from ..datasource_factory import SourceType
 from ..truthound_adapter import get_adapter
-from .source_io import get_async_data_input_from_source, get_data_input_from_source
+from .source_io import checkout_data_input
 from .sources import SourceRepository
 
 
@@ -53,17 +52,13 @@ class SchemaService:
         if source is None:
             raise ValueError(f"Source '{source_id}' not found")
 
-        if SourceType.is_async_type(source.type):
-            data_input = await get_async_data_input_from_source(source, self.session)
-        else:
-            data_input = await get_data_input_from_source(source, self.session)
-
-        result = await self.adapter.learn(
-            data_input,
-            infer_constraints=infer_constraints,
-            categorical_threshold=categorical_threshold,
-            sample_size=sample_size,
-        )
+        async with checkout_data_input(source, self.session) as data_input:
+            result = await self.adapter.learn(
+                data_input,
+                infer_constraints=infer_constraints,
+                categorical_threshold=categorical_threshold,
+                sample_size=sample_size,
+            )
 
         await self.schema_repo.deactivate_for_source(source_id)
         return await self.schema_repo.create(
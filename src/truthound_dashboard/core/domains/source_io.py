@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import Any
 
 from sqlalchemy import select
@@ -10,7 +13,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from truthound_dashboard.db import Source, get_session
 
-from ..datasource_factory import SourceType, create_datasource
+from ..datasource_factory import SourceType
+from ..datasource_pool import get_datasource_pool
 from ..encryption import decrypt_config, is_sensitive_field
 from ..secrets import LocalEncryptedDbSecretProvider
 from ..truthound_adapter import DataInput
@@ -53,7 +57,9 @@ async def get_data_input_from_source(
 
     try:
         full_config = {"type": source_type, **config}
-        return create_datasource(full_config)
+        return await asyncio.to_thread(
+            get_datasource_pool().acquire, full_config, source_id=source.id
+        )
     except Exception as exc:
         logger.error("Failed to create DataSource for %s: %s", source.name, exc)
         raise ValueError(f"Failed to create DataSource: {exc}") from exc
@@ -79,6 +85,28 @@ async def get_async_data_input_from_source(
         raise ValueError(f"Failed to create async DataSource: {exc}") from exc
 
 
+def release_data_input(data_input: DataInput) -> None:
+    """Hand a pooled data source back once a run is done with it."""
+    get_datasource_pool().release(data_input)
+
+
+@asynccontextmanager
+async def checkout_data_input(
+    source: Source,
+    session: AsyncSession | None = None,
+) -> AsyncIterator[DataInput]:
+    """Resolve a source's data input for one run, releasing it afterwards."""
+    if SourceType.is_async_type(source.type):
+        yield await get_async_data_input_from_source(source, session)
+        return
+
+    data_input = await get_data_input_from_source(source, session)
+    try:
+        yield data_input
+    finally:
+        release_data_input(data_input)
+
+
 async def get_source_data_input(source_id: str) -> object:
     """Resolve a source ID into a Truthound data input using a fresh DB session."""
 
@@ -95,7 +123,9 @@ async def get_source_data_input(source_id: str) -> object:
 __all__ = [
     "_has_sensitive_config",
     "_resolve_source_config",
+    "checkout_data_input",
     "get_async_data_input_from_source",
     "get_data_input_from_source",
     "get_source_data_input",
+    "release_data_input",
 ]
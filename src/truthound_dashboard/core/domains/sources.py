@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Sequence
 from typing import Any
 
@@ -21,7 +22,9 @@ from truthound_dashboard.db import (
 )
 from truthound_dashboard.time import utc_now
 
+from ..datasource_pool import get_datasource_pool
 from ..secrets import LocalEncryptedDbSecretProvider, merge_secret_aware_configs
+from ..sketches import get_sketch_store
 from .source_io import _has_sensitive_config, _resolve_source_config
 
 
@@ -280,6 +283,8 @@ class SourceService:
 
         await self.session.flush()
         await self.session.refresh(source)
+        if config is not None or is_active is False:
+            get_datasource_pool().invalidate_source(source.id)
         return source
 
     async def rotate_credentials(
@@ -303,6 +308,7 @@ class SourceService:
         source.credential_updated_at = utc_now()
         await self.session.flush()
         await self.session.refresh(source)
+        get_datasource_pool().invalidate_source(source.id)
         return source
 
     async def _upsert_ownership(
@@ -379,7 +385,11 @@ class SourceService:
         )
 
     async def delete(self, id: str) -> bool:
-        return await self.repository.delete(id)
+        deleted = await self.repository.delete(id)
+        if deleted:
+            get_datasource_pool().invalidate_source(id)
+            await asyncio.to_thread(get_sketch_store().delete_source, id)
+        return deleted
 
     async def get_schema(self, source_id: str):
         return await self.schema_repo.get_active_for_source(source_id)
@@ -9,12 +9,18 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from truthound_dashboard.db import BaseRepository, Validation
+from truthound_dashboard.config import get_settings
+from truthound_dashboard.db import BaseRepository, Source, Validation
 from truthound_dashboard.time import utc_now
 
-from ..datasource_factory import SourceType
-from ..truthound_adapter import CheckResult, get_adapter
-from .source_io import get_async_data_input_from_source, get_data_input_from_source
+from ..result_cache import (
+    build_cache_key,
+    compute_source_fingerprint,
+    fingerprint_schema_path,
+    get_result_cache_metrics,
+)
+from ..truthound_adapter import CheckResult, DataInput, get_adapter
+from .source_io import checkout_data_input
 from .sources import SourceRepository
 
 
@@ -47,12 +53,32 @@ class ValidationRepository(BaseRepository[Validation]):
         )
         return result.scalar_one_or_none()
 
-    async def get_with_source(self, validation_id: str) -> Validation | None:
+    async def get_cached_result(self, source_id: str, cache_key: str) -> Validation | None:
         result = await self.session.execute(
+            select(Validation)
+            .where(
+                Validation.source_id == source_id,
+                Validation.cache_key == cache_key,
+                Validation.status.in_(("success", "failed")),
+            )
+            .order_by(Validation.created_at.desc())
+            .limit(1)
+        )
+        return result.scalar_one_or_none()
+
+    async def get_with_source(
+        self, validation_id: str, *, workspace_id: str | None = None
+    ) -> Validation | None:
+        query = (
             select(Validation)
             .options(selectinload(Validation.source))
             .where(Validation.id == validation_id)
         )
+        if workspace_id is not None:
+            query = query.join(Source, Validation.source_id == Source.id).where(
+                Source.workspace_id == workspace_id
+            )
+        result = await self.session.execute(query)
         return result.scalar_one_or_none()
 
 
@@ -83,6 +109,7 @@ class ValidationService:
         max_unexpected_rows: int | None = None,
         catch_exceptions: bool = True,
         max_retries: int = 3,
+        use_cache: bool = True,
     ) -> Validation:
         source = await self.source_repo.get_by_id(source_id)
         if source is None:
@@ -95,29 +122,44 @@ class ValidationService:
         )
 
         try:
-            if SourceType.is_async_type(source.type):
-                data_input = await get_async_data_input_from_source(source, self.session)
-            else:
-                data_input = await get_data_input_from_source(source, self.session)
-
-            result = await self.adapter.check(
-                data_input,
-                validators=validators,
-                validator_config=validator_config,
-                schema=schema_path,
-                auto_schema=auto_schema,
-                min_severity=min_severity,
-                parallel=parallel,
-                max_workers=max_workers,
-                pushdown=pushdown,
-                result_format=result_format,
-                include_unexpected_rows=include_unexpected_rows,
-                max_unexpected_rows=max_unexpected_rows,
-                catch_exceptions=catch_exceptions,
-                max_retries=max_retries,
-            )
+            async with checkout_data_input(source, self.session) as data_input:
+                cached = await self._lookup_cached_result(
+                    validation,
+                    source,
+                    data_input,
+                    enabled=use_cache,
+                    validators=validators,
+                    validator_config=validator_config,
+                    schema=fingerprint_schema_path(schema_path),
+                    auto_schema=auto_schema,
+                    min_severity=min_severity,
+                    pushdown=pushdown,
+                    result_format=result_format,
+                    include_unexpected_rows=include_unexpected_rows,
+                    max_unexpected_rows=max_unexpected_rows,
+                    catch_exceptions=catch_exceptions,
+                )
 
-            await self._update_validation_success(validation, result)
+                if cached is not None:
+                    self._apply_cached_result(validation, cached)
+                else:
+                    result = await self.adapter.check(
+                        data_input,
+                        validators=validators,
+                        validator_config=validator_config,
+                        schema=schema_path,
+                        auto_schema=auto_schema,
+                        min_severity=min_severity,
+                        parallel=parallel,
+                        max_workers=max_workers,
+                        pushdown=pushdown,
+                        result_format=result_format,
+                        include_unexpected_rows=include_unexpected_rows,
+                        max_unexpected_rows=max_unexpected_rows,
+                        catch_exceptions=catch_exceptions,
+                        max_retries=max_retries,
+                    )
+                    await self._update_validation_success(validation, result)
             source.last_validated_at = utc_now()
         except Exception as exc:
             validation.mark_error(str(exc))
@@ -126,6 +168,55 @@ class ValidationService:
         await self.session.refresh(validation)
         return validation
 
+    async def _lookup_cached_result(
+        self,
+        validation: Validation,
+        source: Source,
+        data_input: DataInput,
+        *,
+        enabled: bool,
+        **params: Any,
+    ) -> Validation | None:
+        """Find a previous run on identical content with identical parameters."""
+        metrics = get_result_cache_metrics()
+        fingerprint = None
+        if enabled and get_settings().result_cache_enabled:
+            fingerprint = await compute_source_fingerprint(
+                source.type, source.config or {}, data_input
+            )
+        if fingerprint is None:
+            metrics.record_bypass("validation")
+            return None
+
+        validation.cache_key = build_cache_key("validation", fingerprint, **params)
+        cached = await self.validation_repo.get_cached_result(
+            source.id, validation.cache_key
+        )
+        if cached is None:
+            metrics.record_miss("validation")
+        else:
+            metrics.record_hit("validation")
+        return cached
+
+    def _apply_cached_result(self, validation: Validation, cached: Validation) -> None:
+        validation.status = cached.status
+        validation.passed = cached.passed
+        validation.has_critical = cached.has_critical
+        validation.has_high = cached.has_high
+        validation.total_issues = cached.total_issues
+        validation.critical_issues = cached.critical_issues
+        validation.high_issues = cached.high_issues
+        validation.medium_issues = cached.medium_issues
+        validation.low_issues = cached.low_issues
+        validation.row_count = cached.row_count
+        validation.column_count = cached.column_count
+        validation.result_json = cached.result_json
+        validation.cache_hit = True
+        validation.completed_at = utc_now()
+        if validation.started_at:
+            delta = validation.completed_at - validation.started_at
+            validation.duration_ms = int(delta.total_seconds() * 1000)
+
     async def _update_validation_success(self, validation: Validation, result: CheckResult) -> None:
         validation.status = "success" if result.passed else "failed"
         validation.passed = result.passed
@@ -145,10 +236,16 @@ class ValidationService:
             validation.duration_ms = int(delta.total_seconds() * 1000)
 
     async def get_validation(
-        self, validation_id: str, *, with_source: bool = False
+        self,
+        validation_id: str,
+        *,
+        with_source: bool = False,
+        workspace_id: str | None = None,
     ) -> Validation | None:
-        if with_source:
-            return await self.validation_repo.get_with_source(validation_id)
+        if with_source or workspace_id is not None:
+            return await self.validation_repo.get_with_source(
+                validation_id, workspace_id=workspace_id
+            )
         return await self.validation_repo.get_by_id(validation_id)
 
     async def list_for_source(
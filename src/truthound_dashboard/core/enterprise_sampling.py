@@ -30,14 +30,26 @@ from __future__ import annotations
 import asyncio
 import logging
 import math
+import random
 import time
 import uuid
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from truthound_dashboard.core.sketches import (
+    BloomFilterSketch,
+    CountMinSketch,
+    HyperLogLogSketch,
+    Sketch,
+    SketchStore,
+    create_sketch,
+    get_sketch_store,
+)
 from truthound_dashboard.schemas.enterprise_sampling import (
     BlockSamplingConfig,
     ColumnAwareSamplingConfig,
@@ -108,6 +120,10 @@ QUALITY_PRESETS = {
     },
 }
 
+# Rows materialized per streaming batch. Together with the reservoir size this
+# bounds the memory used by a single block worker.
+STREAM_BATCH_ROWS = 100_000
+
 # Strategy recommendations by scale
 SCALE_STRATEGY_MAP = {
     ScaleCategory.SMALL: EnterpriseSamplingStrategy.NONE,
@@ -280,6 +296,9 @@ class SamplingContext:
     peak_memory_mb: float = 0.0
     backpressure_events: int = 0
 
+    # Local file backing the LazyFrame, enables row-group-aware reads
+    source_path: str | None = None
+
     def elapsed_ms(self) -> float:
         """Get elapsed time in milliseconds."""
         return (time.time() - self.start_time) * 1000
@@ -299,6 +318,307 @@ class SamplingOutput:
     converged_early: bool | None = None
 
 
+# ============================================================================
+# Streaming Helpers
+# ============================================================================
+
+
+def _open_uniform(rng: random.Random) -> float:
+    """Draw from the open interval (0, 1)."""
+    value = rng.random()
+    while value == 0.0:
+        value = rng.random()
+    return value
+
+
+class ReservoirSampler:
+    """Algorithm L reservoir sampler over a stream of DataFrame batches.
+
+    Keeps a uniform random sample of at most ``k`` rows from an arbitrarily
+    long stream while only holding the reservoir and the current batch in
+    memory. Instead of drawing a random number per row, Algorithm L draws the
+    gap to the next accepted row, so batches without replacements cost O(1).
+    """
+
+    def __init__(self, k: int, seed: int | None = None) -> None:
+        self.k = k
+        self._rng = random.Random(seed)
+        self._reservoir: Any = None  # pl.DataFrame, row i holds slot i
+        self._seen = 0
+        self._w = math.exp(math.log(_open_uniform(self._rng)) / k) if k > 0 else 0.0
+        self._next = k + self._skip() if k > 0 else 0
+
+    def _skip(self) -> int:
+        return int(math.floor(math.log(_open_uniform(self._rng)) / math.log(1.0 - self._w)))
+
+    @property
+    def rows_seen(self) -> int:
+        """Number of rows consumed from the stream."""
+        return self._seen
+
+    def feed(self, batch: Any) -> None:
+        """Consume the next batch of the stream.
+
+        Args:
+            batch: Polars DataFrame with the reservoir's schema.
+        """
+        import polars as pl
+
+        if self.k <= 0 or batch.height == 0:
+            self._seen += batch.height
+            return
+
+        start = self._seen
+        end = start + batch.height
+        offset = 0
+
+        filled = 0 if self._reservoir is None else self._reservoir.height
+        if filled < self.k:
+            take = min(self.k - filled, batch.height)
+            head = batch.slice(0, take)
+            self._reservoir = head if self._reservoir is None else pl.concat([self._reservoir, head])
+            offset = take
+
+        replacements: dict[int, int] = {}
+        while self._next < end:
+            position = self._next - start
+            if position >= offset:
+                replacements[self._rng.randrange(self.k)] = position
+            self._w *= math.exp(math.log(_open_uniform(self._rng)) / self.k)
+            self._next += self._skip() + 1
+
+        if replacements:
+            positions = list(replacements.values())
+            slot_to_new = {slot: i for i, slot in enumerate(replacements)}
+            combined = pl.concat([self._reservoir, batch[positions]])
+            base = self._reservoir.height
+            gather = [
+                base + slot_to_new[slot] if slot in slot_to_new else slot
+                for slot in range(base)
+            ]
+            self._reservoir = combined[gather]
+
+        self._seen = end
+
+    def result(self) -> Any:
+        """Return the sampled rows (fewer than ``k`` if the stream was short)."""
+        return self._reservoir
+
+
+def _iter_batches(lf: Any, batch_rows: int = STREAM_BATCH_ROWS) -> Iterator[Any]:
+    """Yield a LazyFrame as a stream of DataFrames without a full collect."""
+    if hasattr(lf, "collect_batches"):
+        yield from lf.collect_batches(chunk_size=batch_rows, engine="streaming")
+        return
+
+    offset = 0
+    while True:
+        batch = lf.slice(offset, batch_rows).collect()
+        if batch.height == 0:
+            return
+        yield batch
+        offset += batch.height
+        if batch.height < batch_rows:
+            return
+
+
+def _iter_row_group(
+    path: str, row_group: int, batch_rows: int
+) -> Iterator[Any] | None:
+    """Stream one Parquet row group, or None if pyarrow is not installed."""
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        return None
+    import polars as pl
+
+    parquet = pq.ParquetFile(path)
+    return (
+        pl.from_arrow(record_batch)
+        for record_batch in parquet.iter_batches(
+            batch_size=batch_rows, row_groups=[row_group]
+        )
+    )
+
+
+def _parquet_row_group_sizes(path: str | None) -> list[int] | None:
+    """Read row-group sizes from a Parquet footer, if pyarrow is installed."""
+    if not path or not path.endswith(".parquet"):
+        return None
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        return None
+    try:
+        metadata = pq.ParquetFile(path).metadata
+    except Exception as exc:
+        logger.debug(f"Could not read Parquet metadata for {path}: {exc}")
+        return None
+    return [metadata.row_group(i).num_rows for i in range(metadata.num_row_groups)]
+
+
+@dataclass(frozen=True)
+class SamplingBlock:
+    """A contiguous range of rows sampled by one worker.
+
+    Attributes:
+        index: Block number, also used to derive the block seed.
+        offset: First row of the block in the dataset.
+        rows: Number of rows in the block.
+        row_group: Parquet row group backing the block, if aligned.
+    """
+
+    index: int
+    offset: int
+    rows: int
+    row_group: int | None = None
+
+
+def plan_blocks(
+    row_count: int,
+    block_size: int,
+    source_path: str | None = None,
+) -> list[SamplingBlock]:
+    """Split a dataset into sampling blocks.
+
+    Parquet files are split along their row groups so every block reads
+    exactly one row group; other inputs are split into fixed-size ranges.
+
+    Args:
+        row_count: Total rows in the dataset.
+        block_size: Rows per block for non-Parquet inputs.
+        source_path: Local file backing the data, if any.
+
+    Returns:
+        Ordered list of blocks covering the dataset.
+    """
+    row_groups = _parquet_row_group_sizes(source_path)
+    if row_groups and sum(row_groups) == row_count:
+        blocks = []
+        offset = 0
+        for index, rows in enumerate(row_groups):
+            blocks.append(SamplingBlock(index=index, offset=offset, rows=rows, row_group=index))
+            offset += rows
+        return blocks
+
+    block_size = max(block_size, 1)
+    return [
+        SamplingBlock(
+            index=index,
+            offset=offset,
+            rows=min(block_size, row_count - offset),
+        )
+        for index, offset in enumerate(range(0, row_count, block_size))
+    ]
+
+
+def allocate_quotas(blocks: list[SamplingBlock], target_rows: int) -> list[int]:
+    """Allocate a target sample size across blocks proportionally to size.
+
+    Uses largest-remainder rounding so the quotas sum to the target exactly.
+    """
+    total = sum(block.rows for block in blocks)
+    if total == 0:
+        return [0] * len(blocks)
+    target_rows = min(target_rows, total)
+    exact = [target_rows * block.rows / total for block in blocks]
+    quotas = [int(math.floor(value)) for value in exact]
+    remainder = target_rows - sum(quotas)
+    by_fraction = sorted(range(len(blocks)), key=lambda i: exact[i] - quotas[i], reverse=True)
+    for i in by_fraction[:remainder]:
+        quotas[i] += 1
+    return [min(quota, block.rows) for quota, block in zip(quotas, blocks, strict=True)]
+
+
+def sample_block(
+    data: Any,
+    block: SamplingBlock,
+    quota: int,
+    seed: int,
+    source_path: str | None = None,
+    batch_rows: int = STREAM_BATCH_ROWS,
+) -> Any:
+    """Reservoir-sample ``quota`` rows from one block in a streaming pass.
+
+    Row-group-aligned blocks are read directly from the Parquet file so only
+    that row group is decoded; other blocks stream a slice of the LazyFrame.
+    """
+    sampler = ReservoirSampler(quota, seed=seed)
+
+    batches = None
+    if block.row_group is not None and source_path:
+        batches = _iter_row_group(source_path, block.row_group, batch_rows)
+    if batches is None:
+        batches = _iter_batches(data.slice(block.offset, block.rows), batch_rows)
+    for batch in batches:
+        sampler.feed(batch)
+
+    return sampler.result()
+
+
+async def run_blocks(
+    context: SamplingContext,
+    blocks: list[SamplingBlock],
+    worker: Callable[[SamplingBlock], Any],
+    max_workers: int,
+    timeout_seconds: float | None = None,
+) -> list[Any]:
+    """Run a block worker across a bounded thread pool.
+
+    Polars and pyarrow release the GIL while scanning, so threads give real
+    parallelism without copying data between processes. Results are returned
+    in block order; progress is tracked on the context.
+    """
+    loop = asyncio.get_running_loop()
+    context.blocks_total = len(blocks)
+    context.blocks_completed = 0
+    results: list[Any] = [None] * len(blocks)
+    resident_bytes = 0
+
+    with ThreadPoolExecutor(
+        max_workers=max(1, max_workers),
+        thread_name_prefix="enterprise_sampling",
+    ) as executor:
+
+        async def run_one(position: int, block: SamplingBlock) -> None:
+            nonlocal resident_bytes
+            future = loop.run_in_executor(executor, worker, block)
+            result = await asyncio.wait_for(future, timeout_seconds)
+            results[position] = result
+            context.blocks_completed += 1
+            if result is not None:
+                context.rows_processed += block.rows
+                resident_bytes += result.estimated_size()
+                context.peak_memory_mb = max(
+                    context.peak_memory_mb, resident_bytes / (1024 * 1024)
+                )
+
+        await asyncio.gather(*(run_one(i, block) for i, block in enumerate(blocks)))
+
+    return results
+
+
+def _concat_samples(samples: list[Any]) -> Any:
+    import polars as pl
+
+    frames = [sample for sample in samples if sample is not None and sample.height > 0]
+    if not frames:
+        non_empty = [sample for sample in samples if sample is not None]
+        return non_empty[0] if non_empty else pl.DataFrame()
+    return pl.concat(frames)
+
+
+def _as_lazy(data: Any) -> Any:
+    import polars as pl
+
+    return data.lazy() if isinstance(data, pl.DataFrame) else data
+
+
+def _parallel_config(context: SamplingContext) -> ParallelSamplingConfig:
+    block_config = context.config.block_config
+    return block_config.parallel if block_config else ParallelSamplingConfig()
+
+
 # ============================================================================
 # Abstract Base Strategy
 # ============================================================================
@@ -417,8 +737,11 @@ class NoSamplingStrategy(BaseSamplingStrategy):
 class BlockSamplingStrategy(BaseSamplingStrategy):
     """Block-based sampling for 10M-100M row datasets.
 
-    Divides data into fixed-size blocks and samples proportionally
-    from each block. Ensures even coverage across the dataset.
+    Divides data into blocks (Parquet row groups when available, fixed-size
+    row ranges otherwise) and reservoir-samples each block proportionally in
+    a single streaming pass. Blocks run concurrently on a bounded worker
+    pool, and memory stays bounded by the target size plus one batch per
+    worker.
     """
 
     @property
@@ -429,6 +752,10 @@ class BlockSamplingStrategy(BaseSamplingStrategy):
     def supports_parallel(self) -> bool:
         return True
 
+    @property
+    def supports_streaming(self) -> bool:
+        return True
+
     def __init__(self, config: BlockSamplingConfig | None = None):
         self.config = config or BlockSamplingConfig()
 
@@ -438,9 +765,9 @@ class BlockSamplingStrategy(BaseSamplingStrategy):
         data: Any,
     ) -> SamplingOutput:
         """Perform block-based sampling."""
-        import polars as pl
-
         target_rows = context.config.target_rows
+        seed = context.config.seed or 42
+        lf = _as_lazy(data)
 
         # Calculate block size
         block_size = self.config.block_size
@@ -448,61 +775,68 @@ class BlockSamplingStrategy(BaseSamplingStrategy):
             # Auto-detect: aim for ~100 blocks
             block_size = max(context.row_count // 100, 10_000)
 
-        num_blocks = math.ceil(context.row_count / block_size)
-        context.blocks_total = num_blocks
+        blocks = plan_blocks(context.row_count, block_size, context.source_path)
 
         # Calculate samples per block
-        samples_per_block = self.config.sample_per_block
-        if samples_per_block is None:
-            samples_per_block = max(target_rows // num_blocks, 1)
+        if self.config.sample_per_block is None:
+            quotas = allocate_quotas(blocks, target_rows)
+        else:
+            quotas = [min(self.config.sample_per_block, block.rows) for block in blocks]
 
         logger.info(
-            f"Block sampling: {num_blocks} blocks, "
-            f"{samples_per_block} samples/block"
+            f"Block sampling: {len(blocks)} blocks, "
+            f"{sum(quotas)} samples total"
         )
 
-        # Collect data and sample from each block
-        # In production, this would use truthound's block sampler
-        df = data.collect() if hasattr(data, "collect") else data
-        seed = context.config.seed or 42
-
-        sampled_dfs = []
-        for i in range(num_blocks):
-            start_idx = i * block_size
-            end_idx = min((i + 1) * block_size, len(df))
-            block = df.slice(start_idx, end_idx - start_idx)
-
-            if len(block) > samples_per_block:
-                block = block.sample(n=samples_per_block, seed=seed + i)
-
-            sampled_dfs.append(block)
-            context.blocks_completed = i + 1
-
-        # Combine sampled blocks
-        sampled = pl.concat(sampled_dfs)
+        quota_by_block = {block.index: quota for block, quota in zip(blocks, quotas, strict=True)}
+        parallel = _parallel_config(context)
+        samples = await run_blocks(
+            context,
+            blocks,
+            lambda block: sample_block(
+                lf,
+                block,
+                quota_by_block[block.index],
+                seed + block.index,
+                context.source_path,
+            ),
+            max_workers=parallel.max_workers,
+            timeout_seconds=parallel.chunk_timeout_seconds,
+        )
+        sampled = _concat_samples(samples)
 
         # Trim to target if oversampled
-        if len(sampled) > target_rows:
+        if sampled.height > target_rows:
             sampled = sampled.sample(n=target_rows, seed=seed)
 
         return SamplingOutput(
             sampled_data=sampled.lazy(),
-            sampled_rows=len(sampled),
-            blocks_processed=num_blocks,
+            sampled_rows=sampled.height,
+            blocks_processed=len(blocks),
         )
 
 
 class MultiStageSamplingStrategy(BaseSamplingStrategy):
     """Multi-stage hierarchical sampling for 100M-1B row datasets.
 
-    Progressively reduces data in multiple stages. Each stage
-    reduces by factor (total_rows / target)^(1/stages).
+    Early stages select primary sampling units (Parquet row groups or row
+    blocks), each reducing the candidate rows by
+    (total_rows / target)^(1/stages). The final stage reservoir-samples rows
+    from the surviving units only, so unselected units are never read.
     """
 
     @property
     def strategy_type(self) -> EnterpriseSamplingStrategy:
         return EnterpriseSamplingStrategy.MULTI_STAGE
 
+    @property
+    def supports_parallel(self) -> bool:
+        return True
+
+    @property
+    def supports_streaming(self) -> bool:
+        return True
+
     def __init__(self, config: MultiStageSamplingConfig | None = None):
         self.config = config or MultiStageSamplingConfig()
 
@@ -512,55 +846,76 @@ class MultiStageSamplingStrategy(BaseSamplingStrategy):
         data: Any,
     ) -> SamplingOutput:
         """Perform multi-stage sampling."""
-        import polars as pl
-
         target_rows = context.config.target_rows
         num_stages = self.config.num_stages
         seed = context.config.seed or 42
+        rng = random.Random(seed)
+        lf = _as_lazy(data)
 
         # Calculate reduction factor per stage
         if self.config.stage_reduction_factor:
             reduction = self.config.stage_reduction_factor
         else:
-            reduction = (context.row_count / target_rows) ** (1 / num_stages)
+            reduction = max(context.row_count / max(target_rows, 1), 1.0) ** (1 / num_stages)
 
         logger.info(
             f"Multi-stage sampling: {num_stages} stages, "
             f"{reduction:.2f}x reduction per stage"
         )
 
-        # Collect initial data
-        current_data = data.collect() if hasattr(data, "collect") else data
-        current_rows = len(current_data)
+        units = plan_blocks(
+            context.row_count,
+            max(context.row_count // 1000, 10_000),
+            context.source_path,
+        )
 
+        # Unit-selection stages: keep a random subset of units per stage
+        # while the surviving units still hold at least the target rows.
+        selected = units
         stages_completed = 0
-        for stage in range(num_stages):
-            target_stage_rows = int(current_rows / reduction)
-            target_stage_rows = max(target_stage_rows, target_rows)
+        for stage in range(num_stages - 1):
+            current_rows = sum(unit.rows for unit in selected)
+            if self.config.early_stop_enabled and current_rows <= target_rows:
+                break
 
-            if target_stage_rows >= current_rows:
+            keep = math.ceil(len(selected) / reduction)
+            if keep >= len(selected):
+                break
+            candidate = sorted(rng.sample(selected, keep), key=lambda unit: unit.index)
+            if sum(unit.rows for unit in candidate) < target_rows:
                 break
 
-            current_data = current_data.sample(
-                n=target_stage_rows,
-                seed=seed + stage,
-            )
-            current_rows = len(current_data)
+            selected = candidate
             stages_completed = stage + 1
+            logger.debug(
+                f"Stage {stage + 1}: {len(selected)} units, "
+                f"{sum(unit.rows for unit in selected)} rows"
+            )
 
-            logger.debug(f"Stage {stage + 1}: {current_rows} rows")
-
-            # Early stopping check
-            if self.config.early_stop_enabled and current_rows <= target_rows:
-                break
-
-        # Final trim to exact target
-        if current_rows > target_rows:
-            current_data = current_data.sample(n=target_rows, seed=seed)
+        # Final stage: streaming reservoir sample within the selected units
+        quotas = allocate_quotas(selected, target_rows)
+        quota_by_unit = {unit.index: quota for unit, quota in zip(selected, quotas, strict=True)}
+        parallel = _parallel_config(context)
+        samples = await run_blocks(
+            context,
+            selected,
+            lambda unit: sample_block(
+                lf,
+                unit,
+                quota_by_unit[unit.index],
+                seed + unit.index,
+                context.source_path,
+            ),
+            max_workers=parallel.max_workers,
+            timeout_seconds=parallel.chunk_timeout_seconds,
+        )
+        stages_completed += 1
+        sampled = _concat_samples(samples)
 
         return SamplingOutput(
-            sampled_data=current_data.lazy(),
-            sampled_rows=len(current_data),
+            sampled_data=sampled.lazy(),
+            sampled_rows=sampled.height,
+            blocks_processed=len(selected),
             stages_completed=stages_completed,
             converged_early=stages_completed < num_stages,
         )
@@ -813,6 +1168,7 @@ class EnterpriseScaleSampler:
         data: Any,
         row_count: int,
         column_count: int,
+        source_path: str | None = None,
     ) -> EnterpriseSamplingResponse:
         """Execute enterprise-scale sampling.
 
@@ -821,6 +1177,8 @@ class EnterpriseScaleSampler:
             data: Input data (Polars LazyFrame).
             row_count: Total row count.
             column_count: Total column count.
+            source_path: Local file backing ``data``; enables Parquet
+                row-group-aware reads.
 
         Returns:
             EnterpriseSamplingResponse with results.
@@ -839,6 +1197,7 @@ class EnterpriseScaleSampler:
             row_count=row_count,
             column_count=column_count,
             scale_category=scale,
+            source_path=source_path,
         )
 
         # Track job
@@ -873,7 +1232,9 @@ class EnterpriseScaleSampler:
                 throughput_rows_per_sec=row_count / (context.elapsed_ms() / 1000) if context.elapsed_ms() > 0 else 0,
                 speedup_factor=row_count / output.sampled_rows if output.sampled_rows > 0 else 1.0,
                 peak_memory_mb=context.peak_memory_mb,
-                workers_used=config.block_config.parallel.max_workers if config.block_config else 1,
+                workers_used=(
+                    _parallel_config(context).max_workers if strategy.supports_parallel else 1
+                ),
                 blocks_processed=output.blocks_processed,
                 stages_completed=output.stages_completed,
                 converged_early=output.converged_early,
@@ -1036,41 +1397,123 @@ class SampleSizeEstimator:
 
 
 class SketchEstimator:
-    """Estimates using truthound probabilistic data structures for 10B+ row datasets.
+    """Estimates using probabilistic data structures for 10B+ row datasets.
 
-    Uses truthound.profiler.sketches for O(1) memory aggregations:
-    - HyperLogLog: Cardinality estimation (±0.41% error at precision=14)
+    Uses the vectorized sketches in ``core.sketches`` for O(1) memory
+    aggregations:
+    - HyperLogLog: Cardinality estimation (±0.81% error at precision=14)
     - CountMinSketch: Frequency estimation and heavy hitters detection
     - BloomFilter: Membership testing with configurable false positive rate
+
+    When a partition key is supplied, sketches are persisted per source and
+    column. A later request for the same partition is answered from the
+    stored sketch without scanning, and new partitions are merged into it.
     """
 
-    async def estimate(self, request: SketchEstimateRequest, data: Any) -> SketchEstimateResponse:
+    def __init__(self, store: SketchStore | None = None) -> None:
+        self._store = store
+
+    @property
+    def store(self) -> SketchStore:
+        """Sketch store used for persistent sketches."""
+        if self._store is None:
+            self._store = get_sketch_store()
+        return self._store
+
+    async def estimate(
+        self,
+        request: SketchEstimateRequest,
+        data: Any,
+        *,
+        partition_key: str | None = None,
+        incremental: bool = False,
+    ) -> SketchEstimateResponse:
         """Run sketch-based estimation.
 
         Args:
             request: Sketch estimation request.
-            data: Input data.
+            data: Input data (LazyFrame or DataFrame).
+            partition_key: Fingerprint of the scanned data. Enables the
+                persistent sketch store when set.
+            incremental: Merge ``data`` into the stored sketches as a new
+                partition instead of replacing them.
 
         Returns:
             Sketch estimation response.
         """
-        start_time = time.time()
-        results: list[SketchEstimateResult] = []
-        total_memory = 0
+        return await asyncio.to_thread(
+            self._estimate_sync, request, data, partition_key, incremental
+        )
 
+    @staticmethod
+    def _sketch_params(sketch_type: SketchType, config: SketchConfig) -> dict[str, Any]:
+        if sketch_type == SketchType.HYPERLOGLOG:
+            return {"precision": config.hll_precision}
+        if sketch_type == SketchType.COUNTMIN:
+            width = config.cms_width
+            depth = config.cms_depth
+            if config.cms_epsilon:
+                width = int(math.ceil(math.e / config.cms_epsilon))
+            if config.cms_delta:
+                depth = int(math.ceil(math.log(1 / config.cms_delta)))
+            return {"width": width, "depth": depth}
+        return {"capacity": config.bloom_capacity, "error_rate": config.bloom_error_rate}
+
+    def _estimate_sync(
+        self,
+        request: SketchEstimateRequest,
+        data: Any,
+        partition_key: str | None,
+        incremental: bool,
+    ) -> SketchEstimateResponse:
+        start_time = time.time()
         config = request.sketch_config or SketchConfig()
+        kind = request.sketch_type.value
+        params = self._sketch_params(request.sketch_type, config)
+        store = self.store if partition_key else None
+
+        sketches: dict[str, Sketch] = {}
+        stored_sketches: dict[str, Sketch] = {}
+        elapsed: dict[str, float] = dict.fromkeys(request.columns, 0.0)
+        stale: list[str] = []
+        for column in request.columns:
+            stored = None
+            if store is not None and not request.refresh:
+                stored = store.load(request.source_id, column, kind, params)
+            if stored is not None and partition_key in stored.partitions:
+                sketches[column] = stored
+                continue
+            if stored is not None and incremental:
+                stored_sketches[column] = stored
+            sketches[column] = create_sketch(kind, **params)
+            stale.append(column)
+
+        # One streaming pass updates every column that needs a scan.
+        if stale:
+            for batch in _iter_batches(_as_lazy(data).select(stale)):
+                for column in stale:
+                    col_start = time.time()
+                    sketches[column].update(batch[column])
+                    elapsed[column] += time.time() - col_start
+
+        for column in stale:
+            sketch = sketches[column]
+            if partition_key:
+                sketch.partitions.append(partition_key)
+            if column in stored_sketches:
+                sketch = stored_sketches[column].merge(sketch)
+                sketches[column] = sketch
+            if store is not None:
+                store.save(request.source_id, column, sketch)
 
+        results: list[SketchEstimateResult] = []
+        total_memory = 0
         for column in request.columns:
             col_start = time.time()
-
-            if config.sketch_type == SketchType.HYPERLOGLOG:
-                result = await self._estimate_cardinality(column, data, config)
-            elif config.sketch_type == SketchType.COUNTMIN:
-                result = await self._estimate_frequency(column, data, config)
-            else:
-                result = await self._test_membership(column, data, config)
-
-            result.processing_time_ms = (time.time() - col_start) * 1000
+            result = self._build_result(
+                column, request, sketches[column], from_store=column not in stale
+            )
+            result.processing_time_ms = (elapsed[column] + time.time() - col_start) * 1000
             results.append(result)
             total_memory += result.memory_used_bytes
 
@@ -1081,182 +1524,39 @@ class SketchEstimator:
             total_memory_mb=total_memory / (1024 * 1024),
         )
 
-    async def _estimate_cardinality(
+    def _build_result(
         self,
         column: str,
-        data: Any,
-        config: SketchConfig,
+        request: SketchEstimateRequest,
+        sketch: Sketch,
+        *,
+        from_store: bool,
     ) -> SketchEstimateResult:
-        """Estimate cardinality using truthound's HyperLogLog."""
-        df = data.collect() if hasattr(data, "collect") else data
-
-        try:
-            from truthound.profiler.sketches import HyperLogLog, HyperLogLogConfig
-
-            # Create HyperLogLog with specified precision
-            hll_config = HyperLogLogConfig(precision=config.hll_precision)
-            hll = HyperLogLog(hll_config)
-
-            # Add values in batches for efficiency
-            column_values = df[column].drop_nulls().to_list()
-            hll.add_batch(column_values)
-
-            # Get estimate and error
-            cardinality_estimate = hll.estimate()
-            cardinality_error = hll.standard_error()
-
-            # Calculate memory usage
-            memory_bytes = (2 ** config.hll_precision) * 6 // 8
-
-            return SketchEstimateResult(
-                column=column,
-                sketch_type=SketchType.HYPERLOGLOG,
-                cardinality_estimate=cardinality_estimate,
-                cardinality_error=cardinality_error,
-                memory_used_bytes=memory_bytes,
-                processing_time_ms=0.0,
-            )
-
-        except ImportError:
-            logger.warning("truthound.profiler.sketches not available, using fallback")
-            # Fallback to Polars n_unique
-            unique_count = df[column].n_unique()
-            error = 1.04 / math.sqrt(2 ** config.hll_precision)
-            memory_bytes = (2 ** config.hll_precision) * 6 // 8
-
-            return SketchEstimateResult(
-                column=column,
-                sketch_type=SketchType.HYPERLOGLOG,
-                cardinality_estimate=unique_count,
-                cardinality_error=error,
-                memory_used_bytes=memory_bytes,
-                processing_time_ms=0.0,
-            )
-
-    async def _estimate_frequency(
-        self,
-        column: str,
-        data: Any,
-        config: SketchConfig,
-    ) -> SketchEstimateResult:
-        """Estimate frequencies using truthound's Count-Min Sketch."""
-        import polars as pl
-
-        df = data.collect() if hasattr(data, "collect") else data
-
-        try:
-            from truthound.profiler.sketches import CountMinSketch, CountMinSketchConfig
-
-            # Create Count-Min Sketch with specified dimensions
-            cms_config = CountMinSketchConfig(
-                width=config.cms_width,
-                depth=config.cms_depth,
-            )
-            cms = CountMinSketch(cms_config)
-
-            # Add all values
-            column_values = df[column].drop_nulls().to_list()
-            for value in column_values:
-                cms.add(value)
-
-            # Get heavy hitters (items appearing in >1% of stream)
-            heavy_hitters_raw = cms.get_heavy_hitters(threshold=0.01)
-            heavy_hitters = [
-                {"value": str(item), "count": count}
-                for item, count in heavy_hitters_raw[:10]
-            ]
-
-            # Memory = width * depth * 4 bytes (32-bit counters)
-            memory_bytes = config.cms_width * config.cms_depth * 4
-
-            return SketchEstimateResult(
-                column=column,
-                sketch_type=SketchType.COUNTMIN,
-                heavy_hitters=heavy_hitters,
-                memory_used_bytes=memory_bytes,
-                processing_time_ms=0.0,
-            )
-
-        except ImportError:
-            logger.warning("truthound.profiler.sketches not available, using fallback")
-            # Fallback to Polars group_by
-            value_counts = (
-                df.group_by(column)
-                .agg(pl.len().alias("count"))
-                .sort("count", descending=True)
-                .head(10)
-            )
-
-            heavy_hitters = [
-                {"value": str(row[column]), "count": row["count"]}
-                for row in value_counts.iter_rows(named=True)
-            ]
-
-            memory_bytes = config.cms_width * config.cms_depth * 4
-
-            return SketchEstimateResult(
-                column=column,
-                sketch_type=SketchType.COUNTMIN,
-                heavy_hitters=heavy_hitters,
-                memory_used_bytes=memory_bytes,
-                processing_time_ms=0.0,
-            )
-
-    async def _test_membership(
-        self,
-        column: str,
-        data: Any,
-        config: SketchConfig,
-    ) -> SketchEstimateResult:
-        """Test membership using truthound's Bloom Filter."""
-        df = data.collect() if hasattr(data, "collect") else data
-
-        try:
-            from truthound.profiler.sketches import BloomFilter, BloomFilterConfig
-
-            # Create Bloom Filter with specified capacity and error rate
-            bf_config = BloomFilterConfig(
-                capacity=config.bloom_capacity,
-                error_rate=config.bloom_error_rate,
-            )
-            bf = BloomFilter(bf_config)
-
-            # Add all values
-            column_values = df[column].drop_nulls().to_list()
-            for value in column_values:
-                bf.add(value)
-
-            # Get current false positive rate
-            actual_fp_rate = bf.false_positive_rate()
-
-            # Calculate memory usage
-            m = -config.bloom_capacity * math.log(config.bloom_error_rate) / (math.log(2) ** 2)
-            memory_bytes = int(m / 8)
-
-            return SketchEstimateResult(
-                column=column,
-                sketch_type=SketchType.BLOOM,
-                membership_tests={
-                    "items_added": len(column_values),
-                    "false_positive_rate": actual_fp_rate,
-                },
-                memory_used_bytes=memory_bytes,
-                processing_time_ms=0.0,
-            )
+        result = SketchEstimateResult(
+            column=column,
+            sketch_type=request.sketch_type,
+            memory_used_bytes=sketch.memory_bytes,
+            processing_time_ms=0.0,
+            rows_ingested=sketch.rows_added,
+            partitions_merged=len(sketch.partitions),
+            from_store=from_store,
+        )
 
-        except ImportError:
-            logger.warning("truthound.profiler.sketches not available, using fallback")
-            # Fallback: just calculate memory requirements
-            m = -config.bloom_capacity * math.log(config.bloom_error_rate) / (math.log(2) ** 2)
-            memory_bytes = int(m / 8)
-
-            return SketchEstimateResult(
-                column=column,
-                sketch_type=SketchType.BLOOM,
-                membership_tests={},
-                memory_used_bytes=memory_bytes,
-                processing_time_ms=0.0,
-            )
+        if isinstance(sketch, HyperLogLogSketch):
+            result.cardinality_estimate = sketch.estimate()
+            result.cardinality_error = sketch.standard_error()
+        elif isinstance(sketch, CountMinSketch):
+            # Items appearing in >1% of the stream
+            result.heavy_hitters = sketch.heavy_hitters(threshold=0.01, limit=10)
+        elif isinstance(sketch, BloomFilterSketch):
+            result.false_positive_rate = sketch.false_positive_rate()
+            if request.membership_values:
+                found = sketch.contains(request.membership_values)
+                result.membership_tests = {
+                    value: bool(hit)
+                    for value, hit in zip(request.membership_values, found, strict=True)
+                }
+        return result
 
 
 # ============================================================================
@@ -2,14 +2,28 @@
 
 from __future__ import annotations
 
+import base64
+import binascii
 from datetime import datetime, timedelta
 from typing import Any
 
-from sqlalchemy import or_, select
+from sqlalchemy import (
+    Integer,
+    column,
+    false,
+    func,
+    literal_column,
+    or_,
+    select,
+    text,
+    true,
+    tuple_,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from truthound_dashboard.db import IncidentQueue, IncidentQueueMembership, User
+from truthound_dashboard.db.database import INCIDENT_SEARCH_TABLE
 from truthound_dashboard.db.models import EscalationIncidentModel, EscalationStateEnum
 from truthound_dashboard.schemas.unified_alerts import (
     AlertCorrelation,
@@ -30,6 +44,32 @@ def _slugify(value: str) -> str:
     return "-".join(part for part in value.strip().lower().replace("_", "-").split() if part)
 
 
+def _workspace_clause(workspace_id: str) -> Any:
+    return or_(
+        EscalationIncidentModel.workspace_id == workspace_id,
+        EscalationIncidentModel.workspace_id.is_(None),
+    )
+
+
+def _status_clause(status: AlertStatus) -> Any:
+    """SQL equivalent of ``_status_from_state(state) == status``."""
+    state = EscalationIncidentModel.state
+    if status == AlertStatus.RESOLVED:
+        return state == EscalationStateEnum.RESOLVED.value
+    if status == AlertStatus.ACKNOWLEDGED:
+        return state == EscalationStateEnum.ACKNOWLEDGED.value
+    if status == AlertStatus.OPEN:
+        return state.not_in(
+            (EscalationStateEnum.RESOLVED.value, EscalationStateEnum.ACKNOWLEDGED.value)
+        )
+    return false()
+
+
+def _like_pattern(value: str) -> str:
+    escaped = value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
 def _status_from_state(state: str) -> AlertStatus:
     if state == EscalationStateEnum.RESOLVED.value:
         return AlertStatus.RESOLVED
@@ -191,6 +231,26 @@ class IncidentQueueService:
             )
 
 
+def encode_incident_cursor(alert: UnifiedAlertResponse) -> str:
+    """Keyset cursor positioned after ``alert`` in list order."""
+    raw = f"{alert.created_at.isoformat()}|{alert.id}"
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def decode_incident_cursor(cursor: str) -> tuple[datetime, str]:
+    """Decode a keyset cursor.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+        created_at, incident_id = raw.split("|", 1)
+        return datetime.fromisoformat(created_at), incident_id
+    except (UnicodeError, binascii.Error, ValueError) as exc:
+        raise ValueError("Invalid incident cursor") from exc
+
+
 class IncidentService:
     """Queue-aware incident workbench."""
 
@@ -207,43 +267,149 @@ class IncidentService:
         search: str | None = None,
         source: AlertSource | None = None,
         severity: AlertSeverity | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+        cursor: str | None = None,
     ) -> list[UnifiedAlertResponse]:
-        result = await self.session.execute(
+        """List incidents newest first, filtered in SQL.
+
+        Args:
+            workspace_id: Workspace scope.
+            queue_id: Only incidents in this queue.
+            assignee_user_id: Only incidents assigned to this user.
+            status: Only incidents with this alert status.
+            search: Substring matched against title, message and source.
+            source: Only incidents from this alert source.
+            severity: Only incidents with this severity.
+            limit: Page size (None = all).
+            offset: Rows to skip; ignored when ``cursor`` is given.
+            cursor: Keyset cursor from ``encode_incident_cursor``.
+
+        Raises:
+            ValueError: If the cursor is malformed.
+        """
+        filters = await self._filters(
+            workspace_id=workspace_id,
+            queue_id=queue_id,
+            assignee_user_id=assignee_user_id,
+            status=status,
+            search=search,
+            source=source,
+            severity=severity,
+        )
+        query = (
             select(EscalationIncidentModel)
-            .options(
-                selectinload(EscalationIncidentModel.queue),
-                selectinload(EscalationIncidentModel.assignee_user),
-                selectinload(EscalationIncidentModel.assigned_by_user),
+            .where(*filters)
+            .order_by(
+                EscalationIncidentModel.created_at.desc(),
+                EscalationIncidentModel.id.desc(),
             )
-            .where(
-                or_(EscalationIncidentModel.workspace_id == workspace_id, EscalationIncidentModel.workspace_id.is_(None))
+        )
+        if cursor:
+            created_at, incident_id = decode_incident_cursor(cursor)
+            query = query.where(
+                tuple_(EscalationIncidentModel.created_at, EscalationIncidentModel.id)
+                < tuple_(created_at, incident_id)
             )
-            .order_by(EscalationIncidentModel.created_at.desc())
+        elif offset:
+            query = query.offset(offset)
+        if limit is not None:
+            query = query.limit(limit)
+        result = await self.session.execute(query)
+        return [self._incident_to_alert(incident) for incident in result.scalars().all()]
+
+    async def count_incidents(
+        self,
+        *,
+        workspace_id: str,
+        queue_id: str | None = None,
+        assignee_user_id: str | None = None,
+        status: AlertStatus | None = None,
+        search: str | None = None,
+        source: AlertSource | None = None,
+        severity: AlertSeverity | None = None,
+    ) -> int:
+        """Count incidents matching the ``list_incidents`` filters."""
+        filters = await self._filters(
+            workspace_id=workspace_id,
+            queue_id=queue_id,
+            assignee_user_id=assignee_user_id,
+            status=status,
+            search=search,
+            source=source,
+            severity=severity,
+        )
+        result = await self.session.execute(
+            select(func.count()).select_from(EscalationIncidentModel).where(*filters)
         )
-        incidents = list(result.scalars().all())
-        alerts = [self._incident_to_alert(incident) for incident in incidents]
+        return int(result.scalar_one())
 
+    async def _filters(
+        self,
+        *,
+        workspace_id: str,
+        queue_id: str | None,
+        assignee_user_id: str | None,
+        status: AlertStatus | None,
+        search: str | None,
+        source: AlertSource | None,
+        severity: AlertSeverity | None,
+    ) -> list[Any]:
+        model = EscalationIncidentModel
+        filters: list[Any] = [_workspace_clause(workspace_id)]
         if queue_id:
-            alerts = [alert for alert in alerts if alert.queue_id == queue_id]
+            filters.append(model.queue_id == queue_id)
         if assignee_user_id:
-            alerts = [alert for alert in alerts if alert.assignee_user_id == assignee_user_id]
+            filters.append(model.assignee_user_id == assignee_user_id)
         if status:
-            alerts = [alert for alert in alerts if alert.status == status]
+            filters.append(_status_clause(AlertStatus(status)))
         if source:
-            alerts = [alert for alert in alerts if alert.source == source]
+            filters.append(model.alert_source == AlertSource(source).value)
         if severity:
-            alerts = [alert for alert in alerts if alert.severity == severity]
+            filters.append(model.severity == AlertSeverity(severity).value)
         if search:
-            needle = search.lower()
-            alerts = [
-                alert
-                for alert in alerts
-                if needle in alert.title.lower()
-                or needle in alert.message.lower()
-                or needle in alert.source_name.lower()
-                or needle in alert.source_id.lower()
-            ]
-        return alerts
+            filters.append(await self._search_clause(search))
+        return filters
+
+    async def _search_clause(self, search: str) -> Any:
+        """Case-insensitive substring match on title, message and source."""
+        rowid = literal_column("escalation_incidents.rowid")
+        has_index = await self.session.scalar(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+            {"name": INCIDENT_SEARCH_TABLE},
+        )
+        if has_index and len(search) >= 3:
+            phrase = '"' + search.replace('"', '""') + '"'
+            matches = (
+                text(
+                    f"SELECT rowid FROM {INCIDENT_SEARCH_TABLE} "
+                    f"WHERE {INCIDENT_SEARCH_TABLE} MATCH :search_phrase"
+                )
+                .bindparams(search_phrase=phrase)
+                .columns(column("rowid", Integer))
+            )
+            return rowid.in_(matches)
+        # Trigrams need three characters; shorter needles scan instead.
+        pattern = _like_pattern(search.lower())
+        title = func.coalesce(
+            func.nullif(func.json_extract(EscalationIncidentModel.context, "$.title"), ""),
+            "Incident " + EscalationIncidentModel.incident_ref,
+        )
+        message = func.coalesce(
+            func.nullif(func.json_extract(EscalationIncidentModel.context, "$.message"), ""),
+            "Escalation incident requires attention",
+        )
+        return or_(
+            *(
+                func.lower(column).like(pattern, escape="\\")
+                for column in (
+                    title,
+                    message,
+                    EscalationIncidentModel.source_name,
+                    EscalationIncidentModel.incident_ref,
+                )
+            )
+        )
 
     async def get_incident(self, *, incident_id: str, workspace_id: str) -> UnifiedAlertResponse | None:
         incident = await self._load_incident(incident_id=incident_id, workspace_id=workspace_id)
@@ -337,50 +503,60 @@ class IncidentService:
         return self._incident_to_alert(incident)
 
     async def summary(self, *, workspace_id: str, time_range_hours: int = 24) -> AlertSummary:
-        alerts = await self.list_incidents(workspace_id=workspace_id)
-        cutoff = utc_now() - timedelta(hours=time_range_hours)
-        alerts = [alert for alert in alerts if alert.created_at >= cutoff]
+        model = EscalationIncidentModel
+        now = utc_now()
+        cutoff = now - timedelta(hours=time_range_hours)
+        in_range = (_workspace_clause(workspace_id), model.created_at >= cutoff)
 
         by_severity = AlertCountBySeverity()
         by_source = AlertCountBySource()
         by_status = AlertCountByStatus()
+        total = active = 0
 
-        for alert in alerts:
-            setattr(by_severity, alert.severity.value, getattr(by_severity, alert.severity.value) + 1)
-            setattr(by_source, alert.source.value, getattr(by_source, alert.source.value) + 1)
-            if alert.status == AlertStatus.OPEN:
-                by_status.open += 1
-            elif alert.status == AlertStatus.ACKNOWLEDGED:
-                by_status.acknowledged += 1
-            elif alert.status == AlertStatus.RESOLVED:
-                by_status.resolved += 1
-            elif alert.status == AlertStatus.IGNORED:
-                by_status.ignored += 1
-
-        trend = []
-        now = utc_now()
-        for hours_ago in range(24, -1, -1):
-            point_time = now - timedelta(hours=hours_ago)
-            point_start = point_time.replace(minute=0, second=0, microsecond=0)
-            point_end = point_start + timedelta(hours=1)
-            count = sum(1 for alert in alerts if point_start <= alert.created_at < point_end)
-            trend.append(AlertTrendPoint(timestamp=point_start, count=count))
+        result = await self.session.execute(
+            select(model.severity, model.alert_source, model.state, func.count())
+            .where(*in_range)
+            .group_by(model.severity, model.alert_source, model.state)
+        )
+        for severity, source, state, count in result.all():
+            total += count
+            setattr(by_severity, severity, getattr(by_severity, severity) + count)
+            setattr(by_source, source, getattr(by_source, source) + count)
+            status = _status_from_state(state)
+            setattr(by_status, status.value, getattr(by_status, status.value) + count)
+            if status != AlertStatus.RESOLVED:
+                active += count
+
+        # Hourly buckets for the last 24 hours (plus the current hour)
+        first_hour = (now - timedelta(hours=24)).replace(minute=0, second=0, microsecond=0)
+        hour = func.strftime("%Y-%m-%d %H:00:00", model.created_at)
+        result = await self.session.execute(
+            select(hour, func.count())
+            .where(*in_range, model.created_at >= first_hour)
+            .group_by(hour)
+        )
+        hourly = {datetime.fromisoformat(bucket): count for bucket, count in result.all()}
+        trend = [
+            AlertTrendPoint(timestamp=point, count=hourly.get(point, 0))
+            for point in (first_hour + timedelta(hours=h) for h in range(25))
+        ]
 
-        top_sources: dict[str, int] = {}
-        for alert in alerts:
-            top_sources[alert.source_name] = top_sources.get(alert.source_name, 0) + 1
+        result = await self.session.execute(
+            select(model.source_name, func.count().label("count"))
+            .where(*in_range)
+            .group_by(model.source_name)
+            .order_by(func.count().desc(), model.source_name)
+            .limit(5)
+        )
 
         return AlertSummary(
-            total_alerts=len(alerts),
-            active_alerts=len([alert for alert in alerts if alert.status != AlertStatus.RESOLVED]),
+            total_alerts=total,
+            active_alerts=active,
             by_severity=by_severity,
             by_source=by_source,
             by_status=by_status,
             trend_24h=trend,
-            top_sources=[
-                {"name": name, "count": count}
-                for name, count in sorted(top_sources.items(), key=lambda item: item[1], reverse=True)[:5]
-            ],
+            top_sources=[{"name": name, "count": count} for name, count in result.all()],
         )
 
     async def correlations(
@@ -390,28 +566,43 @@ class IncidentService:
         workspace_id: str,
         time_window_hours: int = 1,
     ) -> list[AlertCorrelation]:
-        alert = await self.get_incident(incident_id=incident_id, workspace_id=workspace_id)
-        if alert is None:
+        incident = await self._load_incident(incident_id=incident_id, workspace_id=workspace_id)
+        if incident is None:
             return []
-        alerts = await self.list_incidents(workspace_id=workspace_id)
-        window_start = alert.created_at - timedelta(hours=time_window_hours)
-        window_end = alert.created_at + timedelta(hours=time_window_hours)
-        related = [
-            candidate
-            for candidate in alerts
-            if candidate.id != alert.id and window_start <= candidate.created_at <= window_end
-        ]
+        alert = self._incident_to_alert(incident)
+        model = EscalationIncidentModel
+        in_window = (
+            _workspace_clause(workspace_id),
+            model.id != alert.id,
+            model.created_at.between(
+                alert.created_at - timedelta(hours=time_window_hours),
+                alert.created_at + timedelta(hours=time_window_hours),
+            ),
+        )
 
-        same_queue = [candidate for candidate in related if candidate.queue_id == alert.queue_id and alert.queue_id]
-        same_source = [
-            candidate for candidate in related if candidate.source_name == alert.source_name and candidate not in same_queue
-        ]
+        async def related(*criteria: Any) -> list[UnifiedAlertResponse]:
+            result = await self.session.execute(
+                select(model)
+                .where(*in_window, *criteria)
+                .order_by(model.created_at.desc(), model.id.desc())
+                .limit(10)
+            )
+            return [self._incident_to_alert(row) for row in result.scalars().all()]
+
+        # Each lookup is a range scan on a (column, created_at) index.
+        same_queue = await related(model.queue_id == alert.queue_id) if alert.queue_id else []
+        same_source = await related(
+            model.source_name == incident.source_name,
+            or_(model.queue_id.is_(None), model.queue_id != alert.queue_id)
+            if alert.queue_id
+            else true(),
+        )
         correlations: list[AlertCorrelation] = []
         if same_queue:
             correlations.append(
                 AlertCorrelation(
                     alert_id=alert.id,
-                    related_alerts=same_queue[:10],
+                    related_alerts=same_queue,
                     correlation_type="same_queue",
                     correlation_score=0.9,
                     common_factors=[f"Same queue: {alert.queue_name or 'Unassigned'}"],
@@ -421,7 +612,7 @@ class IncidentService:
             correlations.append(
                 AlertCorrelation(
                     alert_id=alert.id,
-                    related_alerts=same_source[:10],
+                    related_alerts=same_source,
                     correlation_type="same_source",
                     correlation_score=0.7,
                     common_factors=[f"Same source: {alert.source_name}"],
@@ -671,8 +671,12 @@ class LineageService:
 
             graph = LineageGraph()
 
-            # Add all nodes
-            nodes = await self.node_repo.get_all_nodes()
+            # Add all nodes. Only the columns the graph needs are loaded, and
+            # without the paginated repository helpers, which would silently
+            # truncate graphs larger than one page.
+            nodes = await self.session.execute(
+                select(LineageNode.id, LineageNode.name, LineageNode.node_type)
+            )
             for node in nodes:
                 th_node_type = node_type_map.get(node.node_type, NodeType.EXTERNAL)
                 th_node = TruthoundNode(
@@ -683,7 +687,13 @@ class LineageService:
                 graph.add_node(th_node)
 
             # Add all edges
-            edges = await self.edge_repo.get_all_edges()
+            edges = await self.session.execute(
+                select(
+                    LineageEdge.source_node_id,
+                    LineageEdge.target_node_id,
+                    LineageEdge.edge_type,
+                )
+            )
             for edge in edges:
                 th_edge_type = edge_type_map.get(edge.edge_type, EdgeType.DERIVED_FROM)
                 th_edge = TruthoundEdge(
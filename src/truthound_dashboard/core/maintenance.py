@@ -4,10 +4,13 @@ This module provides automated database maintenance operations including:
 - Cleanup of old validation records
 - Removal of stale profile data
 - Notification log cleanup
-- Database optimization (VACUUM)
+- Database optimization (incremental VACUUM)
 
 The maintenance system uses a configurable strategy pattern allowing
-custom cleanup policies.
+custom cleanup policies. Retention rules are expressed as set-based SQL
+and deleted in bounded batches, each in its own short transaction, so the
+SQLite write lock is released between batches and API requests keep
+being served during a large purge.
 
 Example:
     manager = get_maintenance_manager()
@@ -32,7 +35,7 @@ from truthound_dashboard.db import get_session
 from truthound_dashboard.db.models import (
     NotificationLog,
     Profile,
-    Source,
+    ProfileColumnMetric,
     Validation,
 )
 from truthound_dashboard.time import utc_now
@@ -133,6 +136,7 @@ class MaintenanceConfig:
         protected_tags: Tags to never delete (Tag policy).
         delete_tags: Tags to delete after standard retention (Tag policy).
         policies: List of custom retention policies (Composite).
+        delete_batch_size: Rows deleted per transaction by cleanup strategies.
     """
 
     validation_retention_days: int = 90
@@ -150,6 +154,8 @@ class MaintenanceConfig:
     delete_tags: list[str] = field(default_factory=list)  # Tags to delete after retention
     # Custom policies (Composite)
     policies: list[RetentionPolicy] = field(default_factory=list)
+    # Rows deleted per short transaction
+    delete_batch_size: int = 1000
 
     def get_active_policies(self) -> list[RetentionPolicy]:
         """Get all active retention policies sorted by priority.
@@ -238,10 +244,75 @@ class MaintenanceConfig:
             "failed_retention_days": self.failed_retention_days,
             "protected_tags": self.protected_tags,
             "delete_tags": self.delete_tags,
+            "delete_batch_size": self.delete_batch_size,
             "active_policies": [p.to_dict() for p in self.get_active_policies()],
         }
 
 
+async def delete_in_batches(
+    model: Any,
+    *criteria: Any,
+    batch_size: int = 1000,
+) -> int:
+    """Delete rows matching ``criteria`` in short, bounded transactions.
+
+    Each batch deletes at most ``batch_size`` rows selected by primary key
+    and commits before the next one starts, so writers queued behind the
+    purge only ever wait for one batch.
+
+    Args:
+        model: ORM model with an ``id`` primary key.
+        *criteria: WHERE clauses selecting the rows to delete.
+        batch_size: Maximum rows per transaction.
+
+    Returns:
+        Number of rows deleted.
+    """
+    total = 0
+    while True:
+        async with get_session() as session:
+            batch_ids = select(model.id).where(*criteria).limit(batch_size)
+            result = await session.execute(
+                delete(model)
+                .where(model.id.in_(batch_ids))
+                .execution_options(synchronize_session=False)
+            )
+        deleted = result.rowcount or 0
+        total += deleted
+        if deleted < batch_size:
+            return total
+        # Let queued requests take the write lock between batches.
+        await asyncio.sleep(0)
+
+
+async def delete_ids_in_batches(
+    model: Any,
+    ids: list[Any],
+    batch_size: int = 1000,
+) -> int:
+    """Delete rows by primary key in short, bounded transactions.
+
+    Args:
+        model: ORM model with an ``id`` primary key.
+        ids: Primary keys to delete.
+        batch_size: Maximum rows per transaction.
+
+    Returns:
+        Number of rows deleted.
+    """
+    total = 0
+    for start in range(0, len(ids), batch_size):
+        async with get_session() as session:
+            result = await session.execute(
+                delete(model)
+                .where(model.id.in_(ids[start : start + batch_size]))
+                .execution_options(synchronize_session=False)
+            )
+        total += result.rowcount or 0
+        await asyncio.sleep(0)
+    return total
+
+
 class CleanupStrategy(ABC):
     """Abstract base class for cleanup strategies.
 
@@ -283,36 +354,25 @@ class ValidationCleanupStrategy(CleanupStrategy):
                 days=config.validation_retention_days
             )
 
-            async with get_session() as session:
-                # Count records to delete
-                count_result = await session.execute(
-                    select(func.count(Validation.id)).where(
-                        Validation.created_at < cutoff
-                    )
-                )
-                count = count_result.scalar() or 0
-
-                # Delete old records
-                if count > 0:
-                    await session.execute(
-                        delete(Validation).where(Validation.created_at < cutoff)
-                    )
+            count = await delete_in_batches(
+                Validation,
+                Validation.created_at < cutoff,
+                batch_size=config.delete_batch_size,
+            )
 
-                duration = int(
-                    (utc_now() - start_time).total_seconds() * 1000
-                )
+            duration = int((utc_now() - start_time).total_seconds() * 1000)
 
-                logger.info(
-                    f"Validation cleanup: deleted {count} records "
-                    f"older than {config.validation_retention_days} days"
-                )
+            logger.info(
+                f"Validation cleanup: deleted {count} records "
+                f"older than {config.validation_retention_days} days"
+            )
 
-                return CleanupResult(
-                    task_name=self.name,
-                    records_deleted=count,
-                    duration_ms=duration,
-                    success=True,
-                )
+            return CleanupResult(
+                task_name=self.name,
+                records_deleted=count,
+                duration_ms=duration,
+                success=True,
+            )
 
         except Exception as e:
             duration = int((utc_now() - start_time).total_seconds() * 1000)
@@ -333,44 +393,38 @@ class ProfileCleanupStrategy(CleanupStrategy):
         return "profile_cleanup"
 
     async def execute(self, config: MaintenanceConfig) -> CleanupResult:
-        """Keep only the most recent N profiles per source."""
+        """Keep only the most recent N profiles per source.
+
+        Ranks every profile within its source in one window-function query
+        instead of issuing keep/count/delete queries per source.
+        """
         start_time = utc_now()
-        total_deleted = 0
 
         try:
-            async with get_session() as session:
-                # Get all source IDs
-                sources_result = await session.execute(select(Source.id))
-                source_ids = [row[0] for row in sources_result]
-
-                for source_id in source_ids:
-                    # Get IDs of profiles to keep
-                    keep_result = await session.execute(
-                        select(Profile.id)
-                        .where(Profile.source_id == source_id)
-                        .order_by(Profile.created_at.desc())
-                        .limit(config.profile_keep_per_source)
-                    )
-                    keep_ids = [row[0] for row in keep_result]
-
-                    if not keep_ids:
-                        continue
-
-                    # Count and delete excess profiles
-                    count_result = await session.execute(
-                        select(func.count(Profile.id))
-                        .where(Profile.source_id == source_id)
-                        .where(Profile.id.not_in(keep_ids))
-                    )
-                    count = count_result.scalar() or 0
-
-                    if count > 0:
-                        await session.execute(
-                            delete(Profile)
-                            .where(Profile.source_id == source_id)
-                            .where(Profile.id.not_in(keep_ids))
-                        )
-                        total_deleted += count
+            ranked = select(
+                Profile.id,
+                func.row_number()
+                .over(
+                    partition_by=Profile.source_id,
+                    order_by=(Profile.created_at.desc(), Profile.id.desc()),
+                )
+                .label("position"),
+            ).subquery()
+            excess_ids = select(ranked.c.id).where(
+                ranked.c.position > config.profile_keep_per_source
+            )
+            total_deleted = await delete_in_batches(
+                Profile,
+                Profile.id.in_(excess_ids),
+                batch_size=config.delete_batch_size,
+            )
+            # SQLite does not enforce the cascade, so drop the trend rows
+            # of deleted profiles explicitly.
+            await delete_in_batches(
+                ProfileColumnMetric,
+                ProfileColumnMetric.profile_id.not_in(select(Profile.id)),
+                batch_size=config.delete_batch_size,
+            )
 
             duration = int((utc_now() - start_time).total_seconds() * 1000)
 
@@ -413,38 +467,25 @@ class NotificationLogCleanupStrategy(CleanupStrategy):
                 days=config.notification_log_retention_days
             )
 
-            async with get_session() as session:
-                # Count records to delete
-                count_result = await session.execute(
-                    select(func.count(NotificationLog.id)).where(
-                        NotificationLog.created_at < cutoff
-                    )
-                )
-                count = count_result.scalar() or 0
-
-                # Delete old records
-                if count > 0:
-                    await session.execute(
-                        delete(NotificationLog).where(
-                            NotificationLog.created_at < cutoff
-                        )
-                    )
+            count = await delete_in_batches(
+                NotificationLog,
+                NotificationLog.created_at < cutoff,
+                batch_size=config.delete_batch_size,
+            )
 
-                duration = int(
-                    (utc_now() - start_time).total_seconds() * 1000
-                )
+            duration = int((utc_now() - start_time).total_seconds() * 1000)
 
-                logger.info(
-                    f"Notification log cleanup: deleted {count} records "
-                    f"older than {config.notification_log_retention_days} days"
-                )
+            logger.info(
+                f"Notification log cleanup: deleted {count} records "
+                f"older than {config.notification_log_retention_days} days"
+            )
 
-                return CleanupResult(
-                    task_name=self.name,
-                    records_deleted=count,
-                    duration_ms=duration,
-                    success=True,
-                )
+            return CleanupResult(
+                task_name=self.name,
+                records_deleted=count,
+                duration_ms=duration,
+                success=True,
+            )
 
         except Exception as e:
             duration = int((utc_now() - start_time).total_seconds() * 1000)
@@ -504,26 +545,28 @@ class SizeBasedCleanupStrategy(CleanupStrategy):
                 target_size = int(max_bytes * 0.8)
                 bytes_to_free = current_size - target_size
 
-                # Get validations ordered by created_at, delete oldest first
-                validations_result = await session.execute(
-                    select(Validation.id, func.length(Validation.result_json))
-                    .order_by(Validation.created_at.asc())
+                # Oldest first: a row goes while the bytes freed by the
+                # rows before it are still short of the target.
+                size = func.coalesce(func.length(Validation.result_json), 0)
+                running = select(
+                    Validation.id,
+                    size.label("size"),
+                    func.sum(size)
+                    .over(order_by=(Validation.created_at.asc(), Validation.id.asc()))
+                    .label("running"),
+                ).subquery()
+                doomed = await session.execute(
+                    select(running.c.id, running.c.size).where(
+                        running.c.running - running.c.size < bytes_to_free
+                    )
                 )
+                rows = doomed.all()
 
-                freed_bytes = 0
-                ids_to_delete = []
-
-                for val_id, size in validations_result:
-                    if freed_bytes >= bytes_to_free:
-                        break
-                    ids_to_delete.append(val_id)
-                    freed_bytes += size or 0
-
-                if ids_to_delete:
-                    await session.execute(
-                        delete(Validation).where(Validation.id.in_(ids_to_delete))
-                    )
-                    total_deleted = len(ids_to_delete)
+            ids_to_delete = [row[0] for row in rows]
+            freed_bytes = sum(row[1] for row in rows)
+            total_deleted = await delete_ids_in_batches(
+                Validation, ids_to_delete, batch_size=config.delete_batch_size
+            )
 
             duration = int((utc_now() - start_time).total_seconds() * 1000)
 
@@ -584,42 +627,22 @@ class StatusBasedCleanupStrategy(CleanupStrategy):
                 days=config.failed_retention_days
             )
 
-            async with get_session() as session:
-                # Delete old passed validations (use standard retention)
-                passed_count_result = await session.execute(
-                    select(func.count(Validation.id)).where(
-                        Validation.passed == True,  # noqa: E712
-                        Validation.created_at < passed_cutoff,
-                    )
-                )
-                passed_count = passed_count_result.scalar() or 0
-
-                if passed_count > 0:
-                    await session.execute(
-                        delete(Validation).where(
-                            Validation.passed == True,  # noqa: E712
-                            Validation.created_at < passed_cutoff,
-                        )
-                    )
-                    total_deleted += passed_count
+            # Delete old passed validations (use standard retention)
+            passed_count = await delete_in_batches(
+                Validation,
+                Validation.passed == True,  # noqa: E712
+                Validation.created_at < passed_cutoff,
+                batch_size=config.delete_batch_size,
+            )
 
-                # Delete old failed validations (use extended retention)
-                failed_count_result = await session.execute(
-                    select(func.count(Validation.id)).where(
-                        Validation.passed == False,  # noqa: E712
-                        Validation.created_at < failed_cutoff,
-                    )
-                )
-                failed_count = failed_count_result.scalar() or 0
-
-                if failed_count > 0:
-                    await session.execute(
-                        delete(Validation).where(
-                            Validation.passed == False,  # noqa: E712
-                            Validation.created_at < failed_cutoff,
-                        )
-                    )
-                    total_deleted += failed_count
+            # Delete old failed validations (use extended retention)
+            failed_count = await delete_in_batches(
+                Validation,
+                Validation.passed == False,  # noqa: E712
+                Validation.created_at < failed_cutoff,
+                batch_size=config.delete_batch_size,
+            )
+            total_deleted = passed_count + failed_count
 
             duration = int((utc_now() - start_time).total_seconds() * 1000)
 
@@ -671,35 +694,26 @@ class TagBasedCleanupStrategy(CleanupStrategy):
             )
 
         try:
-            async with get_session() as session:
-                # Handle delete_tags: remove validations with these tags
-                # that are past standard retention
-                if config.delete_tags:
-                    cutoff = utc_now() - timedelta(
-                        days=config.validation_retention_days
+            # Handle delete_tags: remove validations with these tags
+            # that are past standard retention
+            if config.delete_tags:
+                cutoff = utc_now() - timedelta(
+                    days=config.validation_retention_days
+                )
+
+                for tag in config.delete_tags:
+                    # Tags stored in result_json metadata
+                    # This is a simplified approach; production might use a tags table
+                    count = await delete_in_batches(
+                        Validation,
+                        Validation.created_at < cutoff,
+                        Validation.result_json.contains(f'"tag": "{tag}"'),
+                        batch_size=config.delete_batch_size,
                     )
+                    total_deleted += count
 
-                    for tag in config.delete_tags:
-                        # Tags stored in result_json metadata
-                        # This is a simplified approach; production might use a tags table
-                        count_result = await session.execute(
-                            select(func.count(Validation.id)).where(
-                                Validation.created_at < cutoff,
-                                Validation.result_json.contains(f'"tag": "{tag}"'),
-                            )
-                        )
-                        count = count_result.scalar() or 0
-
-                        if count > 0:
-                            await session.execute(
-                                delete(Validation).where(
-                                    Validation.created_at < cutoff,
-                                    Validation.result_json.contains(f'"tag": "{tag}"'),
-                                )
-                            )
-                            total_deleted += count
-
-                            logger.info(f"Tag cleanup: deleted {count} validations with tag '{tag}'")
+                    if count > 0:
+                        logger.info(f"Tag cleanup: deleted {count} validations with tag '{tag}'")
 
             duration = int((utc_now() - start_time).total_seconds() * 1000)
 
@@ -785,6 +799,11 @@ class MaintenanceManager:
         report = await manager.run_cleanup()
     """
 
+    # PRAGMA auto_vacuum value for INCREMENTAL mode
+    INCREMENTAL_AUTO_VACUUM = 2
+    # Pages released per incremental_vacuum step
+    VACUUM_PAGES_PER_STEP = 2000
+
     def __init__(self, config: MaintenanceConfig | None = None) -> None:
         """Initialize maintenance manager.
 
@@ -860,7 +879,7 @@ class MaintenanceManager:
                     )
                 )
 
-        # Run VACUUM if configured
+        # Run incremental VACUUM if configured
         if self._config.run_vacuum:
             try:
                 await self.vacuum()
@@ -878,18 +897,47 @@ class MaintenanceManager:
 
         return report
 
-    async def vacuum(self) -> None:
-        """Run SQLite VACUUM to reclaim space."""
-        from truthound_dashboard.db.database import get_engine
+    async def vacuum(self) -> int:
+        """Reclaim free pages with SQLite incremental vacuum.
 
-        logger.info("Running database VACUUM")
+        Frees ``VACUUM_PAGES_PER_STEP`` pages at a time and yields between
+        steps instead of rewriting the whole file under an exclusive lock.
+        A database created before incremental auto-vacuum was enabled is
+        switched over first, which needs one full VACUUM.
 
-        engine = get_engine()
-        async with engine.begin() as conn:
-            # VACUUM cannot run in a transaction, so we need raw connection
-            await conn.execute(text("VACUUM"))
+        Returns:
+            Number of pages returned to the file system.
+        """
+        from truthound_dashboard.db.database import get_engine
 
-        logger.info("Database VACUUM completed")
+        engine = get_engine()
+        async with engine.connect() as conn:
+            # VACUUM and the auto_vacuum switch cannot run in a transaction
+            conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+
+            mode = (await conn.execute(text("PRAGMA auto_vacuum"))).scalar()
+            if mode != self.INCREMENTAL_AUTO_VACUUM:
+                logger.info("Enabling incremental auto-vacuum (one-time full VACUUM)")
+                await conn.execute(text("PRAGMA auto_vacuum = INCREMENTAL"))
+                await conn.execute(text("VACUUM"))
+                return 0
+
+            freed = 0
+            free_pages = (await conn.execute(text("PRAGMA freelist_count"))).scalar() or 0
+            while free_pages:
+                step = min(free_pages, self.VACUUM_PAGES_PER_STEP)
+                await conn.execute(text(f"PRAGMA incremental_vacuum({step})"))
+                remaining = (
+                    await conn.execute(text("PRAGMA freelist_count"))
+                ).scalar() or 0
+                if remaining >= free_pages:
+                    break
+                freed += free_pages - remaining
+                free_pages = remaining
+                await asyncio.sleep(0)
+
+        logger.info(f"Incremental vacuum freed {freed} pages")
+        return freed
 
     async def run_task(self, task_name: str) -> CleanupResult | None:
         """Run a specific cleanup task by name.
@@ -512,10 +512,21 @@ class SafeExpressionEvaluator:
         Raises:
             ExpressionSecurityError: If disallowed nodes are found.
         """
+        # ast.walk also yields operator tokens (Eq, And, Add, ...); allow
+        # exactly the ones the evaluator implements.
+        allowed_operators = {
+            *self.BINARY_OPS,
+            *self.UNARY_OPS,
+            *self.COMPARE_OPS,
+            ast.And,
+            ast.Or,
+        }
         for node in ast.walk(tree):
             # Check node type
-            if type(node) not in self.ALLOWED_NODES and not isinstance(
-                node, ast.Expression
+            if (
+                type(node) not in self.ALLOWED_NODES
+                and type(node) not in allowed_operators
+                and not isinstance(node, ast.Expression)
             ):
                 raise ExpressionSecurityError(
                     expression,
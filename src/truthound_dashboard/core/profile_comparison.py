@@ -17,10 +17,10 @@ from collections.abc import Sequence
 from datetime import datetime, timedelta
 from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from truthound_dashboard.db import Profile, Source
+from truthound_dashboard.db import Profile, ProfileColumnMetric, Source
 from truthound_dashboard.core.domains.profiles import ProfileRepository
 from truthound_dashboard.core.statistics import (
     StatisticalTestResult,
@@ -463,27 +463,47 @@ class ProfileComparisonService:
         period_delta = self._parse_period(period)
         start_time = utc_now() - period_delta
 
-        # Get profiles within period
-        profiles = await self.profile_repo.get_for_source(
-            source.id, limit=1000
+        # Most recent profiles within the period, oldest first. Only the
+        # summary columns are read; per-column values come from the
+        # profile_column_metrics time series.
+        result = await self.session.execute(
+            select(
+                Profile.id,
+                Profile.created_at,
+                Profile.row_count,
+                Profile.column_count,
+                Profile.size_bytes,
+            )
+            .where(Profile.source_id == source.id, Profile.created_at >= start_time)
+            .order_by(Profile.created_at.desc())
+            .limit(1000)
         )
-        profiles = [p for p in profiles if p.created_at >= start_time]
-        profiles.sort(key=lambda p: p.created_at)
+        profiles = list(reversed(result.all()))
+        metrics_filter = (ProfileColumnMetric.source_id == source.id,)
+        if profiles:
+            metrics_filter += (ProfileColumnMetric.ts >= profiles[0].created_at,)
+
+        # Per-profile column averages in one grouped query
+        averages: dict[str, tuple[float, float]] = {}
+        if profiles:
+            result = await self.session.execute(
+                select(
+                    ProfileColumnMetric.profile_id,
+                    func.avg(ProfileColumnMetric.null_pct),
+                    func.avg(ProfileColumnMetric.unique_pct),
+                )
+                .where(*metrics_filter)
+                .group_by(ProfileColumnMetric.profile_id)
+            )
+            averages = {
+                profile_id: (avg_null, avg_unique)
+                for profile_id, avg_null, avg_unique in result.all()
+            }
 
         # Build trend points
         data_points: list[ProfileTrendPoint] = []
         for profile in profiles:
-            columns = profile.columns if hasattr(profile, "columns") else []
-            if not columns and profile.profile_json:
-                columns = profile.profile_json.get("columns", [])
-
-            # Calculate averages
-            null_pcts = [_parse_percentage(c.get("null_pct")) for c in columns]
-            unique_pcts = [_parse_percentage(c.get("unique_pct")) for c in columns]
-
-            avg_null = sum(null_pcts) / len(null_pcts) if null_pcts else 0.0
-            avg_unique = sum(unique_pcts) / len(unique_pcts) if unique_pcts else 0.0
-
+            avg_null, avg_unique = averages.get(profile.id, (0.0, 0.0))
             data_points.append(
                 ProfileTrendPoint(
                     timestamp=profile.created_at,
@@ -496,50 +516,63 @@ class ProfileComparisonService:
                 )
             )
 
-        # Build column trends
+        # Build column trends for the top columns by null_pct
         column_trends: list[ColumnTrend] = []
         if len(profiles) >= 2:
-            # Get all unique column names
-            all_columns = set()
-            for profile in profiles:
-                columns = profile.columns if hasattr(profile, "columns") else []
-                if not columns and profile.profile_json:
-                    columns = profile.profile_json.get("columns", [])
-                for col in columns:
-                    all_columns.add(col.get("name", ""))
-
-            # Build trend for top columns by null_pct
-            for col_name in list(all_columns)[:10]:
-                null_values: list[tuple[datetime, float]] = []
-
-                for profile in profiles:
-                    columns = profile.columns if hasattr(profile, "columns") else []
-                    if not columns and profile.profile_json:
-                        columns = profile.profile_json.get("columns", [])
-
-                    for col in columns:
-                        if col.get("name") == col_name:
-                            null_pct = _parse_percentage(col.get("null_pct"))
-                            null_values.append((profile.created_at, null_pct))
-
-                if len(null_values) >= 2:
-                    first_val = null_values[0][1]
-                    last_val = null_values[-1][1]
-                    change = last_val - first_val
-                    change_pct = (change / first_val * 100) if first_val != 0 else 0
-
-                    column_trends.append(
-                        ColumnTrend(
-                            column=col_name,
-                            metric="null_pct",
-                            values=null_values,
-                            trend_direction=_determine_trend(change, 1.0),
-                            change_pct=round(change_pct, 2),
-                            min_value=min(v[1] for v in null_values),
-                            max_value=max(v[1] for v in null_values),
-                            avg_value=sum(v[1] for v in null_values) / len(null_values),
-                        )
+            null_pct = ProfileColumnMetric.null_pct
+            result = await self.session.execute(
+                select(
+                    ProfileColumnMetric.column_name,
+                    func.min(null_pct),
+                    func.max(null_pct),
+                    func.avg(null_pct),
+                )
+                .where(*metrics_filter)
+                .group_by(ProfileColumnMetric.column_name)
+                .having(func.count() >= 2)
+                .order_by(func.max(null_pct).desc(), ProfileColumnMetric.column_name)
+                .limit(10)
+            )
+            column_stats = {row[0]: row[1:] for row in result.all()}
+
+            series: dict[str, list[tuple[datetime, float]]] = {
+                name: [] for name in column_stats
+            }
+            if column_stats:
+                result = await self.session.execute(
+                    select(
+                        ProfileColumnMetric.column_name,
+                        ProfileColumnMetric.ts,
+                        null_pct,
+                    )
+                    .where(
+                        *metrics_filter,
+                        ProfileColumnMetric.column_name.in_(list(column_stats)),
                     )
+                    .order_by(ProfileColumnMetric.column_name, ProfileColumnMetric.ts)
+                )
+                for col_name, ts, value in result.all():
+                    series[col_name].append((ts, value))
+
+            for col_name, (min_value, max_value, avg_value) in column_stats.items():
+                null_values = series[col_name]
+                first_val = null_values[0][1]
+                last_val = null_values[-1][1]
+                change = last_val - first_val
+                change_pct = (change / first_val * 100) if first_val != 0 else 0
+
+                column_trends.append(
+                    ColumnTrend(
+                        column=col_name,
+                        metric="null_pct",
+                        values=null_values,
+                        trend_direction=_determine_trend(change, 1.0),
+                        change_pct=round(change_pct, 2),
+                        min_value=min_value,
+                        max_value=max_value,
+                        avg_value=avg_value,
+                    )
+                )
 
         # Determine overall row count trend with statistical significance
         row_count_trend = TrendDirection.STABLE
@@ -40,9 +40,14 @@ output = await reporter.generate(data)
 ### Legacy Style (Still Supported)
 
 ```python
-from truthound_dashboard.core.reporters import generate_report
+from truthound_dashboard.core.reporters import generate_report, stream_report
 
 report = await generate_report(validation, format="html")
+
+# Large reports: write chunks as they are rendered
+stream = stream_report(validation, format="html")
+async for chunk in stream.chunks:
+    ...
 ```
 
 ## Extension Points
@@ -127,6 +132,7 @@ from .base import (
     ReportFormat,
     ReportMetadata,
     ReportResult,
+    ReportStream,
     ReportTheme,
 )
 from .csv_reporter import CSVReporter
@@ -138,6 +144,7 @@ from .registry import (
     get_available_formats,
     get_reporter,
     register_reporter,
+    stream_report,
 )
 
 # =============================================================================
@@ -204,6 +211,7 @@ __all__ = [
     "ReportFormat",
     "ReportMetadata",
     "ReportResult",
+    "ReportStream",
     "ReportTheme",
     # Legacy Implementations
     "CSVReporter",
@@ -215,4 +223,5 @@ __all__ = [
     "get_available_formats",
     "get_reporter",
     "register_reporter",
+    "stream_report",
 ]
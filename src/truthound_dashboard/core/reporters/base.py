@@ -7,6 +7,7 @@ the reporter system.
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -16,6 +17,9 @@ from truthound_dashboard.time import utc_now
 if TYPE_CHECKING:
     from truthound_dashboard.db.models import Validation
 
+# Streamed report content is flushed in chunks of roughly this many bytes.
+STREAM_CHUNK_SIZE = 64 * 1024
+
 
 class ReportFormat(str, Enum):
     """Supported report output formats."""
@@ -123,6 +127,23 @@ class ReportResult:
                 self.size_bytes = len(self.content)
 
 
+@dataclass
+class ReportStream:
+    """Report whose content is produced incrementally.
+
+    Attributes:
+        chunks: Async iterator of encoded content chunks.
+        metadata: Report metadata.
+        content_type: MIME type of the content.
+        filename: Suggested filename for download.
+    """
+
+    chunks: AsyncIterator[bytes]
+    metadata: ReportMetadata
+    content_type: str
+    filename: str
+
+
 class Reporter(ABC):
     """Abstract base class for report generators.
 
@@ -178,24 +199,7 @@ class Reporter(ABC):
         import time
 
         start_time = time.time()
-
-        # Build metadata
-        metadata = ReportMetadata(
-            title=title or f"Validation Report - {validation.source_id}",
-            source_id=validation.source_id,
-            validation_id=validation.id,
-            theme=theme,
-            format=self.format,
-            custom_fields=custom_metadata or {},
-        )
-
-        # Try to get source name
-        if hasattr(validation, "source") and validation.source:
-            metadata.source_name = validation.source.name
-
-        # Generate filename
-        timestamp = utc_now().strftime("%Y%m%d_%H%M%S")
-        filename = f"validation_report_{timestamp}{self.file_extension}"
+        metadata = self._build_metadata(validation, theme, title, custom_metadata)
 
         # Render content (subclass implementation)
         content = await self._render_content(
@@ -211,10 +215,70 @@ class Reporter(ABC):
             content=content,
             metadata=metadata,
             content_type=self.content_type,
-            filename=filename,
+            filename=self._build_filename(),
             generation_time_ms=generation_time_ms,
         )
 
+    def stream(
+        self,
+        validation: Validation,
+        *,
+        theme: ReportTheme = ReportTheme.PROFESSIONAL,
+        title: str | None = None,
+        include_samples: bool = True,
+        include_statistics: bool = True,
+        custom_metadata: dict[str, Any] | None = None,
+    ) -> ReportStream:
+        """Generate a report as a stream of UTF-8 encoded chunks.
+
+        Takes the same arguments as generate(). Content is rendered lazily
+        while ``chunks`` is consumed, so the full report is never held in
+        memory by reporters that override _iter_content().
+
+        Returns:
+            ReportStream with metadata and a chunk iterator.
+        """
+        metadata = self._build_metadata(validation, theme, title, custom_metadata)
+        parts = self._iter_content(
+            validation=validation,
+            metadata=metadata,
+            include_samples=include_samples,
+            include_statistics=include_statistics,
+        )
+        return ReportStream(
+            chunks=_encode_chunks(parts),
+            metadata=metadata,
+            content_type=self.content_type,
+            filename=self._build_filename(),
+        )
+
+    def _build_metadata(
+        self,
+        validation: Validation,
+        theme: ReportTheme,
+        title: str | None,
+        custom_metadata: dict[str, Any] | None,
+    ) -> ReportMetadata:
+        """Build report metadata for a validation."""
+        metadata = ReportMetadata(
+            title=title or f"Validation Report - {validation.source_id}",
+            source_id=validation.source_id,
+            validation_id=validation.id,
+            theme=theme,
+            format=self.format,
+            custom_fields=custom_metadata or {},
+        )
+
+        # Try to get source name
+        if hasattr(validation, "source") and validation.source:
+            metadata.source_name = validation.source.name
+        return metadata
+
+    def _build_filename(self) -> str:
+        """Generate a timestamped download filename."""
+        timestamp = utc_now().strftime("%Y%m%d_%H%M%S")
+        return f"validation_report_{timestamp}{self.file_extension}"
+
     @abstractmethod
     async def _render_content(
         self,
@@ -238,6 +302,45 @@ class Reporter(ABC):
         """
         ...
 
+    async def _iter_content(
+        self,
+        validation: Validation,
+        metadata: ReportMetadata,
+        include_samples: bool,
+        include_statistics: bool,
+    ) -> AsyncIterator[str | bytes]:
+        """Yield the report content in parts.
+
+        The default yields the whole of _render_content(). Streaming
+        reporters override this and implement _render_content() with
+        _join_content(), so both paths produce identical output.
+        """
+        yield await self._render_content(
+            validation=validation,
+            metadata=metadata,
+            include_samples=include_samples,
+            include_statistics=include_statistics,
+        )
+
+    async def _join_content(
+        self,
+        validation: Validation,
+        metadata: ReportMetadata,
+        include_samples: bool,
+        include_statistics: bool,
+    ) -> str:
+        """Render the full content by joining _iter_content() parts."""
+        parts = [
+            part
+            async for part in self._iter_content(
+                validation=validation,
+                metadata=metadata,
+                include_samples=include_samples,
+                include_statistics=include_statistics,
+            )
+        ]
+        return "".join(parts)
+
     def _extract_issues(self, validation: Validation) -> list[dict[str, Any]]:
         """Extract issues from validation result.
 
@@ -292,3 +395,18 @@ class Reporter(ABC):
         if passed is None:
             return "⏳ Pending"
         return "✅ Passed" if passed else "❌ Failed"
+
+
+async def _encode_chunks(
+    parts: AsyncIterator[str | bytes],
+    chunk_size: int = STREAM_CHUNK_SIZE,
+) -> AsyncIterator[bytes]:
+    """Encode content parts as UTF-8 and coalesce them into chunks."""
+    buffer = bytearray()
+    async for part in parts:
+        buffer += part.encode("utf-8") if isinstance(part, str) else part
+        if len(buffer) >= chunk_size:
+            yield bytes(buffer)
+            buffer.clear()
+    if buffer:
+        yield bytes(buffer)
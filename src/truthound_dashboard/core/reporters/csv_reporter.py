@@ -7,13 +7,17 @@ from __future__ import annotations
 
 import csv
 import io
-from typing import TYPE_CHECKING, Any
+from collections.abc import AsyncIterator
+from typing import TYPE_CHECKING
 
 from .base import Reporter, ReportFormat, ReportMetadata
 
 if TYPE_CHECKING:
     from truthound_dashboard.db.models import Validation
 
+# Issue rows written per streamed part.
+ROWS_PER_PART = 1000
+
 
 class CSVReporter(Reporter):
     """CSV report generator.
@@ -59,6 +63,18 @@ class CSVReporter(Reporter):
         include_statistics: bool,
     ) -> str:
         """Render CSV report content."""
+        return await self._join_content(
+            validation, metadata, include_samples, include_statistics
+        )
+
+    async def _iter_content(
+        self,
+        validation: Validation,
+        metadata: ReportMetadata,
+        include_samples: bool,
+        include_statistics: bool,
+    ) -> AsyncIterator[str]:
+        """Yield CSV content, ``ROWS_PER_PART`` issue rows at a time."""
         output = io.StringIO()
         writer = csv.writer(output, delimiter=self._delimiter)
 
@@ -74,7 +90,7 @@ class CSVReporter(Reporter):
             writer.writerow(headers)
 
         # Write issue rows
-        for issue in issues:
+        for index, issue in enumerate(issues, start=1):
             row = [
                 issue.get("column", ""),
                 issue.get("issue_type", ""),
@@ -88,8 +104,13 @@ class CSVReporter(Reporter):
                 row.append(samples_str)
 
             writer.writerow(row)
+            if index % ROWS_PER_PART == 0:
+                yield output.getvalue()
+                output.seek(0)
+                output.truncate()
 
-        return output.getvalue()
+        if output.tell():
+            yield output.getvalue()
 
 
 class ExcelCSVReporter(CSVReporter):
@@ -107,16 +128,17 @@ class ExcelCSVReporter(CSVReporter):
     def file_extension(self) -> str:
         return ".csv"
 
-    async def _render_content(
+    async def _iter_content(
         self,
         validation: Validation,
         metadata: ReportMetadata,
         include_samples: bool,
         include_statistics: bool,
-    ) -> str:
+    ) -> AsyncIterator[str]:
         """Render CSV with BOM for Excel."""
-        content = await super()._render_content(
-            validation, metadata, include_samples, include_statistics
-        )
         # Add UTF-8 BOM for Excel
-        return "\ufeff" + content
+        yield "\ufeff"
+        async for part in super()._iter_content(
+            validation, metadata, include_samples, include_statistics
+        ):
+            yield part
@@ -2,10 +2,18 @@
 
 Generates professional HTML reports with responsive design,
 theme support, internationalization, and interactive features.
+
+Reports are rendered incrementally: the issues table is emitted one page
+(``ISSUES_PER_PAGE`` rows in its own ``<tbody>``) at a time, and a small
+inline script shows one page at a time in the browser. Without scripts
+every page stays visible, and ``content-visibility`` keeps off-screen pages
+from being laid out.
 """
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator, Iterator
+from functools import cache
 from html import escape
 from typing import TYPE_CHECKING, Any
 
@@ -15,6 +23,31 @@ from .i18n import ReportLocalizer, SupportedLocale, get_localizer
 if TYPE_CHECKING:
     from truthound_dashboard.db.models import Validation
 
+# Issue rows per <tbody> page in the issues table.
+ISSUES_PER_PAGE = 100
+
+_PAGER_SCRIPT = """
+    <script>
+    (function () {
+        var pages = document.querySelectorAll(".issue-page");
+        var pager = document.querySelector(".pager");
+        if (!pager || pages.length < 2) return;
+        var status = pager.querySelector(".pager-status");
+        var current = 0;
+        function show(index) {
+            current = Math.max(0, Math.min(pages.length - 1, index));
+            for (var i = 0; i < pages.length; i++) {
+                pages[i].classList.toggle("page-hidden", i !== current);
+            }
+            status.textContent = (current + 1) + " / " + pages.length;
+        }
+        pager.querySelector(".pager-prev").onclick = function () { show(current - 1); };
+        pager.querySelector(".pager-next").onclick = function () { show(current + 1); };
+        pager.hidden = false;
+        show(0);
+    })();
+    </script>"""
+
 
 class HTMLReporter(Reporter):
     """HTML report generator with theme and i18n support.
@@ -69,339 +102,53 @@ class HTMLReporter(Reporter):
         include_statistics: bool,
     ) -> str:
         """Render HTML report content."""
+        return await self._join_content(
+            validation, metadata, include_samples, include_statistics
+        )
+
+    async def _iter_content(
+        self,
+        validation: Validation,
+        metadata: ReportMetadata,
+        include_samples: bool,
+        include_statistics: bool,
+    ) -> AsyncIterator[str]:
+        """Yield HTML report content section by section."""
         issues = self._extract_issues(validation)
         theme = metadata.theme
         t = self._localizer  # Shorthand for translations
 
-        # Build HTML sections
-        css = self._generate_css(theme)
-        header = self._render_header(validation, metadata, t)
-        summary = self._render_summary(validation, theme, t)
-        statistics = (
-            self._render_statistics(validation, theme, t) if include_statistics else ""
-        )
-        issues_section = self._render_issues(issues, theme, include_samples, t)
-        footer = self._render_footer(metadata, t)
-
         # Determine text direction for RTL languages
         text_dir = t.text_direction
         lang_code = self._locale.value
 
-        return f"""<!DOCTYPE html>
+        yield f"""<!DOCTYPE html>
 <html lang="{lang_code}" dir="{text_dir}">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>{escape(metadata.title)}</title>
     <style>
-{css}
+{self._generate_css(theme)}
     </style>
 </head>
 <body class="theme-{theme.value}">
     <div class="container">
-        {header}
-        {summary}
-        {statistics}
-        {issues_section}
-        {footer}
-    </div>
+        {self._render_header(validation, metadata, t)}
+        {self._render_summary(validation, theme, t)}
+        {self._render_statistics(validation, theme, t) if include_statistics else ""}
+        """
+        for part in self._iter_issues(issues, theme, include_samples, t):
+            yield part
+        yield f"""
+        {self._render_footer(metadata, t)}
+    </div>{_PAGER_SCRIPT if len(issues) > ISSUES_PER_PAGE else ""}
 </body>
 </html>"""
 
     def _generate_css(self, theme: ReportTheme) -> str:
-        """Generate CSS based on theme."""
-        # Base colors for themes
-        theme_colors = {
-            ReportTheme.LIGHT: {
-                "bg": "#ffffff",
-                "text": "#1f2937",
-                "text-muted": "#6b7280",
-                "border": "#e5e7eb",
-                "card-bg": "#f9fafb",
-                "primary": "#fd9e4b",
-                "success": "#10b981",
-                "danger": "#ef4444",
-            },
-            ReportTheme.DARK: {
-                "bg": "#1f2937",
-                "text": "#f9fafb",
-                "text-muted": "#9ca3af",
-                "border": "#374151",
-                "card-bg": "#111827",
-                "primary": "#fd9e4b",
-                "success": "#34d399",
-                "danger": "#f87171",
-            },
-            ReportTheme.PROFESSIONAL: {
-                "bg": "#f8fafc",
-                "text": "#0f172a",
-                "text-muted": "#64748b",
-                "border": "#cbd5e1",
-                "card-bg": "#ffffff",
-                "primary": "#fd9e4b",
-                "success": "#059669",
-                "danger": "#dc2626",
-            },
-            ReportTheme.MINIMAL: {
-                "bg": "#ffffff",
-                "text": "#000000",
-                "text-muted": "#666666",
-                "border": "#e0e0e0",
-                "card-bg": "#fafafa",
-                "primary": "#fd9e4b",
-                "success": "#22c55e",
-                "danger": "#ef4444",
-            },
-            ReportTheme.HIGH_CONTRAST: {
-                "bg": "#000000",
-                "text": "#ffffff",
-                "text-muted": "#e0e0e0",
-                "border": "#ffffff",
-                "card-bg": "#1a1a1a",
-                "primary": "#ffb347",
-                "success": "#00ff00",
-                "danger": "#ff0000",
-            },
-        }
-
-        c = theme_colors.get(theme, theme_colors[ReportTheme.PROFESSIONAL])
-
-        # RTL support
-        rtl_css = ""
-        if self._locale.is_rtl:
-            rtl_css = """
-        [dir="rtl"] .stat-row {
-            flex-direction: row-reverse;
-        }
-        [dir="rtl"] th, [dir="rtl"] td {
-            text-align: right;
-        }
-        """
-
-        return f"""
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto,
-                         'Helvetica Neue', Arial, sans-serif;
-            background-color: {c['bg']};
-            color: {c['text']};
-            line-height: 1.6;
-            padding: 2rem;
-        }}
-
-        .container {{
-            max-width: 1200px;
-            margin: 0 auto;
-        }}
-
-        .header {{
-            text-align: center;
-            margin-bottom: 2rem;
-            padding-bottom: 1rem;
-            border-bottom: 2px solid {c['primary']};
-        }}
-
-        .header h1 {{
-            font-size: 2rem;
-            margin-bottom: 0.5rem;
-            color: {c['primary']};
-        }}
-
-        .header .subtitle {{
-            color: {c['text-muted']};
-            font-size: 0.95rem;
-        }}
-
-        .card {{
-            background: {c['card-bg']};
-            border: 1px solid {c['border']};
-            border-radius: 8px;
-            padding: 1.5rem;
-            margin-bottom: 1.5rem;
-        }}
-
-        .card-title {{
-            font-size: 1.25rem;
-            font-weight: 600;
-            margin-bottom: 1rem;
-            padding-bottom: 0.5rem;
-            border-bottom: 1px solid {c['border']};
-        }}
-
-        .status-badge {{
-            display: inline-block;
-            padding: 0.5rem 1rem;
-            border-radius: 9999px;
-            font-weight: 600;
-            font-size: 1.1rem;
-        }}
-
-        .status-passed {{
-            background: {c['success']}20;
-            color: {c['success']};
-        }}
-
-        .status-failed {{
-            background: {c['danger']}20;
-            color: {c['danger']};
-        }}
-
-        .summary-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(150px, 1fr));
-            gap: 1rem;
-            margin-top: 1rem;
-        }}
-
-        .summary-item {{
-            text-align: center;
-            padding: 1rem;
-            background: {c['bg']};
-            border-radius: 8px;
-            border: 1px solid {c['border']};
-        }}
-
-        .summary-item .value {{
-            font-size: 2rem;
-            font-weight: 700;
-            display: block;
-        }}
-
-        .summary-item .label {{
-            color: {c['text-muted']};
-            font-size: 0.875rem;
-        }}
-
-        .severity-critical {{ color: #dc2626; }}
-        .severity-high {{ color: #ea580c; }}
-        .severity-medium {{ color: #ca8a04; }}
-        .severity-low {{ color: #2563eb; }}
-
-        table {{
-            width: 100%;
-            border-collapse: collapse;
-            margin-top: 1rem;
-        }}
-
-        th, td {{
-            padding: 0.75rem 1rem;
-            text-align: left;
-            border-bottom: 1px solid {c['border']};
-        }}
-
-        th {{
-            background: {c['bg']};
-            font-weight: 600;
-            color: {c['text-muted']};
-            font-size: 0.875rem;
-            text-transform: uppercase;
-            letter-spacing: 0.05em;
-        }}
-
-        tr:hover {{
-            background: {c['card-bg']};
-        }}
-
-        .severity-badge {{
-            display: inline-block;
-            padding: 0.25rem 0.75rem;
-            border-radius: 9999px;
-            font-size: 0.75rem;
-            font-weight: 600;
-            text-transform: uppercase;
-        }}
-
-        .badge-critical {{
-            background: #dc262620;
-            color: #dc2626;
-        }}
-
-        .badge-high {{
-            background: #ea580c20;
-            color: #ea580c;
-        }}
-
-        .badge-medium {{
-            background: #ca8a0420;
-            color: #ca8a04;
-        }}
-
-        .badge-low {{
-            background: #2563eb20;
-            color: #2563eb;
-        }}
-
-        .samples {{
-            margin-top: 0.5rem;
-            padding: 0.5rem;
-            background: {c['bg']};
-            border-radius: 4px;
-            font-family: monospace;
-            font-size: 0.875rem;
-            color: {c['text-muted']};
-        }}
-
-        .footer {{
-            text-align: center;
-            padding-top: 1.5rem;
-            margin-top: 2rem;
-            border-top: 1px solid {c['border']};
-            color: {c['text-muted']};
-            font-size: 0.875rem;
-        }}
-
-        .stats-grid {{
-            display: grid;
-            grid-template-columns: repeat(2, 1fr);
-            gap: 0.5rem;
-        }}
-
-        .stat-row {{
-            display: flex;
-            justify-content: space-between;
-            padding: 0.5rem 0;
-            border-bottom: 1px solid {c['border']};
-        }}
-
-        .stat-row:last-child {{
-            border-bottom: none;
-        }}
-
-        @media (max-width: 768px) {{
-            body {{
-                padding: 1rem;
-            }}
-
-            .summary-grid {{
-                grid-template-columns: repeat(2, 1fr);
-            }}
-
-            .stats-grid {{
-                grid-template-columns: 1fr;
-            }}
-
-            table {{
-                display: block;
-                overflow-x: auto;
-            }}
-        }}
-
-        @media print {{
-            body {{
-                padding: 0;
-            }}
-
-            .card {{
-                break-inside: avoid;
-            }}
-        }}
-        {rtl_css}
-        """
+        """Get the CSS for a theme (built once per theme and direction)."""
+        return _build_css(theme, self._locale.is_rtl)
 
     def _render_header(
         self,
@@ -524,16 +271,16 @@ class HTMLReporter(Reporter):
         </section>
         """
 
-    def _render_issues(
+    def _iter_issues(
         self,
         issues: list[dict[str, Any]],
         theme: ReportTheme,
         include_samples: bool,
         t: ReportLocalizer,
-    ) -> str:
-        """Render issues table."""
+    ) -> Iterator[str]:
+        """Yield the issues section, one ``<tbody>`` page at a time."""
         if not issues:
-            return f"""
+            yield f"""
             <section class="card">
                 <h2 class="card-title">{t.t("issues.title")}</h2>
                 <p style="text-align: center; color: var(--text-muted); padding: 2rem;">
@@ -541,34 +288,12 @@ class HTMLReporter(Reporter):
                 </p>
             </section>
             """
-
-        rows = []
-        for issue in issues:
-            severity = issue.get("severity", "medium").lower()
-            badge_class = f"badge-{severity}"
-            severity_label = t.t(f"severity.{severity}")
-
-            samples_html = ""
-            if include_samples and issue.get("sample_values"):
-                samples = [str(v)[:50] for v in issue["sample_values"][:5]]
-                samples_html = f'<div class="samples">{escape(", ".join(samples))}</div>'
-
-            rows.append(f"""
-                <tr>
-                    <td>{escape(issue.get('column', t.t('statistics.na')))}</td>
-                    <td>{escape(issue.get('issue_type', 'Unknown'))}</td>
-                    <td><span class="severity-badge {badge_class}">{severity_label}</span></td>
-                    <td>{t.format_number(issue.get('count', 0))}</td>
-                    <td>
-                        {escape(issue.get('details', '') or '')}
-                        {samples_html}
-                    </td>
-                </tr>
-            """)
+            return
 
         issue_count_text = t.plural("issues.count", len(issues))
+        na_text = t.t("statistics.na")
 
-        return f"""
+        yield f"""
         <section class="card">
             <h2 class="card-title">{t.t("issues.title")} ({issue_count_text})</h2>
             <table>
@@ -580,11 +305,46 @@ class HTMLReporter(Reporter):
                         <th>{t.t("issues.count")}</th>
                         <th>{t.t("issues.details")}</th>
                     </tr>
-                </thead>
-                <tbody>
-                    {''.join(rows)}
-                </tbody>
-            </table>
+                </thead>"""
+
+        for page_start in range(0, len(issues), ISSUES_PER_PAGE):
+            rows = [f"""
+                <tbody class="issue-page" data-page="{page_start // ISSUES_PER_PAGE}">"""]
+            for issue in issues[page_start : page_start + ISSUES_PER_PAGE]:
+                severity = issue.get("severity", "medium").lower()
+                badge_class = f"badge-{severity}"
+                severity_label = t.t(f"severity.{severity}")
+
+                samples_html = ""
+                if include_samples and issue.get("sample_values"):
+                    samples = [str(v)[:50] for v in issue["sample_values"][:5]]
+                    samples_html = f'<div class="samples">{escape(", ".join(samples))}</div>'
+
+                rows.append(f"""
+                    <tr>
+                        <td>{escape(issue.get('column', na_text))}</td>
+                        <td>{escape(issue.get('issue_type', 'Unknown'))}</td>
+                        <td><span class="severity-badge {badge_class}">{severity_label}</span></td>
+                        <td>{t.format_number(issue.get('count', 0))}</td>
+                        <td>
+                            {escape(issue.get('details', '') or '')}
+                            {samples_html}
+                        </td>
+                    </tr>""")
+            rows.append("""
+                </tbody>""")
+            yield "".join(rows)
+
+        pager = ""
+        if len(issues) > ISSUES_PER_PAGE:
+            pager = """
+            <nav class="pager" hidden>
+                <button type="button" class="pager-prev" aria-label="Previous page">&lsaquo;</button>
+                <span class="pager-status"></span>
+                <button type="button" class="pager-next" aria-label="Next page">&rsaquo;</button>
+            </nav>"""
+        yield f"""
+            </table>{pager}
         </section>
         """
 
@@ -596,3 +356,339 @@ class HTMLReporter(Reporter):
             <p>{t.t("report.validation_id")}: {escape(metadata.validation_id or t.t("statistics.na"))}</p>
         </footer>
         """
+
+
+@cache
+def _build_css(theme: ReportTheme, rtl: bool) -> str:
+    """Build the report stylesheet for a theme and text direction."""
+    # Base colors for themes
+    theme_colors = {
+        ReportTheme.LIGHT: {
+            "bg": "#ffffff",
+            "text": "#1f2937",
+            "text-muted": "#6b7280",
+            "border": "#e5e7eb",
+            "card-bg": "#f9fafb",
+            "primary": "#fd9e4b",
+            "success": "#10b981",
+            "danger": "#ef4444",
+        },
+        ReportTheme.DARK: {
+            "bg": "#1f2937",
+            "text": "#f9fafb",
+            "text-muted": "#9ca3af",
+            "border": "#374151",
+            "card-bg": "#111827",
+            "primary": "#fd9e4b",
+            "success": "#34d399",
+            "danger": "#f87171",
+        },
+        ReportTheme.PROFESSIONAL: {
+            "bg": "#f8fafc",
+            "text": "#0f172a",
+            "text-muted": "#64748b",
+            "border": "#cbd5e1",
+            "card-bg": "#ffffff",
+            "primary": "#fd9e4b",
+            "success": "#059669",
+            "danger": "#dc2626",
+        },
+        ReportTheme.MINIMAL: {
+            "bg": "#ffffff",
+            "text": "#000000",
+            "text-muted": "#666666",
+            "border": "#e0e0e0",
+            "card-bg": "#fafafa",
+            "primary": "#fd9e4b",
+            "success": "#22c55e",
+            "danger": "#ef4444",
+        },
+        ReportTheme.HIGH_CONTRAST: {
+            "bg": "#000000",
+            "text": "#ffffff",
+            "text-muted": "#e0e0e0",
+            "border": "#ffffff",
+            "card-bg": "#1a1a1a",
+            "primary": "#ffb347",
+            "success": "#00ff00",
+            "danger": "#ff0000",
+        },
+    }
+
+    c = theme_colors.get(theme, theme_colors[ReportTheme.PROFESSIONAL])
+
+    # RTL support
+    rtl_css = ""
+    if rtl:
+        rtl_css = """
+    [dir="rtl"] .stat-row {
+        flex-direction: row-reverse;
+    }
+    [dir="rtl"] th, [dir="rtl"] td {
+        text-align: right;
+    }
+    """
+
+    return f"""
+    * {{
+        margin: 0;
+        padding: 0;
+        box-sizing: border-box;
+    }}
+
+    body {{
+        font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto,
+                     'Helvetica Neue', Arial, sans-serif;
+        background-color: {c['bg']};
+        color: {c['text']};
+        line-height: 1.6;
+        padding: 2rem;
+    }}
+
+    .container {{
+        max-width: 1200px;
+        margin: 0 auto;
+    }}
+
+    .header {{
+        text-align: center;
+        margin-bottom: 2rem;
+        padding-bottom: 1rem;
+        border-bottom: 2px solid {c['primary']};
+    }}
+
+    .header h1 {{
+        font-size: 2rem;
+        margin-bottom: 0.5rem;
+        color: {c['primary']};
+    }}
+
+    .header .subtitle {{
+        color: {c['text-muted']};
+        font-size: 0.95rem;
+    }}
+
+    .card {{
+        background: {c['card-bg']};
+        border: 1px solid {c['border']};
+        border-radius: 8px;
+        padding: 1.5rem;
+        margin-bottom: 1.5rem;
+    }}
+
+    .card-title {{
+        font-size: 1.25rem;
+        font-weight: 600;
+        margin-bottom: 1rem;
+        padding-bottom: 0.5rem;
+        border-bottom: 1px solid {c['border']};
+    }}
+
+    .status-badge {{
+        display: inline-block;
+        padding: 0.5rem 1rem;
+        border-radius: 9999px;
+        font-weight: 600;
+        font-size: 1.1rem;
+    }}
+
+    .status-passed {{
+        background: {c['success']}20;
+        color: {c['success']};
+    }}
+
+    .status-failed {{
+        background: {c['danger']}20;
+        color: {c['danger']};
+    }}
+
+    .summary-grid {{
+        display: grid;
+        grid-template-columns: repeat(auto-fit, minmax(150px, 1fr));
+        gap: 1rem;
+        margin-top: 1rem;
+    }}
+
+    .summary-item {{
+        text-align: center;
+        padding: 1rem;
+        background: {c['bg']};
+        border-radius: 8px;
+        border: 1px solid {c['border']};
+    }}
+
+    .summary-item .value {{
+        font-size: 2rem;
+        font-weight: 700;
+        display: block;
+    }}
+
+    .summary-item .label {{
+        color: {c['text-muted']};
+        font-size: 0.875rem;
+    }}
+
+    .severity-critical {{ color: #dc2626; }}
+    .severity-high {{ color: #ea580c; }}
+    .severity-medium {{ color: #ca8a04; }}
+    .severity-low {{ color: #2563eb; }}
+
+    table {{
+        width: 100%;
+        border-collapse: collapse;
+        margin-top: 1rem;
+    }}
+
+    th, td {{
+        padding: 0.75rem 1rem;
+        text-align: left;
+        border-bottom: 1px solid {c['border']};
+    }}
+
+    th {{
+        background: {c['bg']};
+        font-weight: 600;
+        color: {c['text-muted']};
+        font-size: 0.875rem;
+        text-transform: uppercase;
+        letter-spacing: 0.05em;
+    }}
+
+    tr:hover {{
+        background: {c['card-bg']};
+    }}
+
+    .severity-badge {{
+        display: inline-block;
+        padding: 0.25rem 0.75rem;
+        border-radius: 9999px;
+        font-size: 0.75rem;
+        font-weight: 600;
+        text-transform: uppercase;
+    }}
+
+    .badge-critical {{
+        background: #dc262620;
+        color: #dc2626;
+    }}
+
+    .badge-high {{
+        background: #ea580c20;
+        color: #ea580c;
+    }}
+
+    .badge-medium {{
+        background: #ca8a0420;
+        color: #ca8a04;
+    }}
+
+    .badge-low {{
+        background: #2563eb20;
+        color: #2563eb;
+    }}
+
+    .samples {{
+        margin-top: 0.5rem;
+        padding: 0.5rem;
+        background: {c['bg']};
+        border-radius: 4px;
+        font-family: monospace;
+        font-size: 0.875rem;
+        color: {c['text-muted']};
+    }}
+
+    .footer {{
+        text-align: center;
+        padding-top: 1.5rem;
+        margin-top: 2rem;
+        border-top: 1px solid {c['border']};
+        color: {c['text-muted']};
+        font-size: 0.875rem;
+    }}
+
+    .stats-grid {{
+        display: grid;
+        grid-template-columns: repeat(2, 1fr);
+        gap: 0.5rem;
+    }}
+
+    .stat-row {{
+        display: flex;
+        justify-content: space-between;
+        padding: 0.5rem 0;
+        border-bottom: 1px solid {c['border']};
+    }}
+
+    .stat-row:last-child {{
+        border-bottom: none;
+    }}
+
+    @media (max-width: 768px) {{
+        body {{
+            padding: 1rem;
+        }}
+
+        .summary-grid {{
+            grid-template-columns: repeat(2, 1fr);
+        }}
+
+        .stats-grid {{
+            grid-template-columns: 1fr;
+        }}
+
+        table {{
+            display: block;
+            overflow-x: auto;
+        }}
+    }}
+
+    .issue-page {{
+        content-visibility: auto;
+        contain-intrinsic-size: auto 6000px;
+    }}
+
+    .issue-page.page-hidden {{
+        display: none;
+    }}
+
+    .pager {{
+        display: flex;
+        justify-content: center;
+        align-items: center;
+        gap: 1rem;
+        margin-top: 1rem;
+        color: {c['text-muted']};
+    }}
+
+    .pager[hidden] {{
+        display: none;
+    }}
+
+    .pager button {{
+        padding: 0.25rem 0.75rem;
+        border: 1px solid {c['border']};
+        border-radius: 4px;
+        background: {c['bg']};
+        color: {c['text']};
+        cursor: pointer;
+    }}
+
+    @media print {{
+        body {{
+            padding: 0;
+        }}
+
+        .card {{
+            break-inside: avoid;
+        }}
+
+        .issue-page.page-hidden {{
+            display: table-row-group;
+        }}
+
+        .pager {{
+            display: none;
+        }}
+    }}
+    {rtl_css}
+    """
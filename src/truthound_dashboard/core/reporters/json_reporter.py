@@ -7,10 +7,11 @@ and integration with other tools.
 from __future__ import annotations
 
 import json
+from collections.abc import AsyncIterator
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
-from .base import Reporter, ReportFormat, ReportMetadata
+from .base import STREAM_CHUNK_SIZE, Reporter, ReportFormat, ReportMetadata
 
 if TYPE_CHECKING:
     from truthound_dashboard.db.models import Validation
@@ -57,6 +58,23 @@ class JSONReporter(Reporter):
         include_statistics: bool,
     ) -> str:
         """Render JSON report content."""
+        return await self._join_content(
+            validation, metadata, include_samples, include_statistics
+        )
+
+    async def _iter_content(
+        self,
+        validation: Validation,
+        metadata: ReportMetadata,
+        include_samples: bool,
+        include_statistics: bool,
+    ) -> AsyncIterator[str]:
+        """Yield JSON content as it is encoded.
+
+        ``JSONEncoder.iterencode`` produces the same text as ``json.dumps``
+        in small fragments; they are batched into ``STREAM_CHUNK_SIZE``
+        parts.
+        """
         issues = self._extract_issues(validation)
 
         # Process issues to optionally remove samples
@@ -121,12 +139,22 @@ class JSONReporter(Reporter):
                 "message": validation.error_message,
             }
 
-        return json.dumps(
-            report_data,
+        encoder = json.JSONEncoder(
             indent=self._indent,
             ensure_ascii=self._ensure_ascii,
             default=self._json_serializer,
         )
+        buffer: list[str] = []
+        buffered = 0
+        for fragment in encoder.iterencode(report_data):
+            buffer.append(fragment)
+            buffered += len(fragment)
+            if buffered >= STREAM_CHUNK_SIZE:
+                yield "".join(buffer)
+                buffer.clear()
+                buffered = 0
+        if buffer:
+            yield "".join(buffer)
 
     def _json_serializer(self, obj: Any) -> Any:
         """Custom JSON serializer for non-serializable objects.
@@ -9,7 +9,7 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING, Any
 
-from .base import Reporter, ReportFormat, ReportResult, ReportTheme
+from .base import Reporter, ReportFormat, ReportResult, ReportStream, ReportTheme
 from .i18n import SupportedLocale, get_supported_locales
 
 if TYPE_CHECKING:
@@ -244,6 +244,48 @@ async def generate_report(
     )
 
 
+def stream_report(
+    validation: Validation,
+    *,
+    format: ReportFormat | str = ReportFormat.HTML,
+    theme: ReportTheme | str = ReportTheme.PROFESSIONAL,
+    locale: SupportedLocale | str = SupportedLocale.ENGLISH,
+    title: str | None = None,
+    include_samples: bool = True,
+    include_statistics: bool = True,
+    custom_metadata: dict[str, Any] | None = None,
+) -> ReportStream:
+    """Generate a report for a validation result as a chunk stream.
+
+    Takes the same arguments as generate_report(). Use this when writing
+    the report to a file or an HTTP response, so large reports are never
+    held in memory in full.
+
+    Returns:
+        ReportStream with metadata and an async iterator of byte chunks.
+
+    Example:
+        report = stream_report(validation, format="csv")
+        async for chunk in report.chunks:
+            out.write(chunk)
+    """
+    if isinstance(format, str):
+        format = ReportFormat.from_string(format)
+    if isinstance(theme, str):
+        theme = ReportTheme(theme)
+
+    reporter = get_reporter(format, locale=locale)
+
+    return reporter.stream(
+        validation,
+        theme=theme,
+        title=title,
+        include_samples=include_samples,
+        include_statistics=include_statistics,
+        custom_metadata=custom_metadata,
+    )
+
+
 def get_report_locales() -> list[dict[str, Any]]:
     """Get list of supported report locales.
 
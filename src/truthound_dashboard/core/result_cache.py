@@ -0,0 +1,279 @@
+"""Content-fingerprint result cache for validations and profiles.
+
+Scheduled runs frequently target static snapshots whose content has not
+changed since the previous run. This module derives a cheap fingerprint of
+the underlying data and combines it with a canonical hash of the run
+parameters. When a previous run with the same cache key exists, services can
+short-circuit to its stored result instead of invoking truthound again.
+
+Fingerprints:
+    - File sources: size + mtime + BLAKE2b of the head and tail blocks.
+    - SQL sources: opt-in ``COUNT(*)`` / ``MAX(<change column>)`` probe,
+      enabled by setting ``fingerprint_column`` in the source config.
+
+Sources that cannot be fingerprinted are never served from the cache.
+
+Example:
+    fingerprint = await compute_source_fingerprint(source.type, config, data_input)
+    key = build_cache_key("validation", fingerprint, validators=["Null"])
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from .datasource_factory import SourceType
+
+logger = logging.getLogger(__name__)
+
+# Bytes hashed from each end of a file. Appends and in-place edits near the
+# start of the file change the digest even when size and mtime are preserved.
+PARTIAL_HASH_BLOCK_SIZE = 64 * 1024
+
+
+@dataclass(frozen=True)
+class SourceFingerprint:
+    """Fingerprint of a data source's current content.
+
+    Attributes:
+        kind: Probe that produced the fingerprint (``file`` or ``sql``).
+        digest: Hex digest identifying the content.
+        details: Raw probe values, useful for debugging cache misses.
+    """
+
+    kind: str
+    digest: str
+    details: dict[str, Any] = field(default_factory=dict)
+
+
+def _canonical_json(value: Any) -> str:
+    """Serialize a value deterministically for hashing."""
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+
+
+def fingerprint_file(
+    path: str | Path,
+    *,
+    block_size: int = PARTIAL_HASH_BLOCK_SIZE,
+) -> SourceFingerprint | None:
+    """Fingerprint a local file from its stat and a partial content hash.
+
+    Args:
+        path: File path.
+        block_size: Number of bytes hashed from the head and the tail.
+
+    Returns:
+        SourceFingerprint, or None if the file cannot be read.
+    """
+    try:
+        file_path = Path(path)
+        stat = file_path.stat()
+        hasher = hashlib.blake2b(digest_size=16)
+        with file_path.open("rb") as handle:
+            hasher.update(handle.read(block_size))
+            if stat.st_size > block_size:
+                handle.seek(max(block_size, stat.st_size - block_size))
+                hasher.update(handle.read(block_size))
+    except OSError as exc:
+        logger.debug("Cannot fingerprint file %s: %s", path, exc)
+        return None
+
+    details = {
+        "path": str(file_path.resolve()),
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "partial_hash": hasher.hexdigest(),
+    }
+    digest = hashlib.sha256(_canonical_json(details).encode()).hexdigest()
+    return SourceFingerprint(kind="file", digest=digest, details=details)
+
+
+def fingerprint_sql_datasource(
+    datasource: Any,
+    config: dict[str, Any],
+) -> SourceFingerprint | None:
+    """Fingerprint a SQL data source with a row-count / change-column probe.
+
+    The probe only runs when the source config names a ``fingerprint_column``
+    (typically ``updated_at``); otherwise SQL content cannot be trusted to be
+    unchanged and None is returned.
+
+    Args:
+        datasource: truthound SQL data source exposing ``execute_query``.
+        config: Resolved source configuration.
+
+    Returns:
+        SourceFingerprint, or None if probing is disabled or fails.
+    """
+    column = config.get("fingerprint_column")
+    if not column or not hasattr(datasource, "execute_query"):
+        return None
+
+    try:
+        quoted = datasource._quote_identifier(column)
+        rows = datasource.execute_query(
+            f"SELECT COUNT(*) AS row_count, MAX({quoted}) AS max_changed "
+            f"FROM {datasource.full_table_name}"
+        )
+    except Exception as exc:
+        logger.debug("SQL fingerprint probe failed for %s: %s", column, exc)
+        return None
+
+    if not rows:
+        return None
+    first = rows[0]
+    values = list(first.values()) if isinstance(first, dict) else list(first)
+    details = {
+        "relation": getattr(datasource, "name", None),
+        "column": column,
+        "row_count": values[0] if values else None,
+        "max_changed": str(values[1]) if len(values) > 1 else None,
+    }
+    digest = hashlib.sha256(_canonical_json(details).encode()).hexdigest()
+    return SourceFingerprint(kind="sql", digest=digest, details=details)
+
+
+def _fingerprint_sync(
+    source_type: str,
+    config: dict[str, Any],
+    data_input: Any,
+) -> SourceFingerprint | None:
+    if SourceType.is_file_type(source_type):
+        path = data_input if isinstance(data_input, (str, os.PathLike)) else config.get("path")
+        return fingerprint_file(path) if path else None
+    if SourceType.is_sql_type(source_type):
+        return fingerprint_sql_datasource(data_input, config)
+    return None
+
+
+async def compute_source_fingerprint(
+    source_type: str,
+    config: dict[str, Any],
+    data_input: Any,
+) -> SourceFingerprint | None:
+    """Compute a source fingerprint off the event loop.
+
+    Args:
+        source_type: Source type string (e.g. ``csv``, ``postgresql``).
+        config: Resolved source configuration.
+        data_input: Path or truthound data source for the source.
+
+    Returns:
+        SourceFingerprint, or None when the source type is not cacheable.
+    """
+    return await asyncio.to_thread(
+        _fingerprint_sync, source_type.lower(), config, data_input
+    )
+
+
+def fingerprint_schema_path(schema_path: str | None) -> str | None:
+    """Return a digest for a schema file so schema edits invalidate the cache."""
+    if not schema_path:
+        return None
+    fingerprint = fingerprint_file(schema_path)
+    return fingerprint.digest if fingerprint else schema_path
+
+
+def build_cache_key(
+    operation: str,
+    fingerprint: SourceFingerprint,
+    **params: Any,
+) -> str:
+    """Combine a source fingerprint and canonicalized run parameters.
+
+    Args:
+        operation: Operation namespace (``validation`` or ``profile``).
+        fingerprint: Source content fingerprint.
+        **params: Parameters that influence the result.
+
+    Returns:
+        SHA-256 hex digest usable as a cache key.
+    """
+    payload = {
+        "operation": operation,
+        "fingerprint": fingerprint.digest,
+        "params": params,
+    }
+    return hashlib.sha256(_canonical_json(payload).encode()).hexdigest()
+
+
+class ResultCacheMetrics:
+    """Thread-safe hit/miss counters for the result cache."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._hits: dict[str, int] = {}
+        self._misses: dict[str, int] = {}
+        self._bypassed: dict[str, int] = {}
+
+    def _increment(self, counter: dict[str, int], operation: str) -> None:
+        with self._lock:
+            counter[operation] = counter.get(operation, 0) + 1
+
+    def record_hit(self, operation: str) -> None:
+        """Record a cache hit for an operation."""
+        self._increment(self._hits, operation)
+
+    def record_miss(self, operation: str) -> None:
+        """Record a cache miss for an operation."""
+        self._increment(self._misses, operation)
+
+    def record_bypass(self, operation: str) -> None:
+        """Record a run that could not be fingerprinted or opted out."""
+        self._increment(self._bypassed, operation)
+
+    def snapshot(self) -> dict[str, dict[str, float]]:
+        """Return per-operation counters and hit rates."""
+        with self._lock:
+            operations = set(self._hits) | set(self._misses) | set(self._bypassed)
+            result: dict[str, dict[str, float]] = {}
+            for operation in sorted(operations):
+                hits = self._hits.get(operation, 0)
+                misses = self._misses.get(operation, 0)
+                lookups = hits + misses
+                result[operation] = {
+                    "hits": hits,
+                    "misses": misses,
+                    "bypassed": self._bypassed.get(operation, 0),
+                    "hit_rate": hits / lookups if lookups else 0.0,
+                }
+            return result
+
+    def reset(self) -> None:
+        """Reset all counters."""
+        with self._lock:
+            self._hits.clear()
+            self._misses.clear()
+            self._bypassed.clear()
+
+
+_metrics: ResultCacheMetrics | None = None
+
+
+def get_result_cache_metrics() -> ResultCacheMetrics:
+    """Get the result cache metrics singleton."""
+    global _metrics
+    if _metrics is None:
+        _metrics = ResultCacheMetrics()
+    return _metrics
+
+
+__all__ = [
+    "PARTIAL_HASH_BLOCK_SIZE",
+    "ResultCacheMetrics",
+    "SourceFingerprint",
+    "build_cache_key",
+    "compute_source_fingerprint",
+    "fingerprint_file",
+    "fingerprint_schema_path",
+    "fingerprint_sql_datasource",
+    "get_result_cache_metrics",
+]
@@ -8,11 +8,14 @@ Features:
     - Preset templates for different use cases
     - Category-based filtering
     - Multiple export formats (YAML, JSON, Python, TOML)
+    - Cross-column rules mined from a data sample when one can be read
 """
 
 from __future__ import annotations
 
+import asyncio
 import json
+import logging
 import re
 from datetime import datetime
 from typing import Any
@@ -21,8 +24,15 @@ import yaml
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from truthound_dashboard.db import Profile, Rule, Schema, Source
+from truthound_dashboard.core.datasource_factory import SourceType
 from truthound_dashboard.core.domains.profiles import ProfileRepository
 from truthound_dashboard.core.domains.rules import RuleRepository
+from truthound_dashboard.core.domains.source_io import get_data_input_from_source
+from truthound_dashboard.core.rule_mining import (
+    MINED_RULE_TYPES,
+    RuleMiner,
+    load_mining_sample,
+)
 from truthound_dashboard.schemas.rule_suggestion import (
     ApplyRulesResponse,
     CrossColumnRuleSuggestion,
@@ -39,6 +49,7 @@ from truthound_dashboard.schemas.rule_suggestion import (
 )
 from truthound_dashboard.time import utc_now
 
+logger = logging.getLogger(__name__)
 
 # Common email pattern
 EMAIL_PATTERN = re.compile(
@@ -1533,6 +1544,7 @@ class RuleGeneratorService:
         strictness: StrictnessLevel = StrictnessLevel.MEDIUM,
         include_types: list[CrossColumnRuleType] | None = None,
         exclude_types: list[CrossColumnRuleType] | None = None,
+        mined: list[CrossColumnRuleSuggestion] | None = None,
     ) -> list[CrossColumnRuleSuggestion]:
         """Generate all cross-column rule suggestions.
 
@@ -1541,6 +1553,8 @@ class RuleGeneratorService:
             strictness: Strictness level.
             include_types: Only include these cross-column rule types.
             exclude_types: Exclude these cross-column rule types.
+            mined: Suggestions mined from a data sample. When given, they
+                replace the name-based guesses for ``MINED_RULE_TYPES``.
 
         Returns:
             List of cross-column suggestions.
@@ -1584,6 +1598,14 @@ class RuleGeneratorService:
                 suggestions = generator(columns, strictness)
                 all_suggestions.extend(suggestions)
 
+        if mined is not None:
+            all_suggestions = [
+                s for s in all_suggestions if s.rule_type not in MINED_RULE_TYPES
+            ]
+            all_suggestions.extend(
+                s for s in mined if s.rule_type in types_to_generate
+            )
+
         # Filter by min confidence based on strictness
         thresholds = STRICTNESS_THRESHOLDS[strictness]
         min_confidence = thresholds["min_confidence"]
@@ -1659,6 +1681,37 @@ class RuleGeneratorService:
 
         return result
 
+    async def _mine_cross_column_rules(
+        self, source: Source, sample_rows: int
+    ) -> list[CrossColumnRuleSuggestion] | None:
+        """Mine cross-column rules from a sample of a file source.
+
+        Args:
+            source: Source record.
+            sample_rows: Maximum rows to sample.
+
+        Returns:
+            Mined suggestions, or None when the source cannot be sampled
+            and the profile-based heuristics should be used instead.
+        """
+        if not SourceType.is_file_type(source.type.lower()):
+            return None
+        try:
+            path = await get_data_input_from_source(source, self.session)
+        except ValueError as e:
+            logger.debug("Skipping rule mining for %s: %s", source.name, e)
+            return None
+
+        def mine() -> list[CrossColumnRuleSuggestion]:
+            sample = load_mining_sample(path, sample_rows)
+            return RuleMiner().mine(sample)
+
+        try:
+            return await asyncio.to_thread(mine)
+        except Exception as e:
+            logger.warning("Rule mining failed for %s: %s", source.name, e)
+            return None
+
     async def generate_suggestions(
         self,
         source: Source,
@@ -1673,6 +1726,7 @@ class RuleGeneratorService:
         enable_cross_column: bool = True,
         include_cross_column_types: list[CrossColumnRuleType] | None = None,
         exclude_cross_column_types: list[CrossColumnRuleType] | None = None,
+        sample_rows: int | None = None,
     ) -> RuleSuggestionResponse:
         """Generate rule suggestions based on profile data.
 
@@ -1688,6 +1742,8 @@ class RuleGeneratorService:
             enable_cross_column: Whether to generate cross-column rules.
             include_cross_column_types: Cross-column types to include.
             exclude_cross_column_types: Cross-column types to exclude.
+            sample_rows: Rows sampled from file sources to mine cross-column
+                rules from. None keeps the profile-based heuristics.
 
         Returns:
             Rule suggestion response.
@@ -1741,11 +1797,15 @@ class RuleGeneratorService:
 
         # Generate cross-column suggestions if enabled
         if enable_cross_column and columns:
+            mined = None
+            if sample_rows:
+                mined = await self._mine_cross_column_rules(source, sample_rows)
             cross_column_suggestions = self._generate_cross_column_suggestions(
                 columns,
                 strictness,
                 include_cross_column_types,
                 exclude_cross_column_types,
+                mined,
             )
             # Filter by min confidence
             cross_column_suggestions = [
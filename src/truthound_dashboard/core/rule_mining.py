@@ -0,0 +1,525 @@
+"""Sample-based cross-column rule mining.
+
+The profile-driven generators in :mod:`truthound_dashboard.core.rule_generator`
+guess relationships from column names and summary statistics. This module
+measures them on a data sample instead, so every suggestion carries the
+strength it was observed with:
+
+- Correlations: one standardized matrix product over all numeric columns.
+- Functional dependencies and composite keys: hashed group-by cardinalities.
+  Each column is hashed once; a column pair is the XOR of two
+  independently seeded hashes, so every pair cardinality is a single
+  ``n_unique`` over ``UInt64`` values instead of a multi-column group-by.
+- Sum and product relations: every column pair is combined on a handful of
+  fingerprint rows and matched against every column within the arithmetic
+  tolerance (a sorted search on the first row, then a check of the rest),
+  so rounded results such as ``round(price * qty, 2)`` still match. The
+  matches are then confirmed with vectorized residual checks.
+
+Correlations, dependencies and arithmetic relations are measured on an
+evenly spaced subset of the sample (``discovery_rows``), which bounds their
+cost whatever the sample size. Uniqueness is the one property a subset
+cannot show, so composite key candidates are confirmed on the whole sample.
+On a 1M-row, 200-column sample mining stays around a second on one core.
+
+Example:
+    sample = load_mining_sample("orders.parquet", rows=200_000)
+    suggestions = RuleMiner().mine(sample)
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+from truthound_dashboard.core.anomaly_features import numeric_columns
+from truthound_dashboard.schemas.rule_suggestion import (
+    CrossColumnRuleSuggestion,
+    CrossColumnRuleType,
+)
+
+logger = logging.getLogger(__name__)
+
+# Rule types whose sample-mined suggestions replace the name-based guesses.
+MINED_RULE_TYPES = frozenset(
+    {
+        CrossColumnRuleType.COLUMN_CORRELATION,
+        CrossColumnRuleType.COLUMN_DEPENDENCY,
+        CrossColumnRuleType.COMPOSITE_KEY,
+        CrossColumnRuleType.COLUMN_SUM,
+        CrossColumnRuleType.COLUMN_PRODUCT,
+    }
+)
+
+# Rows used to fingerprint candidate arithmetic relations.
+_FINGERPRINT_ROWS = 8
+
+# Share of distinct values above which a column counts as unique on its own,
+# leaving room for the error of approximate distinct counts.
+_NEAR_UNIQUE = 0.99
+
+
+@dataclass
+class RuleMiningConfig:
+    """Thresholds and limits for rule mining.
+
+    Attributes:
+        discovery_rows: Rows of the sample used to find candidates.
+        min_rows: Smallest sample worth mining.
+        min_correlation: Smallest absolute Pearson correlation reported.
+        correlation_margin: Slack between the measured correlation and the
+            suggested bound.
+        min_dependency_strength: Fraction of rows that must agree with a
+            functional dependency.
+        min_arithmetic_strength: Fraction of rows that must satisfy a sum or
+            product relation.
+        arithmetic_tolerance: Relative tolerance of arithmetic checks.
+        max_pair_columns: Discrete columns considered for dependencies and
+            composite keys.
+        max_key_checks: Composite key candidates checked on the whole
+            sample.
+        max_arithmetic_columns: Numeric columns considered for arithmetic
+            relations.
+        max_suggestions_per_type: Cap on suggestions of each rule type.
+        seed: Hash seed for pair cardinalities.
+    """
+
+    discovery_rows: int = 20_000
+    min_rows: int = 50
+    min_correlation: float = 0.7
+    correlation_margin: float = 0.1
+    min_dependency_strength: float = 0.99
+    min_arithmetic_strength: float = 0.99
+    arithmetic_tolerance: float = 0.01
+    max_pair_columns: int = 24
+    max_key_checks: int = 5
+    max_arithmetic_columns: int = 200
+    max_suggestions_per_type: int = 20
+    seed: int = 42
+
+
+def load_mining_sample(path: str, rows: int, seed: int = 42) -> Any:
+    """Read a uniform random sample of a data file for mining.
+
+    Args:
+        path: Local data file.
+        rows: Maximum rows to sample.
+        seed: Sampling seed.
+
+    Returns:
+        Polars DataFrame.
+    """
+    import polars as pl
+
+    from truthound_dashboard.core.sampling import hash_sample, scan_data_file
+
+    lf = scan_data_file(path)
+    total_rows = lf.select(pl.len()).collect().item()
+    return hash_sample(lf, rows, total_rows, seed=seed)
+
+
+def measured_confidence(strength: float, rows: int) -> float:
+    """Turn an observed strength into a confidence score.
+
+    The strength is discounted by one standard error of a proportion
+    measured on ``rows`` rows, so the same strength seen on a small sample
+    earns less confidence.
+    """
+    if rows <= 0:
+        return 0.0
+    return round(max(0.0, min(0.99, strength - 1 / math.sqrt(rows))), 3)
+
+
+class RuleMiner:
+    """Mines cross-column relationships from a Polars DataFrame."""
+
+    def __init__(self, config: RuleMiningConfig | None = None) -> None:
+        self.config = config or RuleMiningConfig()
+
+    def mine(self, df: Any) -> list[CrossColumnRuleSuggestion]:
+        """Mine every supported relationship from a sample.
+
+        Args:
+            df: Polars DataFrame sample.
+
+        Returns:
+            Suggestions ordered by rule type, strongest first.
+        """
+        if df.height < self.config.min_rows or df.width < 2:
+            return []
+
+        discovery = self._discovery_rows(df)
+        numeric = numeric_columns(df.schema)
+        suggestions: list[CrossColumnRuleSuggestion] = []
+        suggestions.extend(self.correlations(discovery, numeric))
+        suggestions.extend(self.dependencies_and_keys(df, discovery))
+        suggestions.extend(self.arithmetic_relations(discovery, numeric))
+        return suggestions
+
+    def _discovery_rows(self, df: Any) -> Any:
+        # Evenly spaced rows keep the subset spread over the whole sample.
+        if df.height <= self.config.discovery_rows:
+            return df
+        step = df.height / self.config.discovery_rows
+        return df[np.floor(np.arange(self.config.discovery_rows) * step).astype(np.int64)]
+
+    # =========================================================================
+    # Correlations
+    # =========================================================================
+
+    def correlations(
+        self, df: Any, columns: list[str]
+    ) -> list[CrossColumnRuleSuggestion]:
+        """Suggest correlation bounds for strongly correlated numeric pairs.
+
+        Missing values are imputed with the column mean, which can only pull
+        a correlation towards zero.
+        """
+        matrix, kept = self._standardized(df, columns)
+        if len(kept) < 2:
+            return []
+
+        corr = (matrix.T @ matrix) / matrix.shape[0]
+        upper_i, upper_j = np.triu_indices(len(kept), k=1)
+        values = corr[upper_i, upper_j]
+        strong = np.flatnonzero(np.abs(values) >= self.config.min_correlation)
+        strong = strong[np.argsort(-np.abs(values[strong]), kind="stable")]
+
+        suggestions = []
+        margin = self.config.correlation_margin
+        for index in strong[: self.config.max_suggestions_per_type]:
+            col_a, col_b = kept[upper_i[index]], kept[upper_j[index]]
+            r = float(np.clip(values[index], -1.0, 1.0))
+            if r > 0:
+                bounds = (round(max(-1.0, r - margin), 2), 1.0)
+            else:
+                bounds = (-1.0, round(min(1.0, r + margin), 2))
+            suggestions.append(
+                CrossColumnRuleSuggestion(
+                    rule_type=CrossColumnRuleType.COLUMN_CORRELATION,
+                    columns=[col_a, col_b],
+                    validator_name="ColumnCorrelation",
+                    params={
+                        "column_a": col_a,
+                        "column_b": col_b,
+                        "min_correlation": bounds[0],
+                        "max_correlation": bounds[1],
+                    },
+                    confidence=measured_confidence(abs(r), matrix.shape[0]),
+                    reason=f"{col_a} and {col_b} are correlated (r={r:.2f}) in sampled data",
+                    severity_suggestion="medium" if abs(r) >= 0.9 else "low",
+                    evidence={
+                        "pattern": "measured_correlation",
+                        "correlation": round(r, 4),
+                        "sample_rows": matrix.shape[0],
+                    },
+                )
+            )
+        return suggestions
+
+    @staticmethod
+    def _standardized(df: Any, columns: list[str]) -> tuple[np.ndarray, list[str]]:
+        import polars as pl
+
+        if not columns:
+            return np.empty((0, 0), dtype=np.float32), []
+        values = df.select(pl.col(columns).cast(pl.Float32)).to_numpy()
+        with np.errstate(invalid="ignore", divide="ignore"):
+            means = np.nanmean(values, axis=0)
+            values = np.where(np.isnan(values), means, values)
+            values -= means
+            std = values.std(axis=0)
+        keep = np.flatnonzero(np.isfinite(std) & (std > 0))
+        matrix = np.ascontiguousarray(values[:, keep] / std[keep], dtype=np.float32)
+        return matrix, [columns[i] for i in keep]
+
+    # =========================================================================
+    # Functional dependencies and composite keys
+    # =========================================================================
+
+    def dependencies_and_keys(
+        self, df: Any, discovery: Any
+    ) -> list[CrossColumnRuleSuggestion]:
+        """Suggest functional dependencies and two-column composite keys.
+
+        A dependency ``A -> B`` is a candidate when the pair ``(A, B)`` has
+        (nearly) as many distinct values on the discovery rows as ``A``
+        alone. A pair is a key candidate when it is unique on the discovery
+        rows, neither column is unique on the sample, and the product of
+        their cardinalities can cover every sampled row; the tightest
+        candidates are then checked on the whole sample.
+        """
+        import polars as pl
+
+        candidates = [
+            name
+            for name, dtype in discovery.schema.items()
+            if not dtype.is_float() and not dtype.is_nested()
+        ][: self.config.max_pair_columns]
+        if len(candidates) < 2:
+            return []
+
+        # Approximate (HyperLogLog) counts are enough to filter candidates;
+        # keys are confirmed exactly below.
+        sample_card = dict(
+            zip(
+                candidates,
+                df.select(pl.col(candidates).approx_n_unique()).row(0),
+                strict=True,
+            )
+        )
+        # Unique and constant columns make trivial keys and dependencies.
+        candidates = [
+            c for c in candidates if 1 < sample_card[c] < _NEAR_UNIQUE * df.height
+        ]
+        pairs = [
+            (a, b) for i, a in enumerate(candidates) for b in candidates[i + 1 :]
+        ]
+        if not pairs:
+            return []
+
+        rows = discovery.height
+        seed = self.config.seed
+        card = dict(
+            zip(candidates, discovery.select(pl.col(candidates).n_unique()).row(0), strict=True)
+        )
+        hashed = discovery.select(
+            pl.col(name).hash(seed + i).alias(name) for i, name in enumerate(candidates)
+        )
+        pair_card = hashed.select(
+            (pl.col(a) ^ pl.col(b)).n_unique().alias(str(i))
+            for i, (a, b) in enumerate(pairs)
+        ).row(0)
+
+        keys = []
+        dependencies = []
+        for (a, b), combined in zip(pairs, pair_card, strict=True):
+            if combined == rows:
+                if sample_card[a] * sample_card[b] >= df.height:
+                    keys.append((a, b))
+                continue
+            # Orient the dependency from the finer to the coarser column; a
+            # determinant that never repeats on the discovery rows says
+            # nothing about what it determines.
+            det, dep = (a, b) if card[a] >= card[b] else (b, a)
+            if card[det] < rows and card[det] >= combined * self.config.min_dependency_strength:
+                dependencies.append((det, dep))
+
+        keys.sort(key=lambda pair: sample_card[pair[0]] * sample_card[pair[1]])
+        return [
+            *self._confirmed_keys(df, keys[: self.config.max_key_checks]),
+            *self._confirmed_dependencies(
+                discovery, dependencies[: self.config.max_suggestions_per_type]
+            ),
+        ]
+
+    def _confirmed_keys(
+        self, df: Any, keys: list[tuple[str, str]]
+    ) -> list[CrossColumnRuleSuggestion]:
+        import polars as pl
+
+        if not keys:
+            return []
+        seed = self.config.seed
+        unique = df.select(
+            (pl.col(a).hash(seed) ^ pl.col(b).hash(seed + 1)).n_unique().alias(str(i))
+            for i, (a, b) in enumerate(keys)
+        ).row(0)
+
+        suggestions = []
+        for (a, b), distinct in zip(keys, unique, strict=True):
+            if distinct != df.height:
+                continue
+            suggestions.append(
+                CrossColumnRuleSuggestion(
+                    rule_type=CrossColumnRuleType.COMPOSITE_KEY,
+                    columns=[a, b],
+                    validator_name="MultiColumnUnique",
+                    params={"columns": [a, b]},
+                    confidence=measured_confidence(1.0, df.height),
+                    reason=f"{a} and {b} together are unique in all {df.height} sampled rows",
+                    severity_suggestion="high",
+                    evidence={"pattern": "measured_composite_key", "sample_rows": df.height},
+                )
+            )
+        return suggestions
+
+    def _confirmed_dependencies(
+        self, df: Any, dependencies: list[tuple[str, str]]
+    ) -> list[CrossColumnRuleSuggestion]:
+        import polars as pl
+
+        suggestions = []
+        for det, dep in dependencies:
+            # Share of rows that agree with the most common dependent value
+            # of their determinant (the g3 measure).
+            agreeing = (
+                df.group_by(det, dep)
+                .len()
+                .group_by(det)
+                .agg(agreeing=pl.col("len").max())
+                .get_column("agreeing")
+                .sum()
+            )
+            strength = agreeing / df.height
+            if strength < self.config.min_dependency_strength:
+                continue
+            suggestions.append(
+                CrossColumnRuleSuggestion(
+                    rule_type=CrossColumnRuleType.COLUMN_DEPENDENCY,
+                    columns=[det, dep],
+                    validator_name="ColumnDependency",
+                    params={"determinant_column": det, "dependent_column": dep},
+                    confidence=measured_confidence(strength, df.height),
+                    reason=f"{det} determines {dep} in {strength:.1%} of sampled rows",
+                    severity_suggestion="high" if strength == 1.0 else "medium",
+                    evidence={
+                        "pattern": "measured_functional_dependency",
+                        "strength": round(strength, 4),
+                        "sample_rows": df.height,
+                    },
+                )
+            )
+        return suggestions
+
+    # =========================================================================
+    # Arithmetic relations
+    # =========================================================================
+
+    def arithmetic_relations(
+        self, df: Any, columns: list[str]
+    ) -> list[CrossColumnRuleSuggestion]:
+        """Suggest ``a + b = c`` and ``a * b = c`` relations.
+
+        Every pair sum and product is computed on a few fingerprint rows and
+        matched, within ``arithmetic_tolerance``, against every column's
+        fingerprint; only the matches get a residual check over all rows.
+        """
+        import polars as pl
+
+        columns = columns[: self.config.max_arithmetic_columns]
+        if len(columns) < 3:
+            return []
+        values = df.select(pl.col(columns).cast(pl.Float64)).to_numpy()
+        complete = np.flatnonzero(~np.isnan(values).any(axis=1))[:_FINGERPRINT_ROWS]
+        if len(complete) < 3:
+            return []
+        # Constant columns would turn every column into a trivial match.
+        varying = np.flatnonzero(np.ptp(values[complete], axis=0) > 0)
+        values = values[:, varying]
+        fingerprint = values[complete]
+        names = [columns[i] for i in varying]
+
+        left, right = np.triu_indices(len(names), k=1)
+        candidates: list[tuple[CrossColumnRuleType, int, int, int]] = []
+        for rule_type, combined in (
+            (CrossColumnRuleType.COLUMN_SUM, fingerprint[:, left] + fingerprint[:, right]),
+            (CrossColumnRuleType.COLUMN_PRODUCT, fingerprint[:, left] * fingerprint[:, right]),
+        ):
+            pairs, targets = _fingerprint_matches(
+                combined, fingerprint, self.config.arithmetic_tolerance
+            )
+            for pair, target in zip(pairs, targets, strict=True):
+                if target not in (left[pair], right[pair]):
+                    candidates.append((rule_type, left[pair], right[pair], target))
+
+        return self._confirmed_arithmetic(values, names, candidates)
+
+    def _confirmed_arithmetic(
+        self,
+        values: np.ndarray,
+        names: list[str],
+        candidates: list[tuple[CrossColumnRuleType, int, int, int]],
+    ) -> list[CrossColumnRuleSuggestion]:
+        candidates = candidates[: self.config.max_suggestions_per_type * 2]
+        if not candidates:
+            return []
+        a, b, target = (values[:, [c[slot] for c in candidates]] for slot in (1, 2, 3))
+        is_sum = np.array([c[0] == CrossColumnRuleType.COLUMN_SUM for c in candidates])
+        expected = np.where(is_sum, a + b, a * b)
+        # Relative residual, vectorized over every row and candidate.
+        tolerance = self.config.arithmetic_tolerance * np.maximum(1.0, np.abs(target))
+        valid = ~(np.isnan(a) | np.isnan(b) | np.isnan(target))
+        holds = (np.abs(target - expected) <= tolerance) & valid
+        checked = valid.sum(axis=0)
+        strength = np.divide(
+            holds.sum(axis=0), checked, out=np.zeros(len(candidates)), where=checked > 0
+        )
+
+        suggestions = []
+        for (rule_type, i, j, t), ratio, rows in zip(
+            candidates, strength, checked, strict=True
+        ):
+            if ratio < self.config.min_arithmetic_strength:
+                continue
+            inputs, result = [names[i], names[j]], names[t]
+            symbol, validator = (
+                ("+", "ColumnSum")
+                if rule_type == CrossColumnRuleType.COLUMN_SUM
+                else ("×", "ColumnProduct")
+            )
+            suggestions.append(
+                CrossColumnRuleSuggestion(
+                    rule_type=rule_type,
+                    columns=[*inputs, result],
+                    validator_name=validator,
+                    params={
+                        "columns": inputs,
+                        "target_column": result,
+                        "tolerance": self.config.arithmetic_tolerance,
+                    },
+                    confidence=measured_confidence(float(ratio), int(rows)),
+                    reason=(
+                        f"{inputs[0]} {symbol} {inputs[1]} = {result} "
+                        f"in {ratio:.1%} of sampled rows"
+                    ),
+                    severity_suggestion="high",
+                    evidence={
+                        "pattern": "measured_arithmetic",
+                        "strength": round(float(ratio), 4),
+                        "sample_rows": int(rows),
+                    },
+                )
+            )
+        return suggestions[: self.config.max_suggestions_per_type]
+
+
+def _fingerprint_matches(
+    combined: np.ndarray, targets: np.ndarray, tolerance: float
+) -> tuple[np.ndarray, np.ndarray]:
+    """Match combined columns to target columns within a relative tolerance.
+
+    Targets whose first fingerprint value lies near each combined value are
+    found with a sorted search; those candidates are then checked on every
+    fingerprint row with the same residual test used for confirmation.
+
+    Returns:
+        Parallel arrays of combined-column and target-column indices.
+    """
+    order = np.argsort(targets[0], kind="stable")
+    first = targets[0, order]
+    # Twice the tolerance on the combined value bounds every target that
+    # can pass the target-relative check below.
+    slack = 2 * tolerance * np.maximum(1.0, np.abs(combined[0]))
+    lo = np.searchsorted(first, combined[0] - slack, side="left")
+    hi = np.searchsorted(first, combined[0] + slack, side="right")
+    counts = hi - lo
+    starts = np.cumsum(counts) - counts
+    pair = np.repeat(np.arange(combined.shape[1]), counts)
+    target = order[np.repeat(lo, counts) + np.arange(counts.sum()) - np.repeat(starts, counts)]
+
+    expected, actual = combined[:, pair], targets[:, target]
+    holds = np.abs(actual - expected) <= tolerance * np.maximum(1.0, np.abs(actual))
+    matched = holds.all(axis=0)
+    return pair[matched], target[matched]
+
+
+def mine_cross_column_rules(
+    df: Any, config: RuleMiningConfig | None = None
+) -> list[CrossColumnRuleSuggestion]:
+    """Mine cross-column rule suggestions from a Polars DataFrame sample."""
+    return RuleMiner(config).mine(df)
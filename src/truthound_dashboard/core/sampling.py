@@ -13,7 +13,12 @@ Features:
 - Automatic format detection
 - Configurable size thresholds
 - Multiple sampling strategies (random, head, stratified)
-- Memory-efficient streaming for very large files
+- Memory-efficient streaming for very large files: files are scanned lazily,
+  Parquet row counts come from footer metadata, random Parquet samples are
+  drawn row group by row group, and other formats use hash-based selection
+  on a streaming scan
+- Sample files are cached by source fingerprint and sampling parameters, so
+  repeated validations of an unchanged file reuse the same sample
 
 Example:
     sampler = get_sampler()
@@ -31,7 +36,11 @@ from __future__ import annotations
 
 import asyncio
 import hashlib
+import json
 import logging
+import math
+import os
+import threading
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum
@@ -42,6 +51,15 @@ from truthound_dashboard.config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Internal columns used by hash-based sampling.
+_SAMPLE_INDEX_COLUMN = "__sample_idx"
+_SAMPLE_HASH_COLUMN = "__sample_hash"
+_SAMPLE_QUOTA_COLUMN = "__sample_quota"
+_SAMPLE_THRESHOLD_COLUMN = "__sample_threshold"
+
+# Row hashes are uniform over the unsigned 64-bit range.
+_HASH_SPACE = 2**64
+
 
 class SamplingMethod(str, Enum):
     """Available sampling methods."""
@@ -88,6 +106,7 @@ class SamplingResult:
         sampled_rows: Number of rows in sampled file.
         method: Sampling method used.
         size_reduction_pct: Percentage reduction in file size.
+        cached: Whether the sample was reused from the sample cache.
     """
 
     original_path: str
@@ -97,6 +116,7 @@ class SamplingResult:
     sampled_rows: int | None = None
     method: SamplingMethod | None = None
     size_reduction_pct: float = 0.0
+    cached: bool = False
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
@@ -108,13 +128,177 @@ class SamplingResult:
             "sampled_rows": self.sampled_rows,
             "method": self.method.value if self.method else None,
             "size_reduction_pct": round(self.size_reduction_pct, 2),
+            "cached": self.cached,
         }
 
 
+# File suffixes understood by the samplers, mapped to their format name.
+FILE_FORMATS = {
+    ".csv": "csv",
+    ".parquet": "parquet",
+    ".pq": "parquet",
+    ".json": "json",
+    ".jsonl": "jsonl",
+    ".ndjson": "jsonl",
+}
+
+
+def detect_file_format(path: str | Path) -> str:
+    """Return the data format of a file from its suffix ("unknown" if unsupported)."""
+    return FILE_FORMATS.get(Path(path).suffix.lower(), "unknown")
+
+
+def scan_data_file(path: str | Path, file_format: str | None = None) -> Any:
+    """Open a data file as a polars LazyFrame without loading it.
+
+    Args:
+        path: Path to data file.
+        file_format: Format name; detected from the suffix when omitted.
+
+    Returns:
+        Polars LazyFrame.
+    """
+    import polars as pl
+
+    path = Path(path)
+    file_format = file_format or detect_file_format(path)
+
+    if file_format == "csv":
+        return pl.scan_csv(path, infer_schema_length=10000)
+    elif file_format == "parquet":
+        return pl.scan_parquet(path)
+    elif file_format == "json":
+        # JSON arrays cannot be scanned incrementally
+        return pl.read_json(path).lazy()
+    elif file_format == "jsonl":
+        return pl.scan_ndjson(path)
+    else:
+        # Try CSV as fallback
+        logger.warning(f"Unknown format {path.suffix.lower()}, trying CSV")
+        return pl.scan_csv(path, infer_schema_length=10000)
+
+
+def _staging_path(path: Path) -> Path:
+    """Per-writer temporary path, renamed into place once complete."""
+    return path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+
+
+def _candidate_fraction(quota: int, rows: int, oversample: float = 1.1) -> float:
+    """Fraction of rows to keep as candidates so ``quota`` rows survive.
+
+    Oversamples by 10% plus three standard deviations so a single streaming
+    pass almost always yields enough candidates.
+    """
+    if rows <= 0:
+        return 1.0
+    return min(1.0, (quota * oversample + 3 * math.sqrt(quota) + 10) / rows)
+
+
+def _hash_threshold(fraction: float) -> int:
+    """Convert a keep fraction into an inclusive 64-bit hash threshold."""
+    return min(_HASH_SPACE - 1, int(fraction * _HASH_SPACE))
+
+
+def _with_row_hash(lf: Any, seed: int) -> Any:
+    """Attach a row index and a seeded hash of it to a LazyFrame."""
+    import polars as pl
+
+    return lf.with_row_index(_SAMPLE_INDEX_COLUMN).with_columns(
+        pl.col(_SAMPLE_INDEX_COLUMN).hash(seed).alias(_SAMPLE_HASH_COLUMN)
+    )
+
+
+def hash_sample(lf: Any, n: int, total_rows: int, seed: int = 42) -> Any:
+    """Draw a uniform random sample of ``n`` rows in one streaming pass.
+
+    Every row gets a seeded hash of its position. Rows whose hash falls
+    below a threshold are kept as candidates, and the ``n`` candidates with
+    the smallest hashes form the sample. Only the candidates are ever held in
+    memory, and the same seed always selects the same rows.
+
+    Args:
+        lf: Polars LazyFrame to sample.
+        n: Number of rows to sample.
+        total_rows: Total rows in the LazyFrame.
+        seed: Hash seed.
+
+    Returns:
+        Polars DataFrame with at most ``n`` rows, in source order.
+    """
+    import polars as pl
+
+    if total_rows <= n:
+        return lf.collect(engine="streaming")
+
+    fraction = _candidate_fraction(n, total_rows)
+    hashed = _with_row_hash(lf, seed)
+    while True:
+        threshold = pl.lit(_hash_threshold(fraction), dtype=pl.UInt64)
+        candidates = hashed.filter(pl.col(_SAMPLE_HASH_COLUMN) <= threshold).collect(
+            engine="streaming"
+        )
+        if candidates.height >= n or fraction >= 1.0:
+            break
+        fraction = min(1.0, fraction * 2)
+
+    return (
+        candidates.sort(_SAMPLE_HASH_COLUMN)
+        .head(n)
+        .sort(_SAMPLE_INDEX_COLUMN)
+        .drop(_SAMPLE_INDEX_COLUMN, _SAMPLE_HASH_COLUMN)
+    )
+
+
+def row_group_sample(
+    lf: Any,
+    n: int,
+    total_rows: int,
+    source_path: str,
+    seed: int = 42,
+) -> Any:
+    """Draw a random sample from a Parquet file one row group at a time.
+
+    The target is allocated across row groups proportionally to their size,
+    row groups without a quota are never read, and each selected row group is
+    reservoir-sampled independently, so memory is bounded by one row group.
+
+    Args:
+        lf: Polars LazyFrame scanning ``source_path``.
+        n: Number of rows to sample.
+        total_rows: Total rows in the file.
+        source_path: Parquet file path.
+        seed: Random seed.
+
+    Returns:
+        Polars DataFrame with ``min(n, total_rows)`` rows.
+    """
+    import polars as pl
+
+    from truthound_dashboard.core.enterprise_sampling import (
+        STREAM_BATCH_ROWS,
+        allocate_quotas,
+        plan_blocks,
+        sample_block,
+    )
+
+    blocks = plan_blocks(total_rows, STREAM_BATCH_ROWS, source_path)
+    quotas = allocate_quotas(blocks, n)
+    samples = [
+        sample_block(lf, block, quota, seed + block.index, source_path)
+        for block, quota in zip(blocks, quotas, strict=True)
+        if quota > 0
+    ]
+    if not samples:
+        return lf.head(0).collect()
+    return pl.concat(samples, how="vertical_relaxed")
+
+
 class SamplingStrategy(ABC):
     """Abstract base class for sampling strategies.
 
-    Subclass this to implement custom sampling methods.
+    Subclass this to implement custom sampling methods. ``sample`` operates
+    on an in-memory DataFrame; strategies that can work on a lazy scan
+    should also override ``sample_lazy`` to avoid loading the whole file.
     """
 
     @property
@@ -144,6 +328,36 @@ class SamplingStrategy(ABC):
         """
         ...
 
+    def sample_lazy(
+        self,
+        lf: Any,
+        n: int,
+        seed: int = 42,
+        *,
+        total_rows: int,
+        file_format: str | None = None,
+        source_path: str | None = None,
+        **kwargs: Any,
+    ) -> Any:
+        """Sample data from a lazy scan.
+
+        The default implementation collects the scan and delegates to
+        ``sample``, so custom strategies keep working unchanged.
+
+        Args:
+            lf: Polars LazyFrame to sample from.
+            n: Number of rows to sample.
+            seed: Random seed for reproducibility.
+            total_rows: Total rows in the scan.
+            file_format: Detected format of the source file.
+            source_path: Path of the source file.
+            **kwargs: Additional strategy-specific arguments.
+
+        Returns:
+            Sampled DataFrame.
+        """
+        return self.sample(lf.collect(engine="streaming"), n=n, seed=seed, **kwargs)
+
 
 class RandomSamplingStrategy(SamplingStrategy):
     """Random sampling strategy using reservoir sampling for efficiency."""
@@ -166,6 +380,22 @@ class RandomSamplingStrategy(SamplingStrategy):
 
         return df.sample(n=n, seed=seed)
 
+    def sample_lazy(
+        self,
+        lf: Any,
+        n: int,
+        seed: int = 42,
+        *,
+        total_rows: int,
+        file_format: str | None = None,
+        source_path: str | None = None,
+        **kwargs: Any,
+    ) -> Any:
+        """Sample Parquet by row group and other formats by row hash."""
+        if file_format == "parquet" and source_path:
+            return row_group_sample(lf, n, total_rows, source_path, seed=seed)
+        return hash_sample(lf, n, total_rows, seed=seed)
+
 
 class HeadSamplingStrategy(SamplingStrategy):
     """Head sampling strategy - take first N rows."""
@@ -184,6 +414,20 @@ class HeadSamplingStrategy(SamplingStrategy):
         """Take first N rows."""
         return df.head(n)
 
+    def sample_lazy(
+        self,
+        lf: Any,
+        n: int,
+        seed: int = 42,
+        *,
+        total_rows: int,
+        file_format: str | None = None,
+        source_path: str | None = None,
+        **kwargs: Any,
+    ) -> Any:
+        """Take first N rows; the slice is pushed down into the scan."""
+        return lf.head(n).collect()
+
 
 class TailSamplingStrategy(SamplingStrategy):
     """Tail sampling strategy - take last N rows."""
@@ -202,6 +446,20 @@ class TailSamplingStrategy(SamplingStrategy):
         """Take last N rows."""
         return df.tail(n)
 
+    def sample_lazy(
+        self,
+        lf: Any,
+        n: int,
+        seed: int = 42,
+        *,
+        total_rows: int,
+        file_format: str | None = None,
+        source_path: str | None = None,
+        **kwargs: Any,
+    ) -> Any:
+        """Take last N rows using the known row count as a slice offset."""
+        return lf.slice(max(total_rows - n, 0), n).collect(engine="streaming")
+
 
 class StratifiedSamplingStrategy(SamplingStrategy):
     """Stratified sampling strategy by a categorical column."""
@@ -256,6 +514,84 @@ class StratifiedSamplingStrategy(SamplingStrategy):
 
         return sampled
 
+    def sample_lazy(
+        self,
+        lf: Any,
+        n: int,
+        seed: int = 42,
+        *,
+        total_rows: int,
+        file_format: str | None = None,
+        source_path: str | None = None,
+        stratify_column: str | None = None,
+        **kwargs: Any,
+    ) -> Any:
+        """Perform stratified sampling in two streaming passes.
+
+        The first pass counts rows per stratum and allocates the target
+        proportionally. The second keeps hash-selected candidates per
+        stratum and trims each stratum to its quota.
+        """
+        import polars as pl
+
+        from truthound_dashboard.core.enterprise_sampling import (
+            SamplingBlock,
+            allocate_quotas,
+        )
+
+        if total_rows <= n:
+            return lf.collect(engine="streaming")
+
+        if stratify_column is None or stratify_column not in lf.collect_schema():
+            return hash_sample(lf, n, total_rows, seed=seed)
+
+        counts = (
+            lf.group_by(stratify_column)
+            .agg(pl.len().alias("rows"))
+            .collect(engine="streaming")
+        )
+        sizes = counts["rows"].to_list()
+        quotas = allocate_quotas(
+            [
+                SamplingBlock(index=i, offset=0, rows=rows)
+                for i, rows in enumerate(sizes)
+            ],
+            n,
+        )
+        allocation = counts.select(stratify_column).with_columns(
+            pl.Series(_SAMPLE_QUOTA_COLUMN, quotas, dtype=pl.UInt32),
+            pl.Series(
+                _SAMPLE_THRESHOLD_COLUMN,
+                [
+                    _hash_threshold(_candidate_fraction(quota, rows))
+                    for quota, rows in zip(quotas, sizes, strict=True)
+                ],
+                dtype=pl.UInt64,
+            ),
+        )
+
+        candidates = (
+            _with_row_hash(lf, seed)
+            .join(allocation.lazy(), on=stratify_column, nulls_equal=True)
+            .filter(pl.col(_SAMPLE_HASH_COLUMN) <= pl.col(_SAMPLE_THRESHOLD_COLUMN))
+            .collect(engine="streaming")
+        )
+
+        return (
+            candidates.sort(_SAMPLE_HASH_COLUMN)
+            .filter(
+                pl.int_range(pl.len()).over(stratify_column)
+                < pl.col(_SAMPLE_QUOTA_COLUMN)
+            )
+            .sort(_SAMPLE_INDEX_COLUMN)
+            .drop(
+                _SAMPLE_INDEX_COLUMN,
+                _SAMPLE_HASH_COLUMN,
+                _SAMPLE_QUOTA_COLUMN,
+                _SAMPLE_THRESHOLD_COLUMN,
+            )
+        )
+
 
 class DataSampler:
     """Main sampler class that coordinates sampling operations.
@@ -325,19 +661,15 @@ class DataSampler:
         size_mb = size_bytes / (1024 * 1024)
 
         # Detect format
-        suffix = path.suffix.lower()
-        format_map = {
-            ".csv": "csv",
-            ".parquet": "parquet",
-            ".pq": "parquet",
-            ".json": "json",
-            ".jsonl": "jsonl",
-            ".ndjson": "jsonl",
-        }
-        file_format = format_map.get(suffix, "unknown")
+        file_format = detect_file_format(path)
+
+        # Parquet row counts are exact and read from the footer only
+        row_count = None
+        if file_format == "parquet":
+            row_count = self._count_rows(self._scan_dataframe(path, file_format))
 
         # Estimate row count for CSV (rough estimate based on average line size)
-        estimated_rows = None
+        estimated_rows = row_count
         if file_format == "csv" and size_mb > 0:
             # Sample first 10KB to estimate average line length
             with open(path, encoding="utf-8", errors="ignore") as f:
@@ -353,6 +685,7 @@ class DataSampler:
             "size_mb": round(size_mb, 2),
             "format": file_format,
             "estimated_rows": estimated_rows,
+            "row_count": row_count,
         }
 
     def needs_sampling(self, path: str | Path) -> bool:
@@ -367,32 +700,23 @@ class DataSampler:
         info = self.get_file_info(path)
         return info["size_mb"] > self._config.size_threshold_mb
 
-    def _load_dataframe(self, path: str | Path) -> Any:
-        """Load data file into polars DataFrame.
+    def _scan_dataframe(self, path: str | Path, file_format: str) -> Any:
+        """Open a data file as a polars LazyFrame without loading it.
 
         Args:
             path: Path to data file.
+            file_format: Format detected by ``get_file_info``.
 
         Returns:
-            Polars DataFrame.
+            Polars LazyFrame.
         """
+        return scan_data_file(path, file_format)
+
+    def _count_rows(self, lf: Any) -> int:
+        """Count rows of a scan; Parquet answers from metadata."""
         import polars as pl
 
-        path = Path(path)
-        suffix = path.suffix.lower()
-
-        if suffix == ".csv":
-            return pl.read_csv(path, infer_schema_length=10000)
-        elif suffix in (".parquet", ".pq"):
-            return pl.read_parquet(path)
-        elif suffix == ".json":
-            return pl.read_json(path)
-        elif suffix in (".jsonl", ".ndjson"):
-            return pl.read_ndjson(path)
-        else:
-            # Try CSV as fallback
-            logger.warning(f"Unknown format {suffix}, trying CSV")
-            return pl.read_csv(path, infer_schema_length=10000)
+        return int(lf.select(pl.len()).collect().item())
 
     def _save_dataframe(self, df: Any, path: Path, original_format: str) -> None:
         """Save DataFrame to file in specified format.
@@ -412,17 +736,27 @@ class DataSampler:
             # Default to CSV
             df.write_csv(path)
 
-    def _generate_sample_path(self, original_path: Path) -> Path:
+    def _generate_sample_path(
+        self,
+        original_path: Path,
+        cache_key: str | None = None,
+    ) -> Path:
         """Generate a unique path for the sampled file.
 
         Args:
             original_path: Path to original file.
+            cache_key: Sample cache key. When given, the path is derived from
+                it so identical sampling requests share one file.
 
         Returns:
             Path for sampled file in temp directory.
         """
         # Create hash of original path for uniqueness
-        path_hash = hashlib.md5(str(original_path).encode()).hexdigest()[:12]
+        path_hash = (
+            cache_key[:32]
+            if cache_key
+            else hashlib.md5(str(original_path).encode()).hexdigest()[:12]
+        )
         suffix = original_path.suffix
 
         # Use parquet for efficiency if original was CSV/JSON
@@ -471,6 +805,70 @@ class DataSampler:
 
         return result
 
+    def _sample_cache_key(
+        self,
+        path: Path,
+        n: int,
+        strategy: SamplingStrategy,
+        kwargs: dict[str, Any],
+    ) -> str | None:
+        """Build a sample cache key from the file fingerprint and parameters.
+
+        Returns:
+            Cache key, or None if the file cannot be fingerprinted.
+        """
+        from truthound_dashboard.core.result_cache import (
+            build_cache_key,
+            fingerprint_file,
+        )
+
+        fingerprint = fingerprint_file(path)
+        if fingerprint is None:
+            return None
+        return build_cache_key(
+            "sample",
+            fingerprint,
+            n=n,
+            method=strategy.method.value,
+            seed=self._config.seed,
+            options=kwargs,
+        )
+
+    def _load_cached_sample(self, path: Path, cache_key: str) -> SamplingResult | None:
+        """Return a previously written sample for a cache key, if still present."""
+        manifest_path = self._config.temp_dir / f"sample_{cache_key[:32]}.json"
+        try:
+            manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+        sampled_path = Path(manifest["sampled_path"])
+        if manifest["was_sampled"] and not sampled_path.exists():
+            return None
+
+        # Touch cached files so cleanup keeps samples that are still in use
+        for cached_file in {manifest_path, sampled_path}:
+            if cached_file.parent == self._config.temp_dir:
+                os.utime(cached_file)
+
+        return SamplingResult(
+            original_path=str(path),
+            sampled_path=str(sampled_path),
+            was_sampled=manifest["was_sampled"],
+            original_rows=manifest["original_rows"],
+            sampled_rows=manifest["sampled_rows"],
+            method=SamplingMethod(manifest["method"]) if manifest["method"] else None,
+            size_reduction_pct=manifest["size_reduction_pct"],
+            cached=True,
+        )
+
+    def _store_cached_sample(self, cache_key: str, result: SamplingResult) -> None:
+        """Record a sampling result so later requests can reuse it."""
+        manifest_path = self._config.temp_dir / f"sample_{cache_key[:32]}.json"
+        tmp_path = _staging_path(manifest_path)
+        tmp_path.write_text(json.dumps(result.to_dict()), encoding="utf-8")
+        os.replace(tmp_path, manifest_path)
+
     def _sample_sync(
         self,
         path: Path,
@@ -480,6 +878,10 @@ class DataSampler:
     ) -> SamplingResult:
         """Synchronous sampling implementation.
 
+        The file is scanned lazily and only the sampled rows are
+        materialized. Results are cached by file fingerprint and sampling
+        parameters.
+
         Args:
             path: Path to data file.
             n: Number of rows to sample.
@@ -489,39 +891,62 @@ class DataSampler:
         Returns:
             SamplingResult with sampling details.
         """
+        from truthound_dashboard.core.result_cache import get_result_cache_metrics
+
+        metrics = get_result_cache_metrics()
         file_info = self.get_file_info(path)
 
-        # Load data
-        logger.info(f"Loading {path} for sampling ({file_info['size_mb']:.1f} MB)")
-        df = self._load_dataframe(path)
-        original_rows = len(df)
+        cache_key = self._sample_cache_key(path, n, strategy, kwargs)
+        if cache_key is None:
+            metrics.record_bypass("sample")
+        else:
+            cached = self._load_cached_sample(path, cache_key)
+            if cached is not None:
+                metrics.record_hit("sample")
+                logger.info(f"Reusing cached sample for {path}")
+                return cached
+            metrics.record_miss("sample")
+
+        lf = self._scan_dataframe(path, file_info["format"])
+        original_rows = file_info["row_count"]
+        if original_rows is None:
+            original_rows = self._count_rows(lf)
 
         # Check if sampling is actually needed
         if original_rows <= n:
             logger.info(f"File has {original_rows} rows, no sampling needed")
-            return SamplingResult(
+            result = SamplingResult(
                 original_path=str(path),
                 sampled_path=str(path),
                 was_sampled=False,
                 original_rows=original_rows,
                 sampled_rows=original_rows,
             )
+            if cache_key:
+                self._store_cached_sample(cache_key, result)
+            return result
 
         # Perform sampling
         logger.info(
-            f"Sampling {n} rows from {original_rows} using {strategy.method.value}"
+            f"Sampling {n} rows from {original_rows} using {strategy.method.value} "
+            f"({file_info['size_mb']:.1f} MB)"
         )
-        sampled_df = strategy.sample(
-            df,
+        sampled_df = strategy.sample_lazy(
+            lf,
             n=n,
             seed=self._config.seed,
+            total_rows=original_rows,
+            file_format=file_info["format"],
+            source_path=str(path),
             **kwargs,
         )
         sampled_rows = len(sampled_df)
 
-        # Save sampled data
-        sample_path = self._generate_sample_path(path)
-        self._save_dataframe(sampled_df, sample_path, file_info["format"])
+        # Save sampled data; write then rename so readers never see partial files
+        sample_path = self._generate_sample_path(path, cache_key)
+        tmp_path = _staging_path(sample_path)
+        self._save_dataframe(sampled_df, tmp_path, sample_path.suffix.lstrip("."))
+        os.replace(tmp_path, sample_path)
 
         # Calculate size reduction
         sampled_size = sample_path.stat().st_size
@@ -532,7 +957,7 @@ class DataSampler:
             f"({size_reduction:.1f}% size reduction)"
         )
 
-        return SamplingResult(
+        result = SamplingResult(
             original_path=str(path),
             sampled_path=str(sample_path),
             was_sampled=True,
@@ -541,6 +966,9 @@ class DataSampler:
             method=strategy.method,
             size_reduction_pct=size_reduction,
         )
+        if cache_key:
+            self._store_cached_sample(cache_key, result)
+        return result
 
     async def auto_sample(
         self,
@@ -11,15 +11,23 @@ The scheduler:
 5. Runs periodic database maintenance (cleanup, vacuum)
 6. Provides per-schedule check intervals and priority-based evaluation
 7. Supports webhook triggers from external data pipelines
+8. Queues triggered runs with global and per-source concurrency limits
+9. Probes data change sources cheaply and only profiles when they changed
 """
 
 from __future__ import annotations
 
 import asyncio
 import hashlib
+import heapq
 import hmac
+import itertools
 import logging
+import time
 import uuid
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Any
 
@@ -27,12 +35,14 @@ from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.interval import IntervalTrigger
 
+from truthound_dashboard.config import get_settings
 from truthound_dashboard.db import Schedule, Source, TriggerType, get_session
 
+from .change_probes import ProbeOutcome, probe_source_change
+from .datasource_factory import SourceType
 from .maintenance import get_maintenance_manager
 from .notifications.dispatcher import create_dispatcher
 from .domains.validations import ValidationService
-from .truthound_adapter import get_adapter
 from .triggers import TriggerFactory, TriggerContext, TriggerEvaluation
 from .tiering import process_tiering_policies
 from truthound_dashboard.time import utc_now
@@ -40,6 +50,221 @@ from truthound_dashboard.time import utc_now
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class _PendingRun:
+    """A queued validation run waiting for a free slot."""
+
+    schedule_id: str
+    source_id: str | None
+    priority: int
+    seq: int
+    enqueued_at: float
+    reason: str = ""
+
+
+class ValidationRunQueue:
+    """Bounded, prioritized queue for scheduled validation runs.
+
+    Runs are started in priority order (1=highest, 10=lowest, FIFO within
+    a priority) while at most ``max_concurrent`` run globally and at most
+    ``max_per_source`` run against the same source. Submitting a schedule
+    that is already waiting coalesces into the pending run, keeping the
+    better priority. A schedule that is currently running may have one
+    follow-up run pending, so a change seen mid-run is not lost.
+
+    Example:
+        queue = ValidationRunQueue(scheduler._run_validation, max_concurrent=4)
+        queue.submit(schedule.id, schedule.source_id, priority=2)
+    """
+
+    # Number of recent wait times kept for metrics
+    WAIT_SAMPLE_SIZE = 200
+
+    def __init__(
+        self,
+        runner: Callable[[str], Awaitable[None]],
+        *,
+        max_concurrent: int = 4,
+        max_per_source: int = 1,
+        max_pending: int = 1000,
+    ) -> None:
+        """Initialize the queue.
+
+        Args:
+            runner: Coroutine function executing one run for a schedule ID.
+            max_concurrent: Global limit on concurrently executing runs.
+            max_per_source: Limit on concurrent runs against one source.
+            max_pending: Maximum queued runs; further submissions are rejected.
+        """
+        self._runner = runner
+        self._max_concurrent = max_concurrent
+        self._max_per_source = max_per_source
+        self._max_pending = max_pending
+
+        self._heap: list[tuple[int, int, str]] = []
+        self._pending: dict[str, _PendingRun] = {}
+        self._running: dict[str, asyncio.Task] = {}
+        self._running_sources: dict[str | None, int] = {}
+        self._seq = itertools.count()
+
+        self._submitted = 0
+        self._coalesced = 0
+        self._rejected = 0
+        self._completed = 0
+        self._failed = 0
+        self._wait_times: deque[float] = deque(maxlen=self.WAIT_SAMPLE_SIZE)
+
+    @property
+    def depth(self) -> int:
+        """Number of runs waiting for a slot."""
+        return len(self._pending)
+
+    @property
+    def running_count(self) -> int:
+        """Number of runs currently executing."""
+        return len(self._running)
+
+    def submit(
+        self,
+        schedule_id: str,
+        source_id: str | None,
+        priority: int = 5,
+        reason: str = "",
+    ) -> bool:
+        """Queue a run for a schedule.
+
+        Args:
+            schedule_id: Schedule to run.
+            source_id: Source the schedule validates (for per-source limits).
+            priority: Run priority (lower = sooner).
+            reason: What triggered the run, for logging.
+
+        Returns:
+            True if a new run was queued, False if it was coalesced into an
+            already pending run or rejected because the queue is full.
+        """
+        self._submitted += 1
+        pending = self._pending.get(schedule_id)
+        if pending is not None:
+            self._coalesced += 1
+            if priority < pending.priority:
+                pending.priority = priority
+                pending.seq = next(self._seq)
+                heapq.heappush(self._heap, (priority, pending.seq, schedule_id))
+            logger.debug(f"Coalesced run for schedule {schedule_id} ({reason})")
+            return False
+
+        if len(self._pending) >= self._max_pending:
+            self._rejected += 1
+            logger.warning(
+                f"Validation run queue full ({self._max_pending}); "
+                f"dropping run for schedule {schedule_id} ({reason})"
+            )
+            return False
+
+        seq = next(self._seq)
+        self._pending[schedule_id] = _PendingRun(
+            schedule_id=schedule_id,
+            source_id=source_id,
+            priority=priority,
+            seq=seq,
+            enqueued_at=time.monotonic(),
+            reason=reason,
+        )
+        heapq.heappush(self._heap, (priority, seq, schedule_id))
+        self._dispatch()
+        return True
+
+    def _dispatch(self) -> None:
+        """Start as many pending runs as the limits allow."""
+        deferred: list[tuple[int, int, str]] = []
+        while self._heap and len(self._running) < self._max_concurrent:
+            entry = heapq.heappop(self._heap)
+            _, seq, schedule_id = entry
+            pending = self._pending.get(schedule_id)
+            if pending is None or pending.seq != seq:
+                continue  # stale entry superseded by a priority bump
+            if (
+                schedule_id in self._running
+                or self._running_sources.get(pending.source_id, 0)
+                >= self._max_per_source
+            ):
+                deferred.append(entry)
+                continue
+            del self._pending[schedule_id]
+            self._start(pending)
+        for entry in deferred:
+            heapq.heappush(self._heap, entry)
+
+    def _start(self, pending: _PendingRun) -> None:
+        self._wait_times.append(time.monotonic() - pending.enqueued_at)
+        self._running_sources[pending.source_id] = (
+            self._running_sources.get(pending.source_id, 0) + 1
+        )
+        self._running[pending.schedule_id] = asyncio.create_task(
+            self._execute(pending)
+        )
+
+    async def _execute(self, pending: _PendingRun) -> None:
+        try:
+            await self._runner(pending.schedule_id)
+            self._completed += 1
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self._failed += 1
+            logger.error(f"Queued run failed for schedule {pending.schedule_id}: {e}")
+        finally:
+            self._running.pop(pending.schedule_id, None)
+            remaining = self._running_sources.get(pending.source_id, 1) - 1
+            if remaining:
+                self._running_sources[pending.source_id] = remaining
+            else:
+                self._running_sources.pop(pending.source_id, None)
+            self._dispatch()
+
+    async def join(self) -> None:
+        """Wait until nothing is pending or running."""
+        while self._running:
+            await asyncio.gather(*self._running.values(), return_exceptions=True)
+
+    async def stop(self) -> None:
+        """Drop pending runs and cancel the ones in flight."""
+        self._pending.clear()
+        self._heap.clear()
+        tasks = list(self._running.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def get_metrics(self) -> dict[str, Any]:
+        """Get queue depth, throughput and wait-time metrics.
+
+        Returns:
+            Dictionary with queue statistics.
+        """
+        now = time.monotonic()
+        waits = list(self._wait_times)
+        return {
+            "depth": len(self._pending),
+            "running": len(self._running),
+            "max_concurrent": self._max_concurrent,
+            "max_per_source": self._max_per_source,
+            "max_pending": self._max_pending,
+            "submitted": self._submitted,
+            "coalesced": self._coalesced,
+            "rejected": self._rejected,
+            "completed": self._completed,
+            "failed": self._failed,
+            "oldest_pending_seconds": round(
+                max((now - p.enqueued_at for p in self._pending.values()), default=0.0),
+                3,
+            ),
+            "avg_wait_seconds": round(sum(waits) / len(waits), 3) if waits else 0.0,
+            "max_wait_seconds": round(max(waits, default=0.0), 3),
+        }
+
+
 class ValidationScheduler:
     """Scheduler for automated validation runs with notifications.
 
@@ -62,6 +287,8 @@ class ValidationScheduler:
     - Priority-based trigger evaluation (1=highest, 10=lowest)
     - Cooldown support to prevent rapid re-triggering
     - Trigger monitoring and status tracking
+    - Triggered runs go through a ValidationRunQueue: bounded concurrency
+      (global and per source), priority order and duplicate coalescing
 
     Usage:
         scheduler = ValidationScheduler()
@@ -80,6 +307,12 @@ class ValidationScheduler:
     DEFAULT_SCHEDULE_CHECK_INTERVAL_MINUTES = 5
     # Storage tiering check interval (default: check every hour)
     TIERING_CHECK_INTERVAL_SECONDS = 3600  # 1 hour
+    # Trigger evaluations running at once in one checker cycle
+    MAX_CONCURRENT_EVALUATIONS = 8
+    # Upper bound for a single trigger evaluation (probe + profile)
+    EVALUATION_TIMEOUT_SECONDS = 300
+    # Number of recent checker cycles kept for metrics
+    CHECKER_CYCLE_SAMPLE_SIZE = 50
 
     def __init__(
         self,
@@ -87,6 +320,10 @@ class ValidationScheduler:
         maintenance_enabled: bool = True,
         maintenance_cron: str | None = None,
         data_change_check_interval: int | None = None,
+        max_concurrent_runs: int | None = None,
+        max_runs_per_source: int = 1,
+        max_concurrent_evaluations: int | None = None,
+        evaluation_timeout: float | None = None,
     ) -> None:
         """Initialize the scheduler.
 
@@ -96,6 +333,13 @@ class ValidationScheduler:
                 Defaults to daily at 3:00 AM.
             data_change_check_interval: Interval in seconds for the checker loop.
                 Individual schedules can have their own check intervals.
+            max_concurrent_runs: Validations allowed to run at once.
+                Defaults to the ``max_workers`` setting.
+            max_runs_per_source: Validations allowed to run at once per source.
+            max_concurrent_evaluations: Trigger evaluations the data change
+                checker runs at once.
+            evaluation_timeout: Seconds before a single trigger evaluation
+                is abandoned.
         """
         self._scheduler = AsyncIOScheduler()
         self._jobs: dict[str, str] = {}  # schedule_id -> job_id mapping
@@ -122,6 +366,23 @@ class ValidationScheduler:
         self._trigger_trigger_counts: dict[str, int] = {}  # schedule_id -> trigger_count
         self._last_checker_run: datetime | None = None
         self._checker_running = False
+        self._max_concurrent_evaluations = (
+            max_concurrent_evaluations or self.MAX_CONCURRENT_EVALUATIONS
+        )
+        self._evaluation_timeout = (
+            evaluation_timeout or self.EVALUATION_TIMEOUT_SECONDS
+        )
+        self._checker_cycles: deque[dict[str, Any]] = deque(
+            maxlen=self.CHECKER_CYCLE_SAMPLE_SIZE
+        )
+        self._evaluation_timeouts = 0
+
+        # Triggered validation runs
+        self._run_queue = ValidationRunQueue(
+            self._run_validation,
+            max_concurrent=max_concurrent_runs or get_settings().max_workers,
+            max_per_source=max_runs_per_source,
+        )
 
     async def start(self) -> None:
         """Start the scheduler and load existing schedules."""
@@ -143,6 +404,31 @@ class ValidationScheduler:
         """Stop the scheduler."""
         logger.info("Stopping validation scheduler")
         self._scheduler.shutdown(wait=False)
+        await self._run_queue.stop()
+
+    def enqueue_validation(self, schedule: Schedule, reason: str = "") -> bool:
+        """Queue a validation run for a schedule.
+
+        Args:
+            schedule: Schedule to run.
+            reason: What triggered the run, for logging.
+
+        Returns:
+            True if a new run was queued, False if it was coalesced into a
+            pending run or the queue is full.
+        """
+        return self._run_queue.submit(
+            schedule.id,
+            schedule.source_id,
+            priority=self._get_schedule_priority(schedule),
+            reason=reason,
+        )
+
+    async def _enqueue_scheduled_run(
+        self, schedule_id: str, source_id: str, priority: int
+    ) -> None:
+        """APScheduler job: queue a cron/interval run instead of running inline."""
+        self._run_queue.submit(schedule_id, source_id, priority=priority, reason="timer")
 
     def _schedule_maintenance(self) -> None:
         """Schedule periodic database maintenance."""
@@ -298,9 +584,13 @@ class ValidationScheduler:
                 trigger_desc = cron_expr
 
             job = self._scheduler.add_job(
-                self._run_validation,
+                self._enqueue_scheduled_run,
                 trigger=ap_trigger,
-                args=[schedule.id],
+                args=[
+                    schedule.id,
+                    schedule.source_id,
+                    self._get_schedule_priority(schedule),
+                ],
                 id=f"schedule_{schedule.id}",
                 name=f"Validation: {schedule.name}",
                 replace_existing=True,
@@ -595,11 +885,17 @@ class ValidationScheduler:
         - Per-schedule check intervals (respects check_interval_minutes)
         - Priority-based evaluation (lower priority number = higher priority)
         - Cooldown support (prevents rapid re-triggering)
+        - Due schedules are evaluated concurrently, each in its own session
+          and under a timeout, so one slow source does not delay the rest
         """
         self._checker_running = True
         self._last_checker_run = utc_now()
+        started = time.perf_counter()
         logger.debug("Checking data change triggers")
 
+        due_ids: list[str] = []
+        lag_seconds = 0.0
+        timeouts_before = self._evaluation_timeouts
         try:
             async with get_session() as session:
                 from sqlalchemy import select
@@ -628,6 +924,11 @@ class ValidationScheduler:
                 for schedule in schedules:
                     if self._is_schedule_due_for_check(schedule, now):
                         schedules_to_check.append(schedule)
+                        next_check = self._get_next_check_time(schedule)
+                        if next_check is not None:
+                            lag_seconds = max(
+                                lag_seconds, (now - next_check).total_seconds()
+                            )
 
                 if not schedules_to_check:
                     logger.debug("No schedules due for check")
@@ -642,28 +943,64 @@ class ValidationScheduler:
                     f"Checking {len(schedules_to_check)}/{len(schedules)} "
                     "data change/composite schedules (sorted by priority)"
                 )
+                due_ids = [s.id for s in schedules_to_check]
 
-                for schedule in schedules_to_check:
-                    await self._evaluate_and_run_if_needed(session, schedule)
+            # Each evaluation gets its own session so a slow source neither
+            # blocks the others nor holds one long transaction open.
+            semaphore = asyncio.Semaphore(self._max_concurrent_evaluations)
+
+            async def evaluate(schedule_id: str) -> None:
+                async with semaphore:
+                    await self._evaluate_schedule_isolated(schedule_id)
+
+            await asyncio.gather(*(evaluate(sid) for sid in due_ids))
         finally:
             self._checker_running = False
+            if due_ids:
+                self._checker_cycles.append(
+                    {
+                        "started_at": self._last_checker_run,
+                        "duration_seconds": time.perf_counter() - started,
+                        "evaluated": len(due_ids),
+                        "lag_seconds": lag_seconds,
+                        "timeouts": self._evaluation_timeouts - timeouts_before,
+                    }
+                )
 
-    def _is_schedule_due_for_check(self, schedule: Schedule, now: datetime) -> bool:
-        """Check if a schedule is due for evaluation.
+    async def _evaluate_schedule_isolated(self, schedule_id: str) -> None:
+        """Evaluate one schedule in its own session under the evaluation timeout.
+
+        Args:
+            schedule_id: Schedule to evaluate.
+        """
+        try:
+            async with asyncio.timeout(self._evaluation_timeout):
+                async with get_session() as session:
+                    schedule = await session.get(Schedule, schedule_id)
+                    if schedule is None or not schedule.is_active:
+                        return
+                    await self._evaluate_and_run_if_needed(session, schedule)
+        except TimeoutError:
+            self._evaluation_timeouts += 1
+            logger.warning(
+                f"Trigger evaluation for schedule {schedule_id} timed out "
+                f"after {self._evaluation_timeout}s"
+            )
+        except Exception as e:
+            logger.error(f"Error evaluating schedule {schedule_id}: {e}")
+
+    def _get_next_check_time(self, schedule: Schedule) -> datetime | None:
+        """Get when a schedule is next due for evaluation.
 
         Args:
             schedule: Schedule to check.
-            now: Current timestamp.
 
         Returns:
-            True if schedule should be checked.
+            Next check time, or None if the schedule was never checked.
         """
-        schedule_id = schedule.id
-        last_check = self._trigger_check_times.get(schedule_id)
-
-        # First check - always due
+        last_check = self._trigger_check_times.get(schedule.id)
         if last_check is None:
-            return True
+            return None
 
         # Get per-schedule check interval
         config = schedule.trigger_config or {}
@@ -671,9 +1008,23 @@ class ValidationScheduler:
             "check_interval_minutes",
             self.DEFAULT_SCHEDULE_CHECK_INTERVAL_MINUTES
         )
+        return last_check + timedelta(minutes=check_interval_minutes)
+
+    def _is_schedule_due_for_check(self, schedule: Schedule, now: datetime) -> bool:
+        """Check if a schedule is due for evaluation.
+
+        Args:
+            schedule: Schedule to check.
+            now: Current timestamp.
+
+        Returns:
+            True if schedule should be checked.
+        """
+        next_check = self._get_next_check_time(schedule)
 
-        # Calculate if due
-        next_check = last_check + timedelta(minutes=check_interval_minutes)
+        # First check - always due
+        if next_check is None:
+            return True
         return now >= next_check
 
     def _get_schedule_priority(self, schedule: Schedule) -> int:
@@ -769,13 +1120,36 @@ class ValidationScheduler:
             # Get profile data for data change triggers
             profile_data = None
             baseline_profile = None
+            probe_state = None
 
             if schedule.trigger_type == TriggerType.DATA_CHANGE.value:
                 # Check if auto_profile is enabled
                 config = schedule.trigger_config or {}
                 if config.get("auto_profile", True):
+                    probe = None
+                    if config.get("change_probe", True):
+                        probe = await self._probe_source_change(session, schedule)
+                    if probe is not None and probe.changed is False:
+                        schedule.update_trigger_result(
+                            TriggerEvaluation(
+                                should_trigger=False,
+                                reason=f"No change detected by {probe.tier} probe",
+                                details={"probe": probe.to_dict()},
+                            ).to_dict()
+                        )
+                        await session.commit()
+                        return
+
                     # Run a fresh profile before comparison
-                    await self._run_profile_if_needed(session, schedule.source_id)
+                    profiled = await self._run_profile_if_needed(
+                        session, schedule.source_id
+                    )
+                    if probe is not None:
+                        probe_state = probe.to_dict()
+                        if not profiled:
+                            # Keep the old state so the next check sees the
+                            # change again instead of skipping it.
+                            probe_state["state"] = self._stored_probe_state(schedule)
 
                 profile_data, baseline_profile = await self._get_profile_data(
                     session, schedule.source_id
@@ -787,6 +1161,8 @@ class ValidationScheduler:
                 profile_data=profile_data,
                 baseline_profile=baseline_profile,
             )
+            if probe_state is not None:
+                evaluation.details["probe"] = probe_state
 
             # Update schedule with evaluation result
             schedule.update_trigger_result(evaluation.to_dict())
@@ -800,8 +1176,8 @@ class ValidationScheduler:
                 self._trigger_trigger_counts[schedule_id] = (
                     self._trigger_trigger_counts.get(schedule_id, 0) + 1
                 )
-                # Run validation in background
-                asyncio.create_task(self._run_validation(schedule.id))
+                # Queue the validation run
+                self.enqueue_validation(schedule, reason="data_change")
             else:
                 logger.debug(
                     f"Trigger not fired for schedule {schedule.name}: {evaluation.reason}"
@@ -812,16 +1188,68 @@ class ValidationScheduler:
         except Exception as e:
             logger.error(f"Error evaluating schedule {schedule.id}: {e}")
 
+    @staticmethod
+    def _stored_probe_state(schedule: Schedule) -> dict[str, Any] | None:
+        """Get the probe state persisted with the last trigger result."""
+        details = (schedule.last_trigger_result or {}).get("details") or {}
+        probe = details.get("probe") or {}
+        return probe.get("state") or None
+
+    async def _probe_source_change(
+        self, session: Any, schedule: Schedule
+    ) -> ProbeOutcome | None:
+        """Run the cheap change probes for a data change schedule.
+
+        Args:
+            session: Database session.
+            schedule: DATA_CHANGE schedule to probe.
+
+        Returns:
+            ProbeOutcome, or None if the source cannot be probed.
+        """
+        from truthound_dashboard.core.domains.source_io import (
+            _resolve_source_config,
+            checkout_data_input,
+        )
+
+        try:
+            source = await session.get(Source, schedule.source_id)
+            if source is None or SourceType.is_async_type(source.type):
+                return None
+            config = await _resolve_source_config(source, session)
+            async with checkout_data_input(source, session) as data_input:
+                outcome = await probe_source_change(
+                    source.type,
+                    config,
+                    data_input,
+                    trigger_config=schedule.trigger_config,
+                    previous=self._stored_probe_state(schedule),
+                )
+        except Exception as e:
+            logger.warning(f"Change probe failed for source {schedule.source_id}: {e}")
+            return None
+
+        logger.debug(
+            f"Change probe for source {schedule.source_id}: "
+            f"changed={outcome.changed} tier={outcome.tier} "
+            f"({outcome.elapsed_ms:.1f}ms)"
+        )
+        return outcome
+
     async def _run_profile_if_needed(
         self, session: Any, source_id: str
-    ) -> None:
+    ) -> bool:
         """Run a profile for a source if needed for data change detection.
 
         Args:
             session: Database session.
             source_id: Source ID to profile.
+
+        Returns:
+            True if a recent or freshly saved profile is available.
         """
         from sqlalchemy import select
+        from truthound_dashboard.core.domains.profiles import ProfileService
         from truthound_dashboard.db import Profile
 
         try:
@@ -839,21 +1267,15 @@ class ValidationScheduler:
                 profile_age = utc_now() - latest_profile.created_at
                 if profile_age.total_seconds() < 60:
                     logger.debug(f"Recent profile exists for source {source_id}")
-                    return
-
-            # Run profile using adapter
-            adapter = get_adapter()
-            result = await session.execute(
-                select(Source).where(Source.id == source_id)
-            )
-            source = result.scalar_one_or_none()
+                    return True
 
-            if source and source.connection_string:
-                logger.debug(f"Running auto-profile for source {source_id}")
-                await adapter.profile(source.connection_string)
+            logger.debug(f"Running auto-profile for source {source_id}")
+            await ProfileService(session).profile_source(source_id)
+            return True
 
         except Exception as e:
             logger.warning(f"Auto-profile failed for source {source_id}: {e}")
+            return False
 
     async def _get_profile_data(
         self, session: Any, source_id: str
@@ -938,7 +1360,7 @@ class ValidationScheduler:
                     logger.info(
                         f"Event '{event_type}' triggered schedule {schedule.name}"
                     )
-                    asyncio.create_task(self._run_validation(schedule.id))
+                    self.enqueue_validation(schedule, reason=f"event:{event_type}")
                     triggered_schedules.append(schedule.id)
 
         return triggered_schedules
@@ -1036,7 +1458,7 @@ class ValidationScheduler:
                     self._trigger_trigger_counts[schedule.id] = (
                         self._trigger_trigger_counts.get(schedule.id, 0) + 1
                     )
-                    asyncio.create_task(self._run_validation(schedule.id))
+                    self.enqueue_validation(schedule, reason=f"webhook:{source}")
                     triggered_schedules.append(schedule.id)
 
         return {
@@ -1111,6 +1533,41 @@ class ValidationScheduler:
             "total_schedules_tracked": len(self._trigger_check_times),
             "checks_last_hour": checks_last_hour,
             "triggers_last_hour": triggers_last_hour,
+            "checker": self._get_checker_metrics(),
+            "run_queue": self._run_queue.get_metrics(),
+        }
+
+    def _get_checker_metrics(self) -> dict[str, Any]:
+        """Summarize recent data change checker cycles.
+
+        ``lag_seconds`` is how far past its check interval the most overdue
+        schedule was when a cycle started; a growing lag or cycles longer
+        than the checker interval mean the checker is falling behind.
+        """
+        cycles = list(self._checker_cycles)
+        last = cycles[-1] if cycles else None
+        durations = [c["duration_seconds"] for c in cycles]
+        return {
+            "max_concurrent_evaluations": self._max_concurrent_evaluations,
+            "evaluation_timeout_seconds": self._evaluation_timeout,
+            "evaluation_timeouts": self._evaluation_timeouts,
+            "last_cycle_duration_seconds": (
+                round(last["duration_seconds"], 3) if last else None
+            ),
+            "last_cycle_evaluated": last["evaluated"] if last else 0,
+            "last_cycle_lag_seconds": round(last["lag_seconds"], 3) if last else None,
+            "avg_cycle_duration_seconds": (
+                round(sum(durations) / len(durations), 3) if durations else None
+            ),
+            "max_cycle_duration_seconds": (
+                round(max(durations), 3) if durations else None
+            ),
+            "max_lag_seconds": (
+                round(max(c["lag_seconds"] for c in cycles), 3) if cycles else None
+            ),
+            "falling_behind": bool(
+                last and last["duration_seconds"] > self._data_change_check_interval
+            ),
         }
 
     async def get_trigger_check_statuses(self) -> list[dict[str, Any]]:
@@ -1,13 +1,26 @@
-"""Secret reference storage and resolution for control-plane managed configs."""
+"""Secret reference storage and resolution for control-plane managed configs.
+
+Materializing a config resolves all of its secret refs with one query.
+Decrypted values are kept briefly in ``SecretValueCache``, a memory-only,
+size-bounded TTL cache whose buffers are overwritten with zeros when an
+entry is evicted, expires or is invalidated by a rotate, upsert or delete.
+Writes invalidate their refs again when the transaction commits or rolls
+back, and a session never caches refs it has uncommitted writes for.
+"""
 
 from __future__ import annotations
 
+import threading
+import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Iterable
 from typing import Any, cast
 
-from sqlalchemy import select
+from sqlalchemy import event, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from truthound_dashboard.config import get_settings
 from truthound_dashboard.db import SecretRef
 from truthound_dashboard.time import utc_now
 
@@ -22,6 +35,9 @@ SECRET_REF_KEY = "_secret_ref"
 SECRET_REDACTED_KEY = "_redacted"
 SECRET_HINT_KEY = "hint"
 
+# Session.info key holding (cache, ref ID) pairs written in the transaction
+_PENDING_INVALIDATIONS_KEY = "secret_cache_pending_invalidations"
+
 
 def is_secret_ref_payload(value: object) -> bool:
     return isinstance(value, dict) and isinstance(value.get(SECRET_REF_KEY), str)
@@ -51,6 +67,159 @@ def build_secret_ref_payload(secret_ref: SecretRef) -> dict[str, Any]:
     }
 
 
+def collect_secret_ref_ids(config: dict[str, Any]) -> list[str]:
+    """Return the secret ref IDs in a config tree, in first-seen order."""
+    ref_ids: list[str] = []
+    for value in config.values():
+        if is_secret_ref_payload(value):
+            ref_ids.append(value[SECRET_REF_KEY])
+        elif isinstance(value, dict) and not isinstance(value.get("_encrypted"), str):
+            ref_ids.extend(collect_secret_ref_ids(value))
+    return list(dict.fromkeys(ref_ids))
+
+
+def _materialize_with(config: dict[str, Any], resolved: dict[str, str]) -> dict[str, Any]:
+    materialized: dict[str, Any] = {}
+    for key, value in config.items():
+        if is_secret_ref_payload(value):
+            materialized[key] = resolved.get(value[SECRET_REF_KEY])
+        elif isinstance(value, dict) and isinstance(value.get("_encrypted"), str):
+            materialized[key] = decrypt_value(value["_encrypted"])
+        elif isinstance(value, dict):
+            materialized[key] = _materialize_with(value, resolved)
+        else:
+            materialized[key] = value
+    return materialized
+
+
+class SecretValueCache:
+    """Bounded TTL cache of decrypted secret values, keyed by ref ID.
+
+    Values are held in ``bytearray`` buffers that are zeroed when an entry
+    leaves the cache. Strings handed to callers are ordinary copies.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: int | None = None,
+        max_entries: int | None = None,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            ttl_seconds: Entry lifetime (default: settings). 0 disables caching.
+            max_entries: Maximum number of entries (default: settings).
+        """
+        settings = get_settings()
+        self.ttl_seconds = (
+            settings.secret_cache_ttl_seconds if ttl_seconds is None else ttl_seconds
+        )
+        self.max_entries = (
+            settings.secret_cache_max_entries if max_entries is None else max_entries
+        )
+        self._entries: OrderedDict[str, tuple[bytearray, float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._generation = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0
+
+    @property
+    def generation(self) -> int:
+        """Counter bumped by every invalidation; see ``set``."""
+        return self._generation
+
+    def get(self, ref_id: str) -> str | None:
+        """Return the cached value, or None on a miss."""
+        with self._lock:
+            entry = self._entries.get(ref_id)
+            if entry is not None and entry[1] <= time.monotonic():
+                self._discard(ref_id)
+                entry = None
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(ref_id)
+            self._hits += 1
+            return entry[0].decode("utf-8")
+
+    def set(self, ref_id: str, value: str, *, generation: int | None = None) -> None:
+        """Cache a value.
+
+        Args:
+            ref_id: Secret ref ID.
+            value: Decrypted value.
+            generation: ``generation`` read before the value was fetched; the
+                value is dropped if anything was invalidated since.
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            self._discard(ref_id)
+            self._entries[ref_id] = (
+                bytearray(value.encode("utf-8")),
+                time.monotonic() + self.ttl_seconds,
+            )
+            while len(self._entries) > self.max_entries:
+                self._discard(next(iter(self._entries)))
+                self._evictions += 1
+
+    def invalidate(self, ref_id: str) -> None:
+        with self._lock:
+            self._generation += 1
+            self._discard(ref_id)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            for ref_id in list(self._entries):
+                self._discard(ref_id)
+
+    def _discard(self, ref_id: str) -> None:
+        entry = self._entries.pop(ref_id, None)
+        if entry is not None:
+            buffer = entry[0]
+            buffer[:] = bytes(len(buffer))
+
+    def get_stats(self) -> dict[str, Any]:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "ttl_seconds": self.ttl_seconds,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+            }
+
+
+_secret_cache: SecretValueCache | None = None
+
+
+def get_secret_cache() -> SecretValueCache:
+    """Get the decrypted secret value cache singleton."""
+    global _secret_cache
+    if _secret_cache is None:
+        _secret_cache = SecretValueCache()
+    return _secret_cache
+
+
+def reset_secret_cache() -> None:
+    """Zero and drop the secret value cache singleton."""
+    global _secret_cache
+    if _secret_cache is not None:
+        _secret_cache.clear()
+    _secret_cache = None
+
+
 def merge_secret_aware_configs(
     existing: dict[str, Any],
     incoming: dict[str, Any],
@@ -95,6 +264,15 @@ class SecretProvider(ABC):
     async def resolve(self, ref_id: str) -> str | None:
         raise NotImplementedError
 
+    async def resolve_many(self, ref_ids: Iterable[str]) -> dict[str, str]:
+        """Resolve several refs; unknown refs are left out of the result."""
+        resolved: dict[str, str] = {}
+        for ref_id in dict.fromkeys(ref_ids):
+            value = await self.resolve(ref_id)
+            if value is not None:
+                resolved[ref_id] = value
+        return resolved
+
     @abstractmethod
     async def rotate(self, ref_id: str, *, raw_value: str) -> SecretRef | None:
         raise NotImplementedError
@@ -126,8 +304,11 @@ class LocalEncryptedDbSecretProvider(SecretProvider):
 
     provider_name = "local-db"
 
-    def __init__(self, session: AsyncSession) -> None:
+    def __init__(
+        self, session: AsyncSession, cache: SecretValueCache | None = None
+    ) -> None:
         self.session = session
+        self.cache = cache or get_secret_cache()
 
     async def _get_ref_by_name(self, *, workspace_id: str, name: str) -> SecretRef | None:
         result = await self.session.execute(
@@ -165,13 +346,62 @@ class LocalEncryptedDbSecretProvider(SecretProvider):
         return secret_ref
 
     async def resolve(self, ref_id: str) -> str | None:
-        result = await self.session.execute(
-            select(SecretRef).where(SecretRef.id == ref_id)
-        )
-        secret_ref = result.scalar_one_or_none()
-        if secret_ref is None:
-            return None
-        return cast(str, decrypt_value(secret_ref.encrypted_value))
+        return (await self.resolve_many([ref_id])).get(ref_id)
+
+    async def resolve_many(self, ref_ids: Iterable[str]) -> dict[str, str]:
+        """Resolve refs from the cache, fetching the rest in one query.
+
+        Refs this session has uncommitted writes for bypass the cache.
+        """
+        pending = self._pending_ref_ids()
+        resolved: dict[str, str] = {}
+        missing: list[str] = []
+        for ref_id in dict.fromkeys(ref_ids):
+            value = None if ref_id in pending else self.cache.get(ref_id)
+            if value is None:
+                missing.append(ref_id)
+            else:
+                resolved[ref_id] = value
+        if missing:
+            generation = self.cache.generation
+            result = await self.session.execute(
+                select(SecretRef.id, SecretRef.encrypted_value).where(
+                    SecretRef.id.in_(missing)
+                )
+            )
+            for ref_id, encrypted_value in result.all():
+                value = cast(str, decrypt_value(encrypted_value))
+                if ref_id not in pending:
+                    self.cache.set(ref_id, value, generation=generation)
+                resolved[ref_id] = value
+        return resolved
+
+    def _pending_ref_ids(self) -> set[str]:
+        pending = self.session.info.get(_PENDING_INVALIDATIONS_KEY, ())
+        return {ref_id for cache, ref_id in pending if cache is self.cache}
+
+    def _invalidate(self, ref_id: str) -> None:
+        """Drop a written ref from the cache now and when the transaction ends.
+
+        Until the commit, other sessions still read the old value and may
+        cache it again, so the entry is dropped once more after the commit
+        (or rollback).
+        """
+        self.cache.invalidate(ref_id)
+        info = self.session.info
+        pending = info.get(_PENDING_INVALIDATIONS_KEY)
+        if pending is None:
+            pending = info[_PENDING_INVALIDATIONS_KEY] = set()
+
+            def invalidate_pending(_session: Any) -> None:
+                for cache, pending_ref_id in pending:
+                    cache.invalidate(pending_ref_id)
+                pending.clear()
+
+            sync_session = self.session.sync_session
+            event.listen(sync_session, "after_commit", invalidate_pending)
+            event.listen(sync_session, "after_rollback", invalidate_pending)
+        pending.add((self.cache, ref_id))
 
     async def rotate(self, ref_id: str, *, raw_value: str) -> SecretRef | None:
         result = await self.session.execute(
@@ -185,6 +415,7 @@ class LocalEncryptedDbSecretProvider(SecretProvider):
         secret_ref.rotated_at = utc_now()
         await self.session.flush()
         await self.session.refresh(secret_ref)
+        self._invalidate(ref_id)
         return secret_ref
 
     async def delete_ref(self, ref_id: str) -> None:
@@ -194,6 +425,7 @@ class LocalEncryptedDbSecretProvider(SecretProvider):
         secret_ref = result.scalar_one_or_none()
         if secret_ref is not None:
             await self.session.delete(secret_ref)
+        self._invalidate(ref_id)
 
     async def upsert_ref(
         self,
@@ -225,21 +457,13 @@ class LocalEncryptedDbSecretProvider(SecretProvider):
             existing_ref.created_by = created_by
         await self.session.flush()
         await self.session.refresh(existing_ref)
+        self._invalidate(existing_ref.id)
         return existing_ref
 
     async def materialize_config(self, config: dict[str, Any]) -> dict[str, Any]:
-        materialized: dict[str, Any] = {}
-        for key, value in config.items():
-            if is_secret_ref_payload(value):
-                secret_value = await self.resolve(value[SECRET_REF_KEY])
-                materialized[key] = secret_value
-            elif isinstance(value, dict) and isinstance(value.get("_encrypted"), str):
-                materialized[key] = decrypt_value(value["_encrypted"])
-            elif isinstance(value, dict):
-                materialized[key] = await self.materialize_config(value)
-            else:
-                materialized[key] = value
-        return materialized
+        ref_ids = collect_secret_ref_ids(config)
+        resolved = await self.resolve_many(ref_ids) if ref_ids else {}
+        return _materialize_with(config, resolved)
 
     async def persist_config(
         self,
@@ -0,0 +1,576 @@
+"""Vectorized, mergeable probabilistic sketches with persistent state.
+
+The sketches in this module are updated from whole Polars batches: values
+are hashed once by Polars (``Series.hash``) and every register, counter or
+bit update is a NumPy array operation, so no per-value Python work happens
+on the ingest path. All sketches serialize to bytes and merge with sketches
+built from other partitions, which lets ``SketchStore`` keep one sketch per
+source and column and fold new partitions in without rescanning old ones.
+
+Sketches:
+    - HyperLogLogSketch: distinct-count estimation.
+    - CountMinSketch: frequency estimation with tracked heavy-hitter
+      candidates.
+    - BloomFilterSketch: set membership.
+
+Values are hashed from their string representation, so partitions whose
+column types drift (e.g. Int32 vs Int64) still merge consistently. Polars
+hashes are only stable within one Polars release; serialized sketches record
+the hash scheme and are discarded on load when it no longer matches.
+
+Example:
+    hll = HyperLogLogSketch(precision=14)
+    for batch in batches:
+        hll.update(batch["user_id"])
+    print(hll.estimate())
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import math
+import os
+import threading
+import zlib
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, ClassVar
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Seed shared by all sketches so partitions hash identically.
+SKETCH_HASH_SEED = 0x7D5E
+
+_MAGIC = b"TDSK1\n"
+_LOW32 = np.uint64(0xFFFFFFFF)
+_POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+def hash_scheme() -> str:
+    """Identify the hash function so incompatible sketches are not merged."""
+    import polars as pl
+
+    return f"polars-{pl.__version__}-str-{SKETCH_HASH_SEED}"
+
+
+def _as_strings(values: Any) -> Any:
+    """Drop nulls and normalize values to a Polars string Series."""
+    import polars as pl
+
+    series = values if isinstance(values, pl.Series) else pl.Series(values)
+    return series.drop_nulls().cast(pl.String)
+
+
+def hash_values(values: Any) -> np.ndarray:
+    """Hash values to unsigned 64-bit integers in one vectorized call.
+
+    Args:
+        values: Polars Series or sequence of values. Nulls are skipped.
+
+    Returns:
+        ``uint64`` array with one hash per non-null value.
+    """
+    return _as_strings(values).hash(SKETCH_HASH_SEED).to_numpy()
+
+
+def _bit_length32(values: np.ndarray) -> np.ndarray:
+    """Bit length of values below 2**32 (exact via float64 exponents)."""
+    return np.frexp(values.astype(np.float64))[1].astype(np.uint8)
+
+
+def _double_hash_indices(hashes: np.ndarray, count: int, modulus: int) -> np.ndarray:
+    """Derive ``count`` indices per hash with Kirsch-Mitzenmacher hashing.
+
+    Returns:
+        Array of shape ``(count, len(hashes))``.
+    """
+    h1 = hashes & _LOW32
+    h2 = (hashes >> np.uint64(32)) | np.uint64(1)
+    steps = np.arange(count, dtype=np.uint64)[:, None]
+    return ((h1[None, :] + steps * h2[None, :]) % np.uint64(modulus)).astype(np.int64)
+
+
+class Sketch(ABC):
+    """Base class for serializable, mergeable sketches.
+
+    Attributes:
+        rows_added: Non-null values ingested so far.
+        partitions: Keys of the partitions merged into this sketch.
+    """
+
+    kind: ClassVar[str]
+
+    def __init__(self) -> None:
+        self.rows_added = 0
+        self.partitions: list[str] = []
+
+    @property
+    @abstractmethod
+    def params(self) -> dict[str, Any]:
+        """Parameters that must match for two sketches to merge."""
+        ...
+
+    @abstractmethod
+    def update_hashes(self, hashes: np.ndarray) -> None:
+        """Add pre-hashed values."""
+        ...
+
+    def update(self, values: Any) -> None:
+        """Add a batch of values (Polars Series or sequence)."""
+        self.update_hashes(hash_values(values))
+
+    @abstractmethod
+    def _merge_state(self, other: Sketch) -> None:
+        ...
+
+    def merge(self, other: Sketch) -> Sketch:
+        """Merge another sketch with the same parameters into this one.
+
+        Raises:
+            ValueError: If the sketches are of different kinds or parameters.
+        """
+        if other.kind != self.kind or other.params != self.params:
+            raise ValueError(
+                f"Cannot merge {other.kind} {other.params} into {self.kind} {self.params}"
+            )
+        self._merge_state(other)
+        self.rows_added += other.rows_added
+        self.partitions.extend(p for p in other.partitions if p not in self.partitions)
+        return self
+
+    @property
+    @abstractmethod
+    def memory_bytes(self) -> int:
+        """Bytes held by the sketch's arrays."""
+        ...
+
+    @abstractmethod
+    def _state(self) -> tuple[dict[str, Any], list[np.ndarray]]:
+        ...
+
+    @abstractmethod
+    def _load_state(self, extra: dict[str, Any], arrays: list[np.ndarray]) -> None:
+        ...
+
+    def to_bytes(self) -> bytes:
+        """Serialize the sketch to a compact binary blob."""
+        extra, arrays = self._state()
+        header = {
+            "kind": self.kind,
+            "params": self.params,
+            "hash_scheme": hash_scheme(),
+            "rows_added": self.rows_added,
+            "partitions": self.partitions,
+            "extra": extra,
+            "arrays": [[str(a.dtype), list(a.shape)] for a in arrays],
+        }
+        body = b"".join(np.ascontiguousarray(a).tobytes() for a in arrays)
+        payload = json.dumps(header).encode() + b"\n" + body
+        return _MAGIC + zlib.compress(payload, 1)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Sketch:
+        """Deserialize a sketch written by ``to_bytes``.
+
+        Raises:
+            ValueError: If the blob is malformed or uses another hash scheme.
+        """
+        if not data.startswith(_MAGIC):
+            raise ValueError("Not a serialized sketch")
+        payload = zlib.decompress(data[len(_MAGIC) :])
+        raw_header, _, body = payload.partition(b"\n")
+        header = json.loads(raw_header)
+        if header["hash_scheme"] != hash_scheme():
+            raise ValueError(f"Incompatible sketch hash scheme: {header['hash_scheme']}")
+
+        sketch_cls = _SKETCH_TYPES[header["kind"]]
+        sketch = sketch_cls(**header["params"])
+        arrays = []
+        offset = 0
+        for dtype, shape in header["arrays"]:
+            dtype = np.dtype(dtype)
+            size = int(np.prod(shape)) * dtype.itemsize
+            arrays.append(
+                np.frombuffer(body, dtype=dtype, count=int(np.prod(shape)), offset=offset)
+                .reshape(shape)
+                .copy()
+            )
+            offset += size
+        sketch._load_state(header["extra"], arrays)
+        sketch.rows_added = header["rows_added"]
+        sketch.partitions = list(header["partitions"])
+        return sketch
+
+
+class HyperLogLogSketch(Sketch):
+    """HyperLogLog distinct-count estimator with ``2**precision`` registers."""
+
+    kind = "hyperloglog"
+
+    def __init__(self, precision: int = 14) -> None:
+        super().__init__()
+        if not 4 <= precision <= 18:
+            raise ValueError("HyperLogLog precision must be between 4 and 18")
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype=np.uint8)
+
+    @property
+    def params(self) -> dict[str, Any]:
+        return {"precision": self.precision}
+
+    def update_hashes(self, hashes: np.ndarray) -> None:
+        if hashes.size == 0:
+            return
+        p = np.uint64(self.precision)
+        buckets = (hashes >> (np.uint64(64) - p)).astype(np.int64)
+        remaining = hashes << p
+        high = remaining >> np.uint64(32)
+        low = remaining & _LOW32
+        # Leading zeros of the remaining bits, plus one; all-zero remainders
+        # take the maximum rank.
+        bit_length = np.where(high > 0, _bit_length32(high) + 32, _bit_length32(low))
+        max_rank = 64 - self.precision + 1
+        ranks = np.minimum(65 - bit_length.astype(np.int64), max_rank).astype(np.uint8)
+        np.maximum.at(self.registers, buckets, ranks)
+        self.rows_added += int(hashes.size)
+
+    def _merge_state(self, other: Sketch) -> None:
+        np.maximum(self.registers, other.registers, out=self.registers)
+
+    def estimate(self) -> int:
+        """Estimate the number of distinct values."""
+        m = self.registers.size
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw = alpha * m * m / float(np.sum(np.ldexp(1.0, -self.registers.astype(np.int64))))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if raw <= 2.5 * m and zeros:
+            return int(round(m * math.log(m / zeros)))
+        return int(round(raw))
+
+    def standard_error(self) -> float:
+        """Relative standard error of the estimate."""
+        return 1.04 / math.sqrt(self.registers.size)
+
+    @property
+    def memory_bytes(self) -> int:
+        return int(self.registers.nbytes)
+
+    def _state(self) -> tuple[dict[str, Any], list[np.ndarray]]:
+        return {}, [self.registers]
+
+    def _load_state(self, extra: dict[str, Any], arrays: list[np.ndarray]) -> None:
+        self.registers = arrays[0]
+
+
+class CountMinSketch(Sketch):
+    """Count-Min frequency sketch with bounded heavy-hitter tracking.
+
+    Alongside the counter table the sketch keeps up to ``candidates``
+    values with the highest estimated counts, so heavy hitters can be
+    reported without another pass over the data.
+    """
+
+    kind = "countmin"
+
+    def __init__(self, width: int = 2000, depth: int = 5, candidates: int = 100) -> None:
+        super().__init__()
+        self.width = width
+        self.depth = depth
+        self.candidates = candidates
+        self.table = np.zeros((depth, width), dtype=np.uint64)
+        self._tracked: dict[int, str] = {}
+
+    @property
+    def params(self) -> dict[str, Any]:
+        return {"width": self.width, "depth": self.depth, "candidates": self.candidates}
+
+    def _add_counts(self, hashes: np.ndarray, counts: np.ndarray) -> None:
+        indices = _double_hash_indices(hashes, self.depth, self.width)
+        for row in range(self.depth):
+            self.table[row] += np.bincount(
+                indices[row], weights=counts, minlength=self.width
+            ).astype(np.uint64)
+        self.rows_added += int(counts.sum())
+
+    def estimate_hashes(self, hashes: np.ndarray) -> np.ndarray:
+        """Estimated counts for pre-hashed values."""
+        if hashes.size == 0:
+            return np.zeros(0, dtype=np.uint64)
+        indices = _double_hash_indices(hashes, self.depth, self.width)
+        return self.table[np.arange(self.depth)[:, None], indices].min(axis=0)
+
+    def estimate(self, values: Any) -> np.ndarray:
+        """Estimated counts for values."""
+        return self.estimate_hashes(hash_values(values))
+
+    def update_hashes(self, hashes: np.ndarray) -> None:
+        if hashes.size == 0:
+            return
+        unique, counts = np.unique(hashes, return_counts=True)
+        self._add_counts(unique, counts)
+
+    def update(self, values: Any) -> None:
+        strings = _as_strings(values)
+        if strings.len() == 0:
+            return
+        hashes = strings.hash(SKETCH_HASH_SEED).to_numpy()
+        unique, first, counts = np.unique(hashes, return_index=True, return_counts=True)
+        self._add_counts(unique, counts)
+
+        # Only the batch's most frequent values can displace tracked ones.
+        top = np.argsort(counts)[::-1][: self.candidates]
+        labels = strings.gather(first[top]).to_list()
+        for value_hash, label in zip(unique[top].tolist(), labels, strict=True):
+            self._tracked.setdefault(value_hash, label)
+        self._prune()
+
+    def _prune(self) -> None:
+        if len(self._tracked) <= self.candidates:
+            return
+        tracked = np.fromiter(self._tracked, dtype=np.uint64, count=len(self._tracked))
+        keep = tracked[np.argsort(self.estimate_hashes(tracked))[::-1][: self.candidates]]
+        self._tracked = {int(h): self._tracked[int(h)] for h in keep}
+
+    def _merge_state(self, other: Sketch) -> None:
+        self.table += other.table
+        for value_hash, label in other._tracked.items():
+            self._tracked.setdefault(value_hash, label)
+        self._prune()
+
+    def heavy_hitters(
+        self,
+        threshold: float = 0.01,
+        limit: int = 10,
+    ) -> list[dict[str, Any]]:
+        """Tracked values whose estimated share is at least ``threshold``.
+
+        Returns:
+            Up to ``limit`` ``{"value", "count"}`` entries, most frequent first.
+        """
+        if not self._tracked or self.rows_added == 0:
+            return []
+        tracked = np.fromiter(self._tracked, dtype=np.uint64, count=len(self._tracked))
+        estimates = self.estimate_hashes(tracked)
+        order = np.argsort(estimates)[::-1]
+        min_count = self.rows_added * threshold
+        return [
+            {"value": self._tracked[int(tracked[i])], "count": int(estimates[i])}
+            for i in order[:limit]
+            if estimates[i] >= min_count
+        ]
+
+    @property
+    def memory_bytes(self) -> int:
+        return int(self.table.nbytes)
+
+    def _state(self) -> tuple[dict[str, Any], list[np.ndarray]]:
+        tracked_hashes = np.fromiter(self._tracked, dtype=np.uint64, count=len(self._tracked))
+        return {"labels": list(self._tracked.values())}, [self.table, tracked_hashes]
+
+    def _load_state(self, extra: dict[str, Any], arrays: list[np.ndarray]) -> None:
+        self.table = arrays[0]
+        self._tracked = dict(zip(arrays[1].tolist(), extra["labels"], strict=True))
+
+
+class BloomFilterSketch(Sketch):
+    """Bloom filter sized for ``capacity`` items at ``error_rate``."""
+
+    kind = "bloom"
+
+    def __init__(self, capacity: int = 10_000_000, error_rate: float = 0.01) -> None:
+        super().__init__()
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.num_bits = max(8, int(math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.bits = np.zeros((self.num_bits + 7) // 8, dtype=np.uint8)
+
+    @property
+    def params(self) -> dict[str, Any]:
+        return {"capacity": self.capacity, "error_rate": self.error_rate}
+
+    def update_hashes(self, hashes: np.ndarray) -> None:
+        if hashes.size == 0:
+            return
+        positions = _double_hash_indices(hashes, self.num_hashes, self.num_bits).ravel()
+        offsets = positions & 7
+        # One fancy-indexed OR per bit offset: duplicate bytes within a pass
+        # all write the same value, so no unbuffered ufunc.at is needed.
+        for offset in range(8):
+            selected = positions[offsets == offset] >> 3
+            self.bits[selected] |= np.uint8(1 << offset)
+        self.rows_added += int(hashes.size)
+
+    def contains(self, values: Any) -> np.ndarray:
+        """Membership test per non-null value (false positives possible)."""
+        hashes = hash_values(values)
+        if hashes.size == 0:
+            return np.zeros(0, dtype=bool)
+        positions = _double_hash_indices(hashes, self.num_hashes, self.num_bits)
+        present = (self.bits[positions >> 3] >> (positions & 7).astype(np.uint8)) & 1
+        return present.all(axis=0)
+
+    def fill_ratio(self) -> float:
+        """Fraction of bits set."""
+        return float(_POPCOUNT[self.bits].sum(dtype=np.int64)) / self.num_bits
+
+    def false_positive_rate(self) -> float:
+        """Current false positive probability given the bits set so far."""
+        return self.fill_ratio() ** self.num_hashes
+
+    def _merge_state(self, other: Sketch) -> None:
+        np.bitwise_or(self.bits, other.bits, out=self.bits)
+
+    @property
+    def memory_bytes(self) -> int:
+        return int(self.bits.nbytes)
+
+    def _state(self) -> tuple[dict[str, Any], list[np.ndarray]]:
+        return {}, [self.bits]
+
+    def _load_state(self, extra: dict[str, Any], arrays: list[np.ndarray]) -> None:
+        self.bits = arrays[0]
+
+
+_SKETCH_TYPES: dict[str, type[Sketch]] = {
+    cls.kind: cls for cls in (HyperLogLogSketch, CountMinSketch, BloomFilterSketch)
+}
+
+
+PARTITION_SUFFIXES = frozenset({".csv", ".parquet", ".jsonl", ".ndjson"})
+
+
+def resolve_partition_path(source_path: str, partition_path: str) -> Path:
+    """Resolve a partition file inside a source's own location.
+
+    Relative paths are taken from the source directory (the directory of a
+    file source). Symlinks are resolved before the check, so a partition
+    can never point at other files on the server.
+
+    Raises:
+        ValueError: If the partition is not a data file inside the source's
+            directory.
+    """
+    base = Path(source_path).expanduser().resolve()
+    root = base if base.is_dir() else base.parent
+    candidate = Path(partition_path).expanduser()
+    if not candidate.is_absolute():
+        candidate = root / candidate
+    resolved = candidate.resolve()
+    if (
+        not resolved.is_relative_to(root)
+        or resolved.suffix.lower() not in PARTITION_SUFFIXES
+        or not resolved.is_file()
+    ):
+        raise ValueError(
+            "partition_path must be a CSV, Parquet or JSON Lines file "
+            "inside the source's directory"
+        )
+    return resolved
+
+
+def create_sketch(kind: str, **params: Any) -> Sketch:
+    """Create an empty sketch of the given kind.
+
+    Raises:
+        ValueError: If the kind is unknown.
+    """
+    try:
+        return _SKETCH_TYPES[kind](**params)
+    except KeyError:
+        raise ValueError(f"Unknown sketch type: {kind}") from None
+
+
+class SketchStore:
+    """File-backed store holding one sketch per source, column and config.
+
+    Sketches live under ``<root>/<source_id>/`` and are replaced atomically,
+    so concurrent readers always see a complete sketch.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self._root = root
+        self._lock = threading.Lock()
+
+    def _path(self, source_id: str, column: str, kind: str, params: dict[str, Any]) -> Path:
+        key = json.dumps([column, kind, params], sort_keys=True)
+        digest = hashlib.sha256(key.encode()).hexdigest()[:24]
+        safe_source = hashlib.sha256(source_id.encode()).hexdigest()[:16]
+        return self._root / safe_source / f"{kind}-{digest}.sketch"
+
+    def load(
+        self,
+        source_id: str,
+        column: str,
+        kind: str,
+        params: dict[str, Any],
+    ) -> Sketch | None:
+        """Load a stored sketch, or None if missing or unreadable."""
+        path = self._path(source_id, column, kind, params)
+        try:
+            return Sketch.from_bytes(path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, zlib.error) as exc:
+            logger.info("Discarding stored sketch %s: %s", path, exc)
+            return None
+
+    def save(self, source_id: str, column: str, sketch: Sketch) -> None:
+        """Persist a sketch, replacing any previous version."""
+        path = self._path(source_id, column, sketch.kind, sketch.params)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_bytes(sketch.to_bytes())
+        with self._lock:
+            os.replace(tmp_path, path)
+
+    def delete_source(self, source_id: str) -> int:
+        """Delete all sketches stored for a source.
+
+        Returns:
+            Number of sketch files removed.
+        """
+        source_dir = self._path(source_id, "", "", {}).parent
+        removed = 0
+        for path in source_dir.glob("*.sketch"):
+            path.unlink(missing_ok=True)
+            removed += 1
+        return removed
+
+
+_store: SketchStore | None = None
+
+
+def get_sketch_store() -> SketchStore:
+    """Get the sketch store singleton."""
+    global _store
+    if _store is None:
+        from truthound_dashboard.config import get_settings
+
+        _store = SketchStore(get_settings().cache_dir / "sketches")
+    return _store
+
+
+def reset_sketch_store() -> None:
+    """Reset the sketch store singleton (for testing)."""
+    global _store
+    _store = None
+
+
+__all__ = [
+    "SKETCH_HASH_SEED",
+    "BloomFilterSketch",
+    "CountMinSketch",
+    "HyperLogLogSketch",
+    "Sketch",
+    "SketchStore",
+    "create_sketch",
+    "get_sketch_store",
+    "hash_scheme",
+    "hash_values",
+    "reset_sketch_store",
+]
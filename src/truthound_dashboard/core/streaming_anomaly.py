@@ -21,6 +21,9 @@ from truthound_dashboard.time import utc_now
 
 logger = logging.getLogger(__name__)
 
+# WebSocket room receiving per-session streaming statistics
+STREAMING_STATS_ROOM = "anomaly_streaming"
+
 
 class StreamingSessionStatus(str, Enum):
     """Status of a streaming session."""
@@ -522,6 +525,8 @@ class StreamingAnomalyDetector:
             session._alerts.append(alert)
             await self._trigger_alert_callbacks(session, alert)
 
+        await self._publish_statistics(session)
+
         return alert
 
     async def push_batch(
@@ -952,6 +957,29 @@ class StreamingAnomalyDetector:
             except Exception:
                 pass  # Don't let callback errors break detection
 
+    async def _publish_statistics(self, session: StreamingSession) -> None:
+        """Push the session's running statistics to WebSocket subscribers.
+
+        Sent after every data point; the WebSocket manager coalesces these
+        per session, so a client that falls behind only gets the latest.
+        """
+        from truthound_dashboard.core.websocket import (
+            WebSocketMessage,
+            WebSocketMessageType,
+            get_websocket_manager,
+        )
+
+        manager = get_websocket_manager()
+        if not manager.room_size(STREAMING_STATS_ROOM):
+            return
+        await manager.broadcast_to_room(
+            STREAMING_STATS_ROOM,
+            WebSocketMessage(
+                type=WebSocketMessageType.STREAMING_STATS,
+                data={"session_id": session.id, **self._session_statistics(session)},
+            ),
+        )
+
     async def get_alerts(
         self,
         session_id: str,
@@ -993,6 +1021,11 @@ class StreamingAnomalyDetector:
         if session is None:
             return {}
 
+        return self._session_statistics(session)
+
+    @staticmethod
+    def _session_statistics(session: StreamingSession) -> dict[str, Any]:
+        """Build the statistics payload for a session."""
         return {
             "total_points": len(session._buffer),
             "total_alerts": len(session._alerts),
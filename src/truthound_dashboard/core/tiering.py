@@ -22,7 +22,8 @@ Features:
     - Storage tier management (hot, warm, cold, archive)
     - Policy-based migration (age, access, size, scheduled, composite, custom)
     - Migration execution with truthound backends
-    - Access tracking for intelligent tiering
+    - Bounded parallel migrations with chunked streaming copies
+    - Persistent access tracking, iterated least recently accessed first
     - Background policy evaluation and execution
     - Migration history and statistics
 """
@@ -30,15 +31,24 @@ Features:
 from __future__ import annotations
 
 import asyncio
+import itertools
+import json
 import logging
-from concurrent.futures import ThreadPoolExecutor
+import os
+import sqlite3
+import threading
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Executor, ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from functools import partial
-from typing import Any, Protocol, runtime_checkable
+from pathlib import Path
+from typing import Any, BinaryIO, Protocol, runtime_checkable
+from urllib.parse import quote, unquote
 from uuid import uuid4
 
-from sqlalchemy import func, select, update
+from sqlalchemy import func, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 from truthound_dashboard.time import utc_now
@@ -48,6 +58,23 @@ logger = logging.getLogger(__name__)
 # Thread pool for blocking truthound operations
 _executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="tiering")
 
+# Bytes copied per read/write when both stores support streaming
+MIGRATION_CHUNK_SIZE = 1024 * 1024
+
+# Parallel migrations when no tiering config is active
+DEFAULT_MIGRATION_WORKERS = 4
+
+# Upper bound of TieringConfig.max_parallel_migrations
+MAX_MIGRATION_WORKERS = 100
+
+# Shared by all migration engines; each caps its own concurrency.
+_migration_executor = ThreadPoolExecutor(
+    max_workers=MAX_MIGRATION_WORKERS, thread_name_prefix="tiering-migrate"
+)
+
+# Store type served by FileTierStore (one file per item under base_path)
+FILE_TIER_STORE_TYPE = "file_tier"
+
 
 def _generate_id() -> str:
     """Generate a unique ID."""
@@ -221,6 +248,10 @@ class TieringAdapter:
         Returns:
             Store instance or fallback store.
         """
+        local_path = store_config.get("base_path") or store_config.get("path")
+        if store_type == FILE_TIER_STORE_TYPE and local_path:
+            return FileTierStore(local_path)
+
         if not self.is_available:
             return self._create_fallback_store(store_type, store_config)
 
@@ -438,30 +469,43 @@ class TieringAdapter:
     def create_metadata_store(self) -> Any:
         """Create or get the tier metadata store.
 
+        The store is a SQLite index in the dashboard data directory, so
+        access statistics survive restarts and are shared by every service
+        instance. Falls back to an in-memory store if it cannot be opened.
+
         Returns:
             TierMetadataStore instance.
         """
         if self._metadata_store is not None:
             return self._metadata_store
 
-        if self.is_available:
-            try:
-                from truthound.stores.tiering.base import InMemoryTierMetadataStore
-                self._metadata_store = InMemoryTierMetadataStore()
-            except Exception as e:
-                logger.warning(f"Failed to create truthound metadata store: {e}")
-                self._metadata_store = FallbackMetadataStore()
-        else:
+        try:
+            from truthound_dashboard.config import get_settings
+
+            self._metadata_store = SQLiteTierMetadataStore(
+                get_settings().data_dir / "tier_metadata.db"
+            )
+        except Exception as e:
+            logger.warning(f"Failed to open tier metadata index: {e}")
             self._metadata_store = FallbackMetadataStore()
 
         return self._metadata_store
 
+    def close(self) -> None:
+        """Close the metadata store."""
+        if isinstance(self._metadata_store, SQLiteTierMetadataStore):
+            self._metadata_store.close()
+        self._metadata_store = None
+
     async def execute_migration(
         self,
         item_id: str,
         from_store: Any,
         to_store: Any,
         metadata_store: Any,
+        from_tier: str | None = None,
+        to_tier: str | None = None,
+        executor: Executor | None = None,
     ) -> MigrationResult:
         """Execute a single item migration.
 
@@ -470,20 +514,31 @@ class TieringAdapter:
             from_store: Source store.
             to_store: Destination store.
             metadata_store: Metadata store for tracking.
+            from_tier: Source tier name (defaults to the store's name).
+            to_tier: Destination tier name (defaults to the store's name).
+            executor: Executor running the copy (default: shared tiering pool).
 
         Returns:
             MigrationResult with migration details.
         """
         started_at = utc_now()
-        from_tier = getattr(from_store, "name", "unknown")
-        to_tier = getattr(to_store, "name", "unknown")
+        from_tier = from_tier or getattr(from_store, "name", "unknown")
+        to_tier = to_tier or getattr(to_store, "name", "unknown")
 
         try:
             # Run migration in thread pool to avoid blocking
             loop = asyncio.get_event_loop()
             result = await loop.run_in_executor(
-                _executor,
-                partial(self._sync_migrate, item_id, from_store, to_store, metadata_store),
+                executor or _executor,
+                partial(
+                    self._sync_migrate,
+                    item_id,
+                    from_store,
+                    to_store,
+                    metadata_store,
+                    to_tier,
+                    from_tier,
+                ),
             )
             completed_at = utc_now()
             duration_ms = (completed_at - started_at).total_seconds() * 1000
@@ -519,35 +574,73 @@ class TieringAdapter:
         from_store: Any,
         to_store: Any,
         metadata_store: Any,
+        to_tier: str | None = None,
+        from_tier: str | None = None,
     ) -> dict[str, Any]:
-        """Synchronous migration operation (runs in thread pool)."""
-        try:
-            # Get item from source
-            data = from_store.get(item_id)
-            if data is None:
-                return {"success": False, "error": f"Item {item_id} not found in source tier"}
+        """Synchronous migration operation (runs in thread pool).
 
-            # Calculate size
-            size_bytes = len(str(data).encode("utf-8")) if data else 0
-
-            # Save to destination
-            to_store.save(item_id, data)
+        Copies in ``MIGRATION_CHUNK_SIZE`` chunks when the source supports
+        ``open_read`` and the destination ``open_write``, so large items are
+        never held in memory; other stores go through ``get``/``save``.
+        Items missing from the source tier are dropped from the index.
+        """
+        not_found = {"success": False, "error": f"Item {item_id} not found in source tier"}
+        try:
+            if hasattr(from_store, "open_read") and hasattr(to_store, "open_write"):
+                size_bytes = 0
+                try:
+                    with from_store.open_read(item_id) as src, to_store.open_write(
+                        item_id
+                    ) as dst:
+                        while chunk := src.read(MIGRATION_CHUNK_SIZE):
+                            dst.write(chunk)
+                            size_bytes += len(chunk)
+                except FileNotFoundError:
+                    self._forget_missing(metadata_store, item_id, from_tier)
+                    return not_found
+            else:
+                # Get item from source
+                data = from_store.get(item_id)
+                if data is None:
+                    self._forget_missing(metadata_store, item_id, from_tier)
+                    return not_found
+
+                # Calculate size
+                size_bytes = len(str(data).encode("utf-8")) if data else 0
+
+                # Save to destination
+                to_store.save(item_id, data)
 
             # Delete from source
             from_store.delete(item_id)
 
             # Update metadata
-            if metadata_store:
-                info = metadata_store.get_info(item_id)
-                if info:
-                    info.tier_name = getattr(to_store, "name", "unknown")
-                    info.migrated_at = utc_now()
-                    metadata_store.save_info(info)
+            if metadata_store is not None:
+                now = utc_now()
+                info = metadata_store.get_info(item_id) or TierInfo(
+                    item_id=item_id, tier_name="", created_at=now
+                )
+                info.tier_name = to_tier or getattr(to_store, "name", "unknown")
+                info.migrated_at = now
+                info.size_bytes = size_bytes
+                metadata_store.save_info(info)
 
             return {"success": True, "size_bytes": size_bytes}
         except Exception as e:
             return {"success": False, "error": str(e)}
 
+    @staticmethod
+    def _forget_missing(
+        metadata_store: Any, item_id: str, from_tier: str | None
+    ) -> None:
+        """Drop the index row of an item that is gone from its tier."""
+        if metadata_store is None:
+            return
+        info = metadata_store.get_info(item_id)
+        # Leave rows alone that already point at another tier.
+        if info is not None and (from_tier is None or info.tier_name == from_tier):
+            metadata_store.delete_info(item_id)
+
     def evaluate_policy(
         self,
         policy: Any,
@@ -735,6 +828,283 @@ class FallbackMetadataStore:
             self._data[item_id].last_accessed = utc_now()
 
 
+# =============================================================================
+# Persistent implementations
+# =============================================================================
+
+
+class FileTierStore:
+    """Local directory store holding one file per item.
+
+    Besides the ``save``/``get``/``delete``/``list`` store protocol it
+    exposes ``open_read``/``open_write`` so migrations between local tiers
+    stream in chunks, and ``iter_ids`` so callers can page through a tier
+    without materializing every ID.
+    """
+
+    def __init__(self, base_path: str | Path) -> None:
+        self.base_path = Path(base_path)
+        self.base_path.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, item_id: str) -> Path:
+        # Quote everything, including "/", so IDs cannot escape base_path.
+        return self.base_path / quote(item_id, safe="")
+
+    def save(self, item_id: str, data: Any) -> str:
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        elif not isinstance(data, (bytes, bytearray)):
+            data = json.dumps(data, default=str).encode("utf-8")
+        with self.open_write(item_id) as handle:
+            handle.write(data)
+        return item_id
+
+    def get(self, item_id: str) -> bytes | None:
+        try:
+            return self._path(item_id).read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def delete(self, item_id: str) -> bool:
+        try:
+            self._path(item_id).unlink()
+            return True
+        except FileNotFoundError:
+            return False
+
+    def exists(self, item_id: str) -> bool:
+        return self._path(item_id).is_file()
+
+    def iter_ids(self) -> Iterator[str]:
+        with os.scandir(self.base_path) as entries:
+            for entry in entries:
+                if entry.is_file() and not entry.name.startswith("."):
+                    yield unquote(entry.name)
+
+    def list(self) -> list[str]:
+        return list(self.iter_ids())
+
+    def open_read(self, item_id: str) -> BinaryIO:
+        return self._path(item_id).open("rb")
+
+    @contextmanager
+    def open_write(self, item_id: str) -> Iterator[BinaryIO]:
+        """Write to a temporary file that replaces the item on success."""
+        target = self._path(item_id)
+        tmp = target.with_name(f".{target.name}.{uuid4().hex}.tmp")
+        try:
+            with tmp.open("wb") as handle:
+                yield handle
+            os.replace(tmp, target)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+
+
+class SQLiteTierMetadataStore:
+    """Tier metadata index persisted in a SQLite file.
+
+    Implements the TierMetadataStore interface and adds
+    ``least_recently_accessed``, which walks an index on
+    ``(tier_name, COALESCE(last_accessed, created_at))`` so policies see the
+    coldest items first without loading the whole tier.
+    """
+
+    _SCHEMA = (
+        """
+        CREATE TABLE IF NOT EXISTS tier_items (
+            item_id TEXT PRIMARY KEY,
+            tier_name TEXT NOT NULL,
+            created_at TEXT NOT NULL,
+            migrated_at TEXT,
+            access_count INTEGER NOT NULL DEFAULT 0,
+            last_accessed TEXT,
+            size_bytes INTEGER NOT NULL DEFAULT 0,
+            next_migration TEXT,
+            metadata TEXT
+        )
+        """,
+        """
+        CREATE INDEX IF NOT EXISTS ix_tier_items_access
+        ON tier_items (tier_name, COALESCE(last_accessed, created_at))
+        """,
+    )
+    _COLUMNS = (
+        "item_id, tier_name, created_at, migrated_at, access_count, "
+        "last_accessed, size_bytes, next_migration, metadata"
+    )
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            self.path, check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA busy_timeout=5000")
+        for statement in self._SCHEMA:
+            self._conn.execute(statement)
+
+    @staticmethod
+    def _ts(value: datetime | None) -> str | None:
+        return value.isoformat() if value else None
+
+    @staticmethod
+    def _parse_ts(value: str | None) -> datetime | None:
+        return datetime.fromisoformat(value) if value else None
+
+    @classmethod
+    def _row_to_info(cls, row: tuple) -> TierInfo:
+        return TierInfo(
+            item_id=row[0],
+            tier_name=row[1],
+            created_at=datetime.fromisoformat(row[2]),
+            migrated_at=cls._parse_ts(row[3]),
+            access_count=row[4],
+            last_accessed=cls._parse_ts(row[5]),
+            size_bytes=row[6],
+            next_migration=cls._parse_ts(row[7]),
+            metadata=json.loads(row[8]) if row[8] else {},
+        )
+
+    def save_info(self, info: Any) -> None:
+        params = (
+            info.item_id,
+            info.tier_name,
+            self._ts(info.created_at),
+            self._ts(getattr(info, "migrated_at", None)),
+            getattr(info, "access_count", 0),
+            self._ts(getattr(info, "last_accessed", None)),
+            getattr(info, "size_bytes", 0),
+            self._ts(getattr(info, "next_migration", None)),
+            json.dumps(getattr(info, "metadata", None) or {}, default=str),
+        )
+        with self._lock:
+            self._conn.execute(
+                f"INSERT OR REPLACE INTO tier_items ({self._COLUMNS}) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                params,
+            )
+
+    def get_info(self, item_id: str) -> TierInfo | None:
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {self._COLUMNS} FROM tier_items WHERE item_id = ?",
+                (item_id,),
+            ).fetchone()
+        return self._row_to_info(row) if row else None
+
+    def delete_info(self, item_id: str) -> bool:
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM tier_items WHERE item_id = ?", (item_id,)
+            )
+        return cursor.rowcount > 0
+
+    def list_by_tier(self, tier_name: str) -> list[TierInfo]:
+        return self.least_recently_accessed(tier_name)
+
+    def least_recently_accessed(
+        self,
+        tier_name: str,
+        limit: int | None = None,
+    ) -> list[TierInfo]:
+        """List a tier's items, least recently accessed (or created) first.
+
+        Args:
+            tier_name: Tier to list.
+            limit: Maximum items to return.
+
+        Returns:
+            TierInfo objects in access order.
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {self._COLUMNS} FROM tier_items WHERE tier_name = ? "
+                "ORDER BY COALESCE(last_accessed, created_at) LIMIT ?",
+                (tier_name, -1 if limit is None else limit),
+            ).fetchall()
+        return [self._row_to_info(row) for row in rows]
+
+    def update_access(self, item_id: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                "UPDATE tier_items SET access_count = access_count + 1, "
+                "last_accessed = ? WHERE item_id = ?",
+                (utc_now().isoformat(), item_id),
+            )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM tier_items").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class TierMigrationEngine:
+    """Runs tier migrations with a bounded number of parallel workers.
+
+    Migrations run on a migration pool shared by all engines, sized for the
+    largest allowed ``max_parallel_migrations``, so the configured
+    parallelism is not capped by the shared tiering pool; each ``migrate``
+    call keeps at most ``max_workers`` of them in flight.
+
+    Example:
+        engine = TierMigrationEngine(get_tiering_adapter(), max_workers=4)
+        results = await engine.migrate(item_ids, from_store, to_store, metadata_store)
+    """
+
+    def __init__(self, adapter: TieringAdapter, *, max_workers: int = 4) -> None:
+        self._adapter = adapter
+        self._max_workers = max(1, max_workers)
+
+    @property
+    def max_workers(self) -> int:
+        return self._max_workers
+
+    async def migrate(
+        self,
+        item_ids: Iterable[str],
+        from_store: Any,
+        to_store: Any,
+        metadata_store: Any,
+        *,
+        from_tier: str | None = None,
+        to_tier: str | None = None,
+    ) -> list[MigrationResult]:
+        """Migrate items between stores.
+
+        Args:
+            item_ids: Items to migrate.
+            from_store: Source store.
+            to_store: Destination store.
+            metadata_store: Metadata store updated after each migration.
+            from_tier: Source tier name.
+            to_tier: Destination tier name.
+
+        Returns:
+            One MigrationResult per item, in input order.
+        """
+        semaphore = asyncio.Semaphore(self._max_workers)
+
+        async def run(item_id: str) -> MigrationResult:
+            async with semaphore:
+                return await self._adapter.execute_migration(
+                    item_id=item_id,
+                    from_store=from_store,
+                    to_store=to_store,
+                    metadata_store=metadata_store,
+                    from_tier=from_tier,
+                    to_tier=to_tier,
+                    executor=_migration_executor,
+                )
+
+        return list(await asyncio.gather(*(run(item_id) for item_id in item_ids)))
+
+
 # =============================================================================
 # Singleton adapter instance
 # =============================================================================
@@ -750,6 +1120,14 @@ def get_tiering_adapter() -> TieringAdapter:
     return _adapter_instance
 
 
+def reset_tiering_adapter() -> None:
+    """Reset the singleton tiering adapter (for testing)."""
+    global _adapter_instance
+    if _adapter_instance is not None:
+        _adapter_instance.close()
+    _adapter_instance = None
+
+
 # =============================================================================
 # Tiering Service
 # =============================================================================
@@ -818,7 +1196,7 @@ class TieringService:
             priority=tier.priority,
             cost_per_gb=tier.cost_per_gb,
             retrieval_time_ms=tier.retrieval_time_ms,
-            metadata=tier.metadata,
+            metadata=tier.tier_metadata,
         )
         self._tier_objects[tier_id] = tier_obj
 
@@ -970,13 +1348,20 @@ class TieringService:
         policy_id: str,
         dry_run: bool = False,
         batch_size: int = 100,
+        max_workers: int | None = None,
     ) -> TieringExecutionResult:
         """Execute a tier policy.
 
+        Items are scanned least recently accessed first, migrated by a
+        TierMigrationEngine, and recorded with one bulk history insert.
+
         Args:
             policy_id: Policy ID to execute.
             dry_run: If True, don't actually migrate, just report what would happen.
             batch_size: Maximum items to process.
+            max_workers: Parallel migrations. Defaults to the active tiering
+                config (``max_parallel_migrations`` when parallel migration
+                is enabled, otherwise 1).
 
         Returns:
             Execution result with migration details.
@@ -1024,73 +1409,88 @@ class TieringService:
             metadata_store = self._adapter.create_metadata_store()
 
             # Get items in source tier
-            items_to_check = self._get_tier_items(from_store, metadata_store, batch_size)
+            from_tier_name = policy_model.from_tier.name
+            to_tier_name = policy_model.to_tier.name
+            # Index queries and store listing block, so keep them off the loop.
+            items_to_check = await asyncio.to_thread(
+                self._get_tier_items,
+                from_store,
+                metadata_store,
+                batch_size,
+                tier_name=from_tier_name,
+            )
             result.items_scanned = len(items_to_check)
 
-            # Evaluate and migrate
-            for item_info in items_to_check:
-                should_migrate = self._adapter.evaluate_policy(policy_obj, item_info)
+            # Evaluate
+            to_migrate = [
+                item_info
+                for item_info in items_to_check
+                if self._adapter.evaluate_policy(policy_obj, item_info)
+            ]
+
+            if dry_run:
+                for item_info in to_migrate:
+                    result.items_migrated += 1
+                    result.bytes_migrated += item_info.size_bytes
+                    result.migrations.append(
+                        MigrationResult(
+                            item_id=item_info.item_id,
+                            from_tier=from_tier_name,
+                            to_tier=to_tier_name,
+                            success=True,
+                            size_bytes=item_info.size_bytes,
+                        )
+                    )
+            elif to_migrate:
+                if max_workers is None:
+                    max_workers = await self._get_migration_workers()
+                engine = TierMigrationEngine(self._adapter, max_workers=max_workers)
+                migrations = await engine.migrate(
+                    [item_info.item_id for item_info in to_migrate],
+                    from_store,
+                    to_store,
+                    metadata_store,
+                    from_tier=from_tier_name,
+                    to_tier=to_tier_name,
+                )
 
-                if should_migrate:
-                    if dry_run:
+                history_rows = []
+                for migration_result in migrations:
+                    result.migrations.append(migration_result)
+                    if migration_result.success:
                         result.items_migrated += 1
-                        result.bytes_migrated += item_info.size_bytes
-                        result.migrations.append(
-                            MigrationResult(
-                                item_id=item_info.item_id,
-                                from_tier=policy_model.from_tier.name,
-                                to_tier=policy_model.to_tier.name,
-                                success=True,
-                                size_bytes=item_info.size_bytes,
-                            )
-                        )
+                        result.bytes_migrated += migration_result.size_bytes
                     else:
-                        # Execute actual migration
-                        migration_result = await self._adapter.execute_migration(
-                            item_id=item_info.item_id,
-                            from_store=from_store,
-                            to_store=to_store,
-                            metadata_store=metadata_store,
+                        result.items_failed += 1
+                        result.errors.append(
+                            f"Migration failed for {migration_result.item_id}: "
+                            f"{migration_result.error_message}"
                         )
-                        result.migrations.append(migration_result)
-
-                        if migration_result.success:
-                            result.items_migrated += 1
-                            result.bytes_migrated += migration_result.size_bytes
-
-                            # Record in history
-                            history_entry = TierMigrationHistoryModel(
-                                id=_generate_id(),
-                                policy_id=policy_id,
-                                item_id=item_info.item_id,
-                                from_tier_id=policy_model.from_tier_id,
-                                to_tier_id=policy_model.to_tier_id,
-                                size_bytes=migration_result.size_bytes,
-                                started_at=migration_result.started_at,
-                                completed_at=migration_result.completed_at,
-                                status="completed",
-                            )
-                            self._session.add(history_entry)
-                        else:
-                            result.items_failed += 1
-                            result.errors.append(
-                                f"Migration failed for {item_info.item_id}: {migration_result.error_message}"
-                            )
-
-                            # Record failure
-                            history_entry = TierMigrationHistoryModel(
-                                id=_generate_id(),
-                                policy_id=policy_id,
-                                item_id=item_info.item_id,
-                                from_tier_id=policy_model.from_tier_id,
-                                to_tier_id=policy_model.to_tier_id,
-                                size_bytes=0,
-                                started_at=migration_result.started_at,
-                                completed_at=migration_result.completed_at,
-                                status="failed",
-                                error_message=migration_result.error_message,
-                            )
-                            self._session.add(history_entry)
+                    history_rows.append(
+                        {
+                            "id": _generate_id(),
+                            "policy_id": policy_id,
+                            "item_id": migration_result.item_id,
+                            "from_tier_id": policy_model.from_tier_id,
+                            "to_tier_id": policy_model.to_tier_id,
+                            "size_bytes": (
+                                migration_result.size_bytes
+                                if migration_result.success
+                                else 0
+                            ),
+                            "started_at": migration_result.started_at,
+                            "completed_at": migration_result.completed_at,
+                            "status": (
+                                "completed" if migration_result.success else "failed"
+                            ),
+                            "error_message": migration_result.error_message,
+                        }
+                    )
+
+                # Record history in one executemany
+                await self._session.execute(
+                    insert(TierMigrationHistoryModel), history_rows
+                )
 
             if not dry_run:
                 await self._session.commit()
@@ -1102,46 +1502,96 @@ class TieringService:
         result.end_time = utc_now()
         return result
 
+    async def _get_migration_workers(self) -> int:
+        """Get the parallel migration limit from the active tiering config."""
+        from truthound_dashboard.db.models import TieringConfigModel
+
+        config = (
+            await self._session.execute(
+                select(TieringConfigModel).where(TieringConfigModel.is_active.is_(True))
+            )
+        ).scalar_one_or_none()
+        if config is None:
+            return DEFAULT_MIGRATION_WORKERS
+        return config.max_parallel_migrations if config.enable_parallel_migration else 1
+
     def _get_tier_items(
         self,
         store: Any,
         metadata_store: Any,
         limit: int,
+        tier_name: str | None = None,
     ) -> list[TierInfo]:
         """Get items in a tier with their metadata.
 
+        Indexed items come first, least recently accessed first. Index rows
+        of items the store no longer holds are deleted, so they cannot
+        crowd out real items. If the index holds fewer than ``limit`` items
+        for the tier, the store is paged for untracked IDs, which are added
+        to the index so later scans find them there.
+
         Args:
             store: Store backend.
             metadata_store: Metadata store.
             limit: Maximum items to return.
+            tier_name: Tier the store backs.
 
         Returns:
             List of TierInfo objects.
         """
-        items = []
-        tier_name = getattr(store, "name", "unknown")
+        items: list[TierInfo] = []
+        tier_name = tier_name or getattr(store, "name", "unknown")
 
         try:
-            item_ids = store.list()[:limit] if hasattr(store, "list") else []
-
-            for item_id in item_ids:
+            if hasattr(metadata_store, "least_recently_accessed"):
+                items = self._indexed_tier_items(store, metadata_store, tier_name, limit)
+            if len(items) >= limit:
+                return items
+
+            if hasattr(store, "iter_ids"):
+                item_ids: Iterable[str] = store.iter_ids()
+            elif hasattr(store, "list"):
+                item_ids = store.list()
+            else:
+                item_ids = []
+
+            seen = {info.item_id for info in items}
+            untracked = (item_id for item_id in item_ids if item_id not in seen)
+            for item_id in itertools.islice(untracked, limit - len(items)):
                 info = metadata_store.get_info(item_id)
-                if info:
-                    items.append(info)
-                else:
-                    # Create basic info if not tracked
-                    items.append(
-                        TierInfo(
-                            item_id=item_id,
-                            tier_name=tier_name,
-                            created_at=utc_now(),
-                        )
+                if info is None:
+                    # Start tracking items the index has not seen yet
+                    info = TierInfo(
+                        item_id=item_id,
+                        tier_name=tier_name,
+                        created_at=utc_now(),
                     )
+                    metadata_store.save_info(info)
+                items.append(info)
         except Exception as e:
             logger.warning(f"Failed to list tier items: {e}")
 
         return items
 
+    @staticmethod
+    def _indexed_tier_items(
+        store: Any,
+        metadata_store: Any,
+        tier_name: str,
+        limit: int,
+    ) -> list[TierInfo]:
+        """Coldest indexed items, deleting rows of items the store lacks."""
+        while True:
+            indexed = metadata_store.least_recently_accessed(tier_name, limit)
+            if not hasattr(store, "exists"):
+                return indexed
+            missing = {info.item_id for info in indexed if not store.exists(info.item_id)}
+            for item_id in missing:
+                metadata_store.delete_info(item_id)
+            if not missing or len(indexed) < limit:
+                return [info for info in indexed if info.item_id not in missing]
+            # The deleted rows freed up part of the page; read it again.
+
     async def migrate_item(
         self,
         item_id: str,
@@ -1160,15 +1610,17 @@ class TieringService:
         """
         from truthound_dashboard.db.models import TierMigrationHistoryModel
 
-        from_store = await self.get_tier_store(from_tier_id)
-        to_store = await self.get_tier_store(to_tier_id)
+        from_tier = await self.initialize_tier(from_tier_id)
+        to_tier = await self.initialize_tier(to_tier_id)
         metadata_store = self._adapter.create_metadata_store()
 
         result = await self._adapter.execute_migration(
             item_id=item_id,
-            from_store=from_store,
-            to_store=to_store,
+            from_store=self._tier_stores[from_tier_id],
+            to_store=self._tier_stores[to_tier_id],
             metadata_store=metadata_store,
+            from_tier=getattr(from_tier, "name", None),
+            to_tier=getattr(to_tier, "name", None),
         )
 
         # Record in history
@@ -1199,16 +1651,19 @@ class TieringService:
             item_id: Accessed item ID.
             tier_id: Current tier ID.
         """
+        from truthound_dashboard.db.models import StorageTierModel
+
         metadata_store = self._adapter.create_metadata_store()
 
         info = metadata_store.get_info(item_id)
         if info:
             metadata_store.update_access(item_id)
         else:
-            # Create new tracking entry
+            # Create new tracking entry, keyed by tier name like migrations
+            tier = await self._session.get(StorageTierModel, tier_id)
             info = TierInfo(
                 item_id=item_id,
-                tier_name=tier_id,
+                tier_name=tier.name if tier else tier_id,
                 created_at=utc_now(),
                 access_count=1,
                 last_accessed=utc_now(),
@@ -1231,17 +1686,22 @@ class TieringService:
 
         # Get active config
         config_result = await self._session.execute(
-            select(TieringConfigModel).where(TieringConfigModel.is_active == True)
+            select(TieringConfigModel).where(TieringConfigModel.is_active.is_(True))
         )
         config = config_result.scalar_one_or_none()
 
         batch_size = config.batch_size if config else 100
+        max_workers = None
+        if config is not None:
+            max_workers = (
+                config.max_parallel_migrations if config.enable_parallel_migration else 1
+            )
 
         # Get active policies
         policies_result = await self._session.execute(
             select(TierPolicyModel)
-            .where(TierPolicyModel.is_active == True)
-            .where(TierPolicyModel.parent_id == None)  # Only root policies
+            .where(TierPolicyModel.is_active.is_(True))
+            .where(TierPolicyModel.parent_id.is_(None))  # Only root policies
             .order_by(TierPolicyModel.priority)
         )
         policies = policies_result.scalars().all()
@@ -1252,6 +1712,7 @@ class TieringService:
                     policy_id=policy.id,
                     dry_run=False,
                     batch_size=batch_size,
+                    max_workers=max_workers,
                 )
                 results.append(result)
             except Exception as e:
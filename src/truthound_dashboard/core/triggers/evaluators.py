@@ -281,6 +281,11 @@ class DataChangeTrigger(BaseTrigger):
         change_threshold: Minimum change percentage (0.0-1.0)
         metrics: List of metrics to monitor
         check_interval_minutes: How often to check
+        change_probe: Skip re-profiling when a cheap probe sees no change
+            (default True, see core.change_probes)
+        change_column: SQL column whose maximum advances on every write
+        checksum_column: SQL column aggregated into a content checksum
+        checksum_aggregate: Aggregate applied to checksum_column (default sum)
     """
 
     DEFAULT_METRICS = ["row_count", "null_percentage", "distinct_count"]
@@ -6,6 +6,7 @@ updates to connected clients.
 Features:
     - Connection management (track active connections, handle disconnects)
     - Room-based broadcasting for targeted updates
+    - Per-connection send queues so slow clients never delay others
     - Heartbeat/ping-pong for connection health
     - Optional token-based authentication
     - Support for multiple concurrent clients
@@ -27,8 +28,10 @@ Example:
 """
 
 from .manager import (
+    SlowConsumerPolicy,
     WebSocketConnection,
     WebSocketManager,
+    encode_message,
     get_websocket_manager,
     reset_websocket_manager,
 )
@@ -44,8 +47,10 @@ from .messages import (
 
 __all__ = [
     # Manager
+    "SlowConsumerPolicy",
     "WebSocketConnection",
     "WebSocketManager",
+    "encode_message",
     "get_websocket_manager",
     "reset_websocket_manager",
     # Messages
@@ -7,9 +7,14 @@ including connection tracking, room-based broadcasting, and health checks.
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import json
 import logging
+from collections import deque
+from collections.abc import Callable, Hashable
 from dataclasses import dataclass, field
 from datetime import datetime
+from enum import Enum, StrEnum
 from typing import Any
 
 from fastapi import WebSocket, WebSocketDisconnect
@@ -19,10 +24,45 @@ from truthound_dashboard.time import utc_now
 
 logger = logging.getLogger(__name__)
 
+# High-frequency message types whose pending copies are merged per entity.
+DEFAULT_COALESCE_FIELDS: dict[str, str] = {
+    WebSocketMessageType.STREAMING_STATS.value: "session_id",
+    WebSocketMessageType.ARTIFACT_BUILD_PROGRESS.value: "artifact_id",
+}
+
+
+class SlowConsumerPolicy(StrEnum):
+    """What to do when a client's send queue is full."""
+
+    DROP_OLDEST = "drop_oldest"
+    DROP_NEWEST = "drop_newest"
+    DISCONNECT = "disconnect"
+
+
+def encode_message(message: WebSocketMessage | dict[str, Any]) -> str:
+    """Serialize a message to the JSON text frame sent to clients.
+
+    Args:
+        message: Message to serialize.
+
+    Returns:
+        Compact JSON text, encoded the same way as ``WebSocket.send_json``.
+    """
+    data = message.to_json() if isinstance(message, WebSocketMessage) else message
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False, default=str)
+
 
 @dataclass
 class WebSocketConnection:
-    """Represents a WebSocket connection with metadata."""
+    """Represents a WebSocket connection with metadata.
+
+    Outgoing frames go through a bounded queue drained by a dedicated
+    writer task, so a slow client only ever delays itself. When the queue
+    is full the ``policy`` decides whether to drop the oldest frame, drop
+    the new one, or disconnect the client. Frames queued with a coalesce
+    key replace a still-pending frame with the same key instead of queuing
+    another one.
+    """
 
     websocket: WebSocket
     connection_id: str
@@ -31,35 +71,133 @@ class WebSocketConnection:
     last_ping: datetime | None = None
     client_info: dict[str, Any] = field(default_factory=dict)
     token: str | None = None
+    max_queue_size: int = 256
+    policy: SlowConsumerPolicy = SlowConsumerPolicy.DROP_OLDEST
+    send_timeout: float = 10.0
+    sent_count: int = 0
+    dropped_count: int = 0
+    coalesced_count: int = 0
+
+    # (payload, None) for plain frames, (None, key) for coalesced frames.
+    _outbox: deque[tuple[str | None, Hashable | None]] = field(default_factory=deque)
+    _coalesced: dict[Hashable, str] = field(default_factory=dict)
+    _ready: asyncio.Event = field(default_factory=asyncio.Event)
+    _writer: asyncio.Task | None = None
+    _on_failure: Callable[[str], None] | None = None
+    closed: bool = False
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of frames waiting to be sent."""
+        return len(self._outbox)
+
+    def start_writer(self, on_failure: Callable[[str], None] | None = None) -> None:
+        """Start the background writer task.
+
+        Args:
+            on_failure: Called with a reason when the client must be dropped.
+        """
+        self._on_failure = on_failure
+        if self._writer is None:
+            self._writer = asyncio.create_task(self._write_loop())
+
+    async def stop_writer(self) -> None:
+        """Stop the writer task; pending frames are discarded."""
+        self.closed = True
+        writer, self._writer = self._writer, None
+        if writer is not None and writer is not asyncio.current_task():
+            writer.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await writer
+
+    def enqueue(self, payload: str, coalesce_key: Hashable | None = None) -> bool:
+        """Queue a pre-serialized frame without waiting for the client.
+
+        Args:
+            payload: JSON text frame.
+            coalesce_key: Frames with the same key replace each other while
+                still queued.
+
+        Returns:
+            False if the connection is closed or was dropped by policy.
+        """
+        if self.closed:
+            return False
+
+        if coalesce_key is not None and coalesce_key in self._coalesced:
+            self._coalesced[coalesce_key] = payload
+            self.coalesced_count += 1
+            return True
+
+        if len(self._outbox) >= self.max_queue_size:
+            if self.policy is SlowConsumerPolicy.DISCONNECT:
+                self._fail("Slow consumer")
+                return False
+            self.dropped_count += 1
+            if self.policy is SlowConsumerPolicy.DROP_NEWEST:
+                return True
+            _, dropped_key = self._outbox.popleft()
+            if dropped_key is not None:
+                del self._coalesced[dropped_key]
+
+        if coalesce_key is not None:
+            self._coalesced[coalesce_key] = payload
+            self._outbox.append((None, coalesce_key))
+        else:
+            self._outbox.append((payload, None))
+        self._ready.set()
+        return True
 
     async def send_json(self, data: dict[str, Any]) -> bool:
-        """Send JSON data to the client.
+        """Queue JSON data for the client.
 
         Args:
             data: Data to send.
 
         Returns:
-            True if sent successfully, False otherwise.
+            True if queued, False if the connection is closed.
         """
-        try:
-            await self.websocket.send_json(data)
-            return True
-        except Exception as e:
-            logger.warning(
-                f"Failed to send message to connection {self.connection_id}: {e}"
-            )
-            return False
+        return self.enqueue(encode_message(data))
 
     async def send_message(self, message: WebSocketMessage) -> bool:
-        """Send a WebSocket message to the client.
+        """Queue a WebSocket message for the client.
 
         Args:
             message: Message to send.
 
         Returns:
-            True if sent successfully, False otherwise.
+            True if queued, False if the connection is closed.
         """
-        return await self.send_json(message.to_json())
+        return self.enqueue(encode_message(message))
+
+    async def _write_loop(self) -> None:
+        """Drain the outbox to the socket, one frame at a time."""
+        try:
+            while not self.closed:
+                if not self._outbox:
+                    self._ready.clear()
+                    await self._ready.wait()
+                    continue
+                payload, key = self._outbox.popleft()
+                if key is not None:
+                    payload = self._coalesced.pop(key)
+                async with asyncio.timeout(self.send_timeout):
+                    await self.websocket.send_text(payload)
+                self.sent_count += 1
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(
+                f"Failed to send message to connection {self.connection_id}: {e}"
+            )
+            self._fail("Send failed")
+
+    def _fail(self, reason: str) -> None:
+        if self.closed:
+            return
+        self.closed = True
+        if self._on_failure is not None:
+            self._on_failure(reason)
 
 
 class WebSocketManager:
@@ -67,7 +205,9 @@ class WebSocketManager:
 
     Features:
         - Connection tracking
-        - Room-based broadcasting
+        - Room-based broadcasting, serialized once per message
+        - Per-connection bounded send queues with a slow-consumer policy
+        - Coalescing of high-frequency updates (e.g. streaming statistics)
         - Heartbeat/ping-pong
         - Graceful disconnection handling
         - Thread-safe operations
@@ -95,20 +235,38 @@ class WebSocketManager:
         self,
         ping_interval: float = 30.0,
         ping_timeout: float = 10.0,
+        max_queue_size: int = 256,
+        slow_consumer_policy: SlowConsumerPolicy = SlowConsumerPolicy.DROP_OLDEST,
+        send_timeout: float = 10.0,
+        coalesce_fields: dict[str, str] | None = None,
     ) -> None:
         """Initialize the WebSocket manager.
 
         Args:
             ping_interval: Interval between heartbeat pings (seconds).
             ping_timeout: Timeout for ping response (seconds).
+            max_queue_size: Per-connection send queue bound.
+            slow_consumer_policy: What to do when a client's queue is full.
+            send_timeout: Seconds a single send may block before the client
+                is disconnected.
+            coalesce_fields: Message type -> data field identifying the
+                entity it describes. Pending messages of these types for the
+                same entity are replaced by the newest one.
         """
         self._connections: dict[str, WebSocketConnection] = {}
         self._rooms: dict[str, set[str]] = {}
         self._lock = asyncio.Lock()
         self._ping_interval = ping_interval
         self._ping_timeout = ping_timeout
+        self._max_queue_size = max_queue_size
+        self._slow_consumer_policy = slow_consumer_policy
+        self._send_timeout = send_timeout
+        self._coalesce_fields = (
+            dict(DEFAULT_COALESCE_FIELDS) if coalesce_fields is None else coalesce_fields
+        )
         self._heartbeat_task: asyncio.Task | None = None
         self._running = False
+        self._dropped_connections = 0
 
     @property
     def connection_count(self) -> int:
@@ -139,10 +297,8 @@ class WebSocketManager:
         # Cancel heartbeat task
         if self._heartbeat_task:
             self._heartbeat_task.cancel()
-            try:
+            with contextlib.suppress(asyncio.CancelledError):
                 await self._heartbeat_task
-            except asyncio.CancelledError:
-                pass
             self._heartbeat_task = None
 
         # Disconnect all clients
@@ -174,10 +330,16 @@ class WebSocketManager:
             websocket=websocket,
             connection_id=connection_id,
             token=token,
+            max_queue_size=self._max_queue_size,
+            policy=self._slow_consumer_policy,
+            send_timeout=self._send_timeout,
         )
 
         async with self._lock:
             self._connections[connection_id] = connection
+        connection.start_writer(
+            lambda reason: self._drop_connection(connection_id, reason)
+        )
 
         logger.info(f"WebSocket connected: {connection_id}")
 
@@ -217,11 +379,11 @@ class WebSocketManager:
                     if not self._rooms[room]:
                         del self._rooms[room]
 
+        await connection.stop_writer()
+
         # Try to close gracefully
-        try:
+        with contextlib.suppress(Exception):
             await connection.websocket.close()
-        except Exception:
-            pass
 
         logger.info(f"WebSocket disconnected: {connection_id} ({reason})")
 
@@ -271,41 +433,17 @@ class WebSocketManager:
     ) -> int:
         """Broadcast a message to all connected clients.
 
+        The message is serialized once and queued on every connection; the
+        call never waits for a client.
+
         Args:
             message: Message to broadcast.
             exclude: Set of connection IDs to exclude.
 
         Returns:
-            Number of clients that received the message.
+            Number of clients the message was queued for.
         """
-        exclude = exclude or set()
-
-        if isinstance(message, WebSocketMessage):
-            data = message.to_json()
-        else:
-            data = message
-
-        sent_count = 0
-        failed_connections: list[str] = []
-
-        async with self._lock:
-            connections = list(self._connections.items())
-
-        for conn_id, connection in connections:
-            if conn_id in exclude:
-                continue
-
-            success = await connection.send_json(data)
-            if success:
-                sent_count += 1
-            else:
-                failed_connections.append(conn_id)
-
-        # Clean up failed connections
-        for conn_id in failed_connections:
-            await self.disconnect(conn_id, reason="Send failed")
-
-        return sent_count
+        return self._fan_out(list(self._connections), message, exclude)
 
     async def broadcast_to_room(
         self,
@@ -321,42 +459,9 @@ class WebSocketManager:
             exclude: Set of connection IDs to exclude.
 
         Returns:
-            Number of clients that received the message.
+            Number of clients the message was queued for.
         """
-        exclude = exclude or set()
-
-        if isinstance(message, WebSocketMessage):
-            data = message.to_json()
-        else:
-            data = message
-
-        async with self._lock:
-            connection_ids = self._rooms.get(room, set()).copy()
-
-        sent_count = 0
-        failed_connections: list[str] = []
-
-        for conn_id in connection_ids:
-            if conn_id in exclude:
-                continue
-
-            async with self._lock:
-                connection = self._connections.get(conn_id)
-
-            if not connection:
-                continue
-
-            success = await connection.send_json(data)
-            if success:
-                sent_count += 1
-            else:
-                failed_connections.append(conn_id)
-
-        # Clean up failed connections
-        for conn_id in failed_connections:
-            await self.disconnect(conn_id, reason="Send failed")
-
-        return sent_count
+        return self._fan_out(list(self._rooms.get(room, ())), message, exclude)
 
     async def send_to_connection(
         self,
@@ -370,24 +475,50 @@ class WebSocketManager:
             message: Message to send.
 
         Returns:
-            True if sent successfully, False otherwise.
+            True if queued, False otherwise.
         """
-        async with self._lock:
-            connection = self._connections.get(connection_id)
+        return self._fan_out([connection_id], message, None) == 1
 
-        if not connection:
-            return False
+    def room_size(self, room: str) -> int:
+        """Number of connections in a room (cheap check before building a message)."""
+        return len(self._rooms.get(room, ()))
 
-        if isinstance(message, WebSocketMessage):
-            data = message.to_json()
-        else:
-            data = message
-
-        success = await connection.send_json(data)
-        if not success:
-            await self.disconnect(connection_id, reason="Send failed")
+    def _fan_out(
+        self,
+        connection_ids: list[str],
+        message: WebSocketMessage | dict[str, Any],
+        exclude: set[str] | None,
+    ) -> int:
+        """Serialize ``message`` once and queue it on each connection."""
+        data = message.to_json() if isinstance(message, WebSocketMessage) else message
+        payload = encode_message(data)
+        coalesce_key = self._coalesce_key(data)
 
-        return success
+        queued = 0
+        for conn_id in connection_ids:
+            if exclude and conn_id in exclude:
+                continue
+            connection = self._connections.get(conn_id)
+            if connection is not None and connection.enqueue(payload, coalesce_key):
+                queued += 1
+        return queued
+
+    def _coalesce_key(self, data: dict[str, Any]) -> Hashable | None:
+        """Key under which pending copies of this message are merged."""
+        message_type = data.get("type")
+        if isinstance(message_type, Enum):
+            message_type = message_type.value
+        field_name = self._coalesce_fields.get(message_type)
+        if field_name is None:
+            return None
+        return (message_type, (data.get("data") or {}).get(field_name))
+
+    def _drop_connection(self, connection_id: str, reason: str) -> None:
+        """Disconnect a client that failed or fell too far behind."""
+        self._dropped_connections += 1
+        asyncio.get_running_loop().create_task(
+            self.disconnect(connection_id, reason=reason)
+        )
 
     async def _heartbeat_loop(self) -> None:
         """Background task for sending heartbeat pings."""
@@ -399,18 +530,16 @@ class WebSocketManager:
                     break
 
                 # Send ping to all connections
-                async with self._lock:
-                    connections = list(self._connections.values())
-
-                ping_message = WebSocketMessage(
-                    type=WebSocketMessageType.PING,
-                    data={"server_time": utc_now().isoformat()},
+                now = utc_now()
+                for connection in self._connections.values():
+                    connection.last_ping = now
+                await self.broadcast(
+                    WebSocketMessage(
+                        type=WebSocketMessageType.PING,
+                        data={"server_time": now.isoformat()},
+                    )
                 )
 
-                for connection in connections:
-                    connection.last_ping = utc_now()
-                    await connection.send_message(ping_message)
-
             except asyncio.CancelledError:
                 break
             except Exception as e:
@@ -478,6 +607,8 @@ class WebSocketManager:
         Returns:
             Dictionary with status information.
         """
+        connections = list(self._connections.values())
+        depths = [conn.queue_depth for conn in connections]
         return {
             "running": self._running,
             "connection_count": self.connection_count,
@@ -485,6 +616,16 @@ class WebSocketManager:
             "rooms": {room: len(conns) for room, conns in self._rooms.items()},
             "ping_interval": self._ping_interval,
             "ping_timeout": self._ping_timeout,
+            "send_queues": {
+                "max_size": self._max_queue_size,
+                "slow_consumer_policy": self._slow_consumer_policy.value,
+                "total_depth": sum(depths),
+                "max_depth": max(depths, default=0),
+                "sent": sum(conn.sent_count for conn in connections),
+                "dropped": sum(conn.dropped_count for conn in connections),
+                "coalesced": sum(conn.coalesced_count for conn in connections),
+                "dropped_connections": self._dropped_connections,
+            },
         }
 
 
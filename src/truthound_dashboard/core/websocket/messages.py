@@ -14,7 +14,7 @@ from truthound_dashboard.time import utc_now
 
 
 class WebSocketMessageType(str, Enum):
-    """WebSocket message types for escalation incidents."""
+    """WebSocket message types for incidents, anomaly detection and artifacts."""
 
     # Connection lifecycle
     CONNECTED = "connected"
@@ -31,6 +31,17 @@ class WebSocketMessageType(str, Enum):
     INCIDENT_ACKNOWLEDGED = "incident_acknowledged"
     INCIDENT_ESCALATED = "incident_escalated"
 
+    # Anomaly batch events
+    ANOMALY_BATCH_PROGRESS = "anomaly_batch_progress"
+    ANOMALY_BATCH_COMPLETED = "anomaly_batch_completed"
+
+    # Streaming anomaly events
+    STREAMING_STATS = "streaming_stats"
+
+    # Artifact build events
+    ARTIFACT_BUILD_PROGRESS = "artifact_build_progress"
+    ARTIFACT_BUILD_COMPLETED = "artifact_build_completed"
+
 
 class WebSocketMessage(BaseModel):
     """Base WebSocket message schema."""
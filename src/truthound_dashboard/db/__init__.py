@@ -49,6 +49,7 @@ from .models import (
     NotificationRule,
     PIIScan,
     Profile,
+    ProfileColumnMetric,
     Rule,
     Schedule,
     Schema,
@@ -100,6 +101,7 @@ __all__ = [
     "Rule",
     "Validation",
     "Profile",
+    "ProfileColumnMetric",
     "Schedule",
     "DriftComparison",
     "DataMask",
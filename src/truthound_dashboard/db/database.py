@@ -1214,6 +1214,184 @@ async def _migration_workspace_scope_and_queues(conn: AsyncConnection) -> None:
             )
 
 
+async def _migration_result_cache_columns(conn: AsyncConnection) -> None:
+    columns = [
+        ("validations", "cache_key", "VARCHAR(64)", None),
+        ("validations", "cache_hit", "BOOLEAN NOT NULL", False),
+        ("profiles", "cache_key", "VARCHAR(64)", None),
+    ]
+    for table_name, column_name, column_type, default in columns:
+        await _ensure_column(conn, table_name, column_name, column_type, default)
+
+    for table_name in ("validations", "profiles"):
+        if await _table_exists(conn, table_name):
+            await conn.execute(
+                text(
+                    f"CREATE INDEX IF NOT EXISTS ix_{table_name}_cache_key "
+                    f"ON {table_name} (cache_key)"
+                )
+            )
+
+
+async def _migration_profile_column_metrics(conn: AsyncConnection) -> None:
+    from .models import ProfileColumnMetric
+
+    if not await _table_exists(conn, "profiles"):
+        return
+    await conn.execute(
+        text(
+            "CREATE INDEX IF NOT EXISTS idx_profiles_source_created "
+            "ON profiles (source_id, created_at)"
+        )
+    )
+    if not await _table_exists(conn, "profile_column_metrics"):
+        return
+
+    insert = text(
+        """
+        INSERT INTO profile_column_metrics (
+            id, source_id, profile_id, column_name, ts,
+            null_pct, unique_pct, min_value, max_value, mean
+        ) VALUES (
+            :id, :source_id, :profile_id, :column_name, :ts,
+            :null_pct, :unique_pct, :min_value, :max_value, :mean
+        )
+        """
+    )
+    last_id = ""
+    while True:
+        rows = (
+            await conn.execute(
+                text(
+                    """
+                    SELECT id, source_id, created_at, profile_json
+                    FROM profiles
+                    WHERE id > :last_id
+                      AND id NOT IN (SELECT profile_id FROM profile_column_metrics)
+                    ORDER BY id
+                    LIMIT 500
+                    """
+                ),
+                {"last_id": last_id},
+            )
+        ).fetchall()
+        if not rows:
+            return
+        values = []
+        for profile_id, source_id, created_at, profile_json in rows:
+            values.extend(
+                {"id": str(uuid.uuid4()), **value}
+                for value in ProfileColumnMetric.values_for_profile(
+                    profile_id, source_id, created_at, _json_dict(profile_json)
+                )
+            )
+        if values:
+            await conn.execute(insert, values)
+        last_id = rows[-1][0]
+
+
+INCIDENT_SEARCH_TABLE = "escalation_incidents_fts"
+
+
+def _incident_search_values(row: str) -> str:
+    """FTS column values for an incident row, with the alert defaults."""
+    return (
+        f"COALESCE(NULLIF(json_extract({row}.context, '$.title'), ''), "
+        f"'Incident ' || {row}.incident_ref), "
+        f"COALESCE(NULLIF(json_extract({row}.context, '$.message'), ''), "
+        "'Escalation incident requires attention'), "
+        f"{row}.source_name, {row}.incident_ref"
+    )
+
+
+async def _migration_incident_query_indexes(conn: AsyncConnection) -> None:
+    from .models import (
+        INCIDENT_ALERT_SOURCE_SQL,
+        INCIDENT_SEVERITY_SQL,
+        INCIDENT_SOURCE_NAME_SQL,
+    )
+
+    if not await _table_exists(conn, "escalation_incidents"):
+        return
+
+    # table_info hides generated columns; table_xinfo lists them too.
+    result = await conn.execute(text("PRAGMA table_xinfo(escalation_incidents)"))
+    columns = {row[1] for row in result.fetchall()}
+    generated = [
+        ("alert_source", "VARCHAR(32)", INCIDENT_ALERT_SOURCE_SQL),
+        ("severity", "VARCHAR(16)", INCIDENT_SEVERITY_SQL),
+        ("source_name", "VARCHAR(255)", INCIDENT_SOURCE_NAME_SQL),
+    ]
+    for column_name, column_type, expression in generated:
+        if column_name not in columns:
+            await conn.execute(
+                text(
+                    f"ALTER TABLE escalation_incidents ADD COLUMN {column_name} "
+                    f"{column_type} GENERATED ALWAYS AS ({expression}) VIRTUAL"
+                )
+            )
+
+    indexes = {
+        "idx_escalation_incidents_workspace_created": "workspace_id, created_at, id",
+        "idx_escalation_incidents_queue_created": "queue_id, created_at",
+        "idx_escalation_incidents_source_name_created": "source_name, created_at",
+        "idx_escalation_incidents_severity": "severity",
+        "idx_escalation_incidents_alert_source": "alert_source",
+    }
+    for index_name, index_columns in indexes.items():
+        await conn.execute(
+            text(
+                f"CREATE INDEX IF NOT EXISTS {index_name} "
+                f"ON escalation_incidents ({index_columns})"
+            )
+        )
+
+    # Trigram tokens keep search a case-insensitive substring match.
+    try:
+        await conn.execute(
+            text(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {INCIDENT_SEARCH_TABLE} USING fts5("
+                "title, message, source_name, incident_ref, tokenize='trigram')"
+            )
+        )
+    except Exception as exc:  # SQLite built without FTS5
+        logger.warning("Incident search index unavailable: %s", exc)
+        return
+
+    insert_row = (
+        f"INSERT INTO {INCIDENT_SEARCH_TABLE} "
+        "(rowid, title, message, source_name, incident_ref) "
+    )
+    triggers = {
+        "escalation_incidents_fts_insert": (
+            "AFTER INSERT ON escalation_incidents",
+            f"{insert_row} VALUES (new.rowid, {_incident_search_values('new')});",
+        ),
+        "escalation_incidents_fts_update": (
+            "AFTER UPDATE OF context, incident_ref ON escalation_incidents",
+            f"DELETE FROM {INCIDENT_SEARCH_TABLE} WHERE rowid = old.rowid; "
+            f"{insert_row} VALUES (new.rowid, {_incident_search_values('new')});",
+        ),
+        "escalation_incidents_fts_delete": (
+            "AFTER DELETE ON escalation_incidents",
+            f"DELETE FROM {INCIDENT_SEARCH_TABLE} WHERE rowid = old.rowid;",
+        ),
+    }
+    for trigger_name, (event, body) in triggers.items():
+        await conn.execute(
+            text(f"CREATE TRIGGER IF NOT EXISTS {trigger_name} {event} BEGIN {body} END")
+        )
+
+    await conn.execute(text(f"DELETE FROM {INCIDENT_SEARCH_TABLE}"))
+    await conn.execute(
+        text(
+            f"{insert_row} SELECT incidents.rowid, "
+            f"{_incident_search_values('incidents')} "
+            "FROM escalation_incidents AS incidents"
+        )
+    )
+
+
 MIGRATIONS: list[tuple[str, str, MigrationFn]] = [
     (
         "20260322_001_legacy_backfills_and_cleanup",
@@ -1250,6 +1428,21 @@ MIGRATIONS: list[tuple[str, str, MigrationFn]] = [
         "Drop legacy generated_reports and remove roles.permissions legacy column",
         _migration_cutover_cleanup,
     ),
+    (
+        "20261018_001_result_cache_columns",
+        "Add content-fingerprint cache keys to validations and profiles",
+        _migration_result_cache_columns,
+    ),
+    (
+        "20261018_002_profile_column_metrics",
+        "Index profiles by source and time and backfill per-column metrics",
+        _migration_profile_column_metrics,
+    ),
+    (
+        "20261018_003_incident_query_indexes",
+        "Generated incident alert columns, query indexes and FTS5 search",
+        _migration_incident_query_indexes,
+    ),
 ]
 
 
@@ -1270,6 +1463,9 @@ async def _run_migrations(engine: AsyncEngine) -> None:
 async def init_db(engine: AsyncEngine | None = None) -> None:
     target_engine = engine or get_engine()
     async with target_engine.begin() as conn:
+        # Only takes effect on a new, empty database. Existing databases are
+        # switched over by MaintenanceManager.vacuum.
+        await conn.execute(text("PRAGMA auto_vacuum = INCREMENTAL"))
         await conn.run_sync(Base.metadata.create_all)
 
     await _run_migrations(target_engine)
@@ -1279,6 +1475,10 @@ async def drop_db(engine: AsyncEngine | None = None) -> None:
     target_engine = engine or get_engine()
     async with target_engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
+        # Tables created by migrations; dropping the registry lets init_db
+        # rebuild them.
+        await conn.execute(text(f"DROP TABLE IF EXISTS {INCIDENT_SEARCH_TABLE}"))
+        await conn.execute(text("DROP TABLE IF EXISTS schema_migrations"))
 
 
 async def reset_db(engine: AsyncEngine | None = None) -> None:
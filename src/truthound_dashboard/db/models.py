@@ -10,6 +10,7 @@ from enum import Enum
 from sqlalchemy import (
     JSON,
     Boolean,
+    Computed,
     DateTime,
     Enum as SQLEnum,
     Float,
@@ -19,7 +20,7 @@ from sqlalchemy import (
     String,
     Text,
 )
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, backref, mapped_column, relationship
 
 
 from .base import Base, TimestampMixin, UUIDMixin
@@ -390,6 +391,8 @@ class Validation(Base, UUIDMixin):
         total_issues: Total number of issues found.
         result_json: Full validation result as JSON.
         duration_ms: Validation duration in milliseconds.
+        cache_key: Content fingerprint + parameter hash of the run.
+        cache_hit: Whether the result was served from a previous run.
     """
 
     __tablename__ = "validations"
@@ -433,6 +436,10 @@ class Validation(Base, UUIDMixin):
     error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
     duration_ms: Mapped[int | None] = mapped_column(Integer, nullable=True)
 
+    # Result cache
+    cache_key: Mapped[str | None] = mapped_column(String(64), nullable=True, index=True)
+    cache_hit: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
         DateTime, default=utc_now, nullable=False
@@ -504,10 +511,15 @@ class Profile(Base, UUIDMixin, TimestampMixin):
         row_count: Number of rows profiled.
         column_count: Number of columns.
         size_bytes: Data size in bytes.
+        cache_key: Content fingerprint + parameter hash of the run.
     """
 
     __tablename__ = "profiles"
 
+    __table_args__ = (
+        Index("idx_profiles_source_created", "source_id", "created_at"),
+    )
+
     source_id: Mapped[str] = mapped_column(
         String(36),
         ForeignKey("sources.id", ondelete="CASCADE"),
@@ -518,9 +530,15 @@ class Profile(Base, UUIDMixin, TimestampMixin):
     row_count: Mapped[int | None] = mapped_column(Integer, nullable=True)
     column_count: Mapped[int | None] = mapped_column(Integer, nullable=True)
     size_bytes: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    cache_key: Mapped[str | None] = mapped_column(String(64), nullable=True, index=True)
 
     # Relationships
     source: Mapped[Source] = relationship("Source", back_populates="profiles")
+    column_metrics: Mapped[list[ProfileColumnMetric]] = relationship(
+        "ProfileColumnMetric",
+        back_populates="profile",
+        cascade="all, delete-orphan",
+    )
 
     @property
     def columns(self) -> list[dict[str, Any]]:
@@ -530,6 +548,127 @@ class Profile(Base, UUIDMixin, TimestampMixin):
         return []
 
 
+def _metric_percentage(column: dict[str, Any], pct_key: str, ratio_key: str) -> float:
+    """Read a percentage from a "25.5%" string or a 0-1 ratio."""
+    value = column.get(pct_key)
+    if isinstance(value, str):
+        try:
+            return float(value.replace("%", ""))
+        except ValueError:
+            return 0.0
+    ratio = column.get(ratio_key)
+    if isinstance(ratio, (int, float)) and not isinstance(ratio, bool):
+        return float(ratio) * 100
+    return 0.0
+
+
+def _metric_number(column: dict[str, Any], key: str) -> float | None:
+    """Read a numeric statistic from a column or its distribution."""
+    value = column.get(key)
+    if value is None and isinstance(column.get("distribution"), dict):
+        value = column["distribution"].get(key)
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            return float(value)
+        except ValueError:
+            return None
+    return None
+
+
+class ProfileColumnMetric(Base, UUIDMixin):
+    """Per-column metrics of a profile, stored as a time series.
+
+    One row per profiled column, written when the profile is saved, so
+    trend queries are indexed range scans instead of reloading and
+    re-parsing every profile_json.
+
+    Attributes:
+        id: Unique identifier (UUID).
+        source_id: Reference to the profiled Source.
+        profile_id: Reference to the Profile the metrics came from.
+        column_name: Column name.
+        ts: Profile creation time.
+        null_pct: Null percentage (0-100).
+        unique_pct: Unique percentage (0-100).
+        min_value: Minimum, for numeric columns.
+        max_value: Maximum, for numeric columns.
+        mean: Mean, for numeric columns.
+    """
+
+    __tablename__ = "profile_column_metrics"
+
+    __table_args__ = (
+        Index("idx_profile_column_metrics_source_ts", "source_id", "ts"),
+        Index(
+            "idx_profile_column_metrics_source_column_ts",
+            "source_id",
+            "column_name",
+            "ts",
+        ),
+    )
+
+    source_id: Mapped[str] = mapped_column(
+        String(36),
+        ForeignKey("sources.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    profile_id: Mapped[str] = mapped_column(
+        String(36),
+        ForeignKey("profiles.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    column_name: Mapped[str] = mapped_column(String(255), nullable=False)
+    ts: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    null_pct: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    unique_pct: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    min_value: Mapped[float | None] = mapped_column(Float, nullable=True)
+    max_value: Mapped[float | None] = mapped_column(Float, nullable=True)
+    mean: Mapped[float | None] = mapped_column(Float, nullable=True)
+
+    # Relationships
+    profile: Mapped[Profile] = relationship("Profile", back_populates="column_metrics")
+
+    @staticmethod
+    def values_for_profile(
+        profile_id: str,
+        source_id: str,
+        ts: datetime,
+        profile_json: dict[str, Any] | None,
+    ) -> list[dict[str, Any]]:
+        """Build metric rows for every column of a profile.
+
+        Args:
+            profile_id: Profile ID.
+            source_id: Source ID.
+            ts: Profile creation time.
+            profile_json: Stored profile result.
+
+        Returns:
+            Column values ready for a bulk insert.
+        """
+        columns = (profile_json or {}).get("columns") or []
+        return [
+            {
+                "profile_id": profile_id,
+                "source_id": source_id,
+                "column_name": str(column.get("name", "")),
+                "ts": ts,
+                "null_pct": _metric_percentage(column, "null_pct", "null_ratio"),
+                "unique_pct": _metric_percentage(column, "unique_pct", "unique_ratio"),
+                "min_value": _metric_number(column, "min"),
+                "max_value": _metric_number(column, "max"),
+                "mean": _metric_number(column, "mean"),
+            }
+            for column in columns
+            if isinstance(column, dict)
+        ]
+
+
 class Schedule(Base, UUIDMixin, TimestampMixin):
     """Validation schedule model.
 
@@ -1583,6 +1722,27 @@ class EscalationPolicyModel(Base, UUIDMixin, TimestampMixin):
         return len(self.levels) if self.levels else 0
 
 
+def _json_choice(path: str, choices: tuple[str, ...], default: str) -> str:
+    """SQL for a JSON context field restricted to known values."""
+    value = f"json_extract(context, '{path}')"
+    options = ", ".join(f"'{choice}'" for choice in choices)
+    return f"CASE WHEN {value} IN ({options}) THEN {value} ELSE '{default}' END"
+
+
+# Alert fields derived from the incident context, mirroring the defaults of
+# IncidentService._incident_to_alert (AlertSource / AlertSeverity values).
+INCIDENT_ALERT_SOURCE_SQL = _json_choice(
+    "$.source", ("anomaly", "validation"), "validation"
+)
+INCIDENT_SEVERITY_SQL = _json_choice(
+    "$.severity", ("critical", "high", "medium", "low", "info"), "medium"
+)
+INCIDENT_SOURCE_NAME_SQL = (
+    "COALESCE(NULLIF(json_extract(context, '$.source_name'), ''), "
+    "NULLIF(json_extract(context, '$.source_label'), ''), 'Incident')"
+)
+
+
 class EscalationIncidentModel(Base, UUIDMixin):
     """Escalation incident model.
 
@@ -1602,6 +1762,9 @@ class EscalationIncidentModel(Base, UUIDMixin):
         resolved_at: When resolved.
         events: JSON array of state transition events.
         next_escalation_at: When next escalation will occur.
+        alert_source: Alert source from the context (generated, read-only).
+        severity: Alert severity from the context (generated, read-only).
+        source_name: Source name from the context (generated, read-only).
     """
 
     __tablename__ = "escalation_incidents"
@@ -1615,6 +1778,18 @@ class EscalationIncidentModel(Base, UUIDMixin):
         Index("idx_escalation_incidents_assignee", "assignee_user_id"),
         Index("idx_escalation_incidents_created_at", "created_at"),
         Index("idx_escalation_incidents_state_created", "state", "created_at"),
+        Index(
+            "idx_escalation_incidents_workspace_created",
+            "workspace_id",
+            "created_at",
+            "id",
+        ),
+        Index("idx_escalation_incidents_queue_created", "queue_id", "created_at"),
+        Index(
+            "idx_escalation_incidents_source_name_created", "source_name", "created_at"
+        ),
+        Index("idx_escalation_incidents_severity", "severity"),
+        Index("idx_escalation_incidents_alert_source", "alert_source"),
     )
 
     policy_id: Mapped[str] = mapped_column(
@@ -1664,6 +1839,17 @@ class EscalationIncidentModel(Base, UUIDMixin):
     events: Mapped[list[dict[str, Any]]] = mapped_column(JSON, nullable=False, default=list)
     next_escalation_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
 
+    # Generated from context so filters and GROUP BYs run in SQL
+    alert_source: Mapped[str] = mapped_column(
+        String(32), Computed(INCIDENT_ALERT_SOURCE_SQL, persisted=False)
+    )
+    severity: Mapped[str] = mapped_column(
+        String(16), Computed(INCIDENT_SEVERITY_SQL, persisted=False)
+    )
+    source_name: Mapped[str] = mapped_column(
+        String(255), Computed(INCIDENT_SOURCE_NAME_SQL, persisted=False)
+    )
+
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
         DateTime, default=utc_now, nullable=False
@@ -2445,7 +2631,7 @@ class AnomalyExplanation(Base, UUIDMixin):
     # Relationships
     detection: Mapped[AnomalyDetection] = relationship(
         "AnomalyDetection",
-        backref="explanations",
+        backref=backref("explanations", cascade="all, delete-orphan"),
     )
 
     @property
@@ -2588,16 +2774,17 @@ class AnomalyBatchJob(Base, UUIDMixin, TimestampMixin):
         error_message: str | None = None,
     ) -> None:
         """Update progress for a single source."""
-        if self.results_json is None:
-            self.results_json = {}
-
-        self.results_json[source_id] = {
-            "detection_id": detection_id,
-            "status": status,
-            "anomaly_count": anomaly_count,
-            "anomaly_rate": anomaly_rate,
-            "total_rows": total_rows,
-            "error_message": error_message,
+        # Reassign rather than mutate so the JSON column change is tracked
+        self.results_json = {
+            **(self.results_json or {}),
+            source_id: {
+                "detection_id": detection_id,
+                "status": status,
+                "anomaly_count": anomaly_count,
+                "anomaly_rate": anomaly_rate,
+                "total_rows": total_rows,
+                "error_message": error_message,
+            },
         }
 
         if status == "success":
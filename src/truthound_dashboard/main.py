@@ -34,12 +34,7 @@ from fastapi.staticfiles import StaticFiles
 
 from truthound_dashboard import __version__
 from truthound_dashboard.api.error_handlers import setup_error_handlers
-from truthound_dashboard.api.middleware import (
-    RateLimitConfig,
-    RateLimitMiddleware,
-    RequestLoggingMiddleware,
-    SecurityHeadersMiddleware,
-)
+from truthound_dashboard.api.middleware import setup_middleware
 from truthound_dashboard.api.router import api_router
 from truthound_dashboard.config import get_settings
 from truthound_dashboard.core.cache import get_cache
@@ -133,6 +128,32 @@ async def lifespan(_app: FastAPI) -> AsyncGenerator[None, None]:
     await scheduler.stop()
     logger.info("Scheduler stopped")
 
+    # Stop anomaly detection worker processes
+    from truthound_dashboard.core.anomaly import shutdown_anomaly_process_pool
+
+    shutdown_anomaly_process_pool()
+
+    # Stop artifact builds and their worker processes
+    from truthound_dashboard.core.artifact_queue import (
+        reset_artifact_build_queue,
+        shutdown_artifact_process_pool,
+    )
+
+    await reset_artifact_build_queue()
+    shutdown_artifact_process_pool()
+
+    # Write pending session activity
+    from truthound_dashboard.core.control_plane_cache import (
+        reset_session_activity_writer,
+    )
+
+    await reset_session_activity_writer()
+
+    # Close pooled data source connections
+    from truthound_dashboard.core.datasource_pool import reset_datasource_pool
+
+    reset_datasource_pool()
+
     # Stop cache cleanup
     await cache.stop_cleanup_task()
     logger.info("Cache cleanup stopped")
@@ -206,32 +227,12 @@ def configure_cors(app: FastAPI) -> None:
 def configure_middleware(app: FastAPI) -> None:
     """Configure security and logging middleware.
 
-    Adds:
-    - Request logging
-    - Rate limiting
-    - Security headers
+    Delegates to ``setup_middleware``, the single pipeline builder.
 
     Args:
         app: FastAPI application.
     """
-    # Request logging (last added = first executed)
-    app.add_middleware(RequestLoggingMiddleware)
-
-    # Rate limiting
-    rate_limit_config = RateLimitConfig(
-        requests_per_minute=120,
-        exclude_paths=[
-            "/health",
-            "/docs",
-            "/redoc",
-            "/openapi.json",
-            "/api/openapi.json",
-        ],
-    )
-    app.add_middleware(RateLimitMiddleware, config=rate_limit_config)
-
-    # Security headers
-    app.add_middleware(SecurityHeadersMiddleware)
+    setup_middleware(app)
 
 
 def mount_static_files(app: FastAPI) -> None:
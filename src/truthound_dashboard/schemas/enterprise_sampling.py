@@ -563,6 +563,24 @@ class SketchEstimateRequest(BaseModel):
         None,
         description="Sketch configuration",
     )
+    membership_values: list[str] | None = Field(
+        None,
+        max_length=1000,
+        description="Values to test against Bloom filter sketches",
+    )
+    partition_path: str | None = Field(
+        None,
+        description=(
+            "Path of a new partition to merge into the stored sketches "
+            "instead of rebuilding them from the source. Must be a data file "
+            "inside the source's directory; relative paths are resolved "
+            "against it"
+        ),
+    )
+    refresh: bool = Field(
+        False,
+        description="Rebuild stored sketches even if they are up to date",
+    )
 
 
 class SketchEstimateResult(BaseModel):
@@ -594,6 +612,24 @@ class SketchEstimateResult(BaseModel):
         None,
         description="Membership test results",
     )
+    false_positive_rate: float | None = Field(
+        None,
+        description="Current Bloom filter false positive rate",
+    )
+
+    # Persistent sketch state
+    rows_ingested: int | None = Field(
+        None,
+        description="Non-null values folded into the sketch",
+    )
+    partitions_merged: int | None = Field(
+        None,
+        description="Partitions merged into the stored sketch",
+    )
+    from_store: bool = Field(
+        False,
+        description="Whether the result was served from a stored sketch without scanning",
+    )
 
     # Common metrics
     memory_used_bytes: int = Field(..., description="Memory used by sketch")
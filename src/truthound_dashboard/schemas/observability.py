@@ -336,6 +336,26 @@ class StoreMetricsResponse(BaseSchema):
     )
 
 
+class ResultCacheOperationMetrics(BaseSchema):
+    """Result cache counters for one operation (validation or profile)."""
+
+    hits: int = Field(default=0, ge=0, description="Runs served from a stored result")
+    misses: int = Field(default=0, ge=0, description="Fingerprinted runs executed")
+    bypassed: int = Field(
+        default=0, ge=0, description="Runs that could not be fingerprinted or opted out"
+    )
+    hit_rate: float = Field(default=0.0, ge=0, le=1, description="Hits / (hits + misses)")
+
+
+class ResultCacheMetricsResponse(BaseSchema):
+    """Content-fingerprint result cache metrics."""
+
+    enabled: bool = Field(..., description="Whether the result cache is enabled")
+    operations: dict[str, ResultCacheOperationMetrics] = Field(
+        default_factory=dict, description="Metrics keyed by operation"
+    )
+
+
 # =============================================================================
 # Tracing
 # =============================================================================
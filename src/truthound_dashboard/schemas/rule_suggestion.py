@@ -246,10 +246,13 @@ class RuleSuggestionRequest(BaseSchema):
         description="Exclude these cross-column rule types",
     )
     sample_data_rows: int = Field(
-        default=1000,
+        default=100_000,
         ge=100,
-        le=10000,
-        description="Number of sample data rows to analyze for cross-column rules",
+        le=1_000_000,
+        description=(
+            "Number of sample data rows to mine cross-column rules from "
+            "(file sources only)"
+        ),
     )
 
 
@@ -85,7 +85,7 @@ class StorageTierBase(BaseSchema):
         description="Backend store type",
         min_length=1,
         max_length=50,
-        examples=["filesystem", "s3", "gcs", "azure_blob"],
+        examples=["filesystem", "file_tier", "s3", "gcs", "azure_blob"],
     )
     store_config: dict[str, Any] = Field(
         default_factory=dict,
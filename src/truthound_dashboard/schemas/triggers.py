@@ -156,6 +156,24 @@ class DataChangeTriggerConfig(BaseTriggerConfig):
         default=True,
         description="Automatically run profile before comparison",
     )
+    change_probe: bool = Field(
+        default=True,
+        description="Skip the profile when a cheap stat/metadata/SQL probe sees no change",
+    )
+    change_column: str | None = Field(
+        default=None,
+        pattern=r"^[A-Za-z_][A-Za-z0-9_]*$",
+        description="SQL column whose maximum advances on every write (e.g. updated_at)",
+    )
+    checksum_column: str | None = Field(
+        default=None,
+        pattern=r"^[A-Za-z_][A-Za-z0-9_]*$",
+        description="SQL column aggregated into a content checksum (e.g. amount)",
+    )
+    checksum_aggregate: Literal["sum", "avg", "min", "max", "count_distinct"] = Field(
+        default="sum",
+        description="Aggregate applied to checksum_column",
+    )
     cooldown_minutes: int = Field(
         default=15,
         ge=0,
@@ -474,6 +492,14 @@ class TriggerMonitoringResponse(BaseModel):
     checker_running: bool = False
     checker_interval_seconds: int = 300
     last_checker_run_at: datetime | None = None
+    checker_metrics: dict[str, Any] = Field(
+        default_factory=dict,
+        description="Checker cycle duration, lag and timeout statistics",
+    )
+    run_queue: dict[str, Any] = Field(
+        default_factory=dict,
+        description="Validation run queue depth and wait-time statistics",
+    )
 
 
 class WebhookTriggerRequest(BaseModel):
@@ -87,6 +87,9 @@ class UnifiedAlertListResponse(ListResponseWrapper):
     """List response for unified alerts."""
 
     items: list[UnifiedAlertResponse]
+    next_cursor: str | None = Field(
+        default=None, description="Keyset cursor for the next page, if any"
+    )
 
 
 # =============================================================================
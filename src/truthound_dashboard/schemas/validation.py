@@ -277,6 +277,15 @@ class ValidationRunRequest(BaseSchema):
         ),
     )
 
+    # Result cache control
+    use_cache: bool = Field(
+        default=True,
+        description=(
+            "Reuse the stored result of a previous run when the source content "
+            "fingerprint and validation parameters are unchanged."
+        ),
+    )
+
 
 # ---------------------------------------------------------------------------
 # Derived report statistics
@@ -400,6 +409,10 @@ class ValidationResponse(IDMixin, ValidationSummary):
         ge=0,
         description="Validation duration in milliseconds",
     )
+    cache_hit: bool = Field(
+        default=False,
+        description="Whether the result was reused from a run on unchanged data",
+    )
     started_at: datetime | None = Field(default=None, description="Start timestamp")
     completed_at: datetime | None = Field(
         default=None, description="Completion timestamp"
@@ -633,6 +646,7 @@ class ValidationResponse(IDMixin, ValidationSummary):
             metadata=metadata,
             error_message=validation.error_message,
             duration_ms=validation.duration_ms,
+            cache_hit=bool(getattr(validation, "cache_hit", False)),
             started_at=validation.started_at,
             completed_at=validation.completed_at,
             created_at=validation.created_at,
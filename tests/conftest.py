@@ -16,12 +16,17 @@ if str(SRC_ROOT) not in sys.path:
 def isolate_dashboard_data_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
     """Keep tests isolated from the user's real dashboard data directory."""
     from truthound_dashboard.config import reset_settings
+    from truthound_dashboard.core.datasource_pool import reset_datasource_pool
     from truthound_dashboard.core.encryption import reset_encryptor
+    from truthound_dashboard.core.secrets import reset_secret_cache
 
     data_dir = tmp_path / ".truthound-test"
     monkeypatch.setenv("TRUTHOUND_DATA_DIR", str(data_dir))
     reset_settings()
     reset_encryptor()
+    reset_secret_cache()
     yield
+    reset_datasource_pool()
+    reset_secret_cache()
     reset_encryptor()
     reset_settings()
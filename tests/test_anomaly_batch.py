@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from truthound_dashboard.core.anomaly import (
+    AnomalyBatchExecutor,
+    AnomalyDetectionService,
+    BatchSourceJob,
+)
+from truthound_dashboard.db import Source
+from truthound_dashboard.db.database import init_db
+
+
+class _FakeWorker:
+    def __init__(self) -> None:
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, df: Any, algorithm: str, config: dict[str, Any] | None) -> dict[str, Any]:
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            time.sleep(0.05)
+            if df == "broken":
+                raise ValueError("fit failed")
+            return {
+                "anomalies": [{"row_index": 0, "anomaly_score": 0.9}],
+                "anomaly_count": 1,
+                "anomaly_rate": 0.1,
+                "total_rows": 10,
+                "columns_analyzed": ["value"],
+                "column_summaries": {},
+                "duration_ms": 50,
+            }
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+def _loader(source_config: dict[str, Any], _config: dict[str, Any] | None = None) -> str:
+    return source_config["path"]
+
+
+@pytest.mark.asyncio
+async def test_batch_executor_bounds_concurrency_and_captures_errors() -> None:
+    worker = _FakeWorker()
+    jobs = [
+        BatchSourceJob(source_id=f"s{i}", detection_id=f"d{i}", source_config={"path": "ok"})
+        for i in range(6)
+    ]
+    jobs.append(BatchSourceJob(source_id="bad", detection_id="dbad", source_config={"path": "broken"}))
+    results: dict[str, tuple[Any, Any]] = {}
+
+    async def on_result(job: BatchSourceJob, result: Any, error: Any) -> None:
+        results[job.source_id] = (result, error)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        executor = AnomalyBatchExecutor(max_workers=2, pool=pool, loader=_loader, worker=worker)
+        await executor.run(jobs, "isolation_forest", {}, on_result)
+
+    assert worker.peak == 2
+    assert len(results) == 7
+    assert results["s0"][0]["anomaly_count"] == 1
+    assert isinstance(results["bad"][1], ValueError)
+
+
+@pytest.mark.asyncio
+async def test_batch_detection_records_per_source_progress(tmp_path: Path) -> None:
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'anomaly.sqlite3'}",
+        connect_args={"check_same_thread": False},
+    )
+    try:
+        await init_db(engine)
+        factory = async_sessionmaker(engine, expire_on_commit=False)
+        async with factory() as session:
+            good = Source(name="good", type="csv", config={"path": "ok"})
+            bad = Source(name="bad", type="csv", config={"path": "broken"})
+            session.add_all([good, bad])
+            await session.flush()
+
+            service = AnomalyDetectionService(session)
+            batch = await service.create_batch_detection([good.id, bad.id])
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                executor = AnomalyBatchExecutor(
+                    max_workers=2, pool=pool, loader=_loader, worker=_FakeWorker()
+                )
+                batch = await service.run_batch_detection(batch.id, executor=executor)
+            # Progress is only flushed; the caller owns the commit.
+            await session.commit()
+
+        assert batch.status == "partial"
+        assert batch.completed_sources == 1
+        assert batch.failed_sources == 1
+        assert batch.results_json[good.id]["status"] == "success"
+        assert batch.results_json[bad.id]["error_message"] == "fit failed"
+
+        async with factory() as session:
+            stored = await AnomalyDetectionService(session).get_batch_job(batch.id)
+            assert stored is not None
+            assert set(stored.results_json) == {good.id, bad.id}
+    finally:
+        await engine.dispose()
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import polars as pl
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from truthound_dashboard.core import anomaly_explainer
+from truthound_dashboard.core.anomaly import AnomalyDetectionService
+from truthound_dashboard.core.anomaly_explainer import (
+    AnomalyExplainerService,
+    ExplainerModelStore,
+    build_explainer_model,
+    permutation_importance,
+)
+from truthound_dashboard.core.anomaly_features import reset_feature_matrix_cache
+from truthound_dashboard.db import Source
+from truthound_dashboard.db.database import init_db
+from truthound_dashboard.db.models import AnomalyDetection, AnomalyExplanation
+
+
+def test_permutation_importance_scores_all_features_in_one_batch() -> None:
+    rng = np.random.default_rng(1)
+    X = rng.normal(size=(500, 3)).astype(np.float32)
+    X[0] = [8.0, 0.0, 0.0]  # outlier driven by the first feature
+    model = build_explainer_model("isolation_forest", {"n_estimators": 50})
+    model.fit(X)
+
+    calls: list[int] = []
+    score_samples = model.score_samples
+    model.score_samples = lambda rows: calls.append(len(rows)) or score_samples(rows)
+
+    importance = permutation_importance(model, X[:5], X[100:200])
+
+    assert importance.shape == (5, 3)
+    assert calls == [5, 15]
+    assert np.argmax(np.abs(importance[0])) == 0
+
+
+@pytest.mark.asyncio
+async def test_explanations_reuse_stored_model_and_bulk_insert(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    rng = np.random.default_rng(0)
+    data_path = tmp_path / "metrics.parquet"
+    pl.DataFrame({"x": rng.normal(size=600), "y": rng.normal(size=600)}).write_parquet(
+        data_path
+    )
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'explain.sqlite3'}",
+        connect_args={"check_same_thread": False},
+    )
+    store = ExplainerModelStore(tmp_path / "models")
+    monkeypatch.setattr(anomaly_explainer, "_model_store", store)
+    reset_feature_matrix_cache()
+    try:
+        await init_db(engine)
+        factory = async_sessionmaker(engine, expire_on_commit=False)
+        async with factory() as session:
+            source = Source(name="metrics", type="parquet", config={"path": str(data_path)})
+            session.add(source)
+            await session.flush()
+            detection = AnomalyDetection(
+                source_id=source.id,
+                algorithm="lof",
+                status="success",
+                columns_analyzed=["x", "y"],
+                config={"sample_size": 400},
+                result_json={"anomalies": [{"row_index": 3, "anomaly_score": 0.8}]},
+            )
+            session.add(detection)
+            await session.flush()
+
+            fits: list[str] = []
+            service = AnomalyExplainerService(session)
+            build_model = service._build_model
+            monkeypatch.setattr(
+                service,
+                "_build_model",
+                lambda algorithm, config: fits.append(algorithm) or build_model(algorithm, config),
+            )
+
+            rows = list(range(40))
+            first = await service.explain_anomaly(detection.id, rows, max_features=1)
+            second = await service.explain_anomaly(
+                detection.id, rows + [40, 999], max_features=2
+            )
+            stored_rows = await session.scalar(
+                select(func.count()).select_from(AnomalyExplanation)
+            )
+
+            await AnomalyDetectionService(session).delete_detection(detection.id)
+
+        assert "error" not in first
+        assert fits == ["lof"]
+        assert first["explanations"][3]["anomaly_score"] == 0.8
+        assert len(first["explanations"][0]["feature_contributions"]) == 1
+        assert second["row_indices"] == rows + [40]
+        assert stored_rows == 41
+        assert store.load(detection.id, None) is None
+    finally:
+        reset_feature_matrix_cache()
+        await engine.dispose()
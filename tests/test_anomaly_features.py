@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import polars as pl
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from truthound_dashboard.core.anomaly import AnomalyDetectionService
+from truthound_dashboard.core.anomaly_features import (
+    FeatureMatrix,
+    FeatureMatrixCache,
+    get_feature_matrix_cache,
+    reset_feature_matrix_cache,
+)
+from truthound_dashboard.db import Source
+from truthound_dashboard.db.database import init_db
+
+
+def test_feature_matrix_imputes_and_scales_once() -> None:
+    df = pl.DataFrame(
+        {
+            "amount": [1.0, None, 3.0, float("nan")],
+            "count": [10, 20, 30, 40],
+            "flag": [True, False, True, False],
+            "name": ["a", "b", "c", "d"],
+        }
+    )
+    features = FeatureMatrix.from_frame(df)
+
+    assert features.columns == ("amount", "count")
+    assert features.values.dtype == np.float32
+    assert features.values.flags.c_contiguous
+    assert features.missing[:, 0].tolist() == [False, True, False, True]
+    assert features.values[1, 0] == pytest.approx(2.0)
+    assert features.row_values(1) == {"amount": None, "count": 20.0}
+
+    scaled = features.scaled()
+    assert scaled is features.scaled()
+    assert not scaled.flags.writeable
+    assert np.allclose(scaled.mean(axis=0), 0.0, atol=1e-6)
+
+    calls: list[int] = []
+    for _ in range(2):
+        features.memoize(("lof", "{}"), lambda: calls.append(1) or "fit")
+    assert calls == [1]
+
+
+def test_cache_evicts_by_byte_budget() -> None:
+    def matrix(rows: int) -> FeatureMatrix:
+        return FeatureMatrix.from_frame(pl.DataFrame({"amount": np.arange(rows, dtype=float)}))
+
+    size = matrix(1000).nbytes
+    cache = FeatureMatrixCache(max_entries=8, max_bytes=size * 2)
+    cache.put("a", matrix(1000))
+    cache.put("b", matrix(1000))
+    assert cache.get("a") is not None  # "b" is now least recently used
+
+    cache.put("c", matrix(1000))
+    assert cache.get("b") is None
+    assert len(cache) == 2
+    assert cache.nbytes <= size * 2
+
+    # Derived views count too: scaling "a" pushes "c" out on the next put.
+    cache.get("a").scaled()
+    cache.put("d", matrix(10))
+    assert cache.get("c") is None
+
+    cache.put("huge", matrix(10_000))
+    assert cache.get("huge") is None
+
+
+@pytest.mark.asyncio
+async def test_comparison_shares_cached_matrix_across_algorithms(tmp_path: Path) -> None:
+    rng = np.random.default_rng(0)
+    data_path = tmp_path / "metrics.parquet"
+    pl.DataFrame(
+        {"x": rng.normal(size=400), "y": rng.normal(size=400), "label": ["a"] * 400}
+    ).write_parquet(data_path)
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'anomaly.sqlite3'}",
+        connect_args={"check_same_thread": False},
+    )
+    reset_feature_matrix_cache()
+    try:
+        await init_db(engine)
+        factory = async_sessionmaker(engine, expire_on_commit=False)
+        async with factory() as session:
+            source = Source(name="metrics", type="parquet", config={"path": str(data_path)})
+            session.add(source)
+            await session.flush()
+
+            service = AnomalyDetectionService(session)
+            first = await service.run_comparison(
+                source.id, ["lof", "one_class_svm", "dbscan"]
+            )
+            second = await service.run_comparison(
+                source.id, ["lof", "nope"], sample_size=None
+            )
+
+        assert first["status"] == "success"
+        assert first["columns_analyzed"] == ["x", "y"]
+        assert [r["status"] for r in first["algorithm_results"]] == ["success"] * 3
+        assert second["algorithm_results"][1]["status"] == "error"
+        # Same fingerprint and selection: the prepared matrix is reused.
+        assert len(get_feature_matrix_cache()) == 1
+        assert (
+            second["algorithm_results"][0]["anomaly_count"]
+            == first["algorithm_results"][0]["anomaly_count"]
+        )
+    finally:
+        reset_feature_matrix_cache()
+        await engine.dispose()
+
+
+def test_scan_projects_numeric_columns_and_samples_in_scan(tmp_path: Path) -> None:
+    path = tmp_path / "wide.parquet"
+    pl.DataFrame(
+        {
+            "id": list(range(20_000)),
+            "value": [float(i % 100) if i % 10 else None for i in range(20_000)],
+            "note": ["x"] * 20_000,
+        }
+    ).write_parquet(path, row_group_size=2_000)
+
+    features = FeatureMatrix.from_frame(
+        pl.scan_parquet(path), columns=["value", "note"], sample_size=1_000
+    )
+
+    assert features.columns == ("value",)
+    assert features.dtypes == {"value": "Float64"}
+    assert features.source_rows == 20_000
+    assert features.n_rows == 1_000
+    assert features.observed.schema == {"value": pl.Float32}
+
+    mask = np.zeros(features.n_rows, dtype=bool)
+    mask[features.missing[:, 0]] = True  # flag every row with a missing value
+    mask[np.flatnonzero(~features.missing[:, 0])[:3]] = True
+    [summary] = features.column_summaries(mask)
+    assert summary["anomaly_count"] == 3
+    assert summary["min_value"] >= 0.0
+    assert summary["max_value"] <= 99.0
@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from truthound_dashboard.core import artifact_queue
+from truthound_dashboard.core.artifact_queue import (
+    ArtifactBuildQueue,
+    ValidationSnapshot,
+    build_artifact_file,
+    reset_artifact_build_queue,
+)
+from truthound_dashboard.core.artifacts import ArtifactService
+from truthound_dashboard.db import (
+    ArtifactRecord,
+    Source,
+    Validation,
+    Workspace,
+    get_session,
+)
+from truthound_dashboard.db.database import get_engine, init_db, reset_connection
+
+
+class _RecordingManager:
+    def __init__(self) -> None:
+        self.messages: list[dict[str, Any]] = []
+
+    def room_size(self, room: str) -> int:
+        return 1
+
+    async def broadcast_to_room(self, room: str, message: Any) -> int:
+        self.messages.append(message.to_json())
+        return 1
+
+
+@pytest.fixture
+async def queue(monkeypatch: pytest.MonkeyPatch):
+    reset_connection()
+    await init_db()
+    pool = ThreadPoolExecutor(max_workers=2)
+    build_queue = ArtifactBuildQueue(max_workers=2, pool=pool)
+    monkeypatch.setattr(artifact_queue, "_queue", build_queue)
+    yield build_queue
+    await reset_artifact_build_queue()
+    pool.shutdown()
+    await get_engine().dispose()
+    reset_connection()
+
+
+async def _seed(result_json: dict[str, Any] | None) -> tuple[str, str]:
+    async with get_session() as session:
+        workspace = Workspace(name="Ops", slug="ops")
+        source = Source(name="orders", type="csv", config={"path": "orders.csv"})
+        session.add_all([workspace, source])
+        await session.flush()
+        validation = Validation(
+            source_id=source.id,
+            status="failed",
+            passed=False,
+            total_issues=2,
+            result_json=result_json,
+        )
+        session.add(validation)
+        await session.flush()
+        return workspace.id, validation.id
+
+
+async def _request(workspace_id: str, validation_id: str, **kwargs: Any) -> ArtifactRecord:
+    async with get_session() as session:
+        validation = await session.get(Validation, validation_id)
+        return await ArtifactService(session).generate_report_artifact(
+            workspace_id=workspace_id, validation=validation, **kwargs
+        )
+
+
+async def _load(artifact_id: str) -> ArtifactRecord:
+    async with get_session() as session:
+        return await session.get(ArtifactRecord, artifact_id)
+
+
+@pytest.mark.asyncio
+async def test_identical_requests_share_one_background_build(
+    queue: ArtifactBuildQueue,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    manager = _RecordingManager()
+    monkeypatch.setattr(
+        "truthound_dashboard.core.websocket.get_websocket_manager", lambda: manager
+    )
+    issues = [
+        {"column": "id", "issue_type": "null", "severity": "high", "count": i}
+        for i in range(2)
+    ]
+    workspace_id, validation_id = await _seed({"issues": issues})
+
+    first = await _request(workspace_id, validation_id, format="csv")
+    duplicate = await _request(workspace_id, validation_id, format="csv")
+    assert first.status == "pending"
+    assert duplicate.id == first.id
+
+    await queue.join()
+    artifact = await _load(first.id)
+    assert artifact.status == "completed", artifact.error_message
+    content = Path(artifact.file_path).read_bytes()
+    assert artifact.file_size == len(content)
+    assert artifact.content_hash == hashlib.sha256(content).hexdigest()
+    assert artifact.artifact_metadata["content_type"].startswith("text/csv")
+
+    # A completed build is reused; different options build again.
+    again = await _request(workspace_id, validation_id, format="csv")
+    other = await _request(workspace_id, validation_id, format="json")
+    await queue.join()
+    assert again.id == first.id
+    assert other.id != first.id
+    assert queue.get_metrics()["submitted"] == 2
+
+    statuses = [
+        (m["type"], m["data"]["status"])
+        for m in manager.messages
+        if m["data"]["artifact_id"] == first.id
+    ]
+    assert statuses == [
+        ("artifact_build_progress", "pending"),
+        ("artifact_build_progress", "generating"),
+        ("artifact_build_completed", "completed"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_failed_build_is_recorded_on_the_artifact(queue: ArtifactBuildQueue) -> None:
+    workspace_id, validation_id = await _seed(None)
+    async with get_session() as session:
+        validation = await session.get(Validation, validation_id)
+        pending = await ArtifactService(session).generate_datadocs_artifact(
+            workspace_id=workspace_id, validation=validation
+        )
+
+    await queue.join()
+    artifact = await _load(pending.id)
+    assert artifact.status == "failed"
+    assert artifact.error_message == "Validation result is empty"
+    assert artifact.file_path is None
+
+
+@pytest.mark.asyncio
+async def test_stopping_the_queue_fails_unfinished_builds(
+    queue: ArtifactBuildQueue,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    release = threading.Event()
+    monkeypatch.setattr(artifact_queue, "build_artifact_file", lambda *_args: release.wait(5))
+    workspace_id, validation_id = await _seed({"issues": []})
+    running = await _request(workspace_id, validation_id, format="csv")
+    for _ in range(100):
+        if (await _load(running.id)).status == "generating":
+            break
+        await asyncio.sleep(0.01)
+
+    await queue.stop()
+    release.set()
+
+    artifact = await _load(running.id)
+    assert artifact.status == "failed"
+    assert artifact.error_message == "Build cancelled before completion"
+    assert queue.depth == 0
+
+
+def test_build_runs_in_a_spawned_worker_process(tmp_path: Path) -> None:
+    snapshot = ValidationSnapshot(
+        id="validation-1",
+        source_id="source-1",
+        status="failed",
+        result_json={"issues": [{"column": "id", "severity": "low", "count": 1}]},
+    )
+    with ProcessPoolExecutor(
+        max_workers=1, mp_context=multiprocessing.get_context("spawn")
+    ) as pool:
+        result = pool.submit(
+            build_artifact_file,
+            "report",
+            str(tmp_path / "report.json"),
+            snapshot,
+            {"format": "json"},
+        ).result(timeout=120)
+
+    content = (tmp_path / "report.json").read_bytes()
+    assert result["content_hash"] == hashlib.sha256(content).hexdigest()
+    assert b'"column": "id"' in content
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+from truthound_dashboard.db import get_session
+from truthound_dashboard.db.database import get_engine, init_db, reset_connection
+
+SCRIPT = Path(__file__).resolve().parents[1] / "scripts" / "benchmark.py"
+
+
+@pytest.fixture(scope="module")
+def benchmark():
+    spec = importlib.util.spec_from_file_location("dashboard_benchmark", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module  # dataclasses resolve annotations through it
+    spec.loader.exec_module(module)
+    yield module
+    sys.modules.pop(spec.name, None)
+
+
+@pytest.fixture
+async def database():
+    reset_connection()
+    await init_db()
+    yield
+    await get_engine().dispose()
+    reset_connection()
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("database")
+async def test_every_case_runs_against_a_small_fleet(benchmark) -> None:
+    # Over 500 lineage nodes, so impact analysis sees more than one page.
+    config = benchmark.FleetConfig(
+        sources=200, validations=2, lineage_depth=1, incidents=10, notification_logs=20
+    )
+    async with get_session() as session:
+        fleet = await benchmark.seed_fleet(session, config)
+    assert fleet.lineage_nodes == 600
+
+    results = await benchmark.run_suite(fleet, config, repeat=2, batch_size=50)
+
+    assert [r.name for r in results] == list(benchmark.CASES)
+    assert {r.name: r.error for r in results} == dict.fromkeys(benchmark.CASES)
+    assert all(0 < r.min_ms <= r.median_ms <= r.p95_ms for r in results)
+
+    document = benchmark.results_document(results, config, fleet, batch_size=50)
+    assert document["fleet"]["lineage_edges"] == fleet.lineage_edges
+    comparisons = benchmark.compare(results, document, 0.5)
+    assert len(comparisons) == len(results) and not any(c.regressed for c in comparisons)
+
+
+def test_compare_flags_only_meaningful_slowdowns(benchmark) -> None:
+    result = benchmark.CaseResult
+    baseline = {
+        "results": [
+            {"name": "slow", "median_ms": 100.0},
+            {"name": "tiny", "median_ms": 0.2},
+            {"name": "broken", "median_ms": 0.0, "error": "boom"},
+        ]
+    }
+    current = [
+        result("slow", 5, median_ms=160.0),
+        result("tiny", 5, median_ms=0.9),  # 4.5x, but under a millisecond
+        result("broken", 5, median_ms=10.0),
+        result("new", 5, median_ms=10.0),
+    ]
+
+    comparisons = benchmark.compare(current, baseline, 0.5)
+
+    assert [(c.name, c.regressed) for c in comparisons] == [("slow", True), ("tiny", False)]
+    assert comparisons[0].change == pytest.approx(0.6)
+    assert not benchmark.compare(current, baseline, 0.75)[0].regressed
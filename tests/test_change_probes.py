@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import os
+import sqlite3
+from pathlib import Path
+
+import polars as pl
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from truthound_dashboard.core.change_probes import probe_file, probe_sql
+from truthound_dashboard.core.scheduler import ValidationScheduler
+from truthound_dashboard.db import Schedule, Source, TriggerType
+from truthound_dashboard.db.database import init_db
+
+
+def test_file_probe_escalates_from_stat_to_metadata(tmp_path: Path) -> None:
+    path = tmp_path / "orders.parquet"
+    pl.DataFrame({"id": [1, 2, 3], "amount": [1.0, 2.0, 3.0]}).write_parquet(path)
+
+    first = probe_file(path)
+    assert (first.changed, first.tier) == (True, "metadata")
+    assert first.state["row_count"] == 3
+
+    unchanged = probe_file(path, first.state)
+    assert (unchanged.changed, unchanged.tier) == (False, "stat")
+
+    # A touch changes the stat but not the content.
+    os.utime(path, ns=(0, 1_000_000_000))
+    touched = probe_file(path, first.state)
+    assert (touched.changed, touched.tier) == (False, "metadata")
+
+    pl.DataFrame({"id": [1, 2, 3], "amount": [1.0, 2.0, 4.0]}).write_parquet(path)
+    rewritten = probe_file(path, touched.state)
+    assert rewritten.changed is True
+
+    assert probe_file(tmp_path / "missing.parquet").changed is None
+
+
+def test_sql_probe_requires_change_column_or_checksum(tmp_path: Path) -> None:
+    from truthound.datasources.sql.sqlite import SQLiteDataSource
+
+    database = tmp_path / "warehouse.db"
+    with sqlite3.connect(database) as conn:
+        conn.execute("CREATE TABLE orders (id INTEGER, amount REAL, updated_at TEXT)")
+        conn.execute("INSERT INTO orders VALUES (1, 5.0, '2026-01-01')")
+    datasource = SQLiteDataSource(table="orders", database=str(database))
+
+    assert probe_sql(datasource).changed is None
+
+    first = probe_sql(datasource, change_column="updated_at", checksum_column="amount")
+    assert first.changed is True
+    assert first.state["row_count"] == 1
+    again = probe_sql(
+        datasource,
+        change_column="updated_at",
+        checksum_column="amount",
+        previous=first.state,
+    )
+    assert again.changed is False
+
+    # An in-place update keeps the row count and change column but not the sum.
+    with sqlite3.connect(database) as conn:
+        conn.execute("UPDATE orders SET amount = 6.0")
+    updated = probe_sql(
+        datasource,
+        change_column="updated_at",
+        checksum_column="amount",
+        previous=first.state,
+    )
+    assert updated.changed is True
+
+    # Column names are checked against the schema; SQL never gets through.
+    for column in ("amount) FROM orders; DROP TABLE orders; --", "missing"):
+        rejected = probe_sql(datasource, checksum_column=column)
+        assert (rejected.changed, rejected.tier) == (None, "sql")
+    bad_aggregate = probe_sql(datasource, checksum_column="amount", checksum_aggregate="1; --")
+    assert bad_aggregate.changed is None
+    distinct = probe_sql(datasource, checksum_column="amount", checksum_aggregate="count_distinct")
+    assert distinct.state["checksum"] == "1"
+
+
+@pytest.mark.asyncio
+async def test_data_change_check_skips_profile_for_unchanged_source(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    path = tmp_path / "metrics.csv"
+    path.write_text("x\n1\n2\n")
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'scheduler.sqlite3'}",
+        connect_args={"check_same_thread": False},
+    )
+    scheduler = ValidationScheduler(maintenance_enabled=False)
+    profiled: list[str] = []
+
+    async def fake_profile(_session, source_id: str) -> bool:
+        profiled.append(source_id)
+        return True
+
+    monkeypatch.setattr(scheduler, "_run_profile_if_needed", fake_profile)
+    try:
+        await init_db(engine)
+        factory = async_sessionmaker(engine, expire_on_commit=False)
+        async with factory() as session:
+            source = Source(name="metrics", type="csv", config={"path": str(path)})
+            session.add(source)
+            await session.flush()
+            schedule = Schedule(
+                name="on change",
+                source_id=source.id,
+                trigger_type=TriggerType.DATA_CHANGE.value,
+                trigger_config={"type": "data_change", "cooldown_minutes": 0},
+            )
+            session.add(schedule)
+            await session.commit()
+
+            await scheduler._evaluate_and_run_if_needed(session, schedule)
+            await scheduler._evaluate_and_run_if_needed(session, schedule)
+            skipped = schedule.last_trigger_result
+            path.write_text("x\n1\n2\n3\n")
+            await scheduler._evaluate_and_run_if_needed(session, schedule)
+
+        assert profiled == [source.id, source.id]
+        assert skipped["reason"] == "No change detected by stat probe"
+        assert schedule.last_trigger_result["details"]["probe"]["changed"] is True
+    finally:
+        await scheduler._run_queue.stop()
+        await engine.dispose()
@@ -30,6 +30,7 @@ def test_expected_ci_workflow_files_exist() -> None:
         WORKFLOWS / "_security-checks.yml",
         WORKFLOWS / "_secret-integrations.yml",
         WORKFLOWS / "_release-verify.yml",
+        WORKFLOWS / "_benchmarks.yml",
         CI_MANIFESTS / "backend-ruff-ratchet.txt",
         CI_MANIFESTS / "backend-mypy-ratchet.txt",
         CI_MANIFESTS / "frontend-eslint-ratchet.txt",
@@ -62,6 +63,7 @@ def test_required_workflows_support_merge_queue_and_reusable_layout() -> None:
     assert jobs["frontend-ratchet"]["uses"] == "./.github/workflows/_frontend-ratchet.yml"
     assert jobs["preview-build"]["uses"] == "./.github/workflows/_preview-build.yml"
     assert jobs["docs"]["uses"] == "./.github/workflows/_docs-checks.yml"
+    assert jobs["benchmarks"]["uses"] == "./.github/workflows/_benchmarks.yml"
 
     docs_jobs = docs["jobs"]
     assert docs_jobs["docs"]["uses"] == "./.github/workflows/_docs-checks.yml"
@@ -86,6 +88,7 @@ def test_nightly_workflow_has_matrix_advisory_and_secret_jobs() -> None:
     assert jobs["frontend-ratchet"]["uses"] == "./.github/workflows/_frontend-ratchet.yml"
     assert jobs["preview-build"]["uses"] == "./.github/workflows/_preview-build.yml"
     assert jobs["docs"]["uses"] == "./.github/workflows/_docs-checks.yml"
+    assert jobs["benchmarks"]["uses"] == "./.github/workflows/_benchmarks.yml"
     assert jobs["security-audit"]["uses"] == "./.github/workflows/_security-checks.yml"
     assert jobs["secret-integrations"]["uses"] == "./.github/workflows/_secret-integrations.yml"
     assert jobs["secret-integrations"]["environment"] == "ci-secrets"
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import event, select
+
+from truthound_dashboard.core.control_plane import AuthService
+from truthound_dashboard.core.control_plane_cache import (
+    SessionActivityWriter,
+    get_session_activity_writer,
+    reset_control_plane_cache,
+    reset_session_activity_writer,
+)
+from truthound_dashboard.db import Role, Session, get_session
+from truthound_dashboard.db.database import get_engine, init_db, reset_connection
+from truthound_dashboard.time import utc_now
+
+
+@pytest.fixture
+async def database():
+    reset_connection()
+    reset_control_plane_cache()
+    await init_db()
+    yield
+    await reset_session_activity_writer()
+    reset_control_plane_cache()
+    await get_engine().dispose()
+    reset_connection()
+
+
+@pytest.fixture
+def statements():
+    executed: list[str] = []
+
+    def record(_conn, _cursor, statement, *_args):
+        executed.append(statement)
+
+    sync_engine = get_engine().sync_engine
+    event.listen(sync_engine, "before_cursor_execute", record)
+    yield executed
+    event.remove(sync_engine, "before_cursor_execute", record)
+
+
+async def _login() -> str:
+    async with get_session() as session:
+        token, _ = await AuthService(session).login()
+    return token
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("database")
+async def test_repeat_requests_resolve_from_cache_without_writes(statements) -> None:
+    token = await _login()
+    async with get_session() as session:
+        first = await AuthService(session).resolve_context(token)
+    statements.clear()
+
+    for _ in range(5):
+        async with get_session() as session:
+            context = await AuthService(session).resolve_context(token)
+
+    assert statements == []
+    assert context.user.id == first.user.id
+    assert context.workspace.id == first.workspace.id
+    assert "roles:read" in context.permission_keys
+    assert context.session.expires_at == first.session.expires_at
+    # Login just set last_seen_at, so activity is debounced entirely.
+    assert get_session_activity_writer().pending == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("database")
+async def test_logout_and_role_changes_invalidate_cached_context() -> None:
+    token = await _login()
+    async with get_session() as session:
+        service = AuthService(session)
+        context = await service.resolve_context(token)
+        assert "sources:write" in context.permission_keys
+
+        viewer = (
+            await session.execute(select(Role).where(Role.name == "viewer"))
+        ).scalar_one()
+        await service._ensure_membership(
+            user_id=context.user.id, workspace_id=context.workspace.id, role_id=viewer.id
+        )
+
+    async with get_session() as session:
+        service = AuthService(session)
+        context = await service.resolve_context(token)
+        assert context.role.name == "viewer"
+        assert "sources:write" not in context.permission_keys
+
+        await service.logout(token)
+
+    async with get_session() as session:
+        context = await AuthService(session).resolve_context(token)
+    # Auth is disabled, so a revoked token falls back to the bootstrap identity.
+    assert context.session is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("database")
+async def test_activity_writer_debounces_and_coalesces() -> None:
+    stale = utc_now() - timedelta(hours=1)
+    async with get_session() as session:
+        service = AuthService(session)
+        context = await service.ensure_bootstrap_state()
+        sessions = [(await service._create_session(context))[0] for _ in range(3)]
+        for session_obj in sessions:
+            session_obj.last_seen_at = stale
+
+    writer = SessionActivityWriter(interval_seconds=60, flush_delay_seconds=60)
+    assert writer.touch(sessions[0].id, stale)
+    assert not writer.touch(sessions[0].id, stale)
+    assert writer.touch(sessions[1].id, stale)
+    assert not writer.touch(sessions[2].id, utc_now())
+    assert writer.pending == 2
+
+    await writer.close()
+
+    assert writer.pending == 0
+    async with get_session() as session:
+        seen = dict(
+            (await session.execute(select(Session.id, Session.last_seen_at))).all()
+        )
+    assert seen[sessions[0].id] > stale
+    assert seen[sessions[1].id] > stale
+    assert seen[sessions[2].id] == stale
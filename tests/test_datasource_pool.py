@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+from truthound.datasources.sql.sqlite import SQLiteDataSource
+
+from truthound_dashboard.core import datasource_pool as pool_module
+from truthound_dashboard.core.datasource_factory import SourceConfig
+from truthound_dashboard.core.datasource_pool import (
+    DataSourcePool,
+    PoolLimits,
+    datasource_pool_key,
+)
+from truthound_dashboard.core.domains.source_io import checkout_data_input
+from truthound_dashboard.core.domains.sources import SourceService
+from truthound_dashboard.db import Source, get_session
+from truthound_dashboard.db.database import get_engine, init_db, reset_connection
+
+
+def _orders_db(path: Path, rows: int = 3) -> str:
+    with sqlite3.connect(path) as conn:
+        conn.execute("CREATE TABLE orders (id INTEGER, amount REAL)")
+        conn.executemany(
+            "INSERT INTO orders VALUES (?, ?)", [(i, i * 1.5) for i in range(rows)]
+        )
+        conn.execute("CREATE TABLE refunds (id INTEGER)")
+    return str(path)
+
+
+def _config(table: str = "orders") -> dict:
+    return {"type": "postgresql", "host": "db", "database": "app", "table": table}
+
+
+class _LocalFactory:
+    """Serves server-backed configs from a local SQLite file."""
+
+    def __init__(self, database: str) -> None:
+        self.database = database
+
+    def create(self, config: SourceConfig) -> SQLiteDataSource:
+        return SQLiteDataSource(database=self.database, table=config.table)
+
+
+def test_reused_handle_rereads_row_count_and_expires_schema(tmp_path: Path) -> None:
+    database = _orders_db(tmp_path / "orders.db")
+    pool = DataSourcePool(factory=_LocalFactory(database), schema_ttl_seconds=3600)
+
+    first = pool.acquire(_config())
+    assert first.row_count == 3
+    assert list(first.schema) == ["id", "amount"]
+    pool.release(first)
+
+    with sqlite3.connect(database) as conn:
+        conn.execute("INSERT INTO orders VALUES (3, 4.5)")
+        conn.execute("ALTER TABLE orders ADD COLUMN note TEXT")
+
+    second = pool.acquire(_config())
+    assert second is first
+    assert second.row_count == 4
+    # Introspected schema is reused until the TTL runs out.
+    assert list(second.schema) == ["id", "amount"]
+    pool.release(second)
+
+    pool.schema_ttl_seconds = 0
+    third = pool.acquire(_config())
+    assert list(third.schema) == ["id", "amount", "note"]
+    pool.release(third)
+
+    stats = pool.get_stats()
+    assert (stats["hits"], stats["misses"], stats["handles"]) == (2, 1, 1)
+    pool.clear()
+
+
+def test_concurrent_runs_get_their_own_handles(tmp_path: Path) -> None:
+    pool = DataSourcePool(factory=_LocalFactory(_orders_db(tmp_path / "orders.db")))
+
+    first = pool.acquire(_config(), source_id="orders")
+    second = pool.acquire(_config(), source_id="orders")
+    assert second is not first
+    pool.release(second)
+    assert pool.get_stats()["checked_out"] == 1
+
+    # The checked-out handle keeps working until its run releases it.
+    assert pool.invalidate_source("orders") == 2
+    assert second._pool is None
+    assert first.row_count == 3
+    pool.release(first)
+    assert first._pool is None
+
+    assert pool.acquire(_config()) not in (first, second)
+    assert pool.get_stats()["handles"] == 0
+    pool.release(str(tmp_path / "orders.csv"))  # file inputs are not pooled
+    pool.clear()
+
+
+def test_key_hashes_credentials_and_normalizes_type() -> None:
+    base = {"type": "postgresql", "host": "db", "database": "app", "table": "t"}
+    key = datasource_pool_key(SourceConfig.from_dict({**base, "password": "s3cret"}))
+
+    assert "s3cret" not in key
+    assert key != datasource_pool_key(SourceConfig.from_dict({**base, "password": "other"}))
+    assert key == datasource_pool_key(
+        SourceConfig.from_dict({**base, "type": "PostgreSQL", "password": "s3cret"})
+    )
+
+
+def test_health_check_and_limits_close_stale_handles(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    now = [1000.0]
+    monkeypatch.setattr(pool_module.time, "monotonic", lambda: now[0])
+    pool = DataSourcePool(
+        factory=_LocalFactory(_orders_db(tmp_path / "orders.db")),
+        limits={
+            "postgresql": PoolLimits(
+                max_size=1, max_idle_seconds=600, health_check_after_seconds=30
+            )
+        },
+    )
+
+    def run(table: str = "orders"):
+        handle = pool.acquire(_config(table))
+        pool.release(handle)
+        return handle
+
+    first = run()
+    now[0] += 10
+    assert run() is first
+
+    now[0] += 60
+    monkeypatch.setattr(first, "validate_connection", lambda: False)
+    replacement = run()
+    assert replacement is not first
+
+    # A second table exceeds max_size, evicting the least recently used handle.
+    run("refunds")
+    assert run() is not replacement
+
+    now[0] += 601
+    run("refunds")
+    stats = pool.get_stats()
+    assert stats["failed_health_checks"] == 1
+    assert stats["evictions"] == 2
+    assert stats["handles"] == 1
+    pool.clear()
+
+
+@pytest.fixture
+async def database():
+    reset_connection()
+    await init_db()
+    yield
+    await get_engine().dispose()
+    reset_connection()
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("database")
+async def test_sqlite_runs_query_from_any_worker_thread(tmp_path: Path) -> None:
+    orders = _orders_db(tmp_path / "orders.db")
+    config = {"type": "sqlite", "database": orders, "table": "orders"}
+    async with get_session() as session:
+        source = Source(name="orders", type="sqlite", config=config)
+        session.add(source)
+        await session.flush()
+
+        handles = []
+        with (
+            ThreadPoolExecutor(max_workers=1) as first_thread,
+            ThreadPoolExecutor(max_workers=1) as second_thread,
+        ):
+            # Each run queries from a different, still running thread.
+            for thread in (first_thread, second_thread):
+                async with checkout_data_input(source, session) as data_input:
+                    assert thread.submit(getattr, data_input, "row_count").result() == 3
+                    handles.append(data_input)
+
+    assert handles[0] is not handles[1]
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("database")
+async def test_source_runs_share_handles_until_source_update(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    pool = DataSourcePool(factory=_LocalFactory(_orders_db(tmp_path / "orders.db")))
+    monkeypatch.setattr(pool_module, "_datasource_pool", pool)
+    async with get_session() as session:
+        source = Source(name="orders", type="postgresql", config=_config())
+        session.add(source)
+        await session.flush()
+
+        async with checkout_data_input(source, session) as first:
+            pass
+        async with checkout_data_input(source, session) as second:
+            assert second is first
+
+        await SourceService(session).update(source.id, config={"table": "refunds"})
+        async with checkout_data_input(source, session) as updated:
+            assert updated is not first
+            assert updated.row_count == 0
+    pool.clear()
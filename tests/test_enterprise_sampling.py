@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import polars as pl
+import pytest
+
+from truthound_dashboard.core.enterprise_sampling import (
+    EnterpriseScaleSampler,
+    ReservoirSampler,
+    SamplingBlock,
+    SketchEstimator,
+    allocate_quotas,
+)
+from truthound_dashboard.core.sketches import (
+    CountMinSketch,
+    HyperLogLogSketch,
+    Sketch,
+    SketchStore,
+    resolve_partition_path,
+)
+from truthound_dashboard.schemas.enterprise_sampling import (
+    EnterpriseSamplingRequest,
+    EnterpriseSamplingStrategy,
+    SketchEstimateRequest,
+    SketchType,
+)
+
+
+def test_reservoir_sampler_keeps_k_distinct_rows_across_batches() -> None:
+    frame = pl.DataFrame({"id": list(range(10_000))})
+    sampler = ReservoirSampler(250, seed=7)
+    for offset in range(0, frame.height, 333):
+        sampler.feed(frame.slice(offset, 333))
+
+    sample = sampler.result()
+    assert sampler.rows_seen == 10_000
+    assert sample.height == 250
+    assert sample["id"].n_unique() == 250
+    # A uniform sample should reach well past the first batch.
+    assert sample["id"].max() > 5_000
+
+
+def test_allocate_quotas_sums_to_target() -> None:
+    blocks = [
+        SamplingBlock(index=0, offset=0, rows=700),
+        SamplingBlock(index=1, offset=700, rows=200),
+        SamplingBlock(index=2, offset=900, rows=100),
+    ]
+    quotas = allocate_quotas(blocks, 101)
+    assert sum(quotas) == 101
+    assert quotas[0] > quotas[1] > quotas[2]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "strategy",
+    [EnterpriseSamplingStrategy.BLOCK, EnterpriseSamplingStrategy.MULTI_STAGE],
+)
+async def test_streaming_strategies_hit_target_without_collect(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    strategy: EnterpriseSamplingStrategy,
+) -> None:
+    path = tmp_path / "events.parquet"
+    pl.DataFrame({"id": list(range(200_000))}).write_parquet(
+        path, row_group_size=20_000
+    )
+    collected: list[pl.LazyFrame] = []
+    collect = pl.LazyFrame.collect
+
+    def spy_collect(self: pl.LazyFrame, *args, **kwargs):
+        collected.append(self)
+        return collect(self, *args, **kwargs)
+
+    monkeypatch.setattr(pl.LazyFrame, "collect", spy_collect)
+
+    request = EnterpriseSamplingRequest(
+        source_id="src-1",
+        target_rows=5_000,
+        strategy=strategy,
+    )
+    response = await EnterpriseScaleSampler().sample(
+        request,
+        pl.scan_parquet(path),
+        row_count=200_000,
+        column_count=1,
+        source_path=str(path),
+    )
+
+    assert response.status == "completed", response.error_message
+    assert response.metrics is not None
+    assert response.metrics.sampled_rows == 5_000
+    assert response.metrics.blocks_processed
+    assert collected == []
+
+
+def test_sketches_merge_and_round_trip() -> None:
+    values = pl.Series("user", [i % 30_000 for i in range(120_000)])
+    left = HyperLogLogSketch(precision=14)
+    right = HyperLogLogSketch(precision=14)
+    left.update(values.slice(0, 60_000))
+    right.update(values.slice(60_000))
+
+    merged = Sketch.from_bytes(left.merge(right).to_bytes())
+    assert isinstance(merged, HyperLogLogSketch)
+    assert abs(merged.estimate() - 30_000) / 30_000 < 0.03
+    assert merged.rows_added == 120_000
+
+    cms = CountMinSketch(width=500, depth=4)
+    cms.update(pl.Series(["hot"] * 5_000 + [str(i) for i in range(20_000)]))
+    hitters = Sketch.from_bytes(cms.to_bytes()).heavy_hitters(threshold=0.1)
+    assert hitters[0]["value"] == "hot"
+    assert hitters[0]["count"] >= 5_000
+
+    with pytest.raises(ValueError):
+        left.merge(HyperLogLogSketch(precision=12))
+
+
+@pytest.mark.asyncio
+async def test_sketch_estimator_reuses_and_extends_stored_sketches(tmp_path: Path) -> None:
+    estimator = SketchEstimator(SketchStore(tmp_path / "sketches"))
+    request = SketchEstimateRequest(
+        source_id="src-1",
+        columns=["user"],
+        sketch_type=SketchType.HYPERLOGLOG,
+    )
+    base = pl.DataFrame({"user": list(range(10_000))})
+    partition = pl.DataFrame({"user": list(range(5_000, 15_000))})
+
+    first = await estimator.estimate(request, base.lazy(), partition_key="base")
+    # The stored sketch answers without touching the data.
+    reused = await estimator.estimate(request, None, partition_key="base")
+    extended = await estimator.estimate(
+        request, partition.lazy(), partition_key="day-2", incremental=True
+    )
+
+    assert not first.results[0].from_store
+    assert reused.results[0].from_store
+    assert reused.results[0].cardinality_estimate == first.results[0].cardinality_estimate
+    assert extended.results[0].partitions_merged == 2
+    assert extended.results[0].rows_ingested == 20_000
+    assert abs(extended.results[0].cardinality_estimate - 15_000) / 15_000 < 0.03
+
+
+def test_partition_paths_stay_inside_the_source_directory(tmp_path: Path) -> None:
+    source_dir = tmp_path / "events"
+    source_dir.mkdir()
+    (source_dir / "day-1.parquet").touch()
+    (source_dir / "day-2.csv").touch()
+    (source_dir / "notes.txt").touch()
+    secret = tmp_path / "secret.csv"
+    secret.touch()
+    (source_dir / "linked.csv").symlink_to(secret)
+    source_path = str(source_dir / "day-1.parquet")
+
+    assert resolve_partition_path(source_path, "day-2.csv") == source_dir / "day-2.csv"
+    assert (
+        resolve_partition_path(str(source_dir), str(source_dir / "day-2.csv"))
+        == source_dir / "day-2.csv"
+    )
+    for rejected in (
+        "../secret.csv",
+        str(secret),
+        "linked.csv",
+        "notes.txt",
+        "missing.csv",
+        "/etc/passwd",
+    ):
+        with pytest.raises(ValueError):
+            resolve_partition_path(source_path, rejected)
@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import text
+
+from truthound_dashboard.core.control_plane import AuthService
+from truthound_dashboard.core.incidents import IncidentService, encode_incident_cursor
+from truthound_dashboard.db import get_session
+from truthound_dashboard.db.database import (
+    _migration_incident_query_indexes,
+    get_engine,
+    init_db,
+    reset_connection,
+)
+from truthound_dashboard.db.models import EscalationIncidentModel, EscalationPolicyModel
+from truthound_dashboard.schemas.unified_alerts import (
+    AlertSeverity,
+    AlertSource,
+    AlertStatus,
+)
+from truthound_dashboard.time import utc_now
+
+
+@pytest.fixture
+async def workspace_id():
+    reset_connection()
+    await init_db()
+    async with get_session() as session:
+        context = await AuthService(session).ensure_bootstrap_state()
+    yield context.workspace.id
+    await get_engine().dispose()
+    reset_connection()
+
+
+async def _seed(workspace_id: str, count: int = 12) -> list[str]:
+    now = utc_now()
+    async with get_session() as session:
+        policy = EscalationPolicyModel(
+            workspace_id=workspace_id,
+            name="Primary Policy",
+            levels=[{"level": 1, "delay_minutes": 5, "targets": []}],
+        )
+        session.add(policy)
+        await session.flush()
+        incidents = []
+        for i in range(count):
+            incident = EscalationIncidentModel(
+                policy_id=policy.id,
+                workspace_id=workspace_id,
+                incident_ref=f"ref-{i}",
+                state="resolved" if i % 3 == 0 else "triggered",
+                current_level=1,
+                escalation_count=0,
+                context={
+                    "source": "anomaly" if i % 2 else "validation",
+                    "severity": "critical" if i < 4 else "medium",
+                    "source_name": "orders" if i % 4 else "customers",
+                    "title": f"Warehouse check {i} failed",
+                    "message": "Null ratio exceeded" if i == 5 else "Threshold breached",
+                },
+                # Two incidents share each timestamp to exercise the id tiebreak.
+                created_at=now - timedelta(minutes=10 * (i // 2)),
+            )
+            session.add(incident)
+            incidents.append(incident)
+        await session.flush()
+        return [incident.id for incident in incidents]
+
+
+@pytest.mark.asyncio
+async def test_filters_and_search_run_in_sql(workspace_id) -> None:
+    await _seed(workspace_id)
+    async with get_session() as session:
+        service = IncidentService(session)
+
+        resolved = await service.list_incidents(
+            workspace_id=workspace_id, status=AlertStatus.RESOLVED
+        )
+        assert sorted(a.source_id for a in resolved) == ["ref-0", "ref-3", "ref-6", "ref-9"]
+
+        anomalies = await service.list_incidents(
+            workspace_id=workspace_id,
+            source=AlertSource.ANOMALY,
+            severity=AlertSeverity.CRITICAL,
+        )
+        assert sorted(a.source_id for a in anomalies) == ["ref-1", "ref-3"]
+
+        # FTS trigram match is case-insensitive and matches inside words.
+        hits = await service.list_incidents(workspace_id=workspace_id, search="NULL RAT")
+        assert [a.source_id for a in hits] == ["ref-5"]
+        assert await service.count_incidents(workspace_id=workspace_id, search="custom") == 3
+        # Too short for trigrams, so it goes through the LIKE fallback.
+        assert await service.count_incidents(workspace_id=workspace_id, search="11") == 1
+        assert await service.count_incidents(workspace_id=workspace_id, search="%") == 0
+
+        assert await service.list_incidents(workspace_id="other") == []
+
+
+@pytest.mark.asyncio
+async def test_keyset_pages_cover_every_incident_once(workspace_id) -> None:
+    ids = await _seed(workspace_id)
+    async with get_session() as session:
+        service = IncidentService(session)
+        everything = await service.list_incidents(workspace_id=workspace_id)
+        seen: list[str] = []
+        cursor = None
+        while True:
+            page = await service.list_incidents(workspace_id=workspace_id, limit=5, cursor=cursor)
+            seen.extend(a.id for a in page)
+            if len(page) < 5:
+                break
+            cursor = encode_incident_cursor(page[-1])
+
+        offset_page = await service.list_incidents(workspace_id=workspace_id, limit=5, offset=5)
+
+        with pytest.raises(ValueError):
+            await service.list_incidents(workspace_id=workspace_id, cursor="not-a-cursor")
+
+    assert seen == [a.id for a in everything]
+    assert sorted(seen) == sorted(ids)
+    assert [a.id for a in offset_page] == seen[5:10]
+
+
+@pytest.mark.asyncio
+async def test_summary_and_correlations_aggregate_in_sql(workspace_id) -> None:
+    ids = await _seed(workspace_id)
+    async with get_session() as session:
+        service = IncidentService(session)
+        summary = await service.summary(workspace_id=workspace_id)
+        correlations = await service.correlations(incident_id=ids[1], workspace_id=workspace_id)
+
+    assert summary.total_alerts == 12
+    assert summary.active_alerts == 8
+    assert (summary.by_status.open, summary.by_status.resolved) == (8, 4)
+    assert (summary.by_severity.critical, summary.by_severity.medium) == (4, 8)
+    assert (summary.by_source.validation, summary.by_source.anomaly) == (6, 6)
+    assert summary.top_sources == [
+        {"name": "orders", "count": 9},
+        {"name": "customers", "count": 3},
+    ]
+    assert len(summary.trend_24h) == 25
+    assert sum(point.count for point in summary.trend_24h) == 12
+
+    (same_source,) = correlations
+    assert same_source.correlation_type == "same_source"
+    assert sorted(a.source_id for a in same_source.related_alerts) == [
+        f"ref-{i}" for i in (10, 11, 2, 3, 5, 6, 7, 9)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_search_index_follows_updates_and_rebuilds(workspace_id) -> None:
+    ids = await _seed(workspace_id, 3)
+    async with get_session() as session:
+        incident = await session.get(EscalationIncidentModel, ids[0])
+        incident.context = {**incident.context, "title": "Schema changed upstream"}
+
+    async with get_engine().begin() as conn:
+        await _migration_incident_query_indexes(conn)
+        await _migration_incident_query_indexes(conn)
+        indexed = await conn.scalar(text("SELECT count(*) FROM escalation_incidents_fts"))
+    assert indexed == 3
+
+    async with get_session() as session:
+        service = IncidentService(session)
+        upstream = await service.list_incidents(workspace_id=workspace_id, search="upstream")
+        stale = await service.count_incidents(workspace_id=workspace_id, search="check 0")
+
+    assert [a.source_id for a in upstream] == ["ref-0"]
+    assert stale == 0
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import sqlite3
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import func, select
+
+from truthound_dashboard.config import get_settings
+from truthound_dashboard.core.maintenance import (
+    MaintenanceConfig,
+    MaintenanceManager,
+    ProfileCleanupStrategy,
+    SizeBasedCleanupStrategy,
+    ValidationCleanupStrategy,
+)
+from truthound_dashboard.db import Profile, Source, Validation, get_session
+from truthound_dashboard.db.database import get_engine, init_db, reset_connection
+from truthound_dashboard.time import utc_now
+
+
+@pytest.fixture
+async def database():
+    reset_connection()
+    await init_db()
+    yield get_settings().database_path
+    await get_engine().dispose()
+    reset_connection()
+
+
+async def _count(model) -> int:
+    async with get_session() as session:
+        return await session.scalar(select(func.count()).select_from(model))
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("database")
+async def test_retention_keeps_newest_profiles_and_purges_in_batches() -> None:
+    now = utc_now()
+    async with get_session() as session:
+        for s in range(3):
+            source = Source(name=f"s{s}", type="csv", config={"path": f"{s}.csv"})
+            session.add(source)
+            await session.flush()
+            for i in range(8):
+                session.add(
+                    Profile(
+                        source_id=source.id,
+                        profile_json={"i": i},
+                        created_at=now - timedelta(hours=i),
+                    )
+                )
+            for days in (1, 100, 200):
+                session.add(
+                    Validation(
+                        source_id=source.id,
+                        status="success",
+                        passed=True,
+                        created_at=now - timedelta(days=days),
+                    )
+                )
+
+    config = MaintenanceConfig(
+        profile_keep_per_source=5, validation_retention_days=90, delete_batch_size=4
+    )
+    profiles = await ProfileCleanupStrategy().execute(config)
+    validations = await ValidationCleanupStrategy().execute(config)
+
+    assert profiles.success and profiles.records_deleted == 9
+    assert validations.success and validations.records_deleted == 6
+    async with get_session() as session:
+        kept = (await session.execute(select(Profile.profile_json))).scalars().all()
+    assert sorted(p["i"] for p in kept) == sorted(list(range(5)) * 3)
+    assert await _count(Validation) == 3
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("database")
+async def test_size_cleanup_drops_oldest_until_under_target() -> None:
+    now = utc_now()
+    async with get_session() as session:
+        source = Source(name="s", type="csv", config={"path": "s.csv"})
+        session.add(source)
+        await session.flush()
+        for i in range(10):
+            session.add(
+                Validation(
+                    source_id=source.id,
+                    status="success",
+                    result_json={"pad": "x" * 100_000, "i": i},
+                    created_at=now - timedelta(minutes=i),
+                )
+            )
+
+    # ~1 MB stored, 0.5 MB allowed: trim to 80% of the limit.
+    result = await SizeBasedCleanupStrategy().execute(
+        MaintenanceConfig(max_storage_mb=0.5, delete_batch_size=2)
+    )
+
+    assert result.success and result.records_deleted == 6
+    async with get_session() as session:
+        kept = (await session.execute(select(Validation.result_json))).scalars().all()
+    assert sorted(v["i"] for v in kept) == [0, 1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_vacuum_is_incremental_and_converts_legacy_databases(database) -> None:
+    async with get_session() as session:
+        source = Source(name="s", type="csv", config={"path": "s.csv"})
+        session.add(source)
+        await session.flush()
+        for _ in range(50):
+            session.add(
+                Validation(
+                    source_id=source.id,
+                    status="success",
+                    result_json={"pad": "x" * 50_000},
+                    created_at=utc_now() - timedelta(days=365),
+                )
+            )
+    await ValidationCleanupStrategy().execute(MaintenanceConfig())
+
+    manager = MaintenanceManager()
+    assert await manager.vacuum() > 0
+    with sqlite3.connect(database) as conn:
+        assert conn.execute("PRAGMA freelist_count").fetchone()[0] == 0
+
+    # A database created without incremental auto-vacuum is switched over.
+    await get_engine().dispose()
+    with sqlite3.connect(database) as conn:
+        conn.execute("PRAGMA auto_vacuum = NONE")
+        conn.execute("VACUUM")
+        assert conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 0
+    assert await manager.vacuum() == 0
+    with sqlite3.connect(database) as conn:
+        assert conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2
@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+from pathlib import Path
+
+import httpx
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse
+
+from truthound_dashboard.api import middleware
+from truthound_dashboard.api.middleware import (
+    LocaleDetectionMiddleware,
+    MiddlewarePipeline,
+    RateLimitConfig,
+    RateLimitMiddleware,
+    RequestLoggingMiddleware,
+    SecurityHeadersMiddleware,
+    SlidingWindowRateLimiter,
+    SQLiteRateLimiter,
+)
+from truthound_dashboard.core.exceptions import ErrorCode
+
+
+def _app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(
+        MiddlewarePipeline,
+        stages=[
+            LocaleDetectionMiddleware(),
+            RequestLoggingMiddleware(),
+            SecurityHeadersMiddleware(),
+            RateLimitMiddleware(config=RateLimitConfig(requests_per_minute=2)),
+        ],
+    )
+
+    @app.get("/items")
+    async def items(request: Request) -> dict[str, str]:
+        return {"locale": request.state.locale.value, "id": request.state.request_id}
+
+    @app.get("/stream")
+    async def stream() -> StreamingResponse:
+        async def chunks():
+            for i in range(3):
+                yield f"chunk-{i};"
+
+        return StreamingResponse(chunks(), media_type="text/plain")
+
+    return app
+
+
+@pytest.mark.asyncio
+async def test_pipeline_sets_headers_and_rejects_over_limit(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    transport = httpx.ASGITransport(app=_app())
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        with caplog.at_level(logging.INFO, logger="truthound_dashboard.api.middleware"):
+            first = await client.get("/items?lang=ko")
+        second = await client.get("/items")
+        limited = await client.get("/items")
+
+    assert first.status_code == 200
+    assert first.json()["locale"] == "ko"
+    assert first.headers["Content-Language"] == "ko"
+    assert first.headers["X-Request-ID"] == first.json()["id"]
+    assert first.headers["X-Request-ID"] != second.headers["X-Request-ID"]
+    assert first.headers["X-Frame-Options"] == "DENY"
+    assert first.headers["X-RateLimit-Remaining"] == "1"
+    assert any(
+        getattr(r, "status_code", None) == 200 and r.request_id == first.headers["X-Request-ID"]
+        for r in caplog.records
+    )
+
+    # Stages ahead of the rate limiter still decorate the rejection.
+    assert limited.status_code == 429
+    assert limited.json()["error"]["code"] == ErrorCode.RATE_LIMIT_EXCEEDED.value
+    assert limited.headers["Retry-After"]
+    assert limited.headers["X-Frame-Options"] == "DENY"
+    assert "X-Request-ID" in limited.headers
+
+
+@pytest.mark.asyncio
+async def test_pipeline_streams_body_without_buffering() -> None:
+    app = _app()
+    messages: list[dict] = []
+    requests = [{"type": "http.request", "body": b"", "more_body": False}]
+
+    async def receive() -> dict:
+        if requests:
+            return requests.pop()
+        await asyncio.Event().wait()  # client never disconnects
+        return {"type": "http.disconnect"}
+
+    async def send(message: dict) -> None:
+        messages.append(message)
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/stream",
+        "raw_path": b"/stream",
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"host", b"test")],
+        "client": ("127.0.0.1", 5000),
+        "server": ("test", 80),
+    }
+    await app(scope, receive, send)
+
+    start, *bodies = messages
+    assert start["type"] == "http.response.start"
+    assert (b"x-content-type-options", b"nosniff") in start["headers"]
+    chunks = [m["body"] for m in bodies if m["body"]]
+    assert chunks == [b"chunk-0;", b"chunk-1;", b"chunk-2;"]
+
+
+def test_sliding_window_counter_weights_previous_window_and_caps_keys(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    clock = [600.0]
+    monkeypatch.setattr(middleware.time, "time", lambda: clock[0])
+    limiter = SlidingWindowRateLimiter(requests_per_minute=10, max_keys=3)
+
+    assert all(limiter.is_allowed("a")[0] for _ in range(10))
+    assert not limiter.is_allowed("a")[0]
+
+    # Halfway through the next window, half of the previous count still applies.
+    clock[0] = 690.0
+    results = [limiter.is_allowed("a")[0] for _ in range(6)]
+    assert results == [True] * 5 + [False]
+
+    for key in ("b", "c", "d"):
+        limiter.is_allowed(key)
+    assert len(limiter) == 3  # "a" was least recently used and got evicted
+    assert limiter.is_allowed("a")[1]["remaining"] == 9
+
+
+def test_sqlite_limiter_enforces_one_limit_across_instances(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(middleware.time, "time", lambda: 1200.0)
+    path = tmp_path / "rate_limits.db"
+    workers = [SQLiteRateLimiter(path, requests_per_minute=4) for _ in range(2)]
+    try:
+        results = [workers[i % 2].is_allowed("10.0.0.1")[0] for i in range(6)]
+        assert results == [True] * 4 + [False] * 2
+        assert workers[1].is_allowed("10.0.0.2")[0]
+        assert len(workers[0]) == 2
+    finally:
+        for worker in workers:
+            worker.close()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_limiter_runs_off_loop_and_prunes_on_write(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    clock = [1200.0]
+    monkeypatch.setattr(middleware.time, "time", lambda: clock[0])
+    limiter = SQLiteRateLimiter(tmp_path / "rate_limits.db", requests_per_minute=2, max_keys=3)
+    stage = RateLimitMiddleware(config=RateLimitConfig(requests_per_minute=2), strategy=limiter)
+    threads: list[str] = []
+    check = limiter.is_allowed
+
+    def record_thread(key: str):
+        threads.append(threading.current_thread().name)
+        return check(key)
+
+    monkeypatch.setattr(limiter, "is_allowed", record_thread)
+    app = FastAPI()
+    app.add_middleware(MiddlewarePipeline, stages=[stage])
+
+    @app.get("/items")
+    async def items() -> dict[str, bool]:
+        return {"ok": True}
+
+    transport = httpx.ASGITransport(app=app)
+    try:
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            statuses = [(await client.get("/items")).status_code for _ in range(3)]
+        assert statuses == [200, 200, 429]
+        assert threading.main_thread().name not in threads
+
+        for key in ("b", "c", "d", "b", "e"):
+            check(key)
+        # New keys trim the table to max_keys, least recently seen first.
+        assert len(limiter) == 3
+        assert check("b")[1]["remaining"] == 0
+        assert check("c")[1]["remaining"] == 1
+
+        # Two windows later every key has expired and the first write prunes them.
+        clock[0] += 120
+        check("f")
+        assert len(limiter) == 1
+    finally:
+        limiter.close()
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import func, select
+
+from truthound_dashboard.core.domains.profiles import ProfileRepository
+from truthound_dashboard.core.maintenance import (
+    MaintenanceConfig,
+    ProfileCleanupStrategy,
+)
+from truthound_dashboard.core.profile_comparison import ProfileComparisonService
+from truthound_dashboard.db import Profile, ProfileColumnMetric, Source, get_session
+from truthound_dashboard.db.database import (
+    _migration_profile_column_metrics,
+    get_engine,
+    init_db,
+    reset_connection,
+)
+from truthound_dashboard.time import utc_now
+
+
+@pytest.fixture
+async def database():
+    reset_connection()
+    await init_db()
+    yield
+    await get_engine().dispose()
+    reset_connection()
+
+
+def _profile_json(i: int) -> dict:
+    return {
+        "columns": [
+            # Legacy string percentages and current 0-1 ratios both count.
+            {"name": "email", "null_pct": f"{i * 2}%", "unique_pct": "90%"},
+            {
+                "name": "amount",
+                "null_ratio": 0.01 * i,
+                "unique_ratio": 0.5,
+                "distribution": {"min": 0, "max": 100 + i, "mean": 50.0},
+            },
+            {"name": "id", "null_pct": "0%", "unique_pct": "100%"},
+        ]
+    }
+
+
+async def _count_metrics() -> int:
+    async with get_session() as session:
+        return await session.scalar(
+            select(func.count()).select_from(ProfileColumnMetric)
+        )
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("database")
+async def test_trend_reads_metrics_written_on_save() -> None:
+    now = utc_now()
+    async with get_session() as session:
+        source = Source(name="orders", type="csv", config={"path": "orders.csv"})
+        session.add(source)
+        await session.flush()
+        repo = ProfileRepository(session)
+        # The oldest profile falls outside the 30-day period.
+        for i, days in enumerate((40, 3, 2, 1)):
+            await repo.create(
+                source_id=source.id,
+                profile_json=_profile_json(i),
+                row_count=100 * (i + 1),
+                column_count=3,
+                created_at=now - timedelta(days=days),
+            )
+
+        metric = (
+            await session.execute(
+                select(ProfileColumnMetric).where(
+                    ProfileColumnMetric.column_name == "amount",
+                    ProfileColumnMetric.null_pct == 3.0,
+                )
+            )
+        ).scalar_one()
+        assert (metric.unique_pct, metric.min_value, metric.max_value, metric.mean) == (
+            50.0,
+            0.0,
+            103.0,
+            50.0,
+        )
+
+        trend = await ProfileComparisonService(session).get_profile_trend(source)
+
+    assert [p.row_count for p in trend.data_points] == [200, 300, 400]
+    assert trend.data_points[0].avg_null_pct == pytest.approx((2 + 1 + 0) / 3, abs=0.01)
+    assert trend.data_points[0].avg_unique_pct == pytest.approx(80.0)
+
+    by_column = {t.column: t for t in trend.column_trends}
+    assert list(by_column) == ["email", "amount", "id"]
+    email = by_column["email"]
+    assert [value for _, value in email.values] == [2.0, 4.0, 6.0]
+    assert (email.min_value, email.max_value, email.avg_value) == (2.0, 6.0, 4.0)
+    assert email.change_pct == 200.0
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("database")
+async def test_migration_backfills_and_cleanup_drops_metrics() -> None:
+    now = utc_now()
+    async with get_session() as session:
+        source = Source(name="orders", type="csv", config={"path": "orders.csv"})
+        session.add(source)
+        await session.flush()
+        # Profiles saved before the metrics table existed.
+        for i in range(4):
+            session.add(
+                Profile(
+                    source_id=source.id,
+                    profile_json=_profile_json(i),
+                    created_at=now - timedelta(hours=i),
+                )
+            )
+
+    async with get_engine().begin() as conn:
+        await _migration_profile_column_metrics(conn)
+        await _migration_profile_column_metrics(conn)
+    assert await _count_metrics() == 12
+
+    result = await ProfileCleanupStrategy().execute(
+        MaintenanceConfig(profile_keep_per_source=1)
+    )
+
+    assert result.records_deleted == 3
+    assert await _count_metrics() == 3
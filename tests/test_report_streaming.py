@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import json
+import re
+
+import pytest
+
+from truthound_dashboard.core.domains.validations import ValidationService
+from truthound_dashboard.core.reporters import (
+    HTMLReporter,
+    ReportTheme,
+    get_reporter,
+    html_reporter,
+)
+from truthound_dashboard.db import Source, Validation, Workspace, get_session
+from truthound_dashboard.db.database import get_engine, init_db, reset_connection
+
+# Generation timestamps differ between two renders.
+_TIMESTAMP = re.compile(r"\d{2}/\d{2}/\d{4} [\d:]{8}|\d{4}-\d{2}-\d{2}T[\d:.]+")
+
+
+def _validation(issue_count: int) -> Validation:
+    issues = [
+        {
+            "column": f"col_{i % 7}",
+            "issue_type": "null_values",
+            "severity": ["critical", "high", "medium", "low"][i % 4],
+            "count": i,
+            "details": f"row <{i}> & more",
+            "sample_values": [i, None, "ü"],
+        }
+        for i in range(issue_count)
+    ]
+    return Validation(
+        id="validation-1",
+        source_id="source-1",
+        status="failed",
+        passed=False,
+        total_issues=issue_count,
+        result_json={"issues": issues},
+    )
+
+
+async def _collect(report) -> bytes:
+    return b"".join([chunk async for chunk in report.chunks])
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("format", ["html", "csv", "json"])
+async def test_streamed_report_matches_generated_report(format: str) -> None:
+    validation = _validation(250)
+    reporter = get_reporter(format)
+
+    generated = await reporter.generate(validation, title="Orders")
+    streamed = reporter.stream(validation, title="Orders")
+
+    streamed_content = (await _collect(streamed)).decode("utf-8")
+    assert _TIMESTAMP.sub("", streamed_content) == _TIMESTAMP.sub("", generated.content)
+    assert streamed.content_type == generated.content_type
+    if format == "json":
+        assert len(json.loads(generated.content)["issues"]) == 250
+
+
+@pytest.mark.asyncio
+async def test_html_issue_table_is_paginated_and_css_is_cached(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(html_reporter, "ISSUES_PER_PAGE", 100)
+    reporter = HTMLReporter()
+
+    content = (await reporter.generate(_validation(250))).content
+    assert content.count('<tbody class="issue-page"') == 3
+    assert 'class="pager"' in content and "<script>" in content
+    assert "row &lt;7&gt; &amp; more" in content
+
+    small = (await reporter.generate(_validation(3))).content
+    assert small.count('<tbody class="issue-page"') == 1
+    assert "<script>" not in small
+
+    css = reporter._generate_css(ReportTheme.DARK)
+    assert HTMLReporter()._generate_css(ReportTheme.DARK) is css
+    assert HTMLReporter(locale="ar")._generate_css(ReportTheme.DARK) is not css
+
+
+@pytest.fixture
+async def database():
+    reset_connection()
+    await init_db()
+    yield
+    await get_engine().dispose()
+    reset_connection()
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("database")
+async def test_report_lookup_is_scoped_to_the_workspace() -> None:
+    async with get_session() as session:
+        ours, theirs = Workspace(name="Ours", slug="ours"), Workspace(name="Theirs", slug="theirs")
+        session.add_all([ours, theirs])
+        await session.flush()
+        source = Source(name="orders", type="csv", config={}, workspace_id=theirs.id)
+        session.add(source)
+        await session.flush()
+        validation = Validation(source_id=source.id, status="success", passed=True)
+        session.add(validation)
+        await session.flush()
+
+        service = ValidationService(session)
+        assert await service.get_validation(validation.id, workspace_id=ours.id) is None
+        found = await service.get_validation(validation.id, workspace_id=theirs.id)
+        assert found is not None and found.source.name == "orders"
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from truthound_dashboard.core.domains.validations import ValidationService
+from truthound_dashboard.core.result_cache import (
+    build_cache_key,
+    fingerprint_file,
+    get_result_cache_metrics,
+)
+from truthound_dashboard.db import Source
+from truthound_dashboard.db.database import init_db
+
+
+def test_file_fingerprint_tracks_content_and_mtime(tmp_path: Path) -> None:
+    data_path = tmp_path / "orders.csv"
+    data_path.write_text("id,amount\n1,10\n2,20\n", encoding="utf-8")
+
+    first = fingerprint_file(data_path)
+    assert first is not None
+    assert fingerprint_file(data_path) == first
+
+    stat = data_path.stat()
+    data_path.write_text("id,amount\n1,10\n2,99\n", encoding="utf-8")
+    os.utime(data_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    changed = fingerprint_file(data_path)
+    assert changed is not None
+    assert changed.digest != first.digest
+
+    assert fingerprint_file(tmp_path / "missing.csv") is None
+
+
+def test_cache_key_is_canonical_over_parameter_order(tmp_path: Path) -> None:
+    data_path = tmp_path / "orders.csv"
+    data_path.write_text("id\n1\n", encoding="utf-8")
+    fingerprint = fingerprint_file(data_path)
+    assert fingerprint is not None
+
+    key_a = build_cache_key(
+        "validation",
+        fingerprint,
+        validators=["Null"],
+        validator_config={"Null": {"columns": ["id"], "mostly": 0.9}},
+    )
+    key_b = build_cache_key(
+        "validation",
+        fingerprint,
+        validator_config={"Null": {"mostly": 0.9, "columns": ["id"]}},
+        validators=["Null"],
+    )
+    key_c = build_cache_key("validation", fingerprint, validators=["Unique"])
+
+    assert key_a == key_b
+    assert key_a != key_c
+
+
+@pytest.mark.asyncio
+async def test_validation_reuses_stored_result_for_unchanged_file(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    data_path = tmp_path / "orders.csv"
+    data_path.write_text("id,amount\n1,10\n2,20\n", encoding="utf-8")
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'cache.sqlite3'}",
+        connect_args={"check_same_thread": False},
+    )
+    get_result_cache_metrics().reset()
+
+    calls: list[object] = []
+
+    async def fake_check(data_input: object, **_kwargs: object) -> SimpleNamespace:
+        calls.append(data_input)
+        return SimpleNamespace(
+            passed=True,
+            has_critical=False,
+            has_high=False,
+            total_issues=0,
+            critical_issues=0,
+            high_issues=0,
+            medium_issues=0,
+            low_issues=0,
+            row_count=2,
+            column_count=2,
+            to_dict=lambda: {"issues": [], "row_count": 2},
+        )
+
+    try:
+        await init_db(engine)
+        factory = async_sessionmaker(engine, expire_on_commit=False)
+        async with factory() as session:
+            source = Source(name="orders", type="csv", config={"path": str(data_path)})
+            session.add(source)
+            await session.flush()
+
+            service = ValidationService(session)
+            monkeypatch.setattr(service.adapter, "check", fake_check)
+
+            first = await service.run_validation(source.id, validators=["Null"])
+            second = await service.run_validation(source.id, validators=["Null"])
+            other_params = await service.run_validation(source.id, validators=["Unique"])
+            uncached = await service.run_validation(
+                source.id, validators=["Null"], use_cache=False
+            )
+
+        assert first.cache_hit is False
+        assert second.cache_hit is True
+        assert second.cache_key == first.cache_key
+        assert second.result_json == first.result_json
+        assert second.status == "success"
+        assert other_params.cache_hit is False
+        assert uncached.cache_hit is False
+        assert len(calls) == 3
+
+        stats = get_result_cache_metrics().snapshot()["validation"]
+        assert stats["hits"] == 1
+        assert stats["misses"] == 2
+        assert stats["bypassed"] == 1
+    finally:
+        await engine.dispose()
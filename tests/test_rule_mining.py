@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import polars as pl
+import pytest
+
+from truthound_dashboard.core.rule_generator import RuleGeneratorService
+from truthound_dashboard.core.rule_mining import (
+    RuleMiner,
+    RuleMiningConfig,
+    measured_confidence,
+)
+from truthound_dashboard.db import Profile, Source, get_session
+from truthound_dashboard.db.database import get_engine, init_db, reset_connection
+from truthound_dashboard.schemas.rule_suggestion import CrossColumnRuleType
+
+
+def _orders(rows: int = 4_000) -> pl.DataFrame:
+    rng = np.random.default_rng(7)
+    subtotal = rng.uniform(10, 500, rows).round(2)
+    tax = (subtotal * 0.1).round(2)
+    qty = rng.integers(1, 10, rows)
+    price = rng.uniform(1, 50, rows).round(2)
+    country = rng.choice(["KR", "US", "DE", "JP"], rows)
+    currency = {"KR": "KRW", "US": "USD", "DE": "EUR", "JP": "JPY"}
+    return pl.DataFrame(
+        {
+            "order_id": np.repeat(np.arange(rows // 4), 4),
+            "line_no": np.tile(np.arange(4), rows // 4),
+            "country": country,
+            "currency": [currency[c] for c in country],
+            "subtotal": subtotal,
+            "tax": tax,
+            "total": subtotal + tax,
+            "qty": qty,
+            "price": price,
+            "amount": qty * price,
+            "noise": rng.normal(size=rows),
+        }
+    )
+
+
+def _found(suggestions) -> set[tuple[str, tuple[str, ...]]]:
+    return {(s.rule_type.value, tuple(sorted(s.columns))) for s in suggestions}
+
+
+def test_miner_finds_planted_relationships() -> None:
+    suggestions = RuleMiner().mine(_orders())
+    found = _found(suggestions)
+
+    assert ("composite_key", ("line_no", "order_id")) in found
+    assert ("column_dependency", ("country", "currency")) in found
+    assert ("column_sum", ("subtotal", "tax", "total")) in found
+    assert ("column_product", ("amount", "price", "qty")) in found
+    assert ("column_correlation", ("subtotal", "total")) in found
+    assert not any("noise" in columns for _, columns in found)
+
+    dependency = next(
+        s for s in suggestions if s.rule_type == CrossColumnRuleType.COLUMN_DEPENDENCY
+    )
+    assert dependency.columns == ["country", "currency"]
+    assert dependency.evidence["pattern"] == "measured_functional_dependency"
+    assert dependency.confidence == measured_confidence(1.0, 4_000)
+
+
+def test_miner_matches_rounded_arithmetic_results() -> None:
+    rng = np.random.default_rng(11)
+    rows = 2_000
+    price = rng.uniform(1, 50, rows).round(3)
+    qty = rng.uniform(0.5, 20, rows).round(3)
+    fee = rng.uniform(0, 5, rows).round(4)
+    df = pl.DataFrame(
+        {
+            "price": price,
+            "qty": qty,
+            "fee": fee,
+            # Totals are stored rounded to cents, so they never equal the
+            # exact product or sum.
+            "amount": (price * qty).round(2),
+            "charged": (price + fee).round(2),
+        }
+    )
+
+    found = _found(RuleMiner().mine(df))
+
+    assert ("column_product", ("amount", "price", "qty")) in found
+    assert ("column_sum", ("charged", "fee", "price")) in found
+
+
+def test_discovery_subset_does_not_hide_duplicate_keys() -> None:
+    df = _orders()
+    # The duplicate falls between discovery rows; the key must still be rejected.
+    df = pl.concat([df, df[1:2]])
+    suggestions = RuleMiner(RuleMiningConfig(discovery_rows=500)).mine(df)
+
+    assert ("composite_key", ("line_no", "order_id")) not in _found(suggestions)
+
+
+def test_measured_confidence_discounts_small_samples() -> None:
+    assert measured_confidence(1.0, 100) == 0.9
+    assert measured_confidence(1.0, 1_000_000) == 0.99
+    assert measured_confidence(0.5, 0) == 0.0
+
+
+@pytest.fixture
+async def database():
+    reset_connection()
+    await init_db()
+    yield
+    await get_engine().dispose()
+    reset_connection()
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("database")
+async def test_service_replaces_name_heuristics_with_mined_rules(tmp_path: Path) -> None:
+    path = tmp_path / "orders.csv"
+    df = _orders()
+    df.write_csv(path)
+    profile_columns = [
+        {"name": name, "dtype": str(dtype), "null_pct": "0%", "unique_pct": "50%"}
+        for name, dtype in df.schema.items()
+    ]
+
+    async with get_session() as session:
+        source = Source(name="orders", type="csv", config={"path": str(path)})
+        session.add(source)
+        await session.flush()
+        profile = Profile(source_id=source.id, profile_json={"columns": profile_columns})
+        session.add(profile)
+        await session.flush()
+
+        service = RuleGeneratorService(session)
+        heuristic = await service.generate_suggestions(source, profile)
+        mined = await service.generate_suggestions(
+            source,
+            profile,
+            sample_rows=10_000,
+            exclude_cross_column_types=[CrossColumnRuleType.COLUMN_CORRELATION],
+        )
+
+    assert not any(
+        s.evidence.get("pattern", "").startswith("measured_")
+        for s in heuristic.cross_column_suggestions
+    )
+    found = _found(mined.cross_column_suggestions)
+    assert ("column_sum", ("subtotal", "tax", "total")) in found
+    assert ("composite_key", ("line_no", "order_id")) in found
+    by_type = {s.rule_type for s in mined.cross_column_suggestions}
+    assert CrossColumnRuleType.COLUMN_CORRELATION not in by_type
+    for s in mined.cross_column_suggestions:
+        if s.rule_type in (CrossColumnRuleType.COLUMN_SUM, CrossColumnRuleType.COMPOSITE_KEY):
+            assert s.evidence["pattern"].startswith("measured_")
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import polars as pl
+import pytest
+
+from truthound_dashboard.core.sampling import (
+    DataSampler,
+    SamplingConfig,
+    SamplingMethod,
+)
+
+
+@pytest.fixture
+def sampler(tmp_path: Path) -> DataSampler:
+    return DataSampler(
+        SamplingConfig(temp_dir=tmp_path / "samples", size_threshold_mb=0)
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("suffix", ["parquet", "csv", "jsonl"])
+async def test_random_sample_is_uniform_and_cached(
+    tmp_path: Path,
+    sampler: DataSampler,
+    suffix: str,
+) -> None:
+    frame = pl.DataFrame({"id": list(range(50_000))})
+    path = tmp_path / f"events.{suffix}"
+    if suffix == "parquet":
+        frame.write_parquet(path, row_group_size=5_000)
+    elif suffix == "csv":
+        frame.write_csv(path)
+    else:
+        frame.write_ndjson(path)
+
+    first = await sampler.sample(path, n=1_000, method=SamplingMethod.RANDOM)
+    second = await sampler.sample(path, n=1_000, method=SamplingMethod.RANDOM)
+
+    assert first.was_sampled and not first.cached
+    assert first.original_rows == 50_000
+    assert second.cached
+    assert second.sampled_path == first.sampled_path
+
+    sample = pl.read_parquet(first.sampled_path)
+    assert sample.height == 1_000
+    assert sample["id"].n_unique() == 1_000
+    assert sample["id"].max() > 25_000
+
+    other = await sampler.sample(path, n=500, method=SamplingMethod.RANDOM)
+    assert not other.cached
+    assert other.sampled_path != first.sampled_path
+
+
+@pytest.mark.asyncio
+async def test_stratified_sample_keeps_group_proportions(
+    tmp_path: Path,
+    sampler: DataSampler,
+) -> None:
+    path = tmp_path / "orders.csv"
+    pl.DataFrame(
+        {
+            "id": list(range(40_000)),
+            "region": ["eu" if i % 4 == 0 else "us" for i in range(40_000)],
+        }
+    ).write_csv(path)
+
+    result = await sampler.sample(
+        path,
+        n=2_000,
+        method=SamplingMethod.STRATIFIED,
+        stratify_column="region",
+    )
+
+    counts = dict(
+        pl.read_parquet(result.sampled_path).group_by("region").len().iter_rows()
+    )
+    assert counts == {"eu": 500, "us": 1_500}
+
+
+@pytest.mark.asyncio
+async def test_changed_file_invalidates_cached_sample(
+    tmp_path: Path,
+    sampler: DataSampler,
+) -> None:
+    path = tmp_path / "events.parquet"
+    pl.DataFrame({"id": list(range(10_000))}).write_parquet(path)
+    first = await sampler.sample(path, n=100, method=SamplingMethod.TAIL)
+
+    pl.DataFrame({"id": list(range(20_000))}).write_parquet(path)
+    second = await sampler.sample(path, n=100, method=SamplingMethod.TAIL)
+
+    assert sampler.get_file_info(path)["row_count"] == 20_000
+    assert not second.cached
+    assert second.original_rows == 20_000
+    assert pl.read_parquet(second.sampled_path)["id"].min() == 19_900
+    assert first.sampled_path != second.sampled_path
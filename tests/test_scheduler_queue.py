@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from truthound_dashboard.core import scheduler as scheduler_module
+from truthound_dashboard.core.scheduler import ValidationRunQueue, ValidationScheduler
+from truthound_dashboard.db import Schedule, Source, TriggerType
+from truthound_dashboard.db.database import init_db
+
+
+class _Runner:
+    def __init__(self) -> None:
+        self.started: list[str] = []
+        self.gates: dict[str, asyncio.Event] = {}
+        self.active = 0
+        self.peak = 0
+
+    async def __call__(self, schedule_id: str) -> None:
+        self.started.append(schedule_id)
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        gate = self.gates.setdefault(schedule_id, asyncio.Event())
+        try:
+            await gate.wait()
+            if schedule_id == "boom":
+                raise RuntimeError("validation failed")
+        finally:
+            self.active -= 1
+            del self.gates[schedule_id]
+
+    def release_all(self) -> None:
+        for gate in self.gates.values():
+            gate.set()
+
+
+async def _settle() -> None:
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_queue_limits_concurrency_and_orders_by_priority() -> None:
+    runner = _Runner()
+    queue = ValidationRunQueue(runner, max_concurrent=2, max_per_source=1)
+
+    assert queue.submit("a1", "src-a", priority=5)
+    assert queue.submit("a2", "src-a", priority=1)  # same source as a1
+    assert queue.submit("b1", "src-b", priority=9)
+    assert queue.submit("c1", "src-c", priority=3)
+    assert queue.submit("boom", "src-d", priority=2)
+    await _settle()
+
+    # a1 and b1 grabbed both slots before the others arrived.
+    assert runner.started == ["a1", "b1"]
+    assert queue.get_metrics()["depth"] == 3
+
+    # Coalescing keeps the better priority and does not add a second run.
+    assert not queue.submit("c1", "src-c", priority=1)
+
+    while queue.depth or queue.running_count:
+        runner.release_all()
+        await _settle()
+
+    # a2 waited for a1 to release src-a, then ties with c1 (bumped to
+    # priority 1) and wins on submission order; both beat boom.
+    assert runner.started == ["a1", "b1", "a2", "c1", "boom"]
+    assert runner.peak == 2
+    metrics = queue.get_metrics()
+    assert metrics["submitted"] == 6
+    assert metrics["coalesced"] == 1
+    assert metrics["completed"] == 4
+    assert metrics["failed"] == 1
+    assert metrics["depth"] == 0
+    assert metrics["max_wait_seconds"] >= metrics["avg_wait_seconds"] >= 0.0
+
+
+@pytest.mark.asyncio
+async def test_running_schedule_gets_one_follow_up_and_queue_is_bounded() -> None:
+    runner = _Runner()
+    queue = ValidationRunQueue(runner, max_concurrent=1, max_pending=1)
+
+    queue.submit("s1", "src", priority=5)
+    await _settle()
+    # Changes seen while s1 runs collapse into a single follow-up run.
+    assert queue.submit("s1", "src")
+    assert not queue.submit("s1", "src")
+    assert not queue.submit("s2", "other")  # queue full
+    assert queue.get_metrics()["rejected"] == 1
+
+    runner.release_all()
+    await _settle()
+    assert runner.started == ["s1", "s1"]
+
+    await queue.stop()
+    assert queue.running_count == 0
+    assert queue.get_metrics()["completed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_checker_evaluates_concurrently_with_timeout_and_metrics(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'checker.sqlite3'}",
+        connect_args={"check_same_thread": False},
+    )
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    @asynccontextmanager
+    async def session_scope():
+        async with factory() as session:
+            yield session
+            await session.commit()
+
+    monkeypatch.setattr(scheduler_module, "get_session", session_scope)
+    scheduler = ValidationScheduler(
+        maintenance_enabled=False,
+        max_concurrent_evaluations=3,
+        evaluation_timeout=0.2,
+    )
+    active = peak = 0
+
+    async def evaluate(_session, schedule) -> None:
+        nonlocal active, peak
+        scheduler._trigger_check_times[schedule.id] = scheduler_module.utc_now()
+        active += 1
+        peak = max(peak, active)
+        try:
+            await asyncio.sleep(10 if schedule.name == "slow" else 0.05)
+        finally:
+            active -= 1
+
+    monkeypatch.setattr(scheduler, "_evaluate_and_run_if_needed", evaluate)
+    try:
+        await init_db(engine)
+        async with factory() as session:
+            source = Source(name="s", type="csv", config={"path": "s.csv"})
+            session.add(source)
+            await session.flush()
+            for name in ["slow"] + [f"fast-{i}" for i in range(5)]:
+                session.add(
+                    Schedule(
+                        name=name,
+                        source_id=source.id,
+                        trigger_type=TriggerType.DATA_CHANGE.value,
+                        trigger_config={"check_interval_minutes": 1},
+                    )
+                )
+            await session.commit()
+
+        await scheduler._check_data_change_triggers()
+        metrics = scheduler.get_trigger_monitoring_status()["checker"]
+
+        assert peak == 3
+        assert len(scheduler._trigger_check_times) == 6
+        assert metrics["evaluation_timeouts"] == 1
+        assert metrics["last_cycle_evaluated"] == 6
+        assert metrics["last_cycle_lag_seconds"] == 0.0
+        # Bounded by the slow schedule's timeout, not its 10s sleep.
+        assert metrics["last_cycle_duration_seconds"] < 1.0
+
+        # Nothing is due again until the check interval has passed.
+        await scheduler._check_data_change_triggers()
+        assert scheduler.get_trigger_monitoring_status()["checker"][
+            "last_cycle_evaluated"
+        ] == 6
+    finally:
+        await scheduler._run_queue.stop()
+        await engine.dispose()
@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import event
+
+from truthound_dashboard.core import secrets as secrets_module
+from truthound_dashboard.core.control_plane import AuthService
+from truthound_dashboard.core.secrets import (
+    LocalEncryptedDbSecretProvider,
+    SecretValueCache,
+    build_secret_ref_payload,
+    get_secret_cache,
+)
+from truthound_dashboard.db import get_session
+from truthound_dashboard.db.database import get_engine, init_db, reset_connection
+
+
+@pytest.fixture
+async def workspace_id():
+    reset_connection()
+    await init_db()
+    async with get_session() as session:
+        context = await AuthService(session).ensure_bootstrap_state()
+    yield context.workspace.id
+    await get_engine().dispose()
+    reset_connection()
+
+
+@pytest.fixture
+def secret_queries():
+    executed: list[str] = []
+
+    def record(_conn, _cursor, statement, *_args):
+        if "FROM secret_refs" in statement:
+            executed.append(statement)
+
+    sync_engine = get_engine().sync_engine
+    event.listen(sync_engine, "before_cursor_execute", record)
+    yield executed
+    event.remove(sync_engine, "before_cursor_execute", record)
+
+
+@pytest.mark.asyncio
+async def test_materialize_resolves_all_refs_in_one_query(
+    workspace_id, secret_queries
+) -> None:
+    async with get_session() as session:
+        provider = LocalEncryptedDbSecretProvider(session)
+        refs = [
+            await provider.create_ref(
+                workspace_id=workspace_id, name=f"db:{name}", kind="source", raw_value=value
+            )
+            for name, value in (("password", "hunter2"), ("token", "t0k3n"))
+        ]
+    config = {
+        "host": "db.internal",
+        "password": build_secret_ref_payload(refs[0]),
+        "auth": {"token": build_secret_ref_payload(refs[1]), "retries": 3},
+        "backup": {"password": build_secret_ref_payload(refs[0])},
+        "missing": {"_secret_ref": "does-not-exist"},
+    }
+    expected = {
+        "host": "db.internal",
+        "password": "hunter2",
+        "auth": {"token": "t0k3n", "retries": 3},
+        "backup": {"password": "hunter2"},
+        "missing": None,
+    }
+    secret_queries.clear()
+
+    async with get_session() as session:
+        provider = LocalEncryptedDbSecretProvider(session)
+        assert await provider.materialize_config(config) == expected
+        assert len(secret_queries) == 1
+        assert await provider.materialize_config(config) == expected
+        # Only the unknown ref goes back to the database.
+        assert len(secret_queries) == 2
+
+    stats = get_secret_cache().get_stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (2, 4, 2)
+    assert stats["hit_rate"] == pytest.approx(1 / 3)
+
+
+@pytest.mark.asyncio
+async def test_writes_invalidate_cached_values(workspace_id) -> None:
+    async with get_session() as session:
+        provider = LocalEncryptedDbSecretProvider(session)
+        ref = await provider.create_ref(
+            workspace_id=workspace_id, name="db:password", kind="source", raw_value="one"
+        )
+        assert await provider.resolve(ref.id) == "one"
+
+        await provider.rotate(ref.id, raw_value="two")
+        assert await provider.resolve(ref.id) == "two"
+
+        await provider.upsert_ref(
+            workspace_id=workspace_id, name="db:password", kind="source", raw_value="three"
+        )
+        assert await provider.resolve(ref.id) == "three"
+
+        await provider.delete_ref(ref.id)
+        await session.flush()
+        assert await provider.resolve(ref.id) is None
+
+
+@pytest.mark.asyncio
+async def test_uncommitted_rotation_never_reaches_the_cache(workspace_id) -> None:
+    async with get_session() as session:
+        ref = await LocalEncryptedDbSecretProvider(session).create_ref(
+            workspace_id=workspace_id, name="db:password", kind="source", raw_value="one"
+        )
+
+    async def resolve_in_new_session() -> str | None:
+        async with get_session() as session:
+            return await LocalEncryptedDbSecretProvider(session).resolve(ref.id)
+
+    async with get_session() as writer:
+        provider = LocalEncryptedDbSecretProvider(writer)
+        await provider.rotate(ref.id, raw_value="two")
+        # Other sessions still read, and cache, the committed value.
+        assert await resolve_in_new_session() == "one"
+        assert await provider.resolve(ref.id) == "two"
+    assert await resolve_in_new_session() == "two"
+
+    async with get_session() as writer:
+        provider = LocalEncryptedDbSecretProvider(writer)
+        await provider.rotate(ref.id, raw_value="three")
+        assert await provider.resolve(ref.id) == "three"
+        await writer.rollback()
+    assert await resolve_in_new_session() == "two"
+
+
+def test_cache_zeroes_evicted_and_expired_values(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = [1000.0]
+    monkeypatch.setattr(secrets_module.time, "monotonic", lambda: now[0])
+    cache = SecretValueCache(ttl_seconds=60, max_entries=2)
+
+    cache.set("a", "alpha")
+    cache.set("b", "bravo")
+    buffer_a = cache._entries["a"][0]
+    buffer_b = cache._entries["b"][0]
+    assert cache.get("a") == "alpha"
+
+    cache.set("c", "charlie")  # "b" is least recently used
+    assert buffer_b == bytearray(5)
+    assert cache.get("b") is None
+
+    now[0] += 61
+    assert cache.get("a") is None
+    assert buffer_a == bytearray(5)
+    assert cache.get_stats()["evictions"] == 1
+
+    # A value fetched before an invalidation is not cached.
+    generation = cache.generation
+    cache.invalidate("c")
+    cache.set("c", "stale", generation=generation)
+    assert cache.get("c") is None
+
+    disabled = SecretValueCache(ttl_seconds=0)
+    disabled.set("a", "alpha")
+    assert disabled.get("a") is None
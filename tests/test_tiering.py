@@ -0,0 +1,260 @@
+from __future__ import annotations
+
+import threading
+import time
+from datetime import timedelta
+from pathlib import Path
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from truthound_dashboard.core import tiering
+from truthound_dashboard.core.tiering import (
+    FileTierStore,
+    SQLiteTierMetadataStore,
+    TierInfo,
+    TieringService,
+    TierMigrationEngine,
+    get_tiering_adapter,
+    reset_tiering_adapter,
+)
+from truthound_dashboard.db.database import init_db
+from truthound_dashboard.db.models import (
+    StorageTierModel,
+    TieringConfigModel,
+    TierMigrationHistoryModel,
+    TierPolicyModel,
+)
+from truthound_dashboard.time import utc_now
+
+
+class _ReadTrackingStore(FileTierStore):
+    def __init__(self, base_path: Path) -> None:
+        super().__init__(base_path)
+        self.read_sizes: list[int] = []
+
+    def open_read(self, item_id: str):
+        handle = super().open_read(item_id)
+        sizes = self.read_sizes
+
+        class Reader:
+            def read(self, size: int) -> bytes:
+                sizes.append(size)
+                return handle.read(size)
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc) -> None:
+                handle.close()
+
+        return Reader()
+
+
+@pytest.fixture(autouse=True)
+def _fresh_adapter():
+    reset_tiering_adapter()
+    yield
+    reset_tiering_adapter()
+
+
+def test_metadata_index_persists_and_orders_by_last_access(tmp_path: Path) -> None:
+    path = tmp_path / "tier_metadata.db"
+    now = utc_now()
+    index = SQLiteTierMetadataStore(path)
+    for i, item_id in enumerate(["a", "b", "c"]):
+        index.save_info(
+            TierInfo(item_id=item_id, tier_name="hot", created_at=now - timedelta(days=i))
+        )
+    index.save_info(TierInfo(item_id="z", tier_name="cold", created_at=now))
+    index.update_access("c")  # oldest, but just read
+    index.close()
+
+    reopened = SQLiteTierMetadataStore(path)
+    try:
+        assert [i.item_id for i in reopened.least_recently_accessed("hot")] == ["b", "a", "c"]
+        assert [i.item_id for i in reopened.least_recently_accessed("hot", 1)] == ["b"]
+        assert reopened.get_info("c").access_count == 1
+        assert reopened.delete_info("z") and len(reopened) == 3
+    finally:
+        reopened.close()
+
+
+@pytest.mark.asyncio
+async def test_engine_streams_chunks_between_file_stores(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(tiering, "MIGRATION_CHUNK_SIZE", 1024)
+    hot, cold = _ReadTrackingStore(tmp_path / "hot"), FileTierStore(tmp_path / "cold")
+    payloads = {f"runs/{i}": bytes([i]) * (5000 + i) for i in range(10)}
+    for item_id, data in payloads.items():
+        hot.save(item_id, data)
+
+    adapter = get_tiering_adapter()
+    metadata = SQLiteTierMetadataStore(tmp_path / "meta.db")
+    metadata.save_info(TierInfo(item_id="missing", tier_name="hot", created_at=utc_now()))
+    engine = TierMigrationEngine(adapter, max_workers=3)
+    results = await engine.migrate(
+        [*payloads, "missing"], hot, cold, metadata, from_tier="hot", to_tier="cold"
+    )
+    metadata_items = metadata.least_recently_accessed("cold")
+    forgotten = metadata.get_info("missing")
+    metadata.close()
+
+    assert [r.success for r in results] == [True] * 10 + [False]
+    assert "not found" in results[-1].error_message
+    assert forgotten is None
+    assert hot.list() == []
+    assert {item_id: cold.get(item_id) for item_id in cold.list()} == payloads
+    assert sum(r.size_bytes for r in results) == sum(map(len, payloads.values()))
+    assert {i.item_id for i in metadata_items} == set(payloads)
+    assert all(i.migrated_at is not None for i in metadata_items)
+    assert not list((tmp_path / "cold").glob(".*"))  # no temp files left behind
+    # Chunked copy never asks for a whole item at once.
+    assert set(hot.read_sizes) == {1024}
+
+
+@pytest.mark.asyncio
+async def test_engine_runs_max_workers_migrations_in_parallel(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    adapter = get_tiering_adapter()
+    lock = threading.Lock()
+    active = peak = 0
+
+    def migrate(*_args, **_kwargs) -> dict:
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.05)
+        with lock:
+            active -= 1
+        return {"success": True, "size_bytes": 1}
+
+    monkeypatch.setattr(adapter, "_sync_migrate", migrate)
+    # More workers than the shared four-thread tiering pool.
+    engine = TierMigrationEngine(adapter, max_workers=6)
+    results = await engine.migrate([f"item-{i}" for i in range(12)], None, None, None)
+
+    assert all(r.success for r in results)
+    assert peak == 6
+
+
+async def _add_demotion_policy(
+    session, tmp_path: Path
+) -> tuple[StorageTierModel, TierPolicyModel]:
+    hot = StorageTierModel(
+        name="hot",
+        store_type="file_tier",
+        store_config={"base_path": str(tmp_path / "hot")},
+    )
+    cold = StorageTierModel(
+        name="cold",
+        store_type="file_tier",
+        store_config={"base_path": str(tmp_path / "cold")},
+    )
+    session.add_all([hot, cold])
+    await session.flush()
+    policy = TierPolicyModel(
+        name="demote",
+        policy_type="age_based",
+        from_tier_id=hot.id,
+        to_tier_id=cold.id,
+        config={"after_days": 0},
+    )
+    session.add_all(
+        [
+            policy,
+            TieringConfigModel(
+                name="default",
+                enable_parallel_migration=True,
+                max_parallel_migrations=2,
+            ),
+        ]
+    )
+    await session.commit()
+    return hot, policy
+
+
+@pytest.mark.asyncio
+async def test_execute_policy_migrates_coldest_items_and_bulk_records_history(
+    tmp_path: Path,
+) -> None:
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'tiering.sqlite3'}",
+        connect_args={"check_same_thread": False},
+    )
+    try:
+        await init_db(engine)
+        factory = async_sessionmaker(engine, expire_on_commit=False)
+        async with factory() as session:
+            hot, policy = await _add_demotion_policy(session, tmp_path)
+
+            store = FileTierStore(tmp_path / "hot")
+            for i in range(5):
+                store.save(f"item-{i}", {"i": i})
+            service = TieringService(session)
+            for i in range(5):
+                await service.record_access(f"item-{i}", hot.id)
+            # Item 0 was just read again, so it is scanned last.
+            await service.record_access("item-0", hot.id)
+
+            dry = await service.execute_policy(policy.id, dry_run=True, batch_size=3)
+            result = await service.execute_policy(policy.id, batch_size=3)
+            history = await session.scalar(
+                select(func.count()).select_from(TierMigrationHistoryModel)
+            )
+
+        assert [m.item_id for m in dry.migrations] == ["item-1", "item-2", "item-3"]
+        assert result.items_scanned == 3
+        assert result.items_migrated == 3 and not result.errors
+        assert sorted(FileTierStore(tmp_path / "cold").list()) == [
+            "item-1",
+            "item-2",
+            "item-3",
+        ]
+        assert history == 3
+        index = get_tiering_adapter().create_metadata_store()
+        assert index.get_info("item-2").tier_name == "cold"
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_execute_policy_drops_index_rows_of_deleted_items(tmp_path: Path) -> None:
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'tiering.sqlite3'}",
+        connect_args={"check_same_thread": False},
+    )
+    try:
+        await init_db(engine)
+        factory = async_sessionmaker(engine, expire_on_commit=False)
+        async with factory() as session:
+            hot, policy = await _add_demotion_policy(session, tmp_path)
+            store = FileTierStore(tmp_path / "hot")
+            service = TieringService(session)
+            for i in range(6):
+                store.save(f"item-{i}", {"i": i})
+                await service.record_access(f"item-{i}", hot.id)
+            # The coldest items disappear behind the index's back.
+            for i in range(3):
+                store.delete(f"item-{i}")
+
+            result = await service.execute_policy(policy.id, batch_size=3)
+
+        assert result.items_migrated == 3 and not result.errors
+        assert sorted(FileTierStore(tmp_path / "cold").list()) == [
+            "item-3",
+            "item-4",
+            "item-5",
+        ]
+        adapter = get_tiering_adapter()
+        assert adapter.create_metadata_store().get_info("item-0") is None
+        # Existing filesystem tiers keep their store and on-disk layout.
+        legacy = adapter.create_store("filesystem", {"base_path": str(tmp_path / "legacy")})
+        assert not isinstance(legacy, FileTierStore)
+    finally:
+        await engine.dispose()
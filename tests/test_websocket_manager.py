@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import asyncio
+import json
+
+import pytest
+
+from truthound_dashboard.core.websocket import (
+    SlowConsumerPolicy,
+    WebSocketManager,
+    WebSocketMessage,
+    WebSocketMessageType,
+)
+
+
+class _FakeSocket:
+    def __init__(self, blocked: bool = False) -> None:
+        self.frames: list[str] = []
+        self.gate = asyncio.Event()
+        if not blocked:
+            self.gate.set()
+        self.closed = False
+
+    async def accept(self) -> None:
+        pass
+
+    async def send_text(self, payload: str) -> None:
+        await self.gate.wait()
+        self.frames.append(payload)
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+async def _drain() -> None:
+    for _ in range(20):
+        await asyncio.sleep(0)
+
+
+def _stats(session_id: str, points: int) -> WebSocketMessage:
+    return WebSocketMessage(
+        type=WebSocketMessageType.STREAMING_STATS,
+        data={"session_id": session_id, "total_points": points},
+    )
+
+
+@pytest.mark.asyncio
+async def test_broadcast_serializes_once_and_slow_client_does_not_block() -> None:
+    manager = WebSocketManager(max_queue_size=4)
+    fast, slow = _FakeSocket(), _FakeSocket(blocked=True)
+    fast_conn = await manager.connect(fast, "fast")
+    slow_conn = await manager.connect(slow, "slow")
+    for conn in (fast_conn, slow_conn):
+        await manager.join_room(conn, "room")
+
+    for i in range(10):
+        assert await manager.broadcast_to_room(
+            "room", {"type": "incident_updated", "data": {"n": i}}
+        ) == 2
+        await _drain()
+    # A burst of streaming stats for one session collapses into one frame.
+    for points in range(50):
+        await manager.broadcast_to_room("room", _stats("s1", points))
+    await _drain()
+
+    assert len(fast.frames) == 1 + 10 + 1
+    assert [json.loads(f)["data"]["n"] for f in fast.frames[1:11]] == list(range(10))
+    assert json.loads(fast.frames[-1])["data"]["total_points"] == 49
+    status = manager.get_status()["send_queues"]
+    assert status["max_depth"] == 4
+    assert status["coalesced"] == 2 * 49
+
+    # Frames for the slow client are the very same string objects.
+    slow.gate.set()
+    await _drain()
+    assert fast.frames[-2] is slow.frames[-2]
+    assert json.loads(slow.frames[-1])["data"]["total_points"] == 49
+    # The in-flight connected frame plus a full queue; older ones were dropped.
+    assert [json.loads(f)["data"].get("n") for f in slow.frames[1:]] == [7, 8, 9, None]
+    for conn_id in ("fast", "slow"):
+        await manager.disconnect(conn_id)
+
+
+@pytest.mark.asyncio
+async def test_disconnect_policy_drops_slow_consumer() -> None:
+    manager = WebSocketManager(
+        max_queue_size=2, slow_consumer_policy=SlowConsumerPolicy.DISCONNECT
+    )
+    slow = _FakeSocket(blocked=True)
+    await manager.connect(slow, "slow")
+
+    sent = [await manager.broadcast({"type": "ping", "data": {}}) for _ in range(4)]
+    await _drain()
+
+    # The connected frame plus one broadcast fill the queue.
+    assert sent == [1, 0, 0, 0]
+    assert manager.connection_count == 0
+    assert slow.closed
+    assert manager.get_status()["send_queues"]["dropped_connections"] == 1